@@ -46,20 +46,34 @@ Legacy API (v1.0) - Backward Compatible:
     GET  /api/runs/<run_id>/events    - SSE event stream
 """
 
-from .server import SpecManager, app, create_app, get_spec_manager
+from typing import TYPE_CHECKING
 
-# Also expose routers for custom integration
-try:
-    from .routes import events_router, runs_router, specs_router
+# The server and routers are imported lazily: importing them builds every
+# route module (FastAPI, pydantic models, runtime services), which callers of
+# lightweight submodules such as swarm.api.responses should not pay for.
+if TYPE_CHECKING:
+    from .routes import events_router as events_router
+    from .routes import runs_router as runs_router
+    from .routes import specs_router as specs_router
+    from .server import SpecManager as SpecManager
+    from .server import app as app
+    from .server import create_app as create_app
+    from .server import get_spec_manager as get_spec_manager
 
-    __all__ = [
-        "create_app",
-        "SpecManager",
-        "app",
-        "get_spec_manager",
-        "specs_router",
-        "runs_router",
-        "events_router",
-    ]
-except ImportError:
-    __all__ = ["create_app", "SpecManager", "app", "get_spec_manager"]
+_SERVER_EXPORTS = ("create_app", "SpecManager", "app", "get_spec_manager")
+_ROUTER_EXPORTS = ("specs_router", "runs_router", "events_router")
+
+__all__ = [*_SERVER_EXPORTS, *_ROUTER_EXPORTS]
+
+
+def __getattr__(name: str):
+    """Lazy import of the server and routers."""
+    if name in _SERVER_EXPORTS:
+        from . import server
+
+        return getattr(server, name)
+    if name in _ROUTER_EXPORTS:
+        from . import routes
+
+        return getattr(routes, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,31 @@
+"""
+JSON response class for Flow Studio APIs.
+
+Renders response bodies with swarm.runtime.json_codec (orjson when
+installed). The output matches Starlette's JSONResponse: compact
+separators, UTF-8, non-ASCII characters written as-is.
+
+Usage:
+    from swarm.api.responses import JSONResponse
+
+    app = FastAPI(default_response_class=JSONResponse)
+    return JSONResponse(content={...}, status_code=201)
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse as _StarletteJSONResponse
+
+from swarm.runtime import json_codec
+
+
+class JSONResponse(_StarletteJSONResponse):
+    """JSONResponse rendered through the runtime JSON codec."""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumpb(content)
+
+
+__all__ = ["JSONResponse"]
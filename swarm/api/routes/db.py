@@ -5,6 +5,8 @@ Provides endpoints for:
 - Checking database health
 - Triggering manual rebuild from events.jsonl
 - Querying database statistics
+- Querying cross-run rollups (per agent/station/flow/day, per tool)
+- Querying per-step resource usage of a run
 """
 
 from __future__ import annotations
@@ -70,8 +72,61 @@ class DBStatsResponse(BaseModel):
     total_file_changes: int = 0
     total_events: int = 0
     total_facts: int = 0
+    archived_runs: int = Field(0, description="Runs moved from the hot DB to Parquet archives.")
     projection_version: int = 0
     schema_version: int = 0
+    query_cache: Dict[str, Any] = Field(
+        default_factory=dict, description="Query result cache hits, misses, hit rate and saved time."
+    )
+
+
+class RollupRow(BaseModel):
+    """One group of a cross-run rollup."""
+
+    group: Dict[str, Any]
+    count: int
+    success_rate: float
+    failure_rate: float = 0.0
+    total_duration_ms: int = 0
+    avg_duration_ms: float = 0.0
+    p50_duration_ms: Optional[float] = None
+    p95_duration_ms: Optional[float] = None
+    total_tokens: int = 0
+
+
+class RollupResponse(BaseModel):
+    """Cross-run rollup query response."""
+
+    group_by: List[str]
+    rows: List[RollupRow]
+    timestamp: str
+
+
+class StepResourceRow(BaseModel):
+    """Local resource usage of one step execution."""
+
+    flow_key: str
+    step_id: str
+    iteration: int = 1
+    step_index: Optional[int] = None
+    timestamp: Optional[str] = None
+    cpu_ms: float = 0.0
+    subprocess_count: int = 0
+    subprocess_cpu_ms: float = 0.0
+    subprocess_peak_rss_kb: int = 0
+    git_commands: int = 0
+    git_ms: float = 0.0
+    io_read_bytes: Optional[int] = None
+    io_write_bytes: Optional[int] = None
+    db_ingest_ms: float = 0.0
+
+
+class StepResourcesResponse(BaseModel):
+    """Per-step resource usage of a run."""
+
+    run_id: str
+    steps: List[StepResourceRow]
+    timestamp: str
 
 
 # =============================================================================
@@ -255,8 +310,10 @@ async def get_db_stats():
             total_file_changes=safe_count("file_changes"),
             total_events=safe_count("events"),
             total_facts=safe_count("facts"),
+            archived_runs=stats_db.archived_run_count(),
             projection_version=PROJECTION_VERSION,
             schema_version=SCHEMA_VERSION,
+            query_cache=stats_db.query_cache_stats().to_dict(),
         )
 
     except Exception as e:
@@ -306,3 +363,155 @@ async def ingest_run_events(run_id: str):
             "error": str(e),
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
+
+
+def _parse_group_by(group_by: str) -> List[str]:
+    """Parse a comma-separated group_by query parameter."""
+    return [d.strip() for d in group_by.split(",") if d.strip()]
+
+
+def _get_stats_db():
+    """Return the live StatsDB, or raise 503 if unavailable."""
+    from swarm.runtime.resilient_db import get_resilient_db
+
+    stats_db = get_resilient_db().db
+    if stats_db is None or stats_db.connection is None:
+        raise HTTPException(
+            status_code=503,
+            detail={"error": "db_unavailable", "message": "Stats database unavailable"},
+        )
+    return stats_db
+
+
+@router.get("/rollups/steps", response_model=RollupResponse)
+async def get_step_rollups(
+    group_by: str = "agent_key",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    flow_key: Optional[str] = None,
+):
+    """Get cross-run step rollups (counts, failure rate, p50/p95 duration).
+
+    Args:
+        group_by: Comma-separated dimensions: day, flow_key, station_id, agent_key.
+        since: Earliest day (YYYY-MM-DD), inclusive.
+        until: Latest day (YYYY-MM-DD), inclusive.
+        flow_key: Only include this flow.
+
+    Raises:
+        400: Unknown group_by dimension.
+        503: Database unavailable.
+    """
+    dims = _parse_group_by(group_by)
+    stats_db = _get_stats_db()
+    try:
+        rollups = stats_db.get_step_rollup(
+            group_by=tuple(dims), since=since, until=until, flow_key=flow_key
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={"error": "invalid_group_by", "message": str(e)})
+
+    return RollupResponse(
+        group_by=dims,
+        rows=[
+            RollupRow(
+                group={k: str(v) for k, v in r.group.items()},
+                count=r.step_count,
+                success_rate=r.succeeded_count / r.step_count if r.step_count else 0.0,
+                failure_rate=r.failure_rate,
+                total_duration_ms=r.total_duration_ms,
+                avg_duration_ms=r.avg_duration_ms,
+                p50_duration_ms=r.p50_duration_ms,
+                p95_duration_ms=r.p95_duration_ms,
+                total_tokens=r.total_tokens,
+            )
+            for r in rollups
+        ],
+        timestamp=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+@router.get("/rollups/tools", response_model=RollupResponse)
+async def get_tool_rollups(
+    group_by: str = "day",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    tool_name: Optional[str] = None,
+):
+    """Get cross-run tool call rollups (volume, success rate, p50/p95 duration).
+
+    Args:
+        group_by: Comma-separated dimensions: day, tool_name, phase.
+        since: Earliest day (YYYY-MM-DD), inclusive.
+        until: Latest day (YYYY-MM-DD), inclusive.
+        tool_name: Only include this tool.
+
+    Raises:
+        400: Unknown group_by dimension.
+        503: Database unavailable.
+    """
+    dims = _parse_group_by(group_by)
+    stats_db = _get_stats_db()
+    try:
+        rollups = stats_db.get_tool_rollup(
+            group_by=tuple(dims), since=since, until=until, tool_name=tool_name
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={"error": "invalid_group_by", "message": str(e)})
+
+    return RollupResponse(
+        group_by=dims,
+        rows=[
+            RollupRow(
+                group={k: str(v) for k, v in r.group.items()},
+                count=r.call_count,
+                success_rate=r.success_rate,
+                failure_rate=1.0 - r.success_rate,
+                total_duration_ms=r.total_duration_ms,
+                avg_duration_ms=r.total_duration_ms / r.call_count if r.call_count else 0.0,
+                p50_duration_ms=r.p50_duration_ms,
+                p95_duration_ms=r.p95_duration_ms,
+            )
+            for r in rollups
+        ],
+        timestamp=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+@router.get("/runs/{run_id}/resources", response_model=StepResourcesResponse)
+async def get_step_resources(run_id: str, flow_key: Optional[str] = None):
+    """Get per-step resource usage of a run (CPU, subprocesses, git, I/O, ingest).
+
+    Args:
+        run_id: The run to query.
+        flow_key: Only include steps of this flow.
+
+    Raises:
+        503: Database unavailable.
+    """
+    stats_db = _get_stats_db()
+    records = stats_db.get_step_resources(run_id, flow_key)
+
+    return StepResourcesResponse(
+        run_id=run_id,
+        steps=[
+            StepResourceRow(
+                flow_key=r.flow_key,
+                step_id=r.step_id,
+                iteration=r.iteration,
+                step_index=r.step_index,
+                timestamp=r.timestamp.isoformat() if r.timestamp else None,
+                cpu_ms=r.cpu_ms or 0.0,
+                subprocess_count=r.subprocess_count or 0,
+                subprocess_cpu_ms=r.subprocess_cpu_ms or 0.0,
+                subprocess_peak_rss_kb=r.subprocess_peak_rss_kb or 0,
+                git_commands=r.git_commands or 0,
+                git_ms=r.git_ms or 0.0,
+                io_read_bytes=r.io_read_bytes,
+                io_write_bytes=r.io_write_bytes,
+                db_ingest_ms=r.db_ingest_ms,
+            )
+            for r in records
+        ],
+        timestamp=datetime.now(timezone.utc).isoformat(),
+    )
@@ -18,6 +18,10 @@ from typing import Any, AsyncGenerator, Dict, Optional
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
+from swarm.runtime import json_codec
+from swarm.runtime.run_archive import open_run_file, run_path_exists
+from swarm.runtime.state_journal import get_state_journal
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/runs", tags=["events"])
@@ -128,7 +132,7 @@ def format_sse_event(
     if "type" not in data:
         data["type"] = event_type.replace(":", "_")
 
-    lines.append(f"data: {json.dumps(data)}")
+    lines.append(f"data: {json_codec.dumps(data)}")
     lines.append("")  # Empty line terminates event
 
     return "\n".join(lines) + "\n"
@@ -145,28 +149,30 @@ async def read_events_file(
 ) -> tuple[list[Dict[str, Any]], int]:
     """Read new events from the events file.
 
+    Archived runs are read from their bundle.
+
     Args:
         events_file: Path to events.jsonl file.
-        last_position: Last read position in file.
+        last_position: Last read byte offset in file.
 
     Returns:
         Tuple of (events list, new position).
     """
     events = []
 
-    if not events_file.exists():
+    if not run_path_exists(events_file):
         return events, last_position
 
     try:
-        with open(events_file, "r", encoding="utf-8") as f:
+        with open_run_file(events_file, "rb") as f:
             f.seek(last_position)
-            for line in f:
-                line = line.strip()
+            for raw in f:
+                line = raw.decode("utf-8").strip()
                 if line:
                     try:
-                        event = json.loads(line)
+                        event = json_codec.loads(line)
                         events.append(event)
-                    except json.JSONDecodeError:
+                    except json_codec.JSONDecodeError:
                         logger.warning("Invalid JSON in events file: %s", line)
             new_position = f.tell()
     except Exception as e:
@@ -201,7 +207,6 @@ async def generate_run_events(
     """
     run_dir = runs_root / run_id
     events_file = run_dir / "events.jsonl"
-    state_file = run_dir / "run_state.json"
 
     # Track file position for incremental reading
     last_position = 0
@@ -218,16 +223,15 @@ async def generate_run_events(
 
     while True:
         try:
-            # Check if run exists
-            if not state_file.exists():
+            # Read current state (snapshot + journal); None if the run does not exist
+            state = get_state_journal(run_dir, register=False).load()
+            if state is None:
                 yield format_sse_event(
                     EventType.ERROR,
                     {"error": "run_not_found", "message": f"Run '{run_id}' not found"},
                 )
                 break
 
-            # Read current state
-            state = json.loads(state_file.read_text(encoding="utf-8"))
             status = state.get("status", "pending")
 
             # Read new events from file
@@ -268,7 +272,7 @@ async def generate_run_events(
                     {
                         "run_id": run_id,
                         "status": status,
-                        "current_step": state.get("current_step"),
+                        "current_step": state.get("current_step_id") or state.get("current_step"),
                     },
                     event_id=str(event_counter),
                 )
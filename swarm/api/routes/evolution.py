@@ -16,9 +16,11 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Header, HTTPException
-from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from swarm.api.responses import JSONResponse
+from swarm.runtime.run_archive import run_path_exists
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/evolution", tags=["evolution"])
@@ -140,6 +142,7 @@ def _get_evolution_module():
         EvolutionPatch,
         apply_evolution_patch,
         generate_evolution_patch,
+        get_run_patches,
         list_pending_patches,
         validate_evolution_patch,
     )
@@ -150,6 +153,7 @@ def _get_evolution_module():
         "apply_evolution_patch": apply_evolution_patch,
         "validate_evolution_patch": validate_evolution_patch,
         "list_pending_patches": list_pending_patches,
+        "get_run_patches": get_run_patches,
     }
 
 
@@ -230,7 +234,7 @@ async def get_run_evolution_patches(run_id: str):
 
     wisdom_dir = runs_root / run_id / "wisdom"
 
-    if not wisdom_dir.exists():
+    if not run_path_exists(wisdom_dir):
         raise HTTPException(
             status_code=404,
             detail={
@@ -240,7 +244,7 @@ async def get_run_evolution_patches(run_id: str):
             },
         )
 
-    patches = evolution["generate_evolution_patch"](wisdom_dir, run_id=run_id)
+    patches = evolution["get_run_patches"](runs_root, run_id)
 
     return PendingPatchesResponse(
         run_id=run_id,
@@ -274,7 +278,7 @@ async def get_evolution_patch_details(
 
     wisdom_dir = runs_root / run_id / "wisdom"
 
-    if not wisdom_dir.exists():
+    if not run_path_exists(wisdom_dir):
         raise HTTPException(
             status_code=404,
             detail={
@@ -284,7 +288,7 @@ async def get_evolution_patch_details(
             },
         )
 
-    patches = evolution["generate_evolution_patch"](wisdom_dir, run_id=run_id)
+    patches = evolution["get_run_patches"](runs_root, run_id)
 
     # Find the specific patch
     patch = next((p for p in patches if p.id == patch_id), None)
@@ -339,7 +343,7 @@ async def validate_evolution_patch_endpoint(run_id: str, patch_id: str):
 
     wisdom_dir = runs_root / run_id / "wisdom"
 
-    if not wisdom_dir.exists():
+    if not run_path_exists(wisdom_dir):
         raise HTTPException(
             status_code=404,
             detail={
@@ -349,7 +353,7 @@ async def validate_evolution_patch_endpoint(run_id: str, patch_id: str):
             },
         )
 
-    patches = evolution["generate_evolution_patch"](wisdom_dir, run_id=run_id)
+    patches = evolution["get_run_patches"](runs_root, run_id)
     patch = next((p for p in patches if p.id == patch_id), None)
 
     if not patch:
@@ -432,7 +436,7 @@ async def apply_evolution_patch_endpoint(
 
     wisdom_dir = runs_root / run_id / "wisdom"
 
-    if not wisdom_dir.exists():
+    if not run_path_exists(wisdom_dir):
         raise HTTPException(
             status_code=404,
             detail={
@@ -442,7 +446,7 @@ async def apply_evolution_patch_endpoint(
             },
         )
 
-    patches = evolution["generate_evolution_patch"](wisdom_dir, run_id=run_id)
+    patches = evolution["get_run_patches"](runs_root, run_id)
     patch = next((p for p in patches if p.id == patch_id), None)
 
     if not patch:
@@ -557,7 +561,7 @@ async def reject_evolution_patch_endpoint(
     runs_root = _get_runs_root()
     wisdom_dir = runs_root / run_id / "wisdom"
 
-    if not wisdom_dir.exists():
+    if not run_path_exists(wisdom_dir):
         raise HTTPException(
             status_code=404,
             detail={
@@ -567,9 +571,10 @@ async def reject_evolution_patch_endpoint(
             },
         )
 
-    # Record rejection
+    # Record rejection (an archived run gets a loose wisdom/ next to its bundle)
     rejection_path = wisdom_dir / f".rejected_{patch_id}"
     try:
+        wisdom_dir.mkdir(parents=True, exist_ok=True)
         rejection_path.write_text(
             json.dumps(
                 {
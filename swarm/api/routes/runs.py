@@ -13,19 +13,20 @@ Provides REST endpoints for:
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import json
 import logging
-import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Header, HTTPException, Response
-from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from swarm.api.responses import JSONResponse
+from swarm.runtime.run_archive import run_path_exists
+from swarm.runtime.state_journal import RunStateJournal, get_state_journal
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/runs", tags=["runs"])
@@ -125,30 +126,26 @@ class InterruptRequest(BaseModel):
 
 
 class RunStateManager:
-    """Manages run state in memory and on disk.
-
-    In-memory cache for fast access, with disk persistence for durability.
+    """Manages run state on disk, coherently across processes.
+
+    State is read and written through the run's state journal
+    (swarm.runtime.state_journal), which keeps the last state in memory and
+    revalidates it against the files' stat on every access. Writes hold the
+    run's cross-process file lock, so several API workers, the CLI and the
+    orchestrator can share a run directory without stale reads or lost
+    updates. ETags are derived from the same stat and need no hashing.
     """
 
     def __init__(self, runs_root: Path):
         self.runs_root = runs_root
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._locks: Dict[str, asyncio.Lock] = {}
 
-    def _get_lock(self, run_id: str) -> asyncio.Lock:
-        """Get or create a lock for a run."""
-        if run_id not in self._locks:
-            self._locks[run_id] = asyncio.Lock()
-        return self._locks[run_id]
+    def _journal(self, run_id: str, register: bool = True) -> RunStateJournal:
+        """Get the state journal of a run.
 
-    def _compute_etag(self, state: Dict[str, Any]) -> str:
-        """Compute ETag from state."""
-        content = json.dumps(state, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
-
-    def _state_path(self, run_id: str) -> Path:
-        """Get path to run state file."""
-        return self.runs_root / run_id / "run_state.json"
+        Reads pass register=False so polling many runs does not keep a
+        journal (and its file lock) alive for each of them.
+        """
+        return get_state_journal(self.runs_root / run_id, register=register)
 
     async def create_run(
         self,
@@ -178,35 +175,20 @@ class RunStateManager:
             "error": None,
         }
 
-        # Create run directory
-        run_dir = self.runs_root / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save state
-        await self._save_state(run_id, state)
+        await asyncio.to_thread(self._journal(run_id).write, state)
 
         return state
 
-    def _get_run_unlocked(self, run_id: str) -> tuple[Dict[str, Any], str]:
-        """Get run state without locking (internal use only)."""
-        # Check cache first
-        if run_id in self._cache:
-            state = self._cache[run_id]
-            return state, self._compute_etag(state)
-
-        # Load from disk
-        state_path = self._state_path(run_id)
-        if not state_path.exists():
-            raise FileNotFoundError(f"Run '{run_id}' not found")
-
-        state = json.loads(state_path.read_text(encoding="utf-8"))
-        self._cache[run_id] = state
-        return state, self._compute_etag(state)
+    def _get_run_unlocked(self, journal: RunStateJournal) -> tuple[Dict[str, Any], str]:
+        """Get run state and its ETag (callers writing must hold the file lock)."""
+        state, etag = journal.load_versioned()
+        if state is None:
+            raise FileNotFoundError(f"Run '{journal.run_path.name}' not found")
+        return state, etag
 
     async def get_run(self, run_id: str) -> tuple[Dict[str, Any], str]:
         """Get run state with ETag."""
-        async with self._get_lock(run_id):
-            return self._get_run_unlocked(run_id)
+        return self._get_run_unlocked(self._journal(run_id, register=False))
 
     async def update_run(
         self,
@@ -215,8 +197,18 @@ class RunStateManager:
         expected_etag: Optional[str] = None,
     ) -> tuple[Dict[str, Any], str]:
         """Update run state with optional ETag check."""
-        async with self._get_lock(run_id):
-            state, current_etag = self._get_run_unlocked(run_id)
+        return await asyncio.to_thread(self._update_run_sync, run_id, updates, expected_etag)
+
+    def _update_run_sync(
+        self,
+        run_id: str,
+        updates: Dict[str, Any],
+        expected_etag: Optional[str],
+    ) -> tuple[Dict[str, Any], str]:
+        """Read, check and write under the run's file lock."""
+        journal = self._journal(run_id)
+        with journal.locked():
+            state, current_etag = self._get_run_unlocked(journal)
 
             if expected_etag and expected_etag != current_etag:
                 raise ValueError(f"ETag mismatch: expected {expected_etag}, got {current_etag}")
@@ -225,20 +217,8 @@ class RunStateManager:
             state.update(updates)
             state["updated_at"] = datetime.now(timezone.utc).isoformat()
 
-            await self._save_state(run_id, state)
-            return state, self._compute_etag(state)
-
-    async def _save_state(self, run_id: str, state: Dict[str, Any]) -> None:
-        """Save state to disk and cache."""
-        state_path = self._state_path(run_id)
-        state_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write atomically
-        tmp_path = state_path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
-        os.replace(tmp_path, state_path)
-
-        self._cache[run_id] = state
+            journal.write(state)
+            return state, journal.version()
 
     def list_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
         """List recent runs."""
@@ -250,15 +230,16 @@ class RunStateManager:
         # Get directories sorted by modification time
         run_dirs = []
         for item in self.runs_root.iterdir():
-            if item.is_dir() and (item / "run_state.json").exists():
+            if item.is_dir() and run_path_exists(item / "run_state.json"):
                 run_dirs.append((item.stat().st_mtime, item))
 
         run_dirs.sort(key=lambda x: x[0], reverse=True)
 
         for _, run_dir in run_dirs[:limit]:
-            state_path = run_dir / "run_state.json"
             try:
-                state = json.loads(state_path.read_text(encoding="utf-8"))
+                state = get_state_journal(run_dir, register=False).load()
+                if state is None:
+                    raise ValueError("unreadable run_state.json")
                 runs.append(
                     {
                         "run_id": state.get("run_id", run_dir.name),
@@ -17,9 +17,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Header, HTTPException
-from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from swarm.api.responses import JSONResponse
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/wisdom", tags=["wisdom"])
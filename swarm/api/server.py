@@ -12,6 +12,9 @@ Usage:
     # Run standalone
     python -m swarm.api.server
 
+    # Several worker processes (run state is shared through the run directory)
+    python -m swarm.api.server --workers 4
+
     # Or via factory
     from swarm.api import create_app, SpecManager
     app = create_app()
@@ -31,6 +34,7 @@ import asyncio
 import hashlib
 import json
 import logging
+import threading
 import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -39,9 +43,14 @@ from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 from fastapi import FastAPI, Header, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from swarm.runtime.run_archive import open_run_file, run_path_exists
+from swarm.runtime.state_journal import get_state_journal
+
+from .responses import JSONResponse
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -219,7 +228,6 @@ class SpecManager:
 
         self._flow_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
         self._template_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
-        self._run_state_cache: Dict[str, Tuple[Dict[str, Any], str]] = {}
 
         logger.info("SpecManager initialized with repo_root=%s", repo_root)
 
@@ -617,19 +625,13 @@ class SpecManager:
         Raises:
             FileNotFoundError: If run not found.
         """
-        if run_id in self._run_state_cache:
-            return self._run_state_cache[run_id]
-
-        run_dir = self.runs_root / run_id
-        state_file = run_dir / "run_state.json"
-
-        if not state_file.exists():
+        # The journal revalidates its cached state against the files on
+        # every call, so writes by other processes are seen immediately
+        state_data, etag = get_state_journal(
+            self.runs_root / run_id, register=False
+        ).load_versioned()
+        if state_data is None:
             raise FileNotFoundError(f"Run '{run_id}' not found")
-
-        state_data = json.loads(state_file.read_text(encoding="utf-8"))
-        etag = self._compute_etag(state_data)
-
-        self._run_state_cache[run_id] = (state_data, etag)
         return state_data, etag
 
     def list_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
@@ -650,10 +652,12 @@ class SpecManager:
             if not run_dir.is_dir():
                 continue
 
-            state_file = run_dir / "run_state.json"
-            if state_file.exists():
+            if run_path_exists(run_dir / "run_state.json"):
                 try:
-                    state = json.loads(state_file.read_text(encoding="utf-8"))
+                    # Snapshot plus journal, without the internal sequence key
+                    state = get_state_journal(run_dir, register=False).load()
+                    if state is None:
+                        raise ValueError("unreadable run_state.json")
                     runs.append(
                         {
                             "run_id": state.get("run_id", run_dir.name),
@@ -698,12 +702,13 @@ class SpecManager:
                 status = state.get("status", "pending")
 
                 # Read new events from file
-                if events_file.exists():
-                    with open(events_file, "r", encoding="utf-8") as f:
+                if run_path_exists(events_file):
+                    with open_run_file(events_file, "rb") as f:
                         f.seek(last_position)
-                        for line in f:
-                            if line.strip():
-                                yield f"data: {line.strip()}\n\n"
+                        for raw in f:
+                            line = raw.decode("utf-8").strip()
+                            if line:
+                                yield f"data: {line}\n\n"
                         last_position = f.tell()
 
                 # Send heartbeat with current state
@@ -960,6 +965,7 @@ def create_app(
         description="REST API for SpecManager functionality - exposes flows, templates, validation, and compilation to the TypeScript frontend.",
         version="2.0.0",
         lifespan=lifespan,
+        default_response_class=JSONResponse,
     )
 
     # Add CORS middleware
@@ -1383,8 +1389,23 @@ def create_app(
     return app
 
 
-# Create default app instance for uvicorn
-app = create_app()
+# Default app instance for uvicorn (swarm.api.server:app), created on first
+# access: building it imports every route module, which the CLI (--help,
+# --workers) and importers of create_app() or the models do not need.
+app: FastAPI
+_app_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    """Lazy creation of the default app instance."""
+    if name == "app":
+        global app
+        with _app_lock:
+            # Another thread may have built it while we waited
+            if "app" not in globals():
+                app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
@@ -1403,10 +1424,16 @@ def main():
     parser.add_argument("--port", type=int, default=5001, help="Port to bind to")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
     parser.add_argument("--no-cors", action="store_true", help="Disable CORS")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes (default: 1)"
+    )
     args = parser.parse_args()
+    if args.workers > 1 and (args.no_cors or args.debug):
+        parser.error("--workers cannot be combined with --no-cors or --debug")
 
     global app
-    app = create_app(enable_cors=not args.no_cors)
+    if args.workers <= 1:
+        app = create_app(enable_cors=not args.no_cors)
 
     print(f"Starting Flow Studio API server at http://{args.host}:{args.port}")
     print("\nNew API Endpoints (v2.0):")
@@ -1456,7 +1483,18 @@ def main():
     print("    POST   /api/preview/spec/stations/{id}    - Preview station configuration")
     print("    POST   /api/preview/spec/flows/{id}/validate - Validate flow graph")
 
-    uvicorn.run(app, host=args.host, port=args.port, reload=args.debug)
+    if args.workers > 1:
+        # Each worker builds its own app; run state stays coherent across
+        # them through the run directory (see swarm.runtime.state_journal)
+        uvicorn.run(
+            "swarm.api.server:create_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+        )
+    else:
+        uvicorn.run(app, host=args.host, port=args.port, reload=args.debug)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ Usage:
         get_preserve_patterns,
         is_dry_run_enabled,
         should_quarantine_corrupt,
+        get_projection_hot_retention_days,
     )
 """
 
@@ -38,6 +39,7 @@ def _default_config() -> Dict[str, Any]:
         "runs": {
             "max_count": 300,
             "max_total_size_mb": 2000,
+            "archive_after_days": 7,
             "preserve": {
                 "named_runs": ["demo-health-check", "demo-run"],
                 "prefixes": ["stepwise-", "baseline-"],
@@ -46,6 +48,9 @@ def _default_config() -> Dict[str, Any]:
             "preserve_examples": True,
         },
         "flows": {},
+        "projection": {
+            "hot_retention_days": 14,
+        },
         "features": {
             "dry_run": False,
             "log_deletions": True,
@@ -141,6 +146,27 @@ def get_max_total_size_mb() -> int:
     return runs.get("max_total_size_mb", 2000)
 
 
+def get_archive_after_days() -> Optional[int]:
+    """Get days after completion before a finished run is packed into a bundle.
+
+    Returns:
+        Age threshold in days, or None if run archiving is disabled
+        (unset or <= 0).
+    """
+    env_val = os.environ.get("SWARM_RUNS_ARCHIVE_AFTER_DAYS")
+    if env_val is not None:
+        try:
+            days = int(env_val)
+            return days if days > 0 else None
+        except ValueError:
+            pass
+
+    config = _load_config()
+    runs = config.get("runs", {})
+    days = runs.get("archive_after_days", 7)
+    return int(days) if days and int(days) > 0 else None
+
+
 def get_preserve_patterns() -> Dict[str, Any]:
     """Get patterns to preserve (don't delete)."""
     config = _load_config()
@@ -203,3 +229,24 @@ def should_quarantine_corrupt() -> bool:
     config = _load_config()
     features = config.get("features", {})
     return features.get("quarantine_corrupt", True)
+
+
+def get_projection_hot_retention_days() -> Optional[int]:
+    """Get days a completed run stays in the hot stats DB before archiving.
+
+    Returns:
+        Days to keep runs in the hot DuckDB projection, or None if
+        archiving to Parquet is disabled (unset or <= 0).
+    """
+    env_val = os.environ.get("SWARM_DB_HOT_RETENTION_DAYS")
+    if env_val is not None:
+        try:
+            days = int(env_val)
+            return days if days > 0 else None
+        except ValueError:
+            pass
+
+    config = _load_config()
+    projection = config.get("projection", {})
+    days = projection.get("hot_retention_days", 14)
+    return int(days) if days and int(days) > 0 else None
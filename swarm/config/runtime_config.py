@@ -174,6 +174,20 @@ def _default_config() -> Dict[str, Any]:
             "history_max_older_chars": 20000,  # ~5k tokens for older steps
             "timeout_seconds": 30,
         },
+        "scheduler": {
+            "max_concurrent_runs": 4,
+            "backends": {},
+        },
+        "rate_limits": {
+            "shared": False,
+            "engines": {},
+        },
+        "navigator_cache": {
+            "enabled": True,
+            "scope": "run",
+            "max_age_seconds": 3600,
+            "max_entries": 512,
+        },
         "features": {
             "stepwise_execution": True,
             "context_handoff": True,
@@ -588,6 +602,164 @@ def get_resolved_context_budgets(
     return resolver.resolve(flow_key, step_id)
 
 
+# =============================================================================
+# Run Scheduler Limits
+# =============================================================================
+
+
+def get_scheduler_max_concurrent_runs() -> int:
+    """Get the global cap on concurrently executing runs.
+
+    Environment variable precedence:
+    1. SWARM_MAX_CONCURRENT_RUNS
+    2. Config file scheduler.max_concurrent_runs
+    3. Default: 4
+
+    Returns:
+        Maximum number of runs the scheduler executes at once (>= 1).
+    """
+    env_value = os.environ.get("SWARM_MAX_CONCURRENT_RUNS")
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            logger.warning(
+                "Invalid SWARM_MAX_CONCURRENT_RUNS value '%s'. Using config default.",
+                env_value,
+            )
+
+    config = _load_config()
+    scheduler = config.get("scheduler", {}) or {}
+    return max(1, int(scheduler.get("max_concurrent_runs", 4)))
+
+
+def get_scheduler_backend_limit(backend_id: str) -> Optional[int]:
+    """Get the per-backend cap on concurrently executing runs.
+
+    Environment variable precedence:
+    1. SWARM_<BACKEND>_MAX_CONCURRENT_RUNS (hyphens become underscores,
+       e.g., SWARM_GEMINI_CLI_MAX_CONCURRENT_RUNS)
+    2. Config file scheduler.backends.<backend_id>
+    3. Default: None (bounded only by the global limit)
+
+    Args:
+        backend_id: Backend identifier (e.g., "claude-harness").
+
+    Returns:
+        Per-backend limit, or None if the backend has no dedicated limit.
+    """
+    env_var = f"SWARM_{backend_id.upper().replace('-', '_')}_MAX_CONCURRENT_RUNS"
+    env_value = os.environ.get(env_var)
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            logger.warning("Invalid %s value '%s'. Using config default.", env_var, env_value)
+
+    config = _load_config()
+    scheduler = config.get("scheduler", {}) or {}
+    limits = scheduler.get("backends", {}) or {}
+    limit = limits.get(backend_id)
+    return int(limit) if limit else None
+
+
+# =============================================================================
+# Engine Rate Limits
+# =============================================================================
+
+
+def get_engine_rate_limits(engine: str) -> Dict[str, Any]:
+    """Get the rate limits for an engine's calls.
+
+    Environment variable precedence (engine-level limits only):
+    1. SWARM_<ENGINE>_REQUESTS_PER_MINUTE / SWARM_<ENGINE>_TOKENS_PER_MINUTE
+       (hyphens become underscores, e.g., SWARM_CLAUDE_GLM_REQUESTS_PER_MINUTE)
+    2. Config file rate_limits.engines.<engine>
+    3. Default: {} (unlimited)
+
+    Args:
+        engine: Engine identifier (e.g., "claude", "gemini").
+
+    Returns:
+        Dict with optional "requests_per_minute", "tokens_per_minute" and
+        "models" (per-model overrides with the same keys).
+    """
+    config = _load_config()
+    rate_limits = config.get("rate_limits", {}) or {}
+    limits = dict((rate_limits.get("engines", {}) or {}).get(engine, {}) or {})
+
+    prefix = f"SWARM_{engine.upper().replace('-', '_')}"
+    for key in ("requests_per_minute", "tokens_per_minute"):
+        env_var = f"{prefix}_{key.upper()}"
+        env_value = os.environ.get(env_var)
+        if env_value:
+            try:
+                limits[key] = max(0.0, float(env_value))
+            except ValueError:
+                logger.warning("Invalid %s value '%s'. Using config default.", env_var, env_value)
+    return limits
+
+
+def is_rate_limit_shared() -> bool:
+    """Check whether engine rate limit buckets are shared across processes.
+
+    Environment variable precedence:
+    1. SWARM_RATE_LIMIT_SHARED ("1"/"true"/"yes" to enable)
+    2. Config file rate_limits.shared
+    3. Default: False
+    """
+    env_value = os.environ.get("SWARM_RATE_LIMIT_SHARED")
+    if env_value:
+        return env_value.strip().lower() in ("1", "true", "yes")
+
+    config = _load_config()
+    rate_limits = config.get("rate_limits", {}) or {}
+    return bool(rate_limits.get("shared", False))
+
+
+# =============================================================================
+# Navigator Decision Cache
+# =============================================================================
+
+
+def get_navigator_cache_settings() -> Dict[str, Any]:
+    """Get the Navigator decision cache settings.
+
+    Environment variable precedence:
+    1. SWARM_NAVIGATOR_CACHE ("0"/"false"/"no" disables) and
+       SWARM_NAVIGATOR_CACHE_SCOPE ("run", "flow" or "global")
+    2. Config file navigator_cache section
+    3. Default: enabled, run scope, 3600s max age, 512 entries
+
+    Returns:
+        Dict with "enabled", "scope", "max_age_seconds" and "max_entries".
+    """
+    config = _load_config()
+    section = config.get("navigator_cache", {}) or {}
+    settings = {
+        "enabled": bool(section.get("enabled", True)),
+        "scope": str(section.get("scope", "run")),
+        "max_age_seconds": float(section.get("max_age_seconds", 3600)),
+        "max_entries": int(section.get("max_entries", 512)),
+    }
+
+    env_enabled = os.environ.get("SWARM_NAVIGATOR_CACHE")
+    if env_enabled:
+        settings["enabled"] = env_enabled.strip().lower() not in ("0", "false", "no")
+
+    env_scope = os.environ.get("SWARM_NAVIGATOR_CACHE_SCOPE")
+    if env_scope:
+        settings["scope"] = env_scope.strip().lower()
+
+    if settings["scope"] not in ("run", "flow", "global"):
+        logger.warning(
+            "Invalid navigator cache scope '%s'. Using 'run'.",
+            settings["scope"],
+        )
+        settings["scope"] = "run"
+    return settings
+
+
 # Default fallback backend when no flow-specific config exists
 _DEFAULT_BACKEND = "claude-harness"
 
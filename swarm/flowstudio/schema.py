@@ -283,6 +283,39 @@ class FlowTimingResponse(BaseModel):
     message: Optional[str] = Field(None, description="Message if timing not available")
 
 
+class RunTraceResponse(BaseModel):
+    """Response model for /api/runs/{run_id}/trace endpoint (Trace Event Format)."""
+    run_id: str = Field(description="Run identifier")
+    flow_key: Optional[str] = Field(None, description="Flow the spans were filtered to")
+    traceEvents: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Trace events (complete 'X' spans and metadata)"
+    )
+    displayTimeUnit: str = Field("ms", description="Time unit for trace viewers")
+    message: Optional[str] = Field(None, description="Message if no spans were recorded")
+
+
+class RunResourcesResponse(BaseModel):
+    """Response model for /api/runs/{run_id}/resources endpoint."""
+    run_id: str = Field(description="Run identifier")
+    flow_key: Optional[str] = Field(None, description="Flow the steps were filtered to")
+    steps: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Resource usage per step execution (step_resources events)"
+    )
+    totals: Dict[str, Any] = Field(default_factory=dict, description="Usage summed over the steps")
+    message: Optional[str] = Field(None, description="Message if no usage was recorded")
+
+
+class RunForensicVerdictsResponse(BaseModel):
+    """Response model for /api/runs/{run_id}/forensics/verdicts endpoint."""
+    run_id: str = Field(description="Run identifier")
+    flow_key: Optional[str] = Field(None, description="Flow the caches were filtered to")
+    flows: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Per flow: verdict cache stats (hits, misses, stores, entries, hit_rate) and cached verdicts",
+    )
+    message: Optional[str] = Field(None, description="Message if no verdicts were cached")
+
+
 # =============================================================================
 # Tours
 # =============================================================================
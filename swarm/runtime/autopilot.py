@@ -28,6 +28,9 @@ Usage:
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import Executor, Future
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -269,6 +272,7 @@ class AutopilotController:
         repo_root: Optional[Path] = None,
         orchestrator: Optional[Any] = None,
         default_config: Optional[AutopilotConfig] = None,
+        evolution_executor: Optional[Executor] = None,
     ):
         """Initialize the autopilot controller.
 
@@ -277,12 +281,32 @@ class AutopilotController:
             orchestrator: Optional orchestrator instance to use for flow execution.
                 If not provided, will import and use GeminiStepOrchestrator.
             default_config: Default configuration for autopilot runs.
+            evolution_executor: Optional executor for boundary evolution work.
+                When set, evolution processing is submitted to it instead of
+                running inline, keeping it off the tick critical path.
         """
         self._repo_root = repo_root or Path(__file__).resolve().parents[2]
         self._flow_registry = FlowRegistry.get_instance()
         self._orchestrator = orchestrator
         self._states: Dict[RunId, AutopilotState] = {}
         self._default_config = default_config or AutopilotConfig()
+        self._evolution_executor = evolution_executor
+        # Deferred evolution jobs per run, in submission order
+        self._pending_evolution: Dict[RunId, List[Future]] = {}
+        self._evolution_lock = threading.Lock()
+
+    @property
+    def evolution_executor(self) -> Optional[Executor]:
+        """Executor for deferred boundary evolution (None runs it inline)."""
+        return self._evolution_executor
+
+    @evolution_executor.setter
+    def evolution_executor(self, executor: Optional[Executor]) -> None:
+        self._evolution_executor = executor
+
+    def has_run(self, run_id: RunId) -> bool:
+        """Check if run_id is an autopilot run known to this controller."""
+        return run_id in self._states
 
     def _get_orchestrator(self) -> Any:
         """Lazily load the orchestrator to avoid circular imports."""
@@ -357,6 +381,14 @@ class AutopilotController:
                 if auto_apply_patch_types is not None
                 else self._default_config.auto_apply_patch_types
             ),
+            # Explicit policy from defaults; legacy-derived policies are
+            # re-derived from this run's auto_apply_* values in __post_init__
+            evolution_apply_policy=(
+                self._default_config.evolution_apply_policy
+                if not self._default_config.auto_apply_wisdom
+                else EvolutionApplyPolicy.SUGGEST_ONLY
+            ),
+            evolution_boundary=self._default_config.evolution_boundary,
         )
 
         # Create run spec with no_human_mid_flow enabled
@@ -528,6 +560,15 @@ class AutopilotController:
                 ),
             )
 
+            # Process evolution at the wisdom flow boundary if configured
+            if (
+                flow_key == "wisdom"
+                and state.config.evolution_boundary == EvolutionBoundary.FLOW_END
+            ):
+                result = self._run_boundary_evolution(state, "flow_end")
+                if result is not None:
+                    state.wisdom_apply_result = result
+
             # Advance to next flow
             state.current_flow_index += 1
             return True
@@ -1013,17 +1054,24 @@ class AutopilotController:
         # - Evolution boundary is RUN_END (or legacy auto_apply_wisdom is True)
         # - Run completed successfully
         # - Wisdom flow completed
+        # FLOW_END runs already processed evolution after the wisdom flow.
         should_process_evolution = (
             success
             and "wisdom" in state.flows_completed
+            and state.config.evolution_boundary != EvolutionBoundary.FLOW_END
             and (
                 state.config.evolution_boundary == EvolutionBoundary.RUN_END
                 or state.config.auto_apply_wisdom  # Legacy compatibility
             )
         )
 
+        evolution_deferred = False
         if should_process_evolution:
-            state.wisdom_apply_result = self._process_evolution_at_boundary(state, "run_end")
+            result = self._run_boundary_evolution(state, "run_end")
+            if result is None:
+                evolution_deferred = True
+            else:
+                state.wisdom_apply_result = result
 
         # Emit completion event
         evolution_summary = None
@@ -1051,6 +1099,7 @@ class AutopilotController:
                     "flows_failed": state.flows_failed,
                     "error": state.error,
                     "evolution_summary": evolution_summary,
+                    "evolution_deferred": evolution_deferred,
                     # Legacy field for backwards compatibility
                     "wisdom_auto_apply": evolution_summary,
                 },
@@ -1063,6 +1112,78 @@ class AutopilotController:
             state.status.value,
         )
 
+    def _run_boundary_evolution(
+        self,
+        state: AutopilotState,
+        boundary: str,
+    ) -> Optional[WisdomApplyResult]:
+        """Process boundary evolution inline, or defer it to the executor.
+
+        Args:
+            state: The autopilot state containing config and run info.
+            boundary: The boundary type ("flow_end" or "run_end").
+
+        Returns:
+            The WisdomApplyResult when processed inline, or None when the work
+            was submitted to the evolution executor. Deferred results are
+            stored on the state when they complete (see wait_for_evolution).
+        """
+        if self._evolution_executor is None:
+            return self._process_evolution_at_boundary(state, boundary)
+
+        def _deferred() -> WisdomApplyResult:
+            result = self._process_evolution_at_boundary(state, boundary)
+            state.wisdom_apply_result = result
+            return result
+
+        def _clear(done: Future, run_id: RunId = state.run_id) -> None:
+            with self._evolution_lock:
+                futures = self._pending_evolution.get(run_id, [])
+                if done in futures:
+                    futures.remove(done)
+                if not futures:
+                    self._pending_evolution.pop(run_id, None)
+
+        with self._evolution_lock:
+            future = self._evolution_executor.submit(_deferred)
+            self._pending_evolution.setdefault(state.run_id, []).append(future)
+        future.add_done_callback(_clear)
+        logger.debug("Deferred %s evolution for autopilot run %s", boundary, state.run_id)
+        return None
+
+    def has_pending_evolution(self, run_id: RunId) -> bool:
+        """Check if deferred evolution work is still outstanding for a run."""
+        with self._evolution_lock:
+            return bool(self._pending_evolution.get(run_id))
+
+    def pending_evolution_count(self) -> int:
+        """Number of runs with deferred evolution work outstanding."""
+        with self._evolution_lock:
+            return len(self._pending_evolution)
+
+    def wait_for_evolution(
+        self, run_id: RunId, timeout: Optional[float] = None
+    ) -> Optional[WisdomApplyResult]:
+        """Block until deferred evolution work for a run has finished.
+
+        Args:
+            run_id: The autopilot run to wait for.
+            timeout: Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            The run's WisdomApplyResult (None if no evolution was processed).
+
+        Raises:
+            concurrent.futures.TimeoutError: If the work does not finish in time.
+        """
+        with self._evolution_lock:
+            futures = list(self._pending_evolution.get(run_id, []))
+        wait_futures(futures, timeout=timeout)
+        for future in futures:
+            future.result(timeout=0)
+        state = self._states.get(run_id)
+        return state.wisdom_apply_result if state else None
+
     def _process_evolution_at_boundary(
         self,
         state: AutopilotState,
@@ -1090,7 +1211,7 @@ class AutopilotController:
         from swarm.runtime.evolution import (
             PatchType,
             apply_evolution_patch,
-            generate_evolution_patch,
+            get_run_patches,
             validate_evolution_patch,
         )
 
@@ -1133,8 +1254,8 @@ class AutopilotController:
         for pt_str in config.auto_apply_patch_types:
             target_types.extend(type_mapping.get(pt_str, []))
 
-        # Generate patches from wisdom artifacts
-        patches = generate_evolution_patch(wisdom_dir, run_id=run_id)
+        # Patches from the index (regenerated only if wisdom artifacts changed)
+        patches = get_run_patches(wisdom_dir.parent.parent, run_id)
 
         for patch in patches:
             if patch.patch_type not in target_types:
@@ -0,0 +1,299 @@
+"""
+autopilot_scheduler.py - Interleaved execution of many autopilot runs.
+
+AutopilotController drives a single run through tick()/run_to_completion().
+This module adds AutopilotScheduler, which drives many autopilot runs from one
+process by interleaving their ticks on a shared worker pool:
+
+1. Each tick (one flow) is a unit of work; a run never has two ticks in flight
+2. Ready runs are ordered by ticks completed, so no run starves while another
+   chains through all of its flows (fair share between runs)
+3. Boundary evolution work is handed to a separate executor so it never
+   delays the next tick of any run
+
+Usage:
+    from swarm.runtime.autopilot import AutopilotController
+    from swarm.runtime.autopilot_scheduler import AutopilotScheduler
+
+    scheduler = AutopilotScheduler(AutopilotController(), max_workers=8)
+    run_ids = [scheduler.start(issue_ref=ref) for ref in issue_refs]
+    results = [scheduler.wait(run_id) for run_id in run_ids]
+    scheduler.shutdown()
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from swarm.runtime.autopilot import AutopilotController, AutopilotResult
+from swarm.runtime.types import RunId
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AutopilotSchedulerStats:
+    """Point-in-time scheduler metrics.
+
+    Attributes:
+        ready: Runs waiting for a worker.
+        in_flight: Runs with a tick currently executing.
+        parked: Runs that are neither complete nor runnable (e.g. paused).
+        completed: Runs that reached a terminal status.
+        ticks_executed: Total ticks executed across all runs.
+        pending_evolution: Runs with deferred evolution work outstanding.
+    """
+
+    ready: int = 0
+    in_flight: int = 0
+    parked: int = 0
+    completed: int = 0
+    ticks_executed: int = 0
+    pending_evolution: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "ready": self.ready,
+            "in_flight": self.in_flight,
+            "parked": self.parked,
+            "completed": self.completed,
+            "ticks_executed": self.ticks_executed,
+            "pending_evolution": self.pending_evolution,
+        }
+
+
+class AutopilotScheduler:
+    """Drives many autopilot runs concurrently on a shared worker pool.
+
+    Fairness: the ready queue is keyed by (ticks completed, arrival order),
+    so a worker always picks the runnable run that has made the least
+    progress. With N workers and M > N runs, every run advances one flow
+    before any run advances two.
+
+    Runs whose tick returns False without completing (paused, pausing) are
+    parked; call resume() to put them back on the ready queue.
+    """
+
+    def __init__(
+        self,
+        controller: AutopilotController,
+        max_workers: int = 4,
+        evolution_workers: int = 1,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            controller: The controller that owns run state and executes ticks.
+            max_workers: Maximum ticks executing at once (across all runs).
+            evolution_workers: Worker threads for deferred boundary evolution.
+                Set to 0 to keep evolution inline in the tick.
+        """
+        self._controller = controller
+        self._max_workers = max(1, max_workers)
+        self._evolution_pool: Optional[ThreadPoolExecutor] = None
+        if evolution_workers > 0:
+            self._evolution_pool = ThreadPoolExecutor(
+                max_workers=evolution_workers,
+                thread_name_prefix="autopilot-evolution",
+            )
+            controller.evolution_executor = self._evolution_pool
+
+        self._cond = threading.Condition()
+        self._ready: List[Tuple[int, int, RunId]] = []
+        self._queued: Set[RunId] = set()
+        self._in_flight: Set[RunId] = set()
+        self._parked: Set[RunId] = set()
+        self._completed: Set[RunId] = set()
+        self._ticks: Dict[RunId, int] = {}
+        self._ticks_executed = 0
+        self._seq = itertools.count()
+        self._workers: List[threading.Thread] = []
+        self._shutdown = False
+
+    # -------------------------------------------------------------------------
+    # Run management
+    # -------------------------------------------------------------------------
+
+    def start(self, **kwargs: Any) -> RunId:
+        """Start a new autopilot run and schedule it.
+
+        Accepts the same keyword arguments as AutopilotController.start().
+        """
+        run_id = self._controller.start(**kwargs)
+        self.submit(run_id)
+        return run_id
+
+    def submit(self, run_id: RunId) -> None:
+        """Schedule an existing autopilot run for interleaved execution.
+
+        Raises:
+            ValueError: If run_id is not a known autopilot run.
+            RuntimeError: If the scheduler has been shut down.
+        """
+        if not self._controller.has_run(run_id):
+            raise ValueError(f"Unknown autopilot run: {run_id}")
+
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("AutopilotScheduler has been shut down")
+            self._parked.discard(run_id)
+            self._ticks.setdefault(run_id, 0)
+            self._enqueue_locked(run_id)
+            self._ensure_workers_locked()
+
+    def resume(self, run_id: RunId) -> bool:
+        """Resume a paused or stopped run and put it back on the ready queue."""
+        if not self._controller.resume(run_id):
+            return False
+        self.submit(run_id)
+        return True
+
+    def wait(self, run_id: RunId, timeout: Optional[float] = None) -> AutopilotResult:
+        """Block until a run is complete and its evolution work has finished.
+
+        Args:
+            run_id: The autopilot run to wait for.
+            timeout: Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            The run's AutopilotResult (current state if the timeout expired).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while run_id not in self._completed and (
+                run_id in self._queued or run_id in self._in_flight
+            ):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if self._controller.has_pending_evolution(run_id):
+            self._controller.wait_for_evolution(run_id, timeout=remaining)
+        return self._controller.get_result(run_id)
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Block until no run is ready or in flight and evolution has drained.
+
+        Returns:
+            True if the scheduler became idle, False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._ready or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            run_ids = list(self._completed)
+
+        for run_id in run_ids:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                self._controller.wait_for_evolution(run_id, timeout=remaining)
+            except TimeoutError:
+                return False
+        return True
+
+    def stats(self) -> AutopilotSchedulerStats:
+        """Return a snapshot of scheduler metrics."""
+        with self._cond:
+            return AutopilotSchedulerStats(
+                ready=len(self._ready),
+                in_flight=len(self._in_flight),
+                parked=len(self._parked),
+                completed=len(self._completed),
+                ticks_executed=self._ticks_executed,
+                pending_evolution=self._controller.pending_evolution_count(),
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop scheduling ticks and release worker threads.
+
+        In-flight ticks finish; queued runs stay in their current state and
+        can be resubmitted to another scheduler.
+        """
+        with self._cond:
+            self._shutdown = True
+            self._ready.clear()
+            self._queued.clear()
+            self._cond.notify_all()
+            workers = list(self._workers)
+        if wait:
+            for worker in workers:
+                worker.join()
+        if self._evolution_pool is not None:
+            self._evolution_pool.shutdown(wait=wait)
+            if self._controller.evolution_executor is self._evolution_pool:
+                self._controller.evolution_executor = None
+
+    # -------------------------------------------------------------------------
+    # Worker pool
+    # -------------------------------------------------------------------------
+
+    def _enqueue_locked(self, run_id: RunId) -> None:
+        """Add a run to the ready heap. Caller holds the lock."""
+        if run_id in self._queued or run_id in self._in_flight:
+            return
+        heapq.heappush(self._ready, (self._ticks[run_id], next(self._seq), run_id))
+        self._queued.add(run_id)
+        self._cond.notify_all()
+
+    def _ensure_workers_locked(self) -> None:
+        """Start workers lazily up to max_workers. Caller holds the lock."""
+        self._workers = [w for w in self._workers if w.is_alive()]
+        wanted = min(self._max_workers, len(self._ready) + len(self._in_flight))
+        while len(self._workers) < wanted:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"autopilot-scheduler-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _worker_loop(self) -> None:
+        """Take the least-advanced ready run, tick it once, and requeue it."""
+        while True:
+            with self._cond:
+                while not self._ready and not self._shutdown:
+                    self._cond.wait()
+                if self._shutdown:
+                    return
+                _, _, run_id = heapq.heappop(self._ready)
+                self._queued.discard(run_id)
+                self._in_flight.add(run_id)
+
+            advanced = False
+            try:
+                advanced = self._controller.tick(run_id)
+            except Exception:
+                logger.exception("Autopilot tick failed for run %s", run_id)
+
+            complete = self._controller.is_complete(run_id)
+            with self._cond:
+                self._in_flight.discard(run_id)
+                self._ticks[run_id] += 1
+                self._ticks_executed += 1
+                if complete:
+                    self._completed.add(run_id)
+                elif advanced and not self._shutdown:
+                    self._enqueue_locked(run_id)
+                else:
+                    self._parked.add(run_id)
+                self._cond.notify_all()
+
+
+__all__ = [
+    "AutopilotScheduler",
+    "AutopilotSchedulerStats",
+]
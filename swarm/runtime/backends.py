@@ -22,9 +22,10 @@ import threading
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from . import storage
+from .run_scheduler import get_run_scheduler
 from .types import (
     BackendCapabilities,
     BackendId,
@@ -87,6 +88,81 @@ class RunBackend(ABC):
         """Cancel a running run. Returns True if cancelled."""
         return False  # Default: not supported
 
+    def _submit(
+        self,
+        run_id: RunId,
+        spec: RunSpec,
+        target: Callable[[RunId, RunSpec], None],
+    ) -> None:
+        """Queue run execution on the shared RunScheduler.
+
+        The run stays PENDING (with a queue_position) until a worker admits
+        it. spec.params["priority"] orders admission; higher runs first.
+        """
+        try:
+            priority = int(spec.params.get("priority", 0))
+        except (TypeError, ValueError):
+            priority = 0
+        get_run_scheduler().submit(run_id, self.id, target, args=(run_id, spec), priority=priority)
+
+    def _cancel_queued(self, run_id: RunId) -> bool:
+        """Cancel a run that is still waiting in the scheduler queue.
+
+        Returns:
+            True if the run was queued and is now CANCELED.
+        """
+        if not get_run_scheduler().cancel(run_id):
+            return False
+        self._mark_canceled(run_id, queued=True)
+        return True
+
+    def _mark_canceled(self, run_id: RunId, queued: bool) -> None:
+        """Record a run as CANCELED and emit run_canceled."""
+        now = datetime.now(timezone.utc)
+        storage.update_summary(
+            run_id,
+            {
+                "status": RunStatus.CANCELED.value,
+                "completed_at": now.isoformat(),
+                "updated_at": now.isoformat(),
+            },
+        )
+        storage.append_event(
+            run_id,
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="run_canceled",
+                flow_key="unknown",
+                payload={"queued": queued},
+            ),
+        )
+
+    def _cancel_stepwise(self, run_id: RunId) -> bool:
+        """Cancel a queued or running stepwise run.
+
+        Running runs are stopped through the orchestrator's stop request,
+        which the step loop honours before starting its next step.
+        Subclasses must provide _lock, _active_runs, _canceled_runs and
+        _get_orchestrator().
+        """
+        if self._cancel_queued(run_id):
+            return True
+        with self._lock:
+            if run_id not in self._active_runs or run_id in self._canceled_runs:
+                return False
+            self._canceled_runs.add(run_id)
+        self._get_orchestrator().request_stop(run_id)
+        self._mark_canceled(run_id, queued=False)
+        return True
+
+
+def with_queue_state(summary: Optional[RunSummary]) -> Optional[RunSummary]:
+    """Overlay the live scheduler queue position onto a stored summary."""
+    if summary is not None and summary.status == RunStatus.PENDING:
+        summary.queue_position = get_run_scheduler().queue_position(summary.id)
+    return summary
+
 
 class ClaudeHarnessBackend(RunBackend):
     """Backend that wraps existing Claude Code CLI / Make execution.
@@ -151,13 +227,8 @@ class ClaudeHarnessBackend(RunBackend):
             ),
         )
 
-        # Start execution in background thread
-        thread = threading.Thread(
-            target=self._execute_run,
-            args=(run_id, spec),
-            daemon=True,
-        )
-        thread.start()
+        # Queue execution on the shared bounded worker pool
+        self._submit(run_id, spec, self._execute_run)
 
         return run_id
 
@@ -320,14 +391,14 @@ class ClaudeHarnessBackend(RunBackend):
         return f"echo 'Flow {flow_key} would run here'"
 
     def get_summary(self, run_id: RunId) -> Optional[RunSummary]:
-        """Get summary from disk."""
-        return storage.read_summary(run_id)
+        """Get summary from disk, with live queue position if queued."""
+        return with_queue_state(storage.read_summary(run_id))
 
     def list_summaries(self) -> List[RunSummary]:
         """List all runs with summaries."""
         summaries: List[RunSummary] = []
         for rid in storage.list_runs():
-            summary = storage.read_summary(rid)
+            summary = with_queue_state(storage.read_summary(rid))
             if summary:
                 summaries.append(summary)
         return summaries
@@ -337,7 +408,9 @@ class ClaudeHarnessBackend(RunBackend):
         return storage.read_events(run_id)
 
     def cancel(self, run_id: RunId) -> bool:
-        """Cancel a running process."""
+        """Cancel a queued run or a running process."""
+        if self._cancel_queued(run_id):
+            return True
         with self._lock:
             process = self._running_processes.get(run_id)
             if process:
@@ -483,13 +556,8 @@ class GeminiCliBackend(RunBackend):
             ),
         )
 
-        # Start execution in background thread
-        thread = threading.Thread(
-            target=self._execute_run,
-            args=(run_id, spec),
-            daemon=True,
-        )
-        thread.start()
+        # Queue execution on the shared bounded worker pool
+        self._submit(run_id, spec, self._execute_run)
 
         return run_id
 
@@ -884,14 +952,14 @@ Be concise and focused on the task."""
         )
 
     def get_summary(self, run_id: RunId) -> Optional[RunSummary]:
-        """Get summary from disk."""
-        return storage.read_summary(run_id)
+        """Get summary from disk, with live queue position if queued."""
+        return with_queue_state(storage.read_summary(run_id))
 
     def list_summaries(self) -> List[RunSummary]:
         """List all runs with summaries."""
         summaries: List[RunSummary] = []
         for rid in storage.list_runs():
-            summary = storage.read_summary(rid)
+            summary = with_queue_state(storage.read_summary(rid))
             if summary:
                 summaries.append(summary)
         return summaries
@@ -901,7 +969,9 @@ Be concise and focused on the task."""
         return storage.read_events(run_id)
 
     def cancel(self, run_id: RunId) -> bool:
-        """Cancel a running process."""
+        """Cancel a queued run or a running process."""
+        if self._cancel_queued(run_id):
+            return True
         with self._lock:
             process = self._running_processes.get(run_id)
             if process:
@@ -952,6 +1022,9 @@ class GeminiStepwiseBackend(RunBackend):
         self._repo_root = repo_root or Path(__file__).resolve().parents[2]
         self._orchestrator: Optional[Any] = None  # Type: GeminiStepOrchestrator
         self._lock = threading.Lock()
+        # Admitted runs, and those with a pending cancel
+        self._active_runs: Set[RunId] = set()
+        self._canceled_runs: Set[RunId] = set()
 
     def _get_orchestrator(self) -> Any:
         """Lazy-initialize the orchestrator (thread-safe).
@@ -993,7 +1066,7 @@ class GeminiStepwiseBackend(RunBackend):
         - meta.json: Initial RunSummary with status=PENDING
         - events.jsonl: run_created event with stepwise=True
 
-        Asynchronous Work (background thread):
+        Asynchronous Work (RunScheduler worker, once admitted):
         - Actual step execution delegated to orchestrator
         - Status updates (RUNNING, SUCCEEDED, FAILED)
         - Poll get_summary() or get_events() to track progress
@@ -1032,13 +1105,8 @@ class GeminiStepwiseBackend(RunBackend):
             ),
         )
 
-        # Start orchestrator execution in background thread
-        thread = threading.Thread(
-            target=self._execute_stepwise,
-            args=(run_id, spec),
-            daemon=True,
-        )
-        thread.start()
+        # Queue orchestrator execution on the shared bounded worker pool
+        self._submit(run_id, spec, self._execute_stepwise)
 
         return run_id
 
@@ -1049,9 +1117,22 @@ class GeminiStepwiseBackend(RunBackend):
         GeminiStepOrchestrator for step-by-step execution.
         """
         orchestrator = self._get_orchestrator()
+        with self._lock:
+            self._active_runs.add(run_id)
+        try:
+            self._run_flows(orchestrator, run_id, spec)
+        finally:
+            orchestrator.clear_stop_request(run_id)
+            with self._lock:
+                self._active_runs.discard(run_id)
+                self._canceled_runs.discard(run_id)
 
+    def _run_flows(self, orchestrator: Any, run_id: RunId, spec: RunSpec) -> None:
+        """Drive each flow of the spec in turn; stops early on error or cancel."""
         # Execute each flow in the spec
         for flow_key in spec.flow_keys:
+            if run_id in self._canceled_runs:
+                return  # Canceled; cancel() already recorded the status
             try:
                 # Create RunState for this flow execution
                 run_state = RunState(
@@ -1095,6 +1176,9 @@ class GeminiStepwiseBackend(RunBackend):
                 )
                 return  # Exit on error
 
+        if run_id in self._canceled_runs:
+            return
+
         # All flows completed successfully - update status
         now = datetime.now(timezone.utc)
         storage.update_summary(
@@ -1108,14 +1192,14 @@ class GeminiStepwiseBackend(RunBackend):
         )
 
     def get_summary(self, run_id: RunId) -> Optional[RunSummary]:
-        """Get summary from disk."""
-        return storage.read_summary(run_id)
+        """Get summary from disk, with live queue position if queued."""
+        return with_queue_state(storage.read_summary(run_id))
 
     def list_summaries(self) -> List[RunSummary]:
         """List all runs with summaries."""
         summaries: List[RunSummary] = []
         for rid in storage.list_runs():
-            summary = storage.read_summary(rid)
+            summary = with_queue_state(storage.read_summary(rid))
             if summary:
                 summaries.append(summary)
         return summaries
@@ -1125,14 +1209,8 @@ class GeminiStepwiseBackend(RunBackend):
         return storage.read_events(run_id)
 
     def cancel(self, run_id: RunId) -> bool:
-        """Cancel a running stepwise execution.
-
-        Note: Currently returns False as the orchestrator does not yet
-        support mid-execution cancellation. The orchestrator would need
-        to track running state per run_id to support this.
-        """
-        # TODO: Implement cancellation by tracking orchestrator run state
-        return False
+        """Cancel a queued stepwise run, or stop a running one after its current step."""
+        return self._cancel_stepwise(run_id)
 
 
 class ClaudeStepwiseBackend(RunBackend):
@@ -1160,6 +1238,9 @@ class ClaudeStepwiseBackend(RunBackend):
         self._repo_root = repo_root or Path(__file__).resolve().parents[2]
         self._orchestrator: Optional[Any] = None
         self._lock = threading.Lock()
+        # Admitted runs, and those with a pending cancel
+        self._active_runs: Set[RunId] = set()
+        self._canceled_runs: Set[RunId] = set()
 
     def _get_orchestrator(self) -> Any:
         """Lazy-initialize the orchestrator with ClaudeStepEngine (thread-safe).
@@ -1205,7 +1286,7 @@ class ClaudeStepwiseBackend(RunBackend):
         - meta.json: Initial RunSummary with status=PENDING
         - events.jsonl: run_created event with stepwise=True
 
-        Asynchronous Work (background thread):
+        Asynchronous Work (RunScheduler worker, once admitted):
         - Actual step execution delegated to orchestrator
         - Status updates (RUNNING, SUCCEEDED, FAILED)
         - Poll get_summary() or get_events() to track progress
@@ -1248,13 +1329,8 @@ class ClaudeStepwiseBackend(RunBackend):
             ),
         )
 
-        # Start orchestrator execution in background thread
-        thread = threading.Thread(
-            target=self._execute_stepwise,
-            args=(run_id, spec),
-            daemon=True,
-        )
-        thread.start()
+        # Queue orchestrator execution on the shared bounded worker pool
+        self._submit(run_id, spec, self._execute_stepwise)
 
         return run_id
 
@@ -1265,9 +1341,22 @@ class ClaudeStepwiseBackend(RunBackend):
         orchestrator with ClaudeStepEngine for step-by-step execution.
         """
         orchestrator = self._get_orchestrator()
+        with self._lock:
+            self._active_runs.add(run_id)
+        try:
+            self._run_flows(orchestrator, run_id, spec)
+        finally:
+            orchestrator.clear_stop_request(run_id)
+            with self._lock:
+                self._active_runs.discard(run_id)
+                self._canceled_runs.discard(run_id)
 
+    def _run_flows(self, orchestrator: Any, run_id: RunId, spec: RunSpec) -> None:
+        """Drive each flow of the spec in turn; stops early on error or cancel."""
         # Execute each flow in the spec
         for flow_key in spec.flow_keys:
+            if run_id in self._canceled_runs:
+                return  # Canceled; cancel() already recorded the status
             try:
                 # Create RunState for this flow execution
                 run_state = RunState(
@@ -1311,6 +1400,9 @@ class ClaudeStepwiseBackend(RunBackend):
                 )
                 return  # Exit on error
 
+        if run_id in self._canceled_runs:
+            return
+
         # All flows completed successfully - update status
         now = datetime.now(timezone.utc)
         storage.update_summary(
@@ -1324,14 +1416,14 @@ class ClaudeStepwiseBackend(RunBackend):
         )
 
     def get_summary(self, run_id: RunId) -> Optional[RunSummary]:
-        """Get summary from disk."""
-        return storage.read_summary(run_id)
+        """Get summary from disk, with live queue position if queued."""
+        return with_queue_state(storage.read_summary(run_id))
 
     def list_summaries(self) -> List[RunSummary]:
         """List all runs with summaries."""
         summaries: List[RunSummary] = []
         for rid in storage.list_runs():
-            summary = storage.read_summary(rid)
+            summary = with_queue_state(storage.read_summary(rid))
             if summary:
                 summaries.append(summary)
         return summaries
@@ -1341,14 +1433,8 @@ class ClaudeStepwiseBackend(RunBackend):
         return storage.read_events(run_id)
 
     def cancel(self, run_id: RunId) -> bool:
-        """Cancel a running stepwise execution.
-
-        Note: Currently returns False as the orchestrator does not yet
-        support mid-execution cancellation. The orchestrator would need
-        to track running state per run_id to support this.
-        """
-        # TODO: Implement cancellation by tracking orchestrator run state
-        return False
+        """Cancel a queued stepwise run, or stop a running one after its current step."""
+        return self._cancel_stepwise(run_id)
 
 
 # Registry of available backends
@@ -6,6 +6,7 @@ This module provides a high-performance local database for storing:
 - Step execution telemetry
 - Tool call statistics
 - File change tracking
+- Per-step local resource usage
 
 Design Philosophy:
     - The orchestrator writes to events.jsonl (append-only, crash-safe)
@@ -28,15 +29,26 @@ Usage:
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import logging
 import os
+import re
+import tempfile
 import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import json_codec
+from .quantile_sketch import DurationSketch
 
 logger = logging.getLogger(__name__)
 
@@ -291,7 +303,36 @@ SCHEMA_VERSION = 2
 # 2. A fresh DB is created with the new version
 # 3. Data is rebuilt from events.jsonl (empty projection if no events exist)
 
-PROJECTION_VERSION = 2
+PROJECTION_VERSION = 6  # v6: step_resources without run_dir_bytes_written
+
+# Step statuses counted as failures in rollups
+ROLLUP_FAILURE_STATUSES = frozenset({"failed", "error"})
+
+# Dimensions accepted by get_step_rollup() / get_tool_rollup() group_by
+STEP_ROLLUP_DIMENSIONS = ("day", "flow_key", "station_id", "agent_key")
+TOOL_ROLLUP_DIMENSIONS = ("day", "tool_name", "phase")
+
+# Per-run tables moved to Parquet when a run is archived (see archive_cold_runs).
+# ingestion_state and the rollup tables stay hot.
+ARCHIVED_TABLES = (
+    "runs",
+    "steps",
+    "tool_calls",
+    "file_changes",
+    "events",
+    "facts",
+    "routing_decisions",
+    "step_resources",
+    "forensic_verdict_cache",
+)
+
+# Archive location next to the DB file; the dot keeps it out of run listings
+ARCHIVE_DIR_NAME = ".stats_archive"
+ARCHIVE_MANIFEST = "manifest.json"
+ARCHIVE_MANIFEST_VERSION = 1
+
+# Table references that read through <table>_all views for archived runs
+_ARCHIVED_TABLE_REF = re.compile(r"\b(FROM|JOIN)\s+(" + "|".join(ARCHIVED_TABLES) + r")\b")
 
 CREATE_TABLES_SQL = """
 -- Schema version tracking
@@ -463,6 +504,77 @@ CREATE INDEX IF NOT EXISTS idx_routing_decisions_run_id ON routing_decisions(run
 CREATE INDEX IF NOT EXISTS idx_routing_decisions_flow ON routing_decisions(run_id, flow_id);
 CREATE INDEX IF NOT EXISTS idx_routing_decisions_station ON routing_decisions(station_id);
 CREATE INDEX IF NOT EXISTS idx_routing_decisions_decision ON routing_decisions(decision);
+
+-- Step resources table: local cost of each step execution (step_resources
+-- events). db_ingest_ms is measured while this projection ingests the step's
+-- events, so it is re-measured (not replayed) on rebuild.
+CREATE TABLE IF NOT EXISTS step_resources (
+    run_id VARCHAR NOT NULL,
+    flow_key VARCHAR NOT NULL,
+    step_id VARCHAR NOT NULL,
+    iteration INTEGER NOT NULL DEFAULT 1,
+    step_index INTEGER,
+    timestamp TIMESTAMP,
+    cpu_ms DOUBLE DEFAULT 0,
+    subprocess_count INTEGER DEFAULT 0,
+    subprocess_cpu_ms DOUBLE DEFAULT 0,
+    subprocess_peak_rss_kb BIGINT DEFAULT 0,
+    git_commands INTEGER DEFAULT 0,
+    git_ms DOUBLE DEFAULT 0,
+    io_read_bytes BIGINT,
+    io_write_bytes BIGINT,
+    db_ingest_ms DOUBLE DEFAULT 0,
+    PRIMARY KEY (run_id, flow_key, step_id, iteration)
+);
+
+CREATE INDEX IF NOT EXISTS idx_step_resources_flow ON step_resources(flow_key, step_id);
+
+-- Forensic verdict cache table: lookup counters of each flow's verdict cache
+-- at run completion (forensic_verdict_cache in run_completed payloads).
+CREATE TABLE IF NOT EXISTS forensic_verdict_cache (
+    run_id VARCHAR NOT NULL,
+    flow_key VARCHAR NOT NULL,
+    timestamp TIMESTAMP,
+    hits INTEGER DEFAULT 0,
+    misses INTEGER DEFAULT 0,
+    stores INTEGER DEFAULT 0,
+    entries INTEGER DEFAULT 0,
+    hit_rate DOUBLE DEFAULT 0,
+    PRIMARY KEY (run_id, flow_key)
+);
+
+-- Cross-run rollups: maintained incrementally as steps and tool calls complete.
+-- One row per (day, flow, station, agent); duration_sketch is a mergeable
+-- DurationSketch (quantile_sketch.py) so p50/p95 can be computed over any slice.
+-- agent_key is '' when unknown (primary key columns cannot be NULL).
+CREATE TABLE IF NOT EXISTS rollup_steps_daily (
+    day DATE NOT NULL,
+    flow_key VARCHAR NOT NULL,
+    station_id VARCHAR NOT NULL,
+    agent_key VARCHAR NOT NULL,
+    step_count INTEGER DEFAULT 0,
+    succeeded_count INTEGER DEFAULT 0,
+    failed_count INTEGER DEFAULT 0,
+    total_duration_ms BIGINT DEFAULT 0,
+    max_duration_ms INTEGER DEFAULT 0,
+    total_tokens BIGINT DEFAULT 0,
+    duration_sketch JSON,
+    updated_at TIMESTAMP DEFAULT (now()),
+    PRIMARY KEY (day, flow_key, station_id, agent_key)
+);
+
+-- One row per (day, tool, phase); phase is '' when unknown.
+CREATE TABLE IF NOT EXISTS rollup_tools_daily (
+    day DATE NOT NULL,
+    tool_name VARCHAR NOT NULL,
+    phase VARCHAR NOT NULL,
+    call_count INTEGER DEFAULT 0,
+    success_count INTEGER DEFAULT 0,
+    total_duration_ms BIGINT DEFAULT 0,
+    duration_sketch JSON,
+    updated_at TIMESTAMP DEFAULT (now()),
+    PRIMARY KEY (day, tool_name, phase)
+);
 """
 
 
@@ -486,6 +598,8 @@ class RunStats:
     total_duration_ms: int
     tool_call_count: int = 0
     file_change_count: int = 0
+    # Forensic verdict cache hits / lookups over all flows; None if unused
+    verdict_cache_hit_rate: Optional[float] = None
 
 
 @dataclass
@@ -563,6 +677,305 @@ class RoutingDecisionRecord:
     explanation: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class StepResourceRecord:
+    """Local resource usage of one step execution (see resource_usage.py)."""
+
+    run_id: str
+    flow_key: str
+    step_id: str
+    iteration: int
+    step_index: Optional[int]
+    timestamp: Optional[datetime]
+    cpu_ms: float = 0.0
+    subprocess_count: int = 0
+    subprocess_cpu_ms: float = 0.0
+    subprocess_peak_rss_kb: int = 0
+    git_commands: int = 0
+    git_ms: float = 0.0
+    io_read_bytes: Optional[int] = None
+    io_write_bytes: Optional[int] = None
+    db_ingest_ms: float = 0.0
+
+
+@dataclass
+class VerdictCacheRecord:
+    """Forensic verdict cache counters of one flow at run completion."""
+
+    run_id: str
+    flow_key: str
+    timestamp: Optional[datetime]
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    entries: int = 0
+    hit_rate: float = 0.0
+
+
+# Counter columns of forensic_verdict_cache
+VERDICT_CACHE_FIELDS = ("hits", "misses", "stores", "entries", "hit_rate")
+
+
+# Columns of step_resources filled from step_resources event payloads
+STEP_RESOURCE_FIELDS = (
+    "cpu_ms",
+    "subprocess_count",
+    "subprocess_cpu_ms",
+    "subprocess_peak_rss_kb",
+    "git_commands",
+    "git_ms",
+    "io_read_bytes",
+    "io_write_bytes",
+)
+
+# I/O counters are unavailable on some platforms; NULL rather than 0 there
+NULLABLE_STEP_RESOURCE_FIELDS = frozenset({"io_read_bytes", "io_write_bytes"})
+
+
+def _rollup_day(ts: Any) -> Any:
+    """Return the UTC calendar day a rollup row is bucketed under."""
+    if isinstance(ts, datetime):
+        if ts.tzinfo is not None:
+            ts = ts.astimezone(timezone.utc)
+        return ts.date()
+    return datetime.now(timezone.utc).date()
+
+
+@dataclass
+class StepRollup:
+    """Aggregated step statistics for one group of the step rollup.
+
+    Attributes:
+        group: Values of the grouped dimensions (e.g. {"agent_key": "code-implementer"}).
+        step_count: Completed steps in the group.
+        succeeded_count: Steps that succeeded.
+        failed_count: Steps that failed.
+        total_duration_ms: Sum of step durations.
+        max_duration_ms: Longest step duration.
+        total_tokens: Sum of step tokens.
+        p50_duration_ms: Median step duration (sketch estimate).
+        p95_duration_ms: 95th percentile step duration (sketch estimate).
+    """
+
+    group: Dict[str, Any]
+    step_count: int
+    succeeded_count: int
+    failed_count: int
+    total_duration_ms: int
+    max_duration_ms: int
+    total_tokens: int
+    p50_duration_ms: Optional[float] = None
+    p95_duration_ms: Optional[float] = None
+
+    @property
+    def failure_rate(self) -> float:
+        """Fraction of completed steps that failed."""
+        return self.failed_count / self.step_count if self.step_count else 0.0
+
+    @property
+    def avg_duration_ms(self) -> float:
+        """Mean step duration."""
+        return self.total_duration_ms / self.step_count if self.step_count else 0.0
+
+
+@dataclass
+class ToolRollup:
+    """Aggregated tool call statistics for one group of the tool rollup.
+
+    Attributes:
+        group: Values of the grouped dimensions (e.g. {"day": date(2025, 1, 1)}).
+        call_count: Tool calls in the group.
+        success_count: Successful tool calls.
+        total_duration_ms: Sum of call durations.
+        p50_duration_ms: Median call duration (sketch estimate).
+        p95_duration_ms: 95th percentile call duration (sketch estimate).
+    """
+
+    group: Dict[str, Any]
+    call_count: int
+    success_count: int
+    total_duration_ms: int
+    p50_duration_ms: Optional[float] = None
+    p95_duration_ms: Optional[float] = None
+
+    @property
+    def success_rate(self) -> float:
+        """Fraction of tool calls that succeeded."""
+        return self.success_count / self.call_count if self.call_count else 0.0
+
+
+@dataclass
+class QueryCacheStats:
+    """Point-in-time metrics for the StatsDB query result cache.
+
+    Attributes:
+        hits: Queries answered from the cache.
+        misses: Queries executed against DuckDB.
+        entries: Cached results currently held.
+        capacity: Maximum cached results (0 = cache disabled).
+        saved_ms: Query time avoided by hits (cost of the original query).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+    capacity: int = 0
+    saved_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "entries": self.entries,
+            "capacity": self.capacity,
+            "saved_ms": round(self.saved_ms, 3),
+        }
+
+
+# Default number of cached query results (SWARM_DB_QUERY_CACHE_SIZE overrides)
+DEFAULT_QUERY_CACHE_SIZE = 1024
+
+
+def _cached_query(run_scoped: bool = True):
+    """Cache a StatsDB query method's result until its watermark advances.
+
+    Run-scoped queries take run_id as their first argument and are keyed by
+    that run's ingestion watermark, so results for finished runs stay cached
+    until evicted. Other queries are keyed by the global watermark, which
+    advances on every write.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            return self._cached_call(fn, run_scoped, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _rollup_dims(group_by: Sequence[str], allowed: Sequence[str]) -> List[str]:
+    """Validate rollup group_by dimensions (they are interpolated into SQL)."""
+    if isinstance(group_by, str):
+        group_by = (group_by,)
+    unknown = [d for d in group_by if d not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown rollup dimension(s) {unknown}; expected one of {list(allowed)}")
+    return list(group_by)
+
+
+def _rollup_filters(
+    since: Optional[Any], until: Optional[Any], **equals: Optional[str]
+) -> Tuple[str, List[Any]]:
+    """Build a WHERE clause for rollup queries. Filter column names are fixed by callers."""
+    conditions: List[str] = []
+    params: List[Any] = []
+    if since is not None:
+        conditions.append("day >= CAST(? AS DATE)")
+        params.append(str(since))
+    if until is not None:
+        conditions.append("day <= CAST(? AS DATE)")
+        params.append(str(until))
+    for column, value in equals.items():
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+    return ("WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+
+def _merge_sketches(serialized: Optional[List[Optional[str]]]) -> DurationSketch:
+    """Merge the duration sketches of several rollup rows."""
+    merged = DurationSketch()
+    for data in serialized or []:
+        if data:
+            merged.merge(DurationSketch.from_json(data))
+    return merged
+
+
+def _copy_result(value: Any) -> Any:
+    """Deep-copy a result so callers cannot mutate cached values or rows."""
+    return copy.deepcopy(value)
+
+
+@dataclass
+class ArchiveResult:
+    """Outcome of StatsDB.archive_cold_runs().
+
+    Attributes:
+        run_ids: Runs moved (or, in dry-run mode, eligible to move) to Parquet.
+        rows: Rows exported per table.
+        files: Parquet files written.
+        dry_run: True if nothing was written or deleted.
+    """
+
+    run_ids: List[str] = field(default_factory=list)
+    rows: Dict[str, int] = field(default_factory=dict)
+    files: List[str] = field(default_factory=list)
+    dry_run: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "run_ids": list(self.run_ids),
+            "rows": dict(self.rows),
+            "files": list(self.files),
+            "dry_run": self.dry_run,
+        }
+
+
+class _ReadCursorOwner:
+    """Per-thread handle whose collection closes that thread's read cursor."""
+
+
+def _close_quietly(cursor: Any) -> None:
+    """Close a cursor, ignoring errors (it may already be closed)."""
+    try:
+        cursor.close()
+    except Exception:
+        pass
+
+
+class _ArchiveCursor:
+    """Cursor wrapper that reads archived tables through their union views.
+
+    `FROM steps` / `JOIN steps` become `FROM steps_all` (hot rows plus the
+    Parquet archives) for every table in `views`. Everything else is
+    delegated to the wrapped cursor.
+    """
+
+    def __init__(self, cursor: Any, views: frozenset):
+        self._cursor = cursor
+        self._views = views
+
+    def _rewrite(self, match: "re.Match[str]") -> str:
+        if match.group(2) in self._views:
+            return f"{match.group(1)} {match.group(2)}_all"
+        return match.group(0)
+
+    def execute(self, sql: str, parameters: Optional[Sequence[Any]] = None) -> Any:
+        sql = _ARCHIVED_TABLE_REF.sub(self._rewrite, sql)
+        if parameters is None:
+            return self._cursor.execute(sql)
+        return self._cursor.execute(sql, parameters)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+
+def _sql_string(value: Any) -> str:
+    """Quote a value as a SQL string literal (COPY targets cannot be parameters)."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
 # =============================================================================
 # StatsDB Class
 # =============================================================================
@@ -575,8 +988,25 @@ class StatsDB:
     execution statistics. Supports concurrent writes from multiple
     step executions.
 
+    Reads and writes are split: ingestion and record_* calls share one
+    writer connection serialized by an RLock, while query methods run on
+    per-thread cursors of the same database. Each query method executes
+    inside its own read transaction, so it sees one committed snapshot and
+    never waits for ingestion to finish.
+
+    Query results are cached per (method, arguments) and keyed by an
+    ingestion watermark: a per-run counter that advances after every
+    committed write for that run (global for cross-run queries). A cached
+    result is served only while its watermark is unchanged.
+
+    Completed runs older than the hot retention window can be moved to
+    month-partitioned Parquet files (archive_cold_runs). Run-scoped queries
+    for an archived run read `<table>_all` views that union the hot table
+    with its archives, so callers see the same results before and after.
+
     Attributes:
         db_path: Path to the DuckDB database file.
+        archive_dir: Directory holding Parquet archives (None disables archiving).
         connection: Active DuckDB connection (lazy initialized).
     """
 
@@ -585,6 +1015,9 @@ class StatsDB:
         db_path: Optional[Path] = None,
         projection_only: Optional[bool] = None,
         projection_strict: Optional[bool] = None,
+        concurrent_reads: Optional[bool] = None,
+        query_cache_size: Optional[int] = None,
+        archive_dir: Optional[Path] = None,
     ):
         """Initialize the stats database.
 
@@ -594,10 +1027,32 @@ class StatsDB:
                 Defaults to SWARM_DB_PROJECTION_ONLY env var (default: true).
             projection_strict: If True, direct record_* calls raise RuntimeError.
                 Defaults to SWARM_DB_PROJECTION_STRICT env var (default: false).
+            concurrent_reads: If True, queries use per-thread read cursors
+                instead of the writer lock. Defaults to
+                SWARM_DB_CONCURRENT_READS env var (default: true).
+            query_cache_size: Maximum cached query results; 0 disables the
+                cache. Defaults to SWARM_DB_QUERY_CACHE_SIZE env var
+                (default: 1024).
+            archive_dir: Directory for Parquet archives of cold runs.
+                Defaults to .stats_archive/ next to db_path (in-memory
+                databases have no default).
         """
         self.db_path = db_path
+        if archive_dir is None and db_path is not None:
+            archive_dir = Path(db_path).parent / ARCHIVE_DIR_NAME
+        self.archive_dir = Path(archive_dir) if archive_dir is not None else None
+        # run_id -> manifest entry; replaced (never mutated) so readers need no lock
+        self._archived_runs: Dict[str, Dict[str, Any]] = {}
+        self._archive_views: frozenset = frozenset()
         self._connection = None
-        self._lock = threading.RLock()
+        self._lock = threading.RLock()  # Writer lock (ingestion + record_*)
+        self._read_local = threading.local()
+        # Thread owner -> read cursor; entries drop when their thread exits
+        self._read_cursors: "weakref.WeakKeyDictionary[_ReadCursorOwner, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._read_cursors_lock = threading.Lock()
+        self._read_generation = 0
         self._initialized = False
         self._version_checked = False
         self._needs_rebuild = False
@@ -611,8 +1066,36 @@ class StatsDB:
                 os.environ.get("SWARM_DB_PROJECTION_STRICT", "false").lower() == "true"
             )
 
+        if concurrent_reads is None:
+            concurrent_reads = (
+                os.environ.get("SWARM_DB_CONCURRENT_READS", "true").lower() == "true"
+            )
+
+        if query_cache_size is None:
+            try:
+                query_cache_size = int(
+                    os.environ.get("SWARM_DB_QUERY_CACHE_SIZE", DEFAULT_QUERY_CACHE_SIZE)
+                )
+            except ValueError:
+                query_cache_size = DEFAULT_QUERY_CACHE_SIZE
+
         self._projection_only = projection_only
         self._projection_strict = projection_strict
+        self._concurrent_reads = concurrent_reads
+
+        # Query result cache: key -> (watermark, result, cost_ms)
+        self._cache_lock = threading.Lock()
+        self._query_cache: "OrderedDict[Tuple[Any, ...], Tuple[Any, Any, float]]" = OrderedDict()
+        self._query_cache_size = max(0, query_cache_size)
+        self._cache_stats = QueryCacheStats(capacity=self._query_cache_size)
+        self._run_watermarks: Dict[str, int] = {}
+        self._global_watermark = 0
+
+        # Ingest time of step events not yet folded into a step_resources row,
+        # and the steps that have a row: keyed by (run_id, flow_key, step_id).
+        # Guarded by the writer lock.
+        self._pending_ingest_ms: Dict[Tuple[str, str, str], float] = {}
+        self._resource_steps: set = set()
 
     def _projection_guard(self, method_name: str) -> bool:
         """Check if direct projection writes are allowed.
@@ -708,6 +1191,8 @@ class StatsDB:
             # Set projection version (for schema resilience)
             _set_projection_version(self.connection, PROJECTION_VERSION)
 
+            self._load_archive()
+
             logger.debug(
                 "StatsDB schema initialized (schema_version=%d, projection_version=%d)",
                 SCHEMA_VERSION,
@@ -715,10 +1200,14 @@ class StatsDB:
             )
 
     @contextmanager
-    def _transaction(self) -> Iterator[Any]:
+    def _transaction(self, run_id: Optional[str] = None) -> Iterator[Any]:
         """Context manager for database operations.
 
         DuckDB auto-commits by default, so we just need locking for thread safety.
+
+        Args:
+            run_id: Run being written; its cache watermark advances once the
+                write has been committed.
         """
         if self.connection is None:
             yield None
@@ -730,13 +1219,230 @@ class StatsDB:
             except Exception as e:
                 logger.warning("Database operation failed: %s", e)
                 raise
+            finally:
+                if run_id is not None:
+                    self._advance_watermark(run_id)
+
+    def read_snapshot(
+        self, run_id: Optional[str] = None, include_archived: bool = False
+    ) -> ContextManager[Any]:
+        """Open a consistent read-only snapshot for ad-hoc queries.
+
+        For callers outside StatsDB (e.g. the event contract validator).
+        Yields a cursor, or None when the database is unavailable; archived
+        runs are read through their Parquet archives (see _read_snapshot).
+
+        Example:
+            >>> with db.read_snapshot(run_id) as conn:
+            ...     rows = conn.execute("SELECT * FROM events WHERE run_id = ?", [run_id])
+        """
+        return self._read_snapshot(run_id, include_archived)
+
+    @contextmanager
+    def _read_snapshot(
+        self, run_id: Optional[str] = None, include_archived: bool = False
+    ) -> Iterator[Any]:
+        """Context manager for read-only queries.
+
+        Yields a cursor owned by the calling thread, so queries run in
+        parallel with each other and with ingestion. Statements inside the
+        block share one read transaction and therefore one consistent
+        snapshot. Nested blocks reuse the outer transaction.
+
+        With concurrent reads disabled, falls back to the writer connection
+        under the writer lock.
+
+        Args:
+            run_id: Run being queried. If it has been archived, statements
+                read the hot + Parquet union views instead of the hot tables.
+            include_archived: Read the union views regardless of run_id.
+        """
+        if self.connection is None:
+            yield None
+            return
+
+        views = self._archive_views
+        if views and (include_archived or run_id in self._archived_runs):
+            with self._read_snapshot() as cursor:
+                yield _ArchiveCursor(cursor, views)
+            return
+
+        if not self._concurrent_reads:
+            with self._lock:
+                yield self.connection
+            return
+
+        local = self._read_local
+        cursor = getattr(local, "cursor", None)
+        if cursor is None or getattr(local, "generation", None) != self._read_generation:
+            with self._read_cursors_lock:
+                cursor = self.connection.cursor()
+                # The owner lives in this thread's local storage: when the
+                # thread exits it is collected and the cursor is closed
+                owner = _ReadCursorOwner()
+                weakref.finalize(owner, _close_quietly, cursor)
+                self._read_cursors[owner] = cursor
+                local.owner = owner
+                local.cursor = cursor
+                local.generation = self._read_generation
+                local.depth = 0
+
+        if local.depth:
+            local.depth += 1
+            try:
+                yield cursor
+            finally:
+                local.depth -= 1
+            return
+
+        cursor.execute("BEGIN TRANSACTION")
+        local.depth = 1
+        try:
+            yield cursor
+        finally:
+            local.depth = 0
+            try:
+                # Read-only transaction: nothing to commit
+                cursor.execute("ROLLBACK")
+            except Exception as e:
+                logger.debug("Failed to end read transaction: %s", e)
+
+    # =========================================================================
+    # Query Result Cache
+    # =========================================================================
+
+    def _advance_watermark(self, run_id: str) -> None:
+        """Invalidate cached results for a run (and cross-run queries).
+
+        Besides this instance's counters, the run's ingestion_state row is
+        touched so other StatsDB instances on the same file see the write
+        (see _persisted_watermark). Inside ingest_events the row is touched
+        once per batch, not per projected event. Caller holds the writer lock.
+        """
+        if self._connection is not None and not getattr(_ingestion_context, "active", False):
+            try:
+                self._connection.execute(
+                    """
+                    INSERT INTO ingestion_state (run_id, updated_at) VALUES (?, now())
+                    ON CONFLICT (run_id) DO UPDATE SET updated_at = excluded.updated_at
+                    """,
+                    [run_id],
+                )
+            except Exception as e:
+                logger.debug("Failed to touch ingestion_state for %s: %s", run_id, e)
+        with self._cache_lock:
+            self._run_watermarks[run_id] = self._run_watermarks.get(run_id, 0) + 1
+            self._global_watermark += 1
+
+    def _persisted_watermark(self, run_id: Optional[str]) -> Tuple[Any, ...]:
+        """Read the write watermark shared by every instance on this file.
+
+        Args:
+            run_id: Run whose ingestion_state row to read; None reads an
+                aggregate that changes on a write to any run.
+        """
+        with self._read_snapshot() as cursor:
+            if run_id is None:
+                row = cursor.execute(
+                    "SELECT COUNT(*), MAX(updated_at), SUM(last_seq) FROM ingestion_state"
+                ).fetchone()
+            else:
+                row = cursor.execute(
+                    "SELECT updated_at, last_seq FROM ingestion_state WHERE run_id = ?",
+                    [run_id],
+                ).fetchone()
+        return tuple(row) if row else ()
+
+    def _cached_call(
+        self,
+        fn: Any,
+        run_scoped: bool,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Serve a query from the cache or execute and cache it.
+
+        The watermark is read before the query runs. A write that commits
+        while the query executes advances the watermark, so a result that
+        might predate the write is never served for the new watermark.
+        Calls nested in an open read snapshot bypass the cache, since that
+        snapshot may be older than the current watermark.
+
+        The watermark pairs this instance's counter with the persisted
+        ingestion_state watermark, so writes made through another StatsDB
+        instance (e.g. the API tailer's) invalidate this instance's cache.
+        """
+        if (
+            self._query_cache_size <= 0
+            or self.connection is None
+            or getattr(self._read_local, "depth", 0)
+        ):
+            return fn(self, *args, **kwargs)
+
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments (e.g. a list group_by) are not cached
+            return fn(self, *args, **kwargs)
+        run_id = (args[0] if args else kwargs.get("run_id")) if run_scoped else None
+        try:
+            persisted = self._persisted_watermark(run_id)
+        except Exception as e:
+            logger.debug("Query cache bypassed, watermark unavailable: %s", e)
+            return fn(self, *args, **kwargs)
+        with self._cache_lock:
+            if run_scoped:
+                watermark = (self._run_watermarks.get(run_id, 0), persisted)
+            else:
+                watermark = (self._global_watermark, persisted)
+            cached = self._query_cache.get(key)
+            if cached is not None and cached[0] == watermark:
+                self._query_cache.move_to_end(key)
+                self._cache_stats.hits += 1
+                self._cache_stats.saved_ms += cached[2]
+                return _copy_result(cached[1])
+            self._cache_stats.misses += 1
+
+        start = time.perf_counter()
+        result = fn(self, *args, **kwargs)
+        cost_ms = (time.perf_counter() - start) * 1000
+
+        with self._cache_lock:
+            self._query_cache[key] = (watermark, result, cost_ms)
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self._query_cache_size:
+                self._query_cache.popitem(last=False)
+        return _copy_result(result)
+
+    def query_cache_stats(self) -> QueryCacheStats:
+        """Return a snapshot of query cache metrics."""
+        with self._cache_lock:
+            return QueryCacheStats(
+                hits=self._cache_stats.hits,
+                misses=self._cache_stats.misses,
+                entries=len(self._query_cache),
+                capacity=self._query_cache_size,
+                saved_ms=self._cache_stats.saved_ms,
+            )
+
+    def clear_query_cache(self) -> None:
+        """Drop all cached query results (metrics are kept)."""
+        with self._cache_lock:
+            self._query_cache.clear()
 
     def close(self):
-        """Close the database connection."""
+        """Close the database connection and all read cursors."""
         if self._connection is not None:
-            with self._lock:
+            with self._lock, self._read_cursors_lock:
+                for cursor in list(self._read_cursors.values()):
+                    _close_quietly(cursor)
+                self._read_cursors.clear()
+                self._read_generation += 1
                 self._connection.close()
                 self._connection = None
+            # The file may be replaced (e.g. projection rebuild) before reopening
+            self.clear_query_cache()
 
     # =========================================================================
     # Raw Event Storage (Idempotent)
@@ -757,12 +1463,12 @@ class StatsDB:
                     event.get("event_id"),
                     event.get("seq", 0),
                     event["run_id"],
-                    event["ts"],
+                    self._parse_event_ts(event["ts"]) or event["ts"],
                     event["kind"],
                     event["flow_key"],
                     event.get("step_id"),
                     event.get("agent_key"),
-                    json.dumps(event.get("payload", {})),
+                    json_codec.dumps(event.get("payload", {})),
                 ],
             )
             return len(result.fetchall()) > 0
@@ -798,6 +1504,7 @@ class StatsDB:
             """,
                 [run_id, offset, seq],
             )
+            self._advance_watermark(run_id)
 
     # =========================================================================
     # Write Operations
@@ -827,7 +1534,7 @@ class StatsDB:
             return
 
         started_at = ts if ts is not None else datetime.now(timezone.utc)
-        with self._transaction() as conn:
+        with self._transaction(run_id) as conn:
             conn.execute(
                 """
                 INSERT INTO runs (run_id, flow_keys, profile_id, engine_id, started_at, status, metadata)
@@ -837,7 +1544,7 @@ class StatsDB:
                     started_at = EXCLUDED.started_at,
                     status = 'running'
                 """,
-                [run_id, flow_keys, profile_id, engine_id, started_at, json.dumps(metadata or {})],
+                [run_id, flow_keys, profile_id, engine_id, started_at, json_codec.dumps(metadata or {})],
             )
 
     def record_run_end(
@@ -864,7 +1571,7 @@ class StatsDB:
             return
 
         completed_at = ts if ts is not None else datetime.now(timezone.utc)
-        with self._transaction() as conn:
+        with self._transaction(run_id) as conn:
             conn.execute(
                 """
                 UPDATE runs SET
@@ -910,7 +1617,7 @@ class StatsDB:
             return
 
         started_at = ts if ts is not None else datetime.now(timezone.utc)
-        with self._transaction() as conn:
+        with self._transaction(run_id) as conn:
             conn.execute(
                 """
                 INSERT INTO steps (run_id, flow_key, step_id, step_index, agent_key, started_at, status)
@@ -949,8 +1656,8 @@ class StatsDB:
             return
 
         completed_at = ts if ts is not None else datetime.now(timezone.utc)
-        with self._transaction() as conn:
-            conn.execute(
+        with self._transaction(run_id) as conn:
+            result = conn.execute(
                 """
                 UPDATE steps SET
                     completed_at = ?,
@@ -965,6 +1672,7 @@ class StatsDB:
                     routing_confidence = ?,
                     error_message = ?
                 WHERE run_id = ? AND flow_key = ? AND step_id = ? AND status = 'running'
+                RETURNING agent_key
                 """,
                 [
                     completed_at,
@@ -983,6 +1691,18 @@ class StatsDB:
                     step_id,
                 ],
             )
+            # Only steps that actually transitioned out of 'running' count
+            for (agent_key,) in result.fetchall():
+                self._update_step_rollup(
+                    conn,
+                    day=_rollup_day(completed_at),
+                    flow_key=flow_key,
+                    station_id=step_id,
+                    agent_key=agent_key,
+                    status=status,
+                    duration_ms=duration_ms,
+                    total_tokens=prompt_tokens + completion_tokens,
+                )
 
     def record_tool_call(
         self,
@@ -1013,7 +1733,7 @@ class StatsDB:
             return
 
         tool_ts = ts if ts is not None else datetime.now(timezone.utc)
-        with self._transaction() as conn:
+        with self._transaction(run_id) as conn:
             conn.execute(
                 """
                 INSERT INTO tool_calls (
@@ -1038,6 +1758,108 @@ class StatsDB:
                     error_message,
                 ],
             )
+            self._update_tool_rollup(
+                conn,
+                day=_rollup_day(tool_ts),
+                tool_name=tool_name,
+                phase=phase,
+                duration_ms=duration_ms,
+                success=success,
+            )
+
+    # =========================================================================
+    # Rollup Maintenance
+    # =========================================================================
+
+    def _update_step_rollup(
+        self,
+        conn: Any,
+        day: Any,
+        flow_key: str,
+        station_id: str,
+        agent_key: Optional[str],
+        status: str,
+        duration_ms: int,
+        total_tokens: int,
+    ) -> None:
+        """Fold one completed step into rollup_steps_daily. Caller holds the writer lock."""
+        key = [day, flow_key, station_id, agent_key or ""]
+        row = conn.execute(
+            """
+            SELECT duration_sketch FROM rollup_steps_daily
+            WHERE day = ? AND flow_key = ? AND station_id = ? AND agent_key = ?
+            """,
+            key,
+        ).fetchone()
+        sketch = DurationSketch.from_json(row[0] if row else None)
+        sketch.add(duration_ms or 0)
+
+        failed = 1 if status in ROLLUP_FAILURE_STATUSES else 0
+        succeeded = 1 if status == "succeeded" else 0
+        conn.execute(
+            """
+            INSERT INTO rollup_steps_daily (
+                day, flow_key, station_id, agent_key, step_count, succeeded_count,
+                failed_count, total_duration_ms, max_duration_ms, total_tokens,
+                duration_sketch, updated_at
+            ) VALUES (?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?, now())
+            ON CONFLICT (day, flow_key, station_id, agent_key) DO UPDATE SET
+                step_count = step_count + 1,
+                succeeded_count = succeeded_count + excluded.succeeded_count,
+                failed_count = failed_count + excluded.failed_count,
+                total_duration_ms = total_duration_ms + excluded.total_duration_ms,
+                max_duration_ms = greatest(max_duration_ms, excluded.max_duration_ms),
+                total_tokens = total_tokens + excluded.total_tokens,
+                duration_sketch = excluded.duration_sketch,
+                updated_at = excluded.updated_at
+            """,
+            key
+            + [
+                succeeded,
+                failed,
+                duration_ms or 0,
+                duration_ms or 0,
+                total_tokens or 0,
+                sketch.to_json(),
+            ],
+        )
+
+    def _update_tool_rollup(
+        self,
+        conn: Any,
+        day: Any,
+        tool_name: str,
+        phase: Optional[str],
+        duration_ms: int,
+        success: bool,
+    ) -> None:
+        """Fold one tool call into rollup_tools_daily. Caller holds the writer lock."""
+        key = [day, tool_name, phase or ""]
+        row = conn.execute(
+            """
+            SELECT duration_sketch FROM rollup_tools_daily
+            WHERE day = ? AND tool_name = ? AND phase = ?
+            """,
+            key,
+        ).fetchone()
+        sketch = DurationSketch.from_json(row[0] if row else None)
+        sketch.add(duration_ms or 0)
+
+        conn.execute(
+            """
+            INSERT INTO rollup_tools_daily (
+                day, tool_name, phase, call_count, success_count, total_duration_ms,
+                duration_sketch, updated_at
+            ) VALUES (?, ?, ?, 1, ?, ?, ?, now())
+            ON CONFLICT (day, tool_name, phase) DO UPDATE SET
+                call_count = call_count + 1,
+                success_count = success_count + excluded.success_count,
+                total_duration_ms = total_duration_ms + excluded.total_duration_ms,
+                duration_sketch = excluded.duration_sketch,
+                updated_at = excluded.updated_at
+            """,
+            key + [1 if success else 0, duration_ms or 0, sketch.to_json()],
+        )
 
     def record_file_change(
         self,
@@ -1063,7 +1885,7 @@ class StatsDB:
             return
 
         change_ts = ts if ts is not None else datetime.now(timezone.utc)
-        with self._transaction() as conn:
+        with self._transaction(run_id) as conn:
             conn.execute(
                 """
                 INSERT INTO file_changes (run_id, step_id, file_path, change_type, lines_added, lines_removed, timestamp)
@@ -1123,7 +1945,7 @@ class StatsDB:
             return
 
         decision_ts = ts if ts is not None else datetime.now(timezone.utc)
-        with self._transaction() as conn:
+        with self._transaction(run_id) as conn:
             conn.execute(
                 """
                 INSERT INTO routing_decisions (
@@ -1156,10 +1978,127 @@ class StatsDB:
                     decision_ts,
                     terminate,
                     needs_human,
-                    json.dumps(explanation) if explanation else None,
+                    json_codec.dumps(explanation) if explanation else None,
                 ],
             )
 
+    def record_step_resources(
+        self,
+        run_id: str,
+        flow_key: str,
+        step_id: str,
+        usage: Dict[str, Any],
+        iteration: int = 1,
+        step_index: Optional[int] = None,
+        db_ingest_ms: float = 0.0,
+        ts: Optional[datetime] = None,
+    ):
+        """Record the local resource usage of a step execution.
+
+        Note: In projection-only mode, this is a no-op. Use event emission
+        + ingest_events() instead.
+
+        Args:
+            usage: step_resources payload (StepResourceUsage.to_dict()).
+            iteration: Execution count of the step within the flow.
+            step_index: Step index in the flow.
+            db_ingest_ms: Ingest time of the step's events so far.
+            ts: Optional timestamp from event. If None, uses current time.
+        """
+        if self.connection is None:
+            return
+        if not self._projection_guard("record_step_resources"):
+            return
+
+        record_ts = ts if ts is not None else datetime.now(timezone.utc)
+        values = [
+            usage.get(name) if name in NULLABLE_STEP_RESOURCE_FIELDS else usage.get(name) or 0
+            for name in STEP_RESOURCE_FIELDS
+        ]
+        columns = ", ".join(STEP_RESOURCE_FIELDS)
+        placeholders = ", ".join("?" for _ in STEP_RESOURCE_FIELDS)
+        updates = ",\n                    ".join(
+            f"{name} = EXCLUDED.{name}" for name in STEP_RESOURCE_FIELDS
+        )
+        with self._transaction(run_id) as conn:
+            conn.execute(
+                f"""
+                INSERT INTO step_resources (
+                    run_id, flow_key, step_id, iteration, step_index, timestamp,
+                    {columns}, db_ingest_ms
+                ) VALUES (?, ?, ?, ?, ?, ?, {placeholders}, ?)
+                ON CONFLICT (run_id, flow_key, step_id, iteration) DO UPDATE SET
+                    step_index = EXCLUDED.step_index,
+                    timestamp = EXCLUDED.timestamp,
+                    {updates},
+                    db_ingest_ms = step_resources.db_ingest_ms + EXCLUDED.db_ingest_ms
+                """,
+                [run_id, flow_key, step_id, iteration, step_index, record_ts]
+                + values
+                + [db_ingest_ms],
+            )
+
+    def record_forensic_verdict_cache(
+        self,
+        run_id: str,
+        flow_key: str,
+        stats: Dict[str, Any],
+        ts: Optional[datetime] = None,
+    ):
+        """Record a flow's forensic verdict cache counters.
+
+        Note: In projection-only mode, this is a no-op. Use event emission
+        + ingest_events() instead.
+
+        Args:
+            stats: ForensicVerdictCache.stats() from the run_completed payload.
+            ts: Optional timestamp from event. If None, uses current time.
+        """
+        if self.connection is None:
+            return
+        if not self._projection_guard("record_forensic_verdict_cache"):
+            return
+
+        record_ts = ts if ts is not None else datetime.now(timezone.utc)
+        values = [stats.get(name) or 0 for name in VERDICT_CACHE_FIELDS]
+        updates = ",\n                    ".join(
+            f"{name} = EXCLUDED.{name}" for name in VERDICT_CACHE_FIELDS
+        )
+        with self._transaction(run_id) as conn:
+            conn.execute(
+                f"""
+                INSERT INTO forensic_verdict_cache (
+                    run_id, flow_key, timestamp, {", ".join(VERDICT_CACHE_FIELDS)}
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (run_id, flow_key) DO UPDATE SET
+                    timestamp = EXCLUDED.timestamp,
+                    {updates}
+                """,
+                [run_id, flow_key, record_ts] + values,
+            )
+
+    def _flush_ingest_time(self, run_id: str) -> None:
+        """Add pending ingest time to the latest step_resources row of each step.
+
+        Time for steps without a row yet stays pending until the step's
+        step_resources event is ingested.
+        """
+        pending = [key for key in self._pending_ingest_ms if key in self._resource_steps]
+        if not pending:
+            return
+        with self._transaction(run_id) as conn:
+            for key in pending:
+                conn.execute(
+                    """
+                    UPDATE step_resources SET db_ingest_ms = db_ingest_ms + ?
+                    WHERE run_id = ? AND flow_key = ? AND step_id = ? AND iteration = (
+                        SELECT MAX(iteration) FROM step_resources
+                        WHERE run_id = ? AND flow_key = ? AND step_id = ?
+                    )
+                    """,
+                    [self._pending_ingest_ms.pop(key), *key, *key],
+                )
+
     def ingest_fact(
         self,
         run_id: str,
@@ -1214,7 +2153,7 @@ class StatsDB:
         fact_id = f"fact_{uuid.uuid4().hex[:12]}"
         extracted_at = ts if ts is not None else datetime.now(timezone.utc)
 
-        with self._transaction() as conn:
+        with self._transaction(run_id) as conn:
             try:
                 conn.execute(
                     """
@@ -1246,7 +2185,7 @@ class StatsDB:
                         evidence,
                         created_at,
                         extracted_at,
-                        json.dumps(metadata or {}),
+                        json_codec.dumps(metadata or {}),
                     ],
                 )
                 return fact_id
@@ -1278,12 +2217,24 @@ class StatsDB:
         if self.connection is None:
             return 0
 
-        # Set ingestion context to allow record_* calls
-        _ingestion_context.active = True
-        try:
-            return self._ingest_events_internal(events, run_id)
-        finally:
-            _ingestion_context.active = False
+        if run_id in self._archived_runs:
+            # Archived runs live in Parquet; replaying their events would
+            # resurrect hot rows alongside the archive.
+            logger.debug("Skipping ingestion for archived run %s", run_id)
+            return 0
+
+        # Set ingestion context to allow record_* calls. The writer lock is
+        # held for the whole batch so concurrent ingestions do not interleave.
+        with self._lock:
+            _ingestion_context.active = True
+            try:
+                ingested = self._ingest_events_internal(events, run_id)
+                self._flush_ingest_time(run_id)
+                return ingested
+            finally:
+                _ingestion_context.active = False
+                # Raw events table changed even if no projection was touched
+                self._advance_watermark(run_id)
 
     def _parse_event_ts(self, ts_str: Any) -> Optional[datetime]:
         """Parse event timestamp string to datetime.
@@ -1302,9 +2253,10 @@ class StatsDB:
             return None
 
         try:
-            # Handle ISO format with or without timezone
+            # Handle ISO format with or without timezone. Aware datetimes are
+            # serialized as "+00:00Z", so drop the Z rather than replacing it.
             if ts_str.endswith("Z"):
-                ts_str = ts_str[:-1] + "+00:00"
+                ts_str = ts_str[:-1]
             dt = datetime.fromisoformat(ts_str)
             # Ensure UTC timezone
             if dt.tzinfo is None:
@@ -1318,6 +2270,8 @@ class StatsDB:
         newly_ingested = 0
 
         for event in events:
+            ingest_start = time.perf_counter()
+
             # Ensure run_id is set on the event for raw storage
             event_with_run = {**event, "run_id": run_id}
 
@@ -1449,6 +2403,20 @@ class StatsDB:
                     ts=event_ts,
                 )
 
+            elif kind == "step_resources":
+                # Local resource usage measured around the step
+                self.record_step_resources(
+                    run_id=run_id,
+                    flow_key=flow_key,
+                    step_id=step_id,
+                    usage=payload,
+                    iteration=payload.get("iteration") or 1,
+                    step_index=payload.get("step_index"),
+                    db_ingest_ms=self._pending_ingest_ms.pop((run_id, flow_key, step_id), 0.0),
+                    ts=event_ts,
+                )
+                self._resource_steps.add((run_id, flow_key, step_id))
+
             elif kind == "run_started":  # Canonical: run_start -> run_started
                 # Run initialization
                 flow_keys = payload.get("flow_keys", [])
@@ -1472,6 +2440,24 @@ class StatsDB:
                     total_duration_ms=payload.get("duration_ms", 0),
                     ts=event_ts,
                 )
+                verdict_cache = payload.get("forensic_verdict_cache")
+                if verdict_cache:
+                    self.record_forensic_verdict_cache(
+                        run_id=run_id,
+                        flow_key=flow_key,
+                        stats=verdict_cache,
+                        ts=event_ts,
+                    )
+                # Drop ingest time of steps that never reported resources
+                for key in [k for k in self._pending_ingest_ms if k[0] == run_id]:
+                    del self._pending_ingest_ms[key]
+                self._resource_steps = {k for k in self._resource_steps if k[0] != run_id}
+
+            if step_id:
+                # DuckDB cost of projecting this event, charged to its step
+                key = (run_id, flow_key, step_id)
+                ingest_ms = (time.perf_counter() - ingest_start) * 1000
+                self._pending_ingest_ms[key] = self._pending_ingest_ms.get(key, 0.0) + ingest_ms
 
         return newly_ingested
 
@@ -1479,13 +2465,14 @@ class StatsDB:
     # Query Operations (for TypeScript UI)
     # =========================================================================
 
+    @_cached_query()
     def get_run_stats(self, run_id: str) -> Optional[RunStats]:
         """Get aggregated statistics for a run."""
         if self.connection is None:
             return None
 
-        with self._lock:
-            result = self.connection.execute(
+        with self._read_snapshot(run_id) as conn:
+            result = conn.execute(
                 """
                 SELECT
                     r.run_id,
@@ -1498,7 +2485,11 @@ class StatsDB:
                     r.total_tokens,
                     r.total_duration_ms,
                     (SELECT COUNT(*) FROM tool_calls WHERE run_id = r.run_id) as tool_call_count,
-                    (SELECT COUNT(*) FROM file_changes WHERE run_id = r.run_id) as file_change_count
+                    (SELECT COUNT(*) FROM file_changes WHERE run_id = r.run_id) as file_change_count,
+                    (
+                        SELECT SUM(hits) / NULLIF(SUM(hits + misses), 0)
+                        FROM forensic_verdict_cache WHERE run_id = r.run_id
+                    ) as verdict_cache_hit_rate
                 FROM runs r
                 WHERE r.run_id = ?
                 """,
@@ -1520,15 +2511,19 @@ class StatsDB:
                 total_duration_ms=result[8] or 0,
                 tool_call_count=result[9] or 0,
                 file_change_count=result[10] or 0,
+                verdict_cache_hit_rate=(
+                    round(result[11], 4) if result[11] is not None else None
+                ),
             )
 
+    @_cached_query()
     def get_step_stats(self, run_id: str) -> List[StepStats]:
         """Get statistics for all steps in a run."""
         if self.connection is None:
             return []
 
-        with self._lock:
-            results = self.connection.execute(
+        with self._read_snapshot(run_id) as conn:
+            results = conn.execute(
                 """
                 SELECT
                     s.step_id,
@@ -1562,13 +2557,14 @@ class StatsDB:
                 for row in results
             ]
 
+    @_cached_query()
     def get_tool_breakdown(self, run_id: str) -> List[ToolBreakdown]:
         """Get breakdown of tool usage for a run."""
         if self.connection is None:
             return []
 
-        with self._lock:
-            results = self.connection.execute(
+        with self._read_snapshot(run_id) as conn:
+            results = conn.execute(
                 """
                 SELECT
                     tool_name,
@@ -1595,13 +2591,19 @@ class StatsDB:
                 for row in results
             ]
 
-    def get_recent_runs(self, limit: int = 20) -> List[RunStats]:
-        """Get recent runs for the UI dashboard."""
+    @_cached_query(run_scoped=False)
+    def get_recent_runs(self, limit: int = 20, include_archived: bool = False) -> List[RunStats]:
+        """Get recent runs for the UI dashboard.
+
+        Args:
+            limit: Maximum number of runs, newest first.
+            include_archived: Also consider runs moved to Parquet archives.
+        """
         if self.connection is None:
             return []
 
-        with self._lock:
-            results = self.connection.execute(
+        with self._read_snapshot(include_archived=include_archived) as conn:
+            results = conn.execute(
                 """
                 SELECT
                     r.run_id,
@@ -1639,13 +2641,14 @@ class StatsDB:
                 for row in results
             ]
 
+    @_cached_query()
     def get_file_changes(self, run_id: str) -> List[Dict[str, Any]]:
         """Get file changes for a run."""
         if self.connection is None:
             return []
 
-        with self._lock:
-            results = self.connection.execute(
+        with self._read_snapshot(run_id) as conn:
+            results = conn.execute(
                 """
                 SELECT file_path, change_type, lines_added, lines_removed, step_id, timestamp
                 FROM file_changes
@@ -1667,6 +2670,7 @@ class StatsDB:
                 for row in results
             ]
 
+    @_cached_query()
     def get_facts_for_run(self, run_id: str) -> List[Fact]:
         """Get all facts extracted for a run.
 
@@ -1679,8 +2683,8 @@ class StatsDB:
         if self.connection is None:
             return []
 
-        with self._lock:
-            results = self.connection.execute(
+        with self._read_snapshot(run_id) as conn:
+            results = conn.execute(
                 """
                 SELECT
                     fact_id, run_id, step_id, flow_key, agent_key,
@@ -1709,11 +2713,12 @@ class StatsDB:
                     evidence=row[11],
                     created_at=row[12],
                     extracted_at=row[13],
-                    metadata=json.loads(row[14]) if row[14] else {},
+                    metadata=json_codec.loads(row[14]) if row[14] else {},
                 )
                 for row in results
             ]
 
+    @_cached_query()
     def get_facts_by_marker_type(self, run_id: str, marker_type: str) -> List[Fact]:
         """Get facts for a run filtered by marker type.
 
@@ -1727,8 +2732,8 @@ class StatsDB:
         if self.connection is None:
             return []
 
-        with self._lock:
-            results = self.connection.execute(
+        with self._read_snapshot(run_id) as conn:
+            results = conn.execute(
                 """
                 SELECT
                     fact_id, run_id, step_id, flow_key, agent_key,
@@ -1757,11 +2762,12 @@ class StatsDB:
                     evidence=row[11],
                     created_at=row[12],
                     extracted_at=row[13],
-                    metadata=json.loads(row[14]) if row[14] else {},
+                    metadata=json_codec.loads(row[14]) if row[14] else {},
                 )
                 for row in results
             ]
 
+    @_cached_query()
     def get_routing_decisions(self, run_id: str) -> List[RoutingDecisionRecord]:
         """Get all routing decisions for a run.
 
@@ -1774,8 +2780,8 @@ class StatsDB:
         if self.connection is None:
             return []
 
-        with self._lock:
-            results = self.connection.execute(
+        with self._read_snapshot(run_id) as conn:
+            results = conn.execute(
                 """
                 SELECT
                     run_id, step_seq, flow_id, station_id, routing_mode, routing_source,
@@ -1803,11 +2809,12 @@ class StatsDB:
                     timestamp=row[10],
                     terminate=row[11] or False,
                     needs_human=row[12] or False,
-                    explanation=json.loads(row[13]) if row[13] else None,
+                    explanation=json_codec.loads(row[13]) if row[13] else None,
                 )
                 for row in results
             ]
 
+    @_cached_query()
     def get_routing_decisions_by_flow(
         self, run_id: str, flow_id: str
     ) -> List[RoutingDecisionRecord]:
@@ -1823,8 +2830,8 @@ class StatsDB:
         if self.connection is None:
             return []
 
-        with self._lock:
-            results = self.connection.execute(
+        with self._read_snapshot(run_id) as conn:
+            results = conn.execute(
                 """
                 SELECT
                     run_id, step_seq, flow_id, station_id, routing_mode, routing_source,
@@ -1852,11 +2859,88 @@ class StatsDB:
                     timestamp=row[10],
                     terminate=row[11] or False,
                     needs_human=row[12] or False,
-                    explanation=json.loads(row[13]) if row[13] else None,
+                    explanation=json_codec.loads(row[13]) if row[13] else None,
+                )
+                for row in results
+            ]
+
+    @_cached_query()
+    def get_step_resources(
+        self, run_id: str, flow_key: Optional[str] = None
+    ) -> List[StepResourceRecord]:
+        """Get per-step resource usage for a run.
+
+        Args:
+            run_id: The run ID to query.
+            flow_key: Only return steps of this flow.
+
+        Returns:
+            List of StepResourceRecord in execution order.
+        """
+        if self.connection is None:
+            return []
+
+        sql = f"""
+            SELECT
+                run_id, flow_key, step_id, iteration, step_index, timestamp,
+                {", ".join(STEP_RESOURCE_FIELDS)}, db_ingest_ms
+            FROM step_resources
+            WHERE run_id = ?{" AND flow_key = ?" if flow_key else ""}
+            ORDER BY timestamp, step_index, iteration
+        """
+        params = [run_id, flow_key] if flow_key else [run_id]
+        with self._read_snapshot(run_id) as conn:
+            results = conn.execute(sql, params).fetchall()
+
+            return [
+                StepResourceRecord(
+                    run_id=row[0],
+                    flow_key=row[1],
+                    step_id=row[2],
+                    iteration=row[3],
+                    step_index=row[4],
+                    timestamp=row[5],
+                    **dict(zip(STEP_RESOURCE_FIELDS, row[6:-1])),
+                    db_ingest_ms=row[-1] or 0.0,
+                )
+                for row in results
+            ]
+
+    @_cached_query()
+    def get_forensic_verdict_cache_stats(self, run_id: str) -> List[VerdictCacheRecord]:
+        """Get the forensic verdict cache counters of each flow of a run.
+
+        Args:
+            run_id: The run ID to query.
+
+        Returns:
+            List of VerdictCacheRecord ordered by flow completion.
+        """
+        if self.connection is None:
+            return []
+
+        with self._read_snapshot(run_id) as conn:
+            results = conn.execute(
+                f"""
+                SELECT run_id, flow_key, timestamp, {", ".join(VERDICT_CACHE_FIELDS)}
+                FROM forensic_verdict_cache
+                WHERE run_id = ?
+                ORDER BY timestamp, flow_key
+                """,
+                [run_id],
+            ).fetchall()
+
+            return [
+                VerdictCacheRecord(
+                    run_id=row[0],
+                    flow_key=row[1],
+                    timestamp=row[2],
+                    **dict(zip(VERDICT_CACHE_FIELDS, row[3:])),
                 )
                 for row in results
             ]
 
+    @_cached_query()
     def get_routing_decision_summary(self, run_id: str) -> Dict[str, Any]:
         """Get a summary of routing decisions for a run.
 
@@ -1884,15 +2968,15 @@ class StatsDB:
                 "terminations": 0,
             }
 
-        with self._lock:
+        with self._read_snapshot(run_id) as conn:
             # Get total and by-decision counts
-            total_result = self.connection.execute(
+            total_result = conn.execute(
                 "SELECT COUNT(*) FROM routing_decisions WHERE run_id = ?",
                 [run_id],
             ).fetchone()
             total_decisions = total_result[0] if total_result else 0
 
-            decision_counts = self.connection.execute(
+            decision_counts = conn.execute(
                 """
                 SELECT decision, COUNT(*) as count
                 FROM routing_decisions
@@ -1903,7 +2987,7 @@ class StatsDB:
             ).fetchall()
             by_decision = {row[0]: row[1] for row in decision_counts}
 
-            mode_counts = self.connection.execute(
+            mode_counts = conn.execute(
                 """
                 SELECT routing_mode, COUNT(*) as count
                 FROM routing_decisions
@@ -1914,7 +2998,7 @@ class StatsDB:
             ).fetchall()
             by_routing_mode = {row[0]: row[1] for row in mode_counts}
 
-            source_counts = self.connection.execute(
+            source_counts = conn.execute(
                 """
                 SELECT routing_source, COUNT(*) as count
                 FROM routing_decisions
@@ -1925,13 +3009,13 @@ class StatsDB:
             ).fetchall()
             by_routing_source = {row[0]: row[1] for row in source_counts}
 
-            needs_human_result = self.connection.execute(
+            needs_human_result = conn.execute(
                 "SELECT COUNT(*) FROM routing_decisions WHERE run_id = ? AND needs_human = TRUE",
                 [run_id],
             ).fetchone()
             needs_human_count = needs_human_result[0] if needs_human_result else 0
 
-            terminate_result = self.connection.execute(
+            terminate_result = conn.execute(
                 "SELECT COUNT(*) FROM routing_decisions WHERE run_id = ? AND terminate = TRUE",
                 [run_id],
             ).fetchone()
@@ -1946,6 +3030,410 @@ class StatsDB:
                 "terminations": terminations,
             }
 
+    # =========================================================================
+    # Cross-Run Rollup Queries
+    # =========================================================================
+
+    @_cached_query(run_scoped=False)
+    def get_step_rollup(
+        self,
+        group_by: Sequence[str] = ("agent_key",),
+        since: Optional[Any] = None,
+        until: Optional[Any] = None,
+        flow_key: Optional[str] = None,
+        station_id: Optional[str] = None,
+        agent_key: Optional[str] = None,
+    ) -> List[StepRollup]:
+        """Aggregate completed steps across runs from rollup_steps_daily.
+
+        Answers questions such as per-agent p95 duration or failure rate by
+        station without scanning the steps table.
+
+        Args:
+            group_by: Dimensions to group by, from STEP_ROLLUP_DIMENSIONS
+                (day, flow_key, station_id, agent_key). Empty for a grand total.
+            since: Earliest day to include (date or ISO string), inclusive.
+            until: Latest day to include (date or ISO string), inclusive.
+            flow_key: Only include this flow.
+            station_id: Only include this station (step id).
+            agent_key: Only include this agent.
+
+        Returns:
+            One StepRollup per group, ordered by the group values.
+
+        Raises:
+            ValueError: If group_by contains an unknown dimension.
+        """
+        dims = _rollup_dims(group_by, STEP_ROLLUP_DIMENSIONS)
+        where, params = _rollup_filters(
+            since, until, flow_key=flow_key, station_id=station_id, agent_key=agent_key
+        )
+        select_dims = "".join(f"{d}, " for d in dims)
+        group_clause = f"GROUP BY {', '.join(dims)} ORDER BY {', '.join(dims)}" if dims else ""
+
+        with self._read_snapshot() as conn:
+            if conn is None:
+                return []
+            rows = conn.execute(
+                f"""
+                SELECT {select_dims}
+                    SUM(step_count), SUM(succeeded_count), SUM(failed_count),
+                    SUM(total_duration_ms), MAX(max_duration_ms), SUM(total_tokens),
+                    LIST(duration_sketch)
+                FROM rollup_steps_daily
+                {where}
+                {group_clause}
+                """,
+                params,
+            ).fetchall()
+
+        results = []
+        for row in rows:
+            values = row[len(dims) :]
+            if not values[0]:
+                continue  # Grand total over an empty slice
+            sketch = _merge_sketches(values[6])
+            results.append(
+                StepRollup(
+                    group=dict(zip(dims, row[: len(dims)])),
+                    step_count=int(values[0]),
+                    succeeded_count=int(values[1] or 0),
+                    failed_count=int(values[2] or 0),
+                    total_duration_ms=int(values[3] or 0),
+                    max_duration_ms=int(values[4] or 0),
+                    total_tokens=int(values[5] or 0),
+                    p50_duration_ms=sketch.quantile(0.5),
+                    p95_duration_ms=sketch.quantile(0.95),
+                )
+            )
+        return results
+
+    @_cached_query(run_scoped=False)
+    def get_tool_rollup(
+        self,
+        group_by: Sequence[str] = ("day",),
+        since: Optional[Any] = None,
+        until: Optional[Any] = None,
+        tool_name: Optional[str] = None,
+        phase: Optional[str] = None,
+    ) -> List[ToolRollup]:
+        """Aggregate tool calls across runs from rollup_tools_daily.
+
+        Answers questions such as tool-call volume per day without scanning
+        the tool_calls table.
+
+        Args:
+            group_by: Dimensions to group by, from TOOL_ROLLUP_DIMENSIONS
+                (day, tool_name, phase). Empty for a grand total.
+            since: Earliest day to include (date or ISO string), inclusive.
+            until: Latest day to include (date or ISO string), inclusive.
+            tool_name: Only include this tool.
+            phase: Only include this phase.
+
+        Returns:
+            One ToolRollup per group, ordered by the group values.
+
+        Raises:
+            ValueError: If group_by contains an unknown dimension.
+        """
+        dims = _rollup_dims(group_by, TOOL_ROLLUP_DIMENSIONS)
+        where, params = _rollup_filters(since, until, tool_name=tool_name, phase=phase)
+        select_dims = "".join(f"{d}, " for d in dims)
+        group_clause = f"GROUP BY {', '.join(dims)} ORDER BY {', '.join(dims)}" if dims else ""
+
+        with self._read_snapshot() as conn:
+            if conn is None:
+                return []
+            rows = conn.execute(
+                f"""
+                SELECT {select_dims}
+                    SUM(call_count), SUM(success_count), SUM(total_duration_ms),
+                    LIST(duration_sketch)
+                FROM rollup_tools_daily
+                {where}
+                {group_clause}
+                """,
+                params,
+            ).fetchall()
+
+        results = []
+        for row in rows:
+            values = row[len(dims) :]
+            if not values[0]:
+                continue
+            sketch = _merge_sketches(values[3])
+            results.append(
+                ToolRollup(
+                    group=dict(zip(dims, row[: len(dims)])),
+                    call_count=int(values[0]),
+                    success_count=int(values[1] or 0),
+                    total_duration_ms=int(values[2] or 0),
+                    p50_duration_ms=sketch.quantile(0.5),
+                    p95_duration_ms=sketch.quantile(0.95),
+                )
+            )
+        return results
+
+    # =========================================================================
+    # Retention: Parquet Archives for Cold Runs
+    # =========================================================================
+
+    def is_archived(self, run_id: str) -> bool:
+        """Check whether a run's projection has been moved to Parquet."""
+        if self.connection is None:
+            return False
+        return run_id in self._archived_runs
+
+    def archived_run_count(self) -> int:
+        """Number of runs held in Parquet archives."""
+        if self.connection is None:
+            return 0
+        return len(self._archived_runs)
+
+    def archive_cold_runs(
+        self,
+        older_than_days: Optional[int] = None,
+        run_ids: Optional[List[str]] = None,
+        dry_run: bool = False,
+    ) -> ArchiveResult:
+        """Move cold runs out of the hot database into Parquet archives.
+
+        A run is cold once it is no longer running and finished (or started,
+        if it never finished) more than `older_than_days` ago. Its rows in
+        every per-run table are written to
+        `<archive_dir>/<table>/month=<YYYY-MM>/run_id=<run_id>/<archive_id>_<uuid>.parquet`
+        (hive-partitioned by the run's start month and run id, so a query
+        for one archived run only reads that run's files) and then deleted
+        from the hot tables. Rollups and ingestion offsets stay in the hot database,
+        so cross-run dashboards are unaffected and the tailer does not
+        re-read archived runs.
+
+        Queries for an archived run keep working through the union views;
+        ingest_events() and rebuild_from_events() skip archived runs.
+
+        Args:
+            older_than_days: Hot retention window. Defaults to
+                get_projection_hot_retention_days() when run_ids is not given.
+            run_ids: Archive these runs (if not running) regardless of age.
+            dry_run: Only report which runs would be archived.
+
+        Returns:
+            ArchiveResult describing the archived runs and written files.
+        """
+        result = ArchiveResult(dry_run=dry_run)
+        if self.connection is None or self.archive_dir is None:
+            return result
+
+        if older_than_days is None and run_ids is None:
+            from swarm.config.runs_retention_config import get_projection_hot_retention_days
+
+            older_than_days = get_projection_hot_retention_days()
+            if older_than_days is None:
+                return result
+
+        conditions = ["status IS NOT NULL", "status != 'running'"]
+        params: List[Any] = []
+        if older_than_days is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+            conditions.append("COALESCE(completed_at, started_at) < ?")
+            params.append(cutoff.replace(tzinfo=None))
+        if run_ids is not None:
+            conditions.append("run_id IN (SELECT unnest(?::VARCHAR[]))")
+            params.append(list(run_ids))
+
+        with self._lock:
+            conn = self.connection
+            candidates = conn.execute(
+                f"""
+                SELECT run_id, strftime(COALESCE(started_at, completed_at, now()), '%Y-%m')
+                FROM runs
+                WHERE {" AND ".join(conditions)}
+                ORDER BY run_id
+                """,
+                params,
+            ).fetchall()
+            result.run_ids = [row[0] for row in candidates]
+            if not candidates or dry_run:
+                return result
+
+            partitions = {run_id: month for run_id, month in candidates}
+            archive_id = (
+                datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S") + "-" + uuid.uuid4().hex[:8]
+            )
+            conn.execute(
+                "CREATE OR REPLACE TEMP TABLE _archive_batch AS "
+                "SELECT unnest(?::VARCHAR[]) AS run_id, unnest(?::VARCHAR[]) AS month",
+                [list(partitions), list(partitions.values())],
+            )
+
+            written: List[Path] = []
+            try:
+                for table in ARCHIVED_TABLES:
+                    count = conn.execute(
+                        f"SELECT COUNT(*) FROM {table} "
+                        "WHERE run_id IN (SELECT run_id FROM _archive_batch)"
+                    ).fetchone()[0]
+                    if not count:
+                        continue
+                    # month and run_id become directory names, not file columns
+                    table_dir = self.archive_dir / table
+                    table_dir.mkdir(parents=True, exist_ok=True)
+                    conn.execute(
+                        f"""
+                        COPY (
+                            SELECT t.*, b.month FROM {table} t JOIN _archive_batch b USING (run_id)
+                        ) TO {_sql_string(table_dir)} (
+                            FORMAT PARQUET,
+                            PARTITION_BY (month, run_id),
+                            FILENAME_PATTERN {_sql_string(archive_id + "_{uuid}")},
+                            APPEND
+                        )
+                        """
+                    )
+                    written.extend(sorted(table_dir.glob(f"*/*/{archive_id}_*.parquet")))
+                    result.rows[table] = count
+
+                # Record the runs before dropping hot rows: an interrupted
+                # archive is completed on the next open (see _load_archive)
+                archived = dict(self._archived_runs)
+                archived_at = datetime.now(timezone.utc).isoformat()
+                for run_id, month in partitions.items():
+                    archived[run_id] = {
+                        "month": month,
+                        "archive_id": archive_id,
+                        "archived_at": archived_at,
+                    }
+                self._save_archive_manifest(archived)
+            except Exception as e:
+                logger.warning("Failed to archive %d runs: %s", len(partitions), e)
+                for path in written:
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+                conn.execute("DROP TABLE IF EXISTS _archive_batch")
+                raise
+
+            self._archived_runs = archived
+            self._drop_hot_rows("SELECT run_id FROM _archive_batch")
+            conn.execute("DROP TABLE IF EXISTS _archive_batch")
+            self._refresh_archive_views()
+            # Return the freed pages to the file
+            conn.execute("CHECKPOINT")
+            for run_id in partitions:
+                self._advance_watermark(run_id)
+
+        result.files = [str(path) for path in written]
+        logger.info(
+            "Archived %d runs (%d rows) to %s",
+            len(result.run_ids),
+            sum(result.rows.values()),
+            self.archive_dir,
+        )
+        return result
+
+    def _drop_hot_rows(self, run_id_query: str, params: Optional[List[Any]] = None) -> None:
+        """Delete archived runs from every per-run hot table in one transaction."""
+        conn = self.connection
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            for table in ARCHIVED_TABLES:
+                conn.execute(
+                    f"DELETE FROM {table} WHERE run_id IN ({run_id_query})", params or []
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _load_archive(self) -> None:
+        """Load the archive manifest and (re)create the union views.
+
+        Called once per connection. Runs listed in the manifest but still
+        present in hot tables belong to an archive that was interrupted
+        after its Parquet files were written; their hot rows are dropped.
+        """
+        if self.archive_dir is None:
+            return
+
+        manifest_path = self.archive_dir / ARCHIVE_MANIFEST
+        archived: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == ARCHIVE_MANIFEST_VERSION:
+                archived = dict(data.get("runs", {}))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Ignoring unreadable archive manifest %s: %s", manifest_path, e)
+        self._archived_runs = archived
+
+        if archived:
+            run_ids = list(archived)
+            leftover = self.connection.execute(
+                "SELECT COUNT(*) FROM runs WHERE run_id IN (SELECT unnest(?::VARCHAR[]))",
+                [run_ids],
+            ).fetchone()[0]
+            if leftover:
+                logger.info("Completing interrupted archive of %d runs", leftover)
+                self._drop_hot_rows("SELECT unnest(?::VARCHAR[])", [run_ids])
+
+        self._refresh_archive_views()
+
+    def _refresh_archive_views(self) -> None:
+        """Create `<table>_all` views (hot UNION ALL Parquet) for archived tables.
+
+        run_id is read from the hive partition path, so `WHERE run_id = ?`
+        prunes the scan to that run's files. The month partition column is
+        only used for layout and is not exposed.
+        """
+        conn = self.connection
+        views = set()
+        for table in ARCHIVED_TABLES:
+            table_dir = self.archive_dir / table if self.archive_dir is not None else None
+            if table_dir is not None and any(table_dir.glob("*/*/*.parquet")):
+                pattern = _sql_string(table_dir / "*" / "*" / "*.parquet")
+                conn.execute(
+                    f"""
+                    CREATE OR REPLACE VIEW {table}_all AS
+                    SELECT * FROM {table}
+                    UNION ALL BY NAME
+                    SELECT * EXCLUDE (month) FROM read_parquet(
+                        {pattern},
+                        hive_partitioning = true,
+                        hive_types = {{'month': VARCHAR, 'run_id': VARCHAR}},
+                        union_by_name = true
+                    )
+                    """
+                )
+                views.add(table)
+            else:
+                conn.execute(f"DROP VIEW IF EXISTS {table}_all")
+        self._archive_views = frozenset(views)
+
+    def _save_archive_manifest(self, archived: Dict[str, Dict[str, Any]]) -> None:
+        """Write the archive manifest atomically (temp file + os.replace)."""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": ARCHIVE_MANIFEST_VERSION,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "runs": dict(sorted(archived.items())),
+        }
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=".tmp", prefix=ARCHIVE_MANIFEST + ".", dir=self.archive_dir
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.archive_dir / ARCHIVE_MANIFEST)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     # =========================================================================
     # Schema Resilience: Rebuild from Events
     # =========================================================================
@@ -1987,6 +3475,12 @@ class StatsDB:
             "error": None,
         }
 
+        if self.connection is not None and run_id in self._archived_runs:
+            # Projection already lives in the Parquet archive
+            logger.debug("Run %s is archived, skipping rebuild", run_id)
+            result["success"] = True
+            return result
+
         run_path = runs_dir / run_id
         events_file = run_path / storage_module.EVENTS_FILE
 
@@ -2005,9 +3499,9 @@ class StatsDB:
                     if not line:
                         continue
                     try:
-                        event = json.loads(line)
+                        event = json_codec.loads(line)
                         events.append(event)
-                    except json.JSONDecodeError as e:
+                    except json_codec.JSONDecodeError as e:
                         logger.warning(
                             "Skipping malformed event at line %d in %s: %s",
                             line_num,
@@ -2056,6 +3550,8 @@ class StatsDB:
 
         if runs_dir is None:
             runs_dir = storage_module.RUNS_DIR
+        # A fresh database (version bump or missing file) has no rollups yet
+        fresh_database = self.connection is not None and self._needs_rebuild and run_ids is None
 
         stats = {
             "runs_processed": 0,
@@ -2099,11 +3595,84 @@ class StatsDB:
             len(stats["errors"]),
         )
 
+        if fresh_database:
+            # Archived runs are skipped above but still belong in the rollups
+            stats["archived_runs_folded"] = self._fold_archived_rollups()
+
         # Clear the needs_rebuild flag after successful rebuild
         self._needs_rebuild = False
 
         return stats
 
+    def _fold_archived_rollups(self) -> int:
+        """Add archived runs' steps and tool calls to the rollup tables.
+
+        Rollups normally stay hot when a run is archived. A rebuilt database
+        starts with empty rollups and ingestion skips archived runs, so
+        their rows are read back through the `<table>_all` views. Only call
+        this on rollups that do not yet include the archived runs.
+
+        Returns:
+            Number of archived runs folded in.
+        """
+        if self.connection is None or not self._archived_runs:
+            return 0
+
+        run_ids = list(self._archived_runs)
+        with self._lock:
+            conn = self.connection
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                if "steps" in self._archive_views:
+                    steps = conn.execute(
+                        """
+                        SELECT completed_at, flow_key, step_id, agent_key, status,
+                               duration_ms, total_tokens
+                        FROM steps_all
+                        WHERE run_id IN (SELECT unnest(?::VARCHAR[]))
+                          AND completed_at IS NOT NULL AND status != 'running'
+                        """,
+                        [run_ids],
+                    ).fetchall()
+                    for completed_at, flow_key, step_id, agent_key, status, ms, tokens in steps:
+                        self._update_step_rollup(
+                            conn,
+                            day=_rollup_day(completed_at),
+                            flow_key=flow_key,
+                            station_id=step_id,
+                            agent_key=agent_key,
+                            status=status,
+                            duration_ms=ms,
+                            total_tokens=tokens,
+                        )
+                if "tool_calls" in self._archive_views:
+                    tool_calls = conn.execute(
+                        """
+                        SELECT completed_at, tool_name, phase, duration_ms, success
+                        FROM tool_calls_all
+                        WHERE run_id IN (SELECT unnest(?::VARCHAR[]))
+                        """,
+                        [run_ids],
+                    ).fetchall()
+                    for completed_at, tool_name, phase, ms, success in tool_calls:
+                        self._update_tool_rollup(
+                            conn,
+                            day=_rollup_day(completed_at),
+                            tool_name=tool_name,
+                            phase=phase,
+                            duration_ms=ms,
+                            success=bool(success),
+                        )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            with self._cache_lock:
+                self._global_watermark += 1
+
+        logger.info("Folded %d archived runs into the rollups", len(run_ids))
+        return len(run_ids)
+
     @property
     def needs_rebuild(self) -> bool:
         """Check if the database needs to be rebuilt from events.jsonl.
@@ -2262,9 +3831,9 @@ def rebuild_stats_db(
                     if not line:
                         continue
                     try:
-                        event = json.loads(line)
+                        event = json_codec.loads(line)
                         events.append(event)
-                    except json.JSONDecodeError as e:
+                    except json_codec.JSONDecodeError as e:
                         stats["errors"].append(
                             {
                                 "run_id": run_id,
@@ -2294,7 +3863,7 @@ def rebuild_stats_db(
                     for envelope_file in handoff_dir.glob("*.json"):
                         try:
                             with envelope_file.open("r", encoding="utf-8") as f:
-                                envelope_data = json.load(f)
+                                envelope_data = json_codec.load(f)
 
                             # Record file changes from envelope if present
                             file_changes = envelope_data.get("file_changes", {})
@@ -2312,7 +3881,7 @@ def rebuild_stats_db(
 
                             stats["envelopes_processed"] += 1
 
-                        except (json.JSONDecodeError, IOError) as e:
+                        except (json_codec.JSONDecodeError, IOError) as e:
                             stats["errors"].append(
                                 {
                                     "run_id": run_id,
@@ -2359,6 +3928,7 @@ def main():
         python -m swarm.runtime.db rebuild [--runs-dir PATH] [--db-path PATH]
         python -m swarm.runtime.db stats <run_id>
         python -m swarm.runtime.db doctor <run_id> [--strict] [--from-disk]
+        python -m swarm.runtime.db archive [--older-than-days N] [--run-id ID] [--dry-run]
     """
     import argparse
     import sys
@@ -2428,6 +3998,29 @@ def main():
         help="Path to runs directory (for --from-disk mode)",
     )
 
+    # Archive command (projection retention)
+    archive_parser = subparsers.add_parser(
+        "archive",
+        help="Move cold runs from the stats DB to Parquet archives",
+    )
+    archive_parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=None,
+        help="Hot retention window (default: projection.hot_retention_days)",
+    )
+    archive_parser.add_argument(
+        "--run-id",
+        action="append",
+        dest="run_ids",
+        help="Specific run ID to archive (can be repeated)",
+    )
+    archive_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show which runs would be archived",
+    )
+
     args = parser.parse_args()
 
     if args.command == "rebuild":
@@ -2493,6 +4086,21 @@ def main():
         # Exit with error code if there are errors
         sys.exit(1 if errors else 0)
 
+    elif args.command == "archive":
+        db = get_stats_db()
+        result = db.archive_cold_runs(
+            older_than_days=args.older_than_days,
+            run_ids=args.run_ids,
+            dry_run=args.dry_run,
+        )
+        verb = "Would archive" if result.dry_run else "Archived"
+        print(f"{verb} {len(result.run_ids)} run(s)")
+        for run_id in result.run_ids:
+            print(f"  - {run_id}")
+        for table, count in sorted(result.rows.items()):
+            print(f"  {table}: {count} rows")
+        sys.exit(0)
+
     else:
         parser.print_help()
         sys.exit(1)
@@ -30,10 +30,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import subprocess
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from swarm.runtime.resource_usage import GIT_KIND, record_subprocess
+
 # Module logger
 logger = logging.getLogger(__name__)
 
@@ -181,6 +184,7 @@ def _run_git_command(
     Returns:
         Tuple of (success, stdout, stderr).
     """
+    started = time.perf_counter()
     try:
         result = subprocess.run(
             ["git"] + args,
@@ -196,6 +200,9 @@ def _run_git_command(
         return False, "", "Git not found in PATH"
     except Exception as e:
         return False, "", f"Git command failed: {e}"
+    finally:
+        # Counted against the running step's resource usage, if any
+        record_subprocess(GIT_KIND, (time.perf_counter() - started) * 1000)
 
 
 def _parse_numstat_line(line: str) -> Optional[Tuple[int, int, str]]:
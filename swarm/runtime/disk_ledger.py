@@ -0,0 +1,390 @@
+"""
+disk_ledger.py - Incremental per-run disk usage accounting.
+
+Computing run sizes by walking every run directory is O(total files) and
+takes minutes on hosts with thousands of runs. This module keeps a ledger
+of per-run byte counts next to the run catalog (<runs_dir>/.disk_usage.json)
+that is maintained incrementally:
+
+1. Storage writes (events, meta, spec, run_state, envelopes) record byte deltas
+2. When a run reaches a terminal status its directory is measured exactly once
+3. GC planning, retention and quota reports read sizes from the ledger
+
+A full rescan (reconcile()) is only needed to repair drift, e.g. after files
+were written by tools that bypass storage or after a crash lost unflushed
+deltas.
+
+Usage:
+    from swarm.runtime.disk_ledger import get_disk_ledger
+
+    ledger = get_disk_ledger(runs_dir)
+    ledger.record_bytes(run_id, 512)
+    ledger.measure_run(run_id, runs_dir / run_id)
+    print(ledger.total_bytes())
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+from .file_lock import get_file_lock
+
+logger = logging.getLogger(__name__)
+
+LEDGER_FILE = ".disk_usage.json"
+LEDGER_VERSION = 1
+
+# Flush accumulated deltas to disk after this many updates
+DEFAULT_FLUSH_EVERY = 64
+
+
+def measure_dir(path: Path) -> int:
+    """Return the total size in bytes of all files under path.
+
+    Uses os.scandir (one stat per entry, no Path objects) so single-run
+    measurements stay cheap. Unreadable entries are skipped.
+    """
+    total = 0
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return total
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class RunDiskUsage:
+    """Ledger entry for a single run.
+
+    Attributes:
+        run_id: The run identifier.
+        size_bytes: Current accounted size of the run directory.
+        measured_at: ISO timestamp of the last exact measurement, or None if
+            the size has only been accumulated from write deltas.
+        updated_at: ISO timestamp of the last ledger update for this run.
+    """
+
+    run_id: str
+    size_bytes: int = 0
+    measured_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "size_bytes": self.size_bytes,
+            "measured_at": self.measured_at,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, run_id: str, data: Dict[str, Any]) -> "RunDiskUsage":
+        """Create from dictionary."""
+        return cls(
+            run_id=run_id,
+            size_bytes=int(data.get("size_bytes", 0)),
+            measured_at=data.get("measured_at"),
+            updated_at=data.get("updated_at"),
+        )
+
+
+class DiskLedger:
+    """Per-run disk usage ledger persisted as JSON next to the runs.
+
+    Updates are buffered in memory and flushed every `flush_every` updates,
+    on exact measurements, and on removals. Flushing re-reads the file and
+    applies this process's pending changes on top, so backends and the GC
+    tool can share one ledger file without clobbering each other's deltas.
+
+    Thread-safe.
+    """
+
+    def __init__(self, runs_dir: Path, flush_every: int = DEFAULT_FLUSH_EVERY):
+        """Initialize the ledger.
+
+        Args:
+            runs_dir: Base runs directory; the ledger file lives inside it.
+            flush_every: Number of buffered updates that triggers a flush.
+        """
+        self._runs_dir = Path(runs_dir)
+        self._path = self._runs_dir / LEDGER_FILE
+        self._file_lock = get_file_lock(self._path.with_name(LEDGER_FILE + ".lock"))
+        self._flush_every = max(1, flush_every)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, RunDiskUsage] = self._load()
+        self._pending_deltas: Dict[str, int] = {}
+        self._pending_exact: Dict[str, RunDiskUsage] = {}
+        self._pending_removals: Set[str] = set()
+        self._pending_count = 0
+
+    @property
+    def path(self) -> Path:
+        """Path to the ledger file."""
+        return self._path
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def record_bytes(self, run_id: str, delta: int) -> None:
+        """Account a change of `delta` bytes in a run's directory."""
+        if not delta:
+            return
+        with self._lock:
+            entry = self._entries.get(run_id) or RunDiskUsage(run_id=run_id)
+            entry.size_bytes = max(0, entry.size_bytes + delta)
+            entry.updated_at = _now_iso()
+            self._entries[run_id] = entry
+            self._pending_removals.discard(run_id)
+            if run_id in self._pending_exact:
+                self._pending_exact[run_id] = entry
+            else:
+                self._pending_deltas[run_id] = self._pending_deltas.get(run_id, 0) + delta
+            self._pending_count += 1
+            if self._pending_count >= self._flush_every:
+                self._flush_locked()
+
+    def measure_run(self, run_id: str, run_path: Path) -> int:
+        """Measure a run directory exactly and record the result.
+
+        Called when a run finishes so the ledger carries an exact size for
+        every completed run, including artifacts written outside storage.
+
+        Returns:
+            The measured size in bytes.
+        """
+        size = measure_dir(run_path)
+        self.set_size(run_id, size)
+        return size
+
+    def set_size(self, run_id: str, size_bytes: int, flush: bool = True) -> None:
+        """Record an exact size for a run, replacing any accumulated deltas."""
+        now = _now_iso()
+        with self._lock:
+            entry = RunDiskUsage(run_id=run_id, size_bytes=size_bytes, measured_at=now, updated_at=now)
+            self._entries[run_id] = entry
+            self._pending_deltas.pop(run_id, None)
+            self._pending_removals.discard(run_id)
+            self._pending_exact[run_id] = entry
+            self._pending_count += 1
+            if flush:
+                self._flush_locked()
+
+    def remove(self, run_id: str, flush: bool = True) -> None:
+        """Drop a run from the ledger (after deletion or quarantine)."""
+        with self._lock:
+            self._entries.pop(run_id, None)
+            self._pending_deltas.pop(run_id, None)
+            self._pending_exact.pop(run_id, None)
+            self._pending_removals.add(run_id)
+            self._pending_count += 1
+            if flush:
+                self._flush_locked()
+
+    def reconcile(self, run_paths: Dict[str, Path]) -> Dict[str, int]:
+        """Full rescan: measure every run and drop entries for missing runs.
+
+        Args:
+            run_paths: Mapping of run_id to run directory for all known runs.
+
+        Returns:
+            Mapping of run_id to drift in bytes (measured - ledger) for runs
+            whose ledger size was wrong. Runs dropped from the ledger report
+            their negated ledger size.
+        """
+        drift: Dict[str, int] = {}
+        with self._lock:
+            before = {run_id: entry.size_bytes for run_id, entry in self._entries.items()}
+
+        for run_id, run_path in run_paths.items():
+            size = measure_dir(run_path)
+            if before.get(run_id) != size:
+                drift[run_id] = size - before.get(run_id, 0)
+            self.set_size(run_id, size, flush=False)
+
+        for run_id in set(before) - set(run_paths):
+            drift[run_id] = -before[run_id]
+            self.remove(run_id, flush=False)
+
+        self.flush()
+        return drift
+
+    def forget_missing(self, run_ids: Iterable[str]) -> int:
+        """Drop ledger entries for runs not in run_ids. Returns count dropped."""
+        keep = set(run_ids)
+        with self._lock:
+            stale = [run_id for run_id in self._entries if run_id not in keep]
+        for run_id in stale:
+            self.remove(run_id, flush=False)
+        if stale:
+            self.flush()
+        return len(stale)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def get(self, run_id: str) -> Optional[RunDiskUsage]:
+        """Return the ledger entry for a run, or None if unaccounted."""
+        with self._lock:
+            return self._entries.get(run_id)
+
+    def sizes(self) -> Dict[str, int]:
+        """Return a snapshot of run_id -> size_bytes."""
+        with self._lock:
+            return {run_id: entry.size_bytes for run_id, entry in self._entries.items()}
+
+    def total_bytes(self) -> int:
+        """Return the total accounted size across all runs."""
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._entries.values())
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Write pending updates to the ledger file."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Merge pending updates into the on-disk ledger. Caller holds the lock."""
+        if not self._pending_count:
+            return
+        if not self._runs_dir.exists():
+            # Runs directory was removed; nothing left to account for
+            self._clear_pending_locked()
+            return
+
+        # Other processes flush the same file; hold the file lock from read to replace
+        with self._file_lock:
+            merged = self._load()
+            for run_id in self._pending_removals:
+                merged.pop(run_id, None)
+            for run_id, entry in self._pending_exact.items():
+                merged[run_id] = entry
+            for run_id, delta in self._pending_deltas.items():
+                entry = merged.get(run_id) or RunDiskUsage(run_id=run_id)
+                entry.size_bytes = max(0, entry.size_bytes + delta)
+                entry.updated_at = _now_iso()
+                merged[run_id] = entry
+
+            try:
+                self._write(merged)
+            except OSError as e:
+                logger.warning("Failed to write disk usage ledger %s: %s", self._path, e)
+                return
+
+        self._entries = merged
+        self._clear_pending_locked()
+
+    def _clear_pending_locked(self) -> None:
+        self._pending_deltas.clear()
+        self._pending_exact.clear()
+        self._pending_removals.clear()
+        self._pending_count = 0
+
+    def _load(self) -> Dict[str, RunDiskUsage]:
+        """Read the ledger file. Missing or unreadable files yield an empty ledger."""
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            runs = data.get("runs", {})
+            return {run_id: RunDiskUsage.from_dict(run_id, entry) for run_id, entry in runs.items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            logger.warning("Ignoring unreadable disk usage ledger %s: %s", self._path, e)
+            return {}
+
+    def _write(self, entries: Dict[str, RunDiskUsage]) -> None:
+        """Write the ledger atomically (temp file + os.replace)."""
+        data = {
+            "version": LEDGER_VERSION,
+            "updated_at": _now_iso(),
+            "runs": {run_id: entry.to_dict() for run_id, entry in sorted(entries.items())},
+        }
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=LEDGER_FILE + ".", dir=self._runs_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self._path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+# =============================================================================
+# Global Instances (one ledger per runs directory)
+# =============================================================================
+
+_ledgers: Dict[Path, DiskLedger] = {}
+_ledgers_lock = threading.Lock()
+
+
+def get_disk_ledger(runs_dir: Path) -> DiskLedger:
+    """Get the shared DiskLedger for a runs directory."""
+    key = Path(runs_dir).resolve()
+    with _ledgers_lock:
+        ledger = _ledgers.get(key)
+        if ledger is None:
+            ledger = DiskLedger(key)
+            _ledgers[key] = ledger
+        return ledger
+
+
+def flush_disk_ledgers() -> None:
+    """Flush pending updates for every open ledger."""
+    with _ledgers_lock:
+        ledgers = list(_ledgers.values())
+    for ledger in ledgers:
+        ledger.flush()
+
+
+atexit.register(flush_disk_ledgers)
+
+
+def reset_disk_ledgers() -> None:
+    """Flush and forget all ledger instances (for testing)."""
+    flush_disk_ledgers()
+    with _ledgers_lock:
+        _ledgers.clear()
+
+
+__all__ = [
+    "LEDGER_FILE",
+    "DiskLedger",
+    "RunDiskUsage",
+    "flush_disk_ledgers",
+    "get_disk_ledger",
+    "measure_dir",
+    "reset_disk_ledgers",
+]
@@ -24,6 +24,7 @@ from swarm.runtime.path_helpers import (
 from swarm.runtime.path_helpers import (
     transcript_path as make_transcript_path,
 )
+from swarm.runtime.resource_usage import MeasuredPopen
 from swarm.runtime.types import RunEvent
 
 from ..models import (
@@ -78,8 +79,10 @@ def run_step_cli(
     cmd = " ".join(shlex.quote(a) for a in args)
     cwd = str(ctx.repo_root) if ctx.repo_root else str(Path.cwd())
 
-    process = subprocess.Popen(
+    # MeasuredPopen reports the CLI's CPU time and peak RSS to the step meter
+    process = MeasuredPopen(
         cmd,
+        kind="claude",
         cwd=cwd,
         shell=True,
         stdin=subprocess.PIPE,
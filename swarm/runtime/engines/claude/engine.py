@@ -18,7 +18,7 @@ from __future__ import annotations
 import logging
 import shutil
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 from swarm.config.runtime_config import (
     get_cli_path,
@@ -39,7 +39,9 @@ from swarm.runtime.context_pack import build_context_pack
 from swarm.runtime.path_helpers import (
     handoff_envelope_path as make_handoff_envelope_path,
 )
+from swarm.runtime.rate_limiter import get_rate_limiter, priority_for_spec
 from swarm.runtime.receipt_io import make_receipt_data, write_step_receipt
+from swarm.runtime.tracing import trace_span
 from swarm.runtime.types import (
     RoutingSignal,
     RunEvent,
@@ -69,6 +71,7 @@ from .session_runner import (
 from .session_runner import (
     execute_step_session_sync as _execute_step_session_sync,
 )
+from .spec_adapter import try_compile_from_spec
 from .stubs import (
     finalize_from_existing_handoff,
     finalize_step_stub,
@@ -79,6 +82,29 @@ from .stubs import (
 
 logger = logging.getLogger(__name__)
 
+# Engine name for rate limits (runtime.yaml rate_limits.engines)
+RATE_LIMIT_ENGINE = "claude"
+
+
+def _spec_model(step_result: StepResult) -> Optional[str]:
+    """Model chosen by the spec for the work phase, reused by later phases."""
+    return step_result.artifacts.get("spec_model") if step_result.artifacts else None
+
+
+def _plan_model(spec_result: Optional[Tuple[str, Optional[str], Any]]) -> Optional[str]:
+    """Model of a compiled step (try_compile_from_spec() result), if any."""
+    return spec_result[2].model if spec_result else None
+
+
+def _result_tokens(result: Any) -> Optional[int]:
+    """Total tokens reported by a step result (or a tuple starting with one)."""
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    artifacts = getattr(result, "artifacts", None) or {}
+    token_counts = artifacts.get("token_counts") or {}
+    total = token_counts.get("total")
+    return int(total) if total else None
+
 
 class ClaudeStepEngine(LifecycleCapableEngine):
     """Step engine using Claude Agent SDK or CLI.
@@ -255,11 +281,12 @@ class ClaudeStepEngine(LifecycleCapableEngine):
         # Prefer self.repo_root but fall back to ctx.repo_root
         effective_repo_root = self.repo_root or ctx.repo_root
         try:
-            context_pack = build_context_pack(
-                ctx=ctx,
-                run_state=None,  # Not using in-memory run state
-                repo_root=effective_repo_root,
-            )
+            with trace_span("hydrate"):
+                context_pack = build_context_pack(
+                    ctx=ctx,
+                    run_state=None,  # Not using in-memory run state
+                    repo_root=effective_repo_root,
+                )
 
             # Inject into context
             if ctx.extra is None:
@@ -301,7 +328,34 @@ class ClaudeStepEngine(LifecycleCapableEngine):
 
         Delegates to prompt_builder module.
         """
-        return build_prompt(ctx, self.repo_root, self._profile_id)
+        with trace_span("prompt"):
+            return build_prompt(ctx, self.repo_root, self._profile_id)
+
+    def _call_limited(
+        self, ctx: StepContext, fn: Callable[..., Any], *args: Any, model: Optional[str] = None
+    ) -> Any:
+        """Run one engine call under the global rate limiter."""
+        limiter = get_rate_limiter()
+        priority = priority_for_spec(ctx.spec)
+        with limiter.acquire(RATE_LIMIT_ENGINE, model, priority=priority) as permit:
+            result = fn(*args)
+            permit.record_tokens(_result_tokens(result))
+            return result
+
+    async def _call_limited_async(
+        self,
+        ctx: StepContext,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        model: Optional[str] = None,
+    ) -> Any:
+        """Async version of _call_limited()."""
+        limiter = get_rate_limiter()
+        priority = priority_for_spec(ctx.spec)
+        async with limiter.acquire_async(RATE_LIMIT_ENGINE, model, priority=priority) as permit:
+            result = await fn(*args)
+            permit.record_tokens(_result_tokens(result))
+            return result
 
     # =========================================================================
     # PUBLIC LIFECYCLE METHODS
@@ -319,13 +373,13 @@ class ClaudeStepEngine(LifecycleCapableEngine):
         ctx = self._hydrate_context(ctx)
 
         if self.stub_mode or self._mode == "stub":
-            return run_worker_stub(ctx, self.engine_id)
+            return self._call_limited(ctx, run_worker_stub, ctx, self.engine_id)
 
         if not self._check_sdk_available():
             logger.warning("SDK not available for run_worker, falling back to stub")
-            return run_worker_stub(ctx, self.engine_id)
+            return self._call_limited(ctx, run_worker_stub, ctx, self.engine_id)
 
-        return run_async_safely(self._run_worker_async(ctx))
+        return run_async_safely(self._run_worker_limited(ctx))
 
     async def run_worker_async(self, ctx: StepContext) -> Tuple[StepResult, List[RunEvent], str]:
         """Async version of run_worker for async-native orchestration.
@@ -336,13 +390,13 @@ class ClaudeStepEngine(LifecycleCapableEngine):
         ctx = self._hydrate_context(ctx)
 
         if self.stub_mode or self._mode == "stub":
-            return run_worker_stub(ctx, self.engine_id)
+            return self._call_limited(ctx, run_worker_stub, ctx, self.engine_id)
 
         if not self._check_sdk_available():
             logger.warning("SDK not available for run_worker_async, falling back to stub")
-            return run_worker_stub(ctx, self.engine_id)
+            return self._call_limited(ctx, run_worker_stub, ctx, self.engine_id)
 
-        return await self._run_worker_async(ctx)
+        return await self._run_worker_limited(ctx)
 
     def finalize_step(
         self,
@@ -368,17 +422,38 @@ class ClaudeStepEngine(LifecycleCapableEngine):
         )
 
         if self.stub_mode or self._mode == "stub":
-            return finalize_step_stub(
-                ctx, step_result, work_summary, self.engine_id, self._provider
+            return self._call_limited(
+                ctx,
+                finalize_step_stub,
+                ctx,
+                step_result,
+                work_summary,
+                self.engine_id,
+                self._provider,
             )
 
         if not self._check_sdk_available():
             logger.warning("SDK not available for finalize_step, falling back to stub")
-            return finalize_step_stub(
-                ctx, step_result, work_summary, self.engine_id, self._provider
+            return self._call_limited(
+                ctx,
+                finalize_step_stub,
+                ctx,
+                step_result,
+                work_summary,
+                self.engine_id,
+                self._provider,
             )
 
-        return run_async_safely(self._finalize_step_async(ctx, step_result, work_summary))
+        return run_async_safely(
+            self._call_limited_async(
+                ctx,
+                self._finalize_step_async,
+                ctx,
+                step_result,
+                work_summary,
+                model=_spec_model(step_result),
+            )
+        )
 
     async def finalize_step_async(
         self,
@@ -403,17 +478,36 @@ class ClaudeStepEngine(LifecycleCapableEngine):
         )
 
         if self.stub_mode or self._mode == "stub":
-            return finalize_step_stub(
-                ctx, step_result, work_summary, self.engine_id, self._provider
+            return self._call_limited(
+                ctx,
+                finalize_step_stub,
+                ctx,
+                step_result,
+                work_summary,
+                self.engine_id,
+                self._provider,
             )
 
         if not self._check_sdk_available():
             logger.warning("SDK not available for finalize_step_async, falling back to stub")
-            return finalize_step_stub(
-                ctx, step_result, work_summary, self.engine_id, self._provider
+            return self._call_limited(
+                ctx,
+                finalize_step_stub,
+                ctx,
+                step_result,
+                work_summary,
+                self.engine_id,
+                self._provider,
             )
 
-        return await self._finalize_step_async(ctx, step_result, work_summary)
+        return await self._call_limited_async(
+            ctx,
+            self._finalize_step_async,
+            ctx,
+            step_result,
+            work_summary,
+            model=_spec_model(step_result),
+        )
 
     def route_step(
         self,
@@ -435,7 +529,11 @@ class ClaudeStepEngine(LifecycleCapableEngine):
             logger.warning("SDK not available for route_step, falling back to stub")
             return route_step_stub(ctx, handoff_data)
 
-        return run_async_safely(self._route_step_async(ctx, handoff_data, spec_model=spec_model))
+        return run_async_safely(
+            self._call_limited_async(
+                ctx, self._route_step_async, ctx, handoff_data, spec_model, model=spec_model
+            )
+        )
 
     async def route_step_async(
         self,
@@ -457,7 +555,9 @@ class ClaudeStepEngine(LifecycleCapableEngine):
             logger.warning("SDK not available for route_step_async, falling back to stub")
             return route_step_stub(ctx, handoff_data)
 
-        return await self._route_step_async(ctx, handoff_data, spec_model=spec_model)
+        return await self._call_limited_async(
+            ctx, self._route_step_async, ctx, handoff_data, spec_model, model=spec_model
+        )
 
     def run_step(self, ctx: StepContext) -> Tuple[StepResult, Iterable[RunEvent]]:
         """Execute a step using Claude Agent SDK, CLI, or stub mode.
@@ -506,14 +606,22 @@ class ClaudeStepEngine(LifecycleCapableEngine):
             logger.debug(
                 "ClaudeStepEngine using stub for step %s (explicit stub mode)", ctx.step_id
             )
-            return run_step_stub(ctx, self.engine_id, self._provider, self._build_prompt)
+            return self._call_limited(
+                ctx, run_step_stub, ctx, self.engine_id, self._provider, self._build_prompt
+            )
 
         if self._mode == "cli":
             if self._check_cli_available():
                 logger.debug("ClaudeStepEngine using CLI for step %s", ctx.step_id)
                 try:
-                    return run_step_cli(
-                        ctx, self._cli_cmd, self.engine_id, self._provider, self._build_prompt
+                    return self._call_limited(
+                        ctx,
+                        run_step_cli,
+                        ctx,
+                        self._cli_cmd,
+                        self.engine_id,
+                        self._provider,
+                        self._build_prompt,
                     )
                 except Exception as e:
                     logger.warning("CLI execution failed for step %s: %s", ctx.step_id, e)
@@ -523,7 +631,9 @@ class ClaudeStepEngine(LifecycleCapableEngine):
                     "ClaudeStepEngine CLI not available for step %s, falling back to stub",
                     ctx.step_id,
                 )
-                return run_step_stub(ctx, self.engine_id, self._provider, self._build_prompt)
+                return self._call_limited(
+                    ctx, run_step_stub, ctx, self.engine_id, self._provider, self._build_prompt
+                )
 
         if self._mode == "sdk":
             if self._check_sdk_available():
@@ -538,7 +648,9 @@ class ClaudeStepEngine(LifecycleCapableEngine):
                     "ClaudeStepEngine SDK not available for step %s, falling back to stub",
                     ctx.step_id,
                 )
-                return run_step_stub(ctx, self.engine_id, self._provider, self._build_prompt)
+                return self._call_limited(
+                    ctx, run_step_stub, ctx, self.engine_id, self._provider, self._build_prompt
+                )
 
         # Default: try SDK, then CLI, then stub
         if self._check_sdk_available():
@@ -552,15 +664,23 @@ class ClaudeStepEngine(LifecycleCapableEngine):
         if self._check_cli_available():
             logger.debug("ClaudeStepEngine using CLI for step %s (auto-detected)", ctx.step_id)
             try:
-                return run_step_cli(
-                    ctx, self._cli_cmd, self.engine_id, self._provider, self._build_prompt
+                return self._call_limited(
+                    ctx,
+                    run_step_cli,
+                    ctx,
+                    self._cli_cmd,
+                    self.engine_id,
+                    self._provider,
+                    self._build_prompt,
                 )
             except Exception as e:
                 logger.warning("CLI execution failed for step %s: %s", ctx.step_id, e)
                 return make_failed_result(ctx, f"CLI execution failed: {e}")
 
         logger.debug("ClaudeStepEngine using stub for step %s (no execution backend)", ctx.step_id)
-        return run_step_stub(ctx, self.engine_id, self._provider, self._build_prompt)
+        return self._call_limited(
+            ctx, run_step_stub, ctx, self.engine_id, self._provider, self._build_prompt
+        )
 
     # =========================================================================
     # WP6: PER-STEP SESSION PATTERN (delegated to session_runner)
@@ -576,7 +696,7 @@ class ClaudeStepEngine(LifecycleCapableEngine):
         Delegates to session_runner module. See session_runner.execute_step_session
         for full documentation.
         """
-        return await _execute_step_session(self, ctx, is_terminal)
+        return await self._call_limited_async(ctx, _execute_step_session, self, ctx, is_terminal)
 
     def execute_step_session_sync(
         self,
@@ -584,13 +704,30 @@ class ClaudeStepEngine(LifecycleCapableEngine):
         is_terminal: bool = False,
     ) -> Tuple[StepResult, Iterable[RunEvent], Optional[RoutingSignal]]:
         """Synchronous wrapper for execute_step_session."""
-        return _execute_step_session_sync(self, ctx, is_terminal)
+        return self._call_limited(ctx, _execute_step_session_sync, self, ctx, is_terminal)
 
     # =========================================================================
     # INTERNAL ASYNC IMPLEMENTATIONS (delegate to sdk_runner)
     # =========================================================================
 
-    async def _run_worker_async(self, ctx: StepContext) -> Tuple[StepResult, List[RunEvent], str]:
+    async def _run_worker_limited(
+        self, ctx: StepContext
+    ) -> Tuple[StepResult, List[RunEvent], str]:
+        """Run the work phase under the rate limit of the step's model.
+
+        The step is compiled from its spec first, so the permit is charged
+        to the model the call will use rather than the engine default.
+        """
+        spec_result = try_compile_from_spec(ctx, self.repo_root or ctx.repo_root)
+        return await self._call_limited_async(
+            ctx, self._run_worker_async, ctx, spec_result, model=_plan_model(spec_result)
+        )
+
+    async def _run_worker_async(
+        self,
+        ctx: StepContext,
+        spec_result: Optional[Tuple[str, Optional[str], Any]] = None,
+    ) -> Tuple[StepResult, List[RunEvent], str]:
         """Async implementation of run_worker."""
         # Prefer self.repo_root but fall back to ctx.repo_root
         effective_repo_root = self.repo_root or ctx.repo_root
@@ -600,6 +737,7 @@ class ClaudeStepEngine(LifecycleCapableEngine):
             profile_id=self._profile_id,
             build_prompt_fn=self._build_prompt,
             stats_db=self._stats_db,
+            spec_result=spec_result,
         )
 
     async def _finalize_step_async(
@@ -651,7 +789,7 @@ class ClaudeStepEngine(LifecycleCapableEngine):
         routing_signal = None
 
         # For run_step(), we use the lifecycle methods but combine them
-        step_result, events, work_summary = await self._run_worker_async(ctx)
+        step_result, events, work_summary = await self._run_worker_limited(ctx)
 
         if step_result.status == "failed":
             # Write receipt even for failed steps
@@ -21,16 +21,13 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from swarm.config.runtime_config import get_resolved_context_budgets
 from swarm.runtime.flow_loader import load_agent_step_prompt
-from swarm.runtime.history_priority import (
-    HistoryPriority,
-    get_priority_label,
-    prioritize_history,
-)
+from swarm.runtime.history_priority import history_index_for, render_history_step
 
 from ..models import HistoryTruncationInfo, StepContext
 
@@ -632,76 +629,17 @@ def build_prompt(
         recent_max = budgets.history_max_recent_chars
         older_max = budgets.history_max_older_chars
 
-        # Sort history by priority (CRITICAL first, then HIGH, MEDIUM, LOW)
-        prioritized = prioritize_history(ctx.history)
-        total_steps = len(ctx.history)
-
-        # Track which items we include and their priorities
-        included_items: List[Tuple[int, Dict[str, Any], List[str]]] = []
-        priority_counts: Dict[str, int] = {
-            "CRITICAL": 0,
-            "HIGH": 0,
-            "MEDIUM": 0,
-            "LOW": 0,
-        }
-        chars_used = 0
-
-        # Most recent step index for determining output limits
-        most_recent_idx = total_steps - 1 if total_steps > 0 else -1
-
-        # Process by priority order, including highest-value items first
-        for priority, orig_idx, prev in prioritized:
-            is_most_recent = orig_idx == most_recent_idx
-            step_lines: List[str] = []
-
-            status_emoji = "[OK]" if prev.get("status") == "succeeded" else "[FAIL]"
-            priority_label = get_priority_label(priority)
-            step_lines.append(f"### Step: {prev.get('step_id')} {status_emoji}")
-
-            if prev.get("output"):
-                output = str(prev.get("output"))
-                # CRITICAL items get full recent budget, others based on recency
-                if priority >= HistoryPriority.CRITICAL:
-                    max_chars = recent_max
-                elif is_most_recent:
-                    max_chars = recent_max
-                else:
-                    max_chars = older_max
-                if len(output) > max_chars:
-                    output = output[:max_chars] + "... (truncated)"
-                step_lines.append(f"Output: {output}")
-
-            if prev.get("error"):
-                error = str(prev.get("error"))
-                max_error = 200
-                if len(error) > max_error:
-                    error = error[:max_error] + "... (truncated)"
-                step_lines.append(f"Error: {error}")
-
-            step_lines.append("")
-
-            # Calculate chars for this step
-            step_text = "\n".join(step_lines)
-            step_chars = len(step_text)
-
-            # Check if adding this step would exceed budget
-            if chars_used + step_chars > history_budget:
-                continue
-
-            # Include this item
-            included_items.append((orig_idx, prev, step_lines))
-            priority_counts[priority_label] += 1
-            chars_used += step_chars
-
-        # Sort included items back to chronological order for output
-        included_items.sort(key=lambda x: x[0])
+        # Priority-ordered selection from the run's incremental history index:
+        # each item is classified once, when it first appears in the history
+        render = partial(render_history_step, recent_max=recent_max, older_max=older_max)
+        selection = history_index_for(ctx.history).select(history_budget, render=render)
+        total_steps = selection.total
+        chars_used = selection.used
+        priority_counts = selection.priority_distribution()
 
         # Build history lines in chronological order
-        history_lines: List[str] = []
-        for _, _, step_lines in included_items:
-            history_lines.extend(step_lines)
-
-        steps_included = len(included_items)
+        history_lines: List[str] = [text for _, _, _, text in selection.included]
+        steps_included = len(selection.included)
 
         # Track truncation metadata with priority information
         truncated = steps_included < total_steps
@@ -165,6 +165,7 @@ async def run_worker_async(
         [StepContext], Tuple[str, Optional[HistoryTruncationInfo], Optional[str]]
     ],
     stats_db: Optional[Any] = None,
+    spec_result: Optional[Tuple[str, Optional[str], Any]] = None,
 ) -> Tuple[StepResult, List[RunEvent], str]:
     """Async implementation of run_worker.
 
@@ -174,6 +175,8 @@ async def run_worker_async(
         profile_id: Profile ID for prompt building.
         build_prompt_fn: Function to build prompt.
         stats_db: Optional stats database for telemetry.
+        spec_result: try_compile_from_spec() result if the caller already
+            compiled the step (e.g. to pick the model's rate limit).
 
     Returns:
         Tuple of (StepResult, events, work_summary).
@@ -189,7 +192,8 @@ async def run_worker_async(
     ensure_receipts_dir(ctx.run_base)
 
     # Try spec-based prompt compilation first, fall back to legacy
-    spec_result = try_compile_from_spec(ctx, repo_root)
+    if spec_result is None:
+        spec_result = try_compile_from_spec(ctx, repo_root)
     plan = None  # Track plan for later use in envelope creation
 
     if spec_result:
@@ -301,7 +301,12 @@ def finalize_from_existing_handoff(
             step_id=ctx.step_id,
             flow_key=ctx.flow_key,
             run_id=ctx.run_id,
-            routing_signal=None,
+            routing_signal=RoutingSignal(
+                decision=RoutingDecision.ADVANCE,
+                reason="inline_finalization",
+                confidence=1.0,
+                needs_human=False,
+            ),
             summary=handoff_data.get("summary", work_summary[:500]),
             status=envelope_status,
             error=step_result.error,
@@ -316,7 +321,12 @@ def finalize_from_existing_handoff(
             step_id=ctx.step_id,
             flow_key=ctx.flow_key,
             run_id=ctx.run_id,
-            routing_signal=None,
+            routing_signal=RoutingSignal(
+                decision=RoutingDecision.ADVANCE,
+                reason="inline_finalization",
+                confidence=1.0,
+                needs_human=False,
+            ),
             summary=work_summary[:500] if work_summary else f"Step {ctx.step_id} completed",
             status=envelope_status,
             error=step_result.error,
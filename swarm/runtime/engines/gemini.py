@@ -13,6 +13,7 @@ import shlex
 import shutil
 import subprocess
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -24,11 +25,7 @@ from swarm.config.runtime_config import (
     get_resolved_context_budgets,
     is_stub_mode,
 )
-from swarm.runtime.history_priority import (
-    HistoryPriority,
-    get_priority_label,
-    prioritize_history,
-)
+from swarm.runtime.history_priority import history_index_for, render_history_step
 from swarm.runtime.path_helpers import (
     ensure_llm_dir,
     ensure_receipts_dir,
@@ -39,6 +36,8 @@ from swarm.runtime.path_helpers import (
 from swarm.runtime.path_helpers import (
     transcript_path as make_transcript_path,
 )
+from swarm.runtime.rate_limiter import get_rate_limiter, priority_for_spec
+from swarm.runtime.resource_usage import MeasuredPopen
 from swarm.runtime.types import RunEvent
 
 from .base import StepEngine
@@ -124,12 +123,23 @@ class GeminiStepEngine(StepEngine):
     def run_step(self, ctx: StepContext) -> Tuple[StepResult, Iterable[RunEvent]]:
         """Execute a step via Gemini CLI.
 
+        Waits for a permit from the global rate limiter (engine "gemini")
+        before running the step, and charges it the tokens the CLI reported.
+
         Args:
             ctx: Step execution context.
 
         Returns:
             Tuple of (StepResult, list of RunEvents).
         """
+        limiter = get_rate_limiter()
+        with limiter.acquire("gemini", priority=priority_for_spec(ctx.spec)) as permit:
+            result, events = self._run_step(ctx)
+            token_counts = (result.artifacts or {}).get("token_counts") or {}
+            permit.record_tokens(token_counts.get("total") or None)
+            return result, events
+
+    def _run_step(self, ctx: StepContext) -> Tuple[StepResult, Iterable[RunEvent]]:
         events: List[RunEvent] = []
         start_time = datetime.now(timezone.utc)
 
@@ -157,7 +167,7 @@ class GeminiStepEngine(StepEngine):
 
         # Real execution via Gemini CLI
         try:
-            output, cli_events = self._execute_gemini(ctx, prompt, truncation_info)
+            output, cli_events, token_counts = self._execute_gemini(ctx, prompt, truncation_info)
             events.extend(cli_events)
 
             end_time = datetime.now(timezone.utc)
@@ -168,6 +178,7 @@ class GeminiStepEngine(StepEngine):
                 status="succeeded",
                 output=output,
                 duration_ms=duration_ms,
+                artifacts={"token_counts": token_counts},
             )
 
         except Exception as e:
@@ -275,78 +286,17 @@ class GeminiStepEngine(StepEngine):
             recent_max = budgets.history_max_recent_chars
             older_max = budgets.history_max_older_chars
 
-            # Sort history by priority (CRITICAL first, then HIGH, MEDIUM, LOW)
-            # Within same priority, maintain chronological order
-            prioritized = prioritize_history(ctx.history)
-            total_steps = len(ctx.history)
-
-            # Track which items we include and their priorities
-            included_items: List[Tuple[int, Dict[str, Any], List[str]]] = []
-            priority_counts: Dict[str, int] = {
-                "CRITICAL": 0,
-                "HIGH": 0,
-                "MEDIUM": 0,
-                "LOW": 0,
-            }
-            chars_used = 0
-
-            # Most recent step index for determining output limits
-            most_recent_idx = total_steps - 1 if total_steps > 0 else -1
-
-            # Process by priority order, including highest-value items first
-            for priority, orig_idx, prev in prioritized:
-                is_most_recent = orig_idx == most_recent_idx
-                step_lines: List[str] = []
-
-                status_emoji = "[OK]" if prev.get("status") == "succeeded" else "[FAIL]"
-                priority_label = get_priority_label(priority)
-                step_lines.append(f"### Step: {prev.get('step_id')} {status_emoji}")
-
-                if prev.get("output"):
-                    output = str(prev.get("output"))
-                    # CRITICAL items get full recent budget, others based on recency
-                    if priority >= HistoryPriority.CRITICAL:
-                        max_chars = recent_max
-                    elif is_most_recent:
-                        max_chars = recent_max
-                    else:
-                        max_chars = older_max
-                    if len(output) > max_chars:
-                        output = output[:max_chars] + "... (truncated)"
-                    step_lines.append(f"Output: {output}")
-
-                if prev.get("error"):
-                    error = str(prev.get("error"))
-                    max_error = 200
-                    if len(error) > max_error:
-                        error = error[:max_error] + "... (truncated)"
-                    step_lines.append(f"Error: {error}")
-
-                step_lines.append("")
-
-                # Calculate chars for this step
-                step_text = "\n".join(step_lines)
-                step_chars = len(step_text)
-
-                # Check if adding this step would exceed budget
-                if chars_used + step_chars > history_budget:
-                    # Budget exceeded - skip lower priority items
-                    continue
-
-                # Include this item
-                included_items.append((orig_idx, prev, step_lines))
-                priority_counts[priority_label] += 1
-                chars_used += step_chars
-
-            # Sort included items back to chronological order for output
-            included_items.sort(key=lambda x: x[0])
+            # Priority-ordered selection from the run's incremental history index:
+            # each item is classified once, when it first appears in the history
+            render = partial(render_history_step, recent_max=recent_max, older_max=older_max)
+            selection = history_index_for(ctx.history).select(history_budget, render=render)
+            total_steps = selection.total
+            chars_used = selection.used
+            priority_counts = selection.priority_distribution()
 
             # Build history lines in chronological order
-            history_lines: List[str] = []
-            for _, _, step_lines in included_items:
-                history_lines.extend(step_lines)
-
-            steps_included = len(included_items)
+            history_lines: List[str] = [text for _, _, _, text in selection.included]
+            steps_included = len(selection.included)
 
             # Track truncation metadata with priority information
             truncated = steps_included < total_steps
@@ -395,7 +345,7 @@ class GeminiStepEngine(StepEngine):
         ctx: StepContext,
         prompt: str,
         truncation_info: Optional[HistoryTruncationInfo] = None,
-    ) -> Tuple[str, List[RunEvent]]:
+    ) -> Tuple[str, List[RunEvent], Dict[str, int]]:
         """Execute Gemini CLI and capture output.
 
         Captures assistant content from Gemini JSONL output and writes:
@@ -408,7 +358,7 @@ class GeminiStepEngine(StepEngine):
             truncation_info: Optional history truncation metadata for context budgets.
 
         Returns:
-            Tuple of (actual assistant output text, list of events).
+            Tuple of (actual assistant output text, list of events, token counts).
 
         Raises:
             RuntimeError: If execution fails.
@@ -425,8 +375,10 @@ class GeminiStepEngine(StepEngine):
         ]
         cmd = " ".join(shlex.quote(a) for a in args)
 
-        process = subprocess.Popen(
+        # MeasuredPopen reports the CLI's CPU time and peak RSS to the step meter
+        process = MeasuredPopen(
             cmd,
+            kind="gemini",
             cwd=str(self.repo_root),
             shell=True,
             stdout=subprocess.PIPE,
@@ -527,7 +479,7 @@ class GeminiStepEngine(StepEngine):
             # Fallback if no assistant content was captured
             output_text = f"Step {ctx.step_id} completed. Output lines: {len(raw_events)}"
 
-        return output_text, events
+        return output_text, events, token_counts
 
     def _write_transcript(self, ctx: StepContext, raw_events: List[Dict[str, Any]]) -> Path:
         """Write transcript JSONL to RUN_BASE/llm/<step_id>-<agent_key>-gemini.jsonl.
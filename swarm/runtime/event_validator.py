@@ -334,17 +334,18 @@ def validate_run_from_db(
             )
         ]
 
-    # Query raw events ordered by seq
+    # Query raw events ordered by seq (archived runs read their Parquet archive)
     try:
-        result = db.connection.execute(
-            """
-            SELECT event_id, seq, kind, step_id, payload
-            FROM events
-            WHERE run_id = ?
-            ORDER BY seq
-            """,
-            [run_id],
-        ).fetchall()
+        with db.read_snapshot(run_id) as conn:
+            result = conn.execute(
+                """
+                SELECT event_id, seq, kind, step_id, payload
+                FROM events
+                WHERE run_id = ?
+                ORDER BY seq
+                """,
+                [run_id],
+            ).fetchall()
     except Exception as e:
         return [
             EventContractViolation(
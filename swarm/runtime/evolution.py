@@ -9,6 +9,7 @@ The evolution loop:
 1. feedback-applier agent generates structured evolution suggestions
 2. generate_evolution_patch() parses Wisdom artifacts for improvement suggestions
 3. apply_evolution_patch() applies patches to spec files (with dry_run support)
+4. list_pending_patches() queries the persisted patch index (patch_index.py)
 
 Usage:
     from swarm.runtime.evolution import (
@@ -935,6 +936,9 @@ def list_pending_patches(
 ) -> List[Tuple[str, List[EvolutionPatch]]]:
     """List pending evolution patches across all runs.
 
+    Served from the persisted patch index (see patch_index.py); a run's
+    patches are only regenerated when its wisdom artifacts change.
+
     Args:
         runs_root: Path to runs directory (e.g., swarm/runs/)
         limit: Maximum number of runs to scan
@@ -942,36 +946,33 @@ def list_pending_patches(
     Returns:
         List of (run_id, patches) tuples for runs with pending patches
     """
+    from .patch_index import PatchStatus, get_patch_index
+
     results: List[Tuple[str, List[EvolutionPatch]]] = []
 
     if not runs_root.exists():
         return results
 
-    run_dirs = sorted(runs_root.iterdir(), reverse=True)[:limit]
+    index = get_patch_index(runs_root)
+    run_ids = index.refresh(limit=limit)
 
-    for run_dir in run_dirs:
-        if not run_dir.is_dir():
-            continue
+    by_run: Dict[str, List[EvolutionPatch]] = {}
+    for indexed in index.query(status=PatchStatus.PENDING, run_ids=run_ids):
+        by_run.setdefault(indexed.run_id, []).append(indexed.patch)
 
-        wisdom_dir = run_dir / "wisdom"
-        if not wisdom_dir.exists():
-            continue
+    return [(run_id, patches) for run_id, patches in by_run.items()]
 
-        # Check if patches have been applied
-        applied_markers = list(wisdom_dir.glob(".applied_*"))
-        rejected_markers = list(wisdom_dir.glob(".rejected_*"))
 
-        patches = generate_evolution_patch(wisdom_dir, run_id=run_dir.name)
+def get_run_patches(runs_root: Path, run_id: str) -> List[EvolutionPatch]:
+    """Get all evolution patches for a run (any status) from the patch index.
 
-        # Filter out applied/rejected patches
-        pending_patches = [
-            p
-            for p in patches
-            if not any(m.name.endswith(p.id) for m in applied_markers)
-            and not any(m.name.endswith(p.id) for m in rejected_markers)
-        ]
+    Args:
+        runs_root: Path to runs directory (e.g., swarm/runs/)
+        run_id: The run whose wisdom artifacts to read
 
-        if pending_patches:
-            results.append((run_dir.name, pending_patches))
+    Returns:
+        List of EvolutionPatch objects, regenerated only if artifacts changed.
+    """
+    from .patch_index import get_patch_index
 
-    return results
+    return get_patch_index(runs_root).get_run_patches(run_id)
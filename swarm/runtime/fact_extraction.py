@@ -41,7 +41,7 @@ import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Pattern
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Pattern
 
 from swarm.config.flow_registry import get_flow_order
 
@@ -545,11 +545,10 @@ def extract_facts_from_run(
 # - content, priority, status, evidence, created_at, extracted_at, metadata
 
 
-# Type alias for forward reference
-try:
+# StatsDB is only used in annotations; importing db.py here would load it for
+# every importer of the extraction helpers (e.g. the facts API routes)
+if TYPE_CHECKING:
     from .db import StatsDB
-except ImportError:
-    StatsDB = None  # type: ignore
 
 
 def ingest_facts_to_db(
@@ -0,0 +1,144 @@
+"""
+file_lock.py - Advisory file locks shared across processes.
+
+Several processes may write the same run directory: API server workers,
+the CLI and the orchestrator. Thread locks only serialize writers within
+one process, so read-modify-write sequences on shared files take an
+exclusive flock() on a lock file next to the data instead:
+
+    from swarm.runtime.file_lock import get_file_lock
+
+    with get_file_lock(run_path / "run_state.lock"):
+        state = load()
+        ...
+        save(state)
+
+Locks are reentrant within a thread, so a caller can hold a lock across a
+sequence of operations that each take it again. Within a process, use
+get_file_lock() rather than constructing FileLock directly: flock() locks
+held through different open files conflict even inside one process.
+
+On platforms without fcntl the lock only serializes threads of the current
+process.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+class FileLock:
+    """Exclusive advisory lock on a file, held across processes.
+
+    Reentrant: the owning thread may acquire it again without blocking. The
+    flock() is taken on the outermost acquire and dropped on the matching
+    release.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the lock.
+
+        Args:
+            path: Lock file path. Created on first acquire if missing.
+        """
+        self.path = Path(path)
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        """Block until the lock is held by the calling thread."""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self) -> None:
+        """Release one level of the lock."""
+        self._depth -= 1
+        if self._depth == 0:
+            self._unlock_file()
+        self._thread_lock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+    def _lock_file(self) -> None:
+        if fcntl is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def _unlock_file(self) -> None:
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        except OSError as e:
+            logger.warning("Failed to unlock %s: %s", self.path, e)
+        finally:
+            os.close(fd)
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+# Weak: a lock only has to be shared while someone references it (a holder
+# always does), so locks of runs nobody touches any more are dropped
+_locks: "weakref.WeakValueDictionary[Path, FileLock]" = weakref.WeakValueDictionary()
+_locks_lock = threading.Lock()
+
+
+def get_file_lock(path: Path) -> FileLock:
+    """Get the process-wide lock object for a lock file path.
+
+    Callers keep the returned object for as long as they need the lock.
+    """
+    key = Path(path)
+    with _locks_lock:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = FileLock(key)
+            _locks[key] = lock
+        return lock
+
+
+def reset_file_locks() -> None:
+    """Forget all lock objects (for testing). Locks must not be held."""
+    with _locks_lock:
+        _locks.clear()
+
+
+__all__ = [
+    "FileLock",
+    "get_file_lock",
+    "reset_file_locks",
+]
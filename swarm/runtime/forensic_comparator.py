@@ -18,6 +18,8 @@ Usage:
         build_forensic_verdict,
         forensic_verdict_to_dict,
         forensic_verdict_from_dict,
+        get_forensic_verdict_cache,
+        read_forensic_verdict_cache,
     )
 
     # Compare handoff claims against forensic evidence
@@ -31,6 +33,16 @@ Usage:
         # Navigator should flag this for review
         ...
 
+    # Reuse verdicts across navigator calls and reruns of the same run
+    verdict = compare_claim_vs_evidence(
+        handoff=envelope,
+        diff_result=diff_scan_result,
+        cache=get_forensic_verdict_cache(run_base),
+    )
+
+    # Viewers read the persisted verdicts and hit rate without counting lookups
+    cached = read_forensic_verdict_cache(run_base)
+
 Integration:
     The Navigator receives ForensicVerdict in its context and uses it to inform
     routing decisions. This is NOT blocking validation - the flow continues,
@@ -42,16 +54,26 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from swarm.runtime import json_codec
+from swarm.runtime.file_lock import get_file_lock
+
 # Import forensic types for evidence comparison
 from swarm.runtime.forensic_types import (
     DiffScanResult,
     TestParseResult,
 )
+from swarm.runtime.path_helpers import FORENSICS_DIR
+from swarm.runtime.run_archive import open_run_file
 
 logger = logging.getLogger(__name__)
 
@@ -307,6 +329,7 @@ def compare_claim_vs_evidence(
     handoff: Dict[str, Any],
     diff_result: Optional[DiffScanResult] = None,
     test_summary: Optional[TestParseResult] = None,
+    cache: Optional["ForensicVerdictCache"] = None,
 ) -> ForensicVerdict:
     """Compare handoff claims against forensic evidence.
 
@@ -320,6 +343,8 @@ def compare_claim_vs_evidence(
         handoff: HandoffEnvelope as a dictionary.
         diff_result: DiffScanResult from scanning actual file changes.
         test_summary: TestParseResult from parsing actual test output.
+        cache: Verdict cache of the run. A verdict already computed for the
+            same claims and evidence is returned instead of recomputed.
 
     Returns:
         ForensicVerdict with comparison results and recommendation.
@@ -328,6 +353,15 @@ def compare_claim_vs_evidence(
         This function is non-blocking. It produces signal for the Navigator
         but does not stop flow execution.
     """
+    if cache is not None:
+        key = _verdict_cache_key("compare", handoff, diff_result, test_summary)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        verdict = compare_claim_vs_evidence(handoff, diff_result, test_summary)
+        cache.put(key, verdict)
+        return verdict
+
     claims = _extract_handoff_claims(handoff)
     discrepancies: List[Discrepancy] = []
     reward_flags: List[RewardHackingFlag] = []
@@ -532,6 +566,7 @@ def build_forensic_verdict(
     diff_result: Optional[DiffScanResult] = None,
     test_summary: Optional[TestParseResult] = None,
     previous_test_summary: Optional[TestParseResult] = None,
+    cache: Optional["ForensicVerdictCache"] = None,
 ) -> ForensicVerdict:
     """Build a ForensicVerdict with optional historical comparison.
 
@@ -544,10 +579,22 @@ def build_forensic_verdict(
         test_summary: TestParseResult from parsing actual test output.
         previous_test_summary: TestParseResult from the previous iteration
             (for detecting test count/coverage regression).
+        cache: Verdict cache of the run (see compare_claim_vs_evidence).
 
     Returns:
         ForensicVerdict with comparison results and recommendation.
     """
+    if cache is not None:
+        key = _verdict_cache_key(
+            "build", handoff, diff_result, test_summary, previous_test_summary
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        verdict = build_forensic_verdict(handoff, diff_result, test_summary, previous_test_summary)
+        cache.put(key, verdict)
+        return verdict
+
     # Start with basic comparison
     verdict = compare_claim_vs_evidence(handoff, diff_result, test_summary)
 
@@ -605,6 +652,292 @@ def build_forensic_verdict(
     return verdict
 
 
+# =============================================================================
+# Verdict cache
+# =============================================================================
+
+# Verdict cache file, under RUN_BASE/forensics/
+VERDICT_CACHE_FILENAME = "verdict_cache.json"
+
+# Bumped when the verdict logic changes, so persisted verdicts are recomputed
+VERDICT_CACHE_VERSION = 1
+
+DEFAULT_VERDICT_CACHE_ENTRIES = 256
+
+
+def _verdict_cache_key(
+    kind: str,
+    handoff: Dict[str, Any],
+    diff_result: Optional[DiffScanResult],
+    test_summary: Optional[TestParseResult],
+    previous_test_summary: Optional[TestParseResult] = None,
+) -> str:
+    """Key a verdict by the evidence hash and the claims it is checked against.
+
+    The evidence hash covers the diff scan and the test counts. Coverage (not
+    part of the hash) and the handoff fields the comparison reads are added,
+    so any input that can change the verdict changes the key.
+    """
+    claims = _extract_handoff_claims(handoff)
+    claims.pop("summary", None)
+    claims["test_count"] = handoff.get("test_count")
+    claims["coverage_percent"] = handoff.get("coverage_percent")
+
+    evidence: Dict[str, Any] = dict(_compute_evidence_hash(diff_result, test_summary))
+    if test_summary is not None:
+        evidence["coverage"] = test_summary.coverage_percent
+    if previous_test_summary is not None:
+        evidence["previous"] = [
+            previous_test_summary.total_tests,
+            previous_test_summary.coverage_percent,
+        ]
+
+    material = {"kind": kind, "claims": claims, "evidence": evidence}
+    canonical = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+    return f"{kind}:{digest}"
+
+
+class ForensicVerdictCache:
+    """Verdicts of one run, keyed by evidence hash and persisted as JSON.
+
+    A verdict is a pure function of the handoff claims and the evidence, so
+    the Navigator, reruns of the flow and Flow Studio views can all reuse the
+    verdict computed the first time. Entries go stale only by key: when the
+    diff or test evidence (or the claims) change, the key changes.
+
+    Stores write through to the file; hit counters are written on flush()
+    and on the next store. Writes re-read the file under a file lock and
+    merge, so processes sharing a run add up their counters and keep each
+    other's verdicts. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_entries: int = DEFAULT_VERDICT_CACHE_ENTRIES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: JSON file to persist to, or None for an in-memory cache.
+            max_entries: Capacity before the least recently used entry is evicted.
+        """
+        self.path = Path(path) if path is not None else None
+        self._file_lock = (
+            get_file_lock(self.path.with_name(self.path.name + ".lock"))
+            if self.path is not None
+            else None
+        )
+        self._max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0}
+        # Counter increments not yet merged into the file
+        self._unsaved = dict.fromkeys(self._stats, 0)
+        self._lock = threading.Lock()
+        self._loaded = self.path is None
+        self._dirty = False
+
+    def get(self, key: str) -> Optional[ForensicVerdict]:
+        """Return a copy of the cached verdict for key, or None."""
+        with self._lock:
+            self._load()
+            self._dirty = True
+            data = self._entries.get(key)
+            if data is None:
+                self._count("misses")
+                return None
+            self._entries.move_to_end(key)
+            self._count("hits")
+        return forensic_verdict_from_dict(data)
+
+    def put(self, key: str, verdict: ForensicVerdict) -> None:
+        """Store a verdict and persist the cache."""
+        data = forensic_verdict_to_dict(verdict)
+        with self._lock:
+            self._load()
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            self._count("stores")
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._save()
+
+    def flush(self) -> None:
+        """Persist hit counters recorded since the last write."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return lookup counters (cumulative across processes) and the hit rate."""
+        with self._lock:
+            self._load()
+            return _verdict_cache_stats(self._stats, len(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._entries)
+
+    def _count(self, name: str) -> None:
+        """Bump a counter. Caller holds the lock."""
+        self._stats[name] += 1
+        self._unsaved[name] += 1
+
+    def _load(self) -> None:
+        """Read the persisted cache on first use. Caller holds the lock."""
+        if self._loaded:
+            return
+        self._loaded = True
+        data = _read_verdict_cache_file(self.path)
+        if data is None:
+            return
+        self._entries.update(data.get("entries") or {})
+        for name, value in (data.get("stats") or {}).items():
+            if name in self._stats:
+                self._stats[name] += int(value)
+
+    def _save(self) -> None:
+        """Merge with the file and write it atomically. Caller holds the lock."""
+        self._dirty = False
+        if self.path is None:
+            return
+        try:
+            with self._file_lock:
+                self._merge_and_write()
+        except OSError as e:
+            logger.warning("Failed to persist verdict cache %s: %s", self.path, e)
+
+    def _merge_and_write(self) -> None:
+        """Read-merge-replace the file. Caller holds both locks."""
+        on_disk = _read_verdict_cache_file(self.path) or {}
+        # Other processes' entries first: ours were used most recently
+        entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict(on_disk.get("entries") or {})
+        for key, data in self._entries.items():
+            entries.pop(key, None)
+            entries[key] = data
+        while len(entries) > self._max_entries:
+            entries.popitem(last=False)
+        disk_stats = on_disk.get("stats") or {}
+        stats = {name: int(disk_stats.get(name, 0)) + self._unsaved[name] for name in self._stats}
+        state = {"version": VERDICT_CACHE_VERSION, "stats": stats, "entries": entries}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=self.path.name + ".", suffix=".tmp", dir=self.path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_codec.dumpb(state))
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._entries = entries
+        self._stats = stats
+        self._unsaved = dict.fromkeys(self._stats, 0)
+
+
+def _verdict_cache_stats(counters: Dict[str, Any], entries: int) -> Dict[str, Any]:
+    """Lookup counters plus entry count and hit rate."""
+    stats = {name: int(counters.get(name, 0)) for name in ("hits", "misses", "stores")}
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        **stats,
+        "entries": entries,
+        "hit_rate": round(stats["hits"] / lookups, 4) if lookups else 0.0,
+    }
+
+
+def _read_verdict_cache_file(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a persisted verdict cache; None if missing, unreadable or outdated.
+
+    Archived runs are read from their bundle.
+    """
+    try:
+        with open_run_file(path, "rb") as f:
+            data = json_codec.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, json_codec.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable verdict cache %s: %s", path, e)
+        return None
+    if not isinstance(data, dict) or data.get("version") != VERDICT_CACHE_VERSION:
+        return None
+    return data
+
+
+def read_forensic_verdict_cache(run_base: Path) -> Optional[Dict[str, Any]]:
+    """Read a run's persisted verdict cache for display.
+
+    Unlike get_forensic_verdict_cache(), nothing is counted or written, so
+    viewers do not skew the hit rate.
+
+    Args:
+        run_base: The RUN_BASE path (e.g., swarm/runs/<run-id>/<flow-key>).
+
+    Returns:
+        {"stats": {hits, misses, stores, entries, hit_rate}, "verdicts":
+        {key: verdict dict}}, or None if the run has no verdict cache.
+    """
+    data = _read_verdict_cache_file(Path(run_base) / FORENSICS_DIR / VERDICT_CACHE_FILENAME)
+    if data is None:
+        return None
+    verdicts = data.get("entries") or {}
+    return {
+        "stats": _verdict_cache_stats(data.get("stats") or {}, len(verdicts)),
+        "verdicts": verdicts,
+    }
+
+
+# Caches of recently active runs, keyed by RUN_BASE
+_MAX_RUN_CACHES = 32
+_run_caches: "OrderedDict[Path, ForensicVerdictCache]" = OrderedDict()
+_run_caches_lock = threading.Lock()
+
+
+def get_forensic_verdict_cache(run_base: Path) -> ForensicVerdictCache:
+    """Return the verdict cache of a run, shared by everyone in this process.
+
+    Args:
+        run_base: The RUN_BASE path (e.g., swarm/runs/<run-id>/<flow-key>).
+    """
+    key = Path(run_base).resolve()
+    with _run_caches_lock:
+        cache = _run_caches.get(key)
+        if cache is None:
+            cache = ForensicVerdictCache(key / FORENSICS_DIR / VERDICT_CACHE_FILENAME)
+            _run_caches[key] = cache
+        _run_caches.move_to_end(key)
+        while len(_run_caches) > _MAX_RUN_CACHES:
+            _, evicted = _run_caches.popitem(last=False)
+            evicted.flush()
+        return cache
+
+
+def forensic_verdict_cache_stats(run_base: Path) -> Optional[Dict[str, Any]]:
+    """Flush and return a run's verdict cache stats, if it was used in this process."""
+    with _run_caches_lock:
+        cache = _run_caches.get(Path(run_base).resolve())
+    if cache is None:
+        return None
+    cache.flush()
+    return cache.stats()
+
+
+def reset_forensic_verdict_caches() -> None:
+    """Flush and forget all per-run caches (for testing)."""
+    with _run_caches_lock:
+        caches = list(_run_caches.values())
+        _run_caches.clear()
+    for cache in caches:
+        cache.flush()
+
+
 # =============================================================================
 # Exports
 # =============================================================================
@@ -626,4 +959,10 @@ __all__ = [
     # Core functions
     "compare_claim_vs_evidence",
     "build_forensic_verdict",
+    # Verdict cache
+    "ForensicVerdictCache",
+    "get_forensic_verdict_cache",
+    "forensic_verdict_cache_stats",
+    "read_forensic_verdict_cache",
+    "reset_forensic_verdict_caches",
 ]
@@ -0,0 +1,79 @@
+"""
+git_probe.py - Read git repository state from disk without running git.
+
+Cache keys across the runtime (preflight results, shared upstream status)
+depend on HEAD and ref files. Spawning git for every lookup would cost more
+than the cached work, so these helpers read .git directly. They understand
+linked worktrees (.git files, commondir) and packed refs.
+
+Usage:
+    from swarm.runtime.git_probe import find_git_dir, git_common_dir, read_git_head
+
+    git_dir = find_git_dir(repo_root)
+    head = read_git_head(git_dir)      # Commit id, "" if unknown
+    common = git_common_dir(git_dir)   # Shared refs of linked worktrees
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+
+def find_git_dir(repo_root: Path) -> Optional[Path]:
+    """Locate the git directory of a worktree without running git."""
+    for directory in (repo_root, *repo_root.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                return (directory / content[len("gitdir:") :].strip()).resolve()
+            return None
+    return None
+
+
+def git_common_dir(git_dir: Path) -> Path:
+    """Directory holding the shared refs (differs from git_dir in linked worktrees)."""
+    try:
+        return (git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()).resolve()
+    except OSError:
+        return git_dir
+
+
+def read_git_head(git_dir: Optional[Path]) -> str:
+    """Resolve HEAD to a commit id by reading refs (no subprocess)."""
+    if git_dir is None:
+        return ""
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return ""
+    if not head.startswith("ref:"):
+        return head
+    ref = head[len("ref:") :].strip()
+    # Linked worktrees keep branch refs in the common git directory
+    common = git_common_dir(git_dir)
+    for base in (git_dir, common):
+        try:
+            return (base / ref).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+    try:
+        for line in (common / "packed-refs").read_text(encoding="utf-8").splitlines():
+            if line.endswith(" " + ref):
+                return line.split(" ", 1)[0]
+    except OSError:
+        pass
+    return ref
+
+
+__all__ = [
+    "find_git_dir",
+    "git_common_dir",
+    "read_git_head",
+]
@@ -23,6 +23,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from swarm.runtime import json_codec
 from swarm.runtime.path_helpers import (
     ensure_forensics_dir,
     ensure_handoff_dir,
@@ -290,14 +291,14 @@ def write_handoff_envelope(
     extracted_file_changes_path: Optional[Path] = None
 
     if file_changes:
-        file_changes_json = json.dumps(file_changes)
+        file_changes_json = json_codec.dumpb(file_changes)
         if len(file_changes_json) > FILE_CHANGES_EXTRACTION_THRESHOLD:
             # Write file_changes to forensics directory
             ensure_forensics_dir(run_base)
             extracted_file_changes_path = make_file_changes_path(run_base, step_id)
 
             with extracted_file_changes_path.open("w", encoding="utf-8") as f:
-                json.dump(file_changes, f, indent=2)
+                json_codec.dump(file_changes, f, indent=True)
 
             logger.debug(
                 "Extracted file_changes (%d bytes) to %s",
@@ -316,13 +317,13 @@ def write_handoff_envelope(
     if write_draft:
         draft_path = run_base / "handoff" / f"{step_id}.draft.json"
         with draft_path.open("w", encoding="utf-8") as f:
-            json.dump(envelope_data, f, indent=2)
+            json_codec.dump(envelope_data, f, indent=True)
         logger.debug("Wrote draft envelope to %s", draft_path)
 
     # Write committed envelope at canonical path
     committed_path = make_handoff_envelope_path(run_base, step_id)
     with committed_path.open("w", encoding="utf-8") as f:
-        json.dump(envelope_data, f, indent=2)
+        json_codec.dump(envelope_data, f, indent=True)
     logger.debug("Wrote committed envelope to %s", committed_path)
 
     return envelope_data
@@ -354,17 +355,17 @@ def update_envelope_routing(
 
     try:
         with committed_path.open("r", encoding="utf-8") as f:
-            envelope_data = json.load(f)
+            envelope_data = json_codec.load(f)
 
         envelope_data["routing_signal"] = routing_signal
 
         with committed_path.open("w", encoding="utf-8") as f:
-            json.dump(envelope_data, f, indent=2)
+            json_codec.dump(envelope_data, f, indent=True)
 
         logger.debug("Updated envelope routing_signal for step %s", step_id)
         return envelope_data
 
-    except (json.JSONDecodeError, OSError) as e:
+    except (json_codec.JSONDecodeError, OSError) as e:
         logger.warning(
             "Failed to update envelope routing for step %s: %s",
             step_id,
@@ -399,9 +400,9 @@ def _hydrate_file_changes(
         if fc_path.exists():
             try:
                 with fc_path.open("r", encoding="utf-8") as f:
-                    envelope_data["file_changes"] = json.load(f)
+                    envelope_data["file_changes"] = json_codec.load(f)
                 logger.debug("Hydrated file_changes from %s", fc_path)
-            except (json.JSONDecodeError, OSError) as e:
+            except (json_codec.JSONDecodeError, OSError) as e:
                 logger.warning(
                     "Failed to hydrate file_changes from %s: %s",
                     fc_path,
@@ -445,8 +446,8 @@ def read_handoff_envelope(
         if draft_path.exists():
             try:
                 with draft_path.open("r", encoding="utf-8") as f:
-                    envelope_data = json.load(f)
-            except (json.JSONDecodeError, OSError) as e:
+                    envelope_data = json_codec.load(f)
+            except (json_codec.JSONDecodeError, OSError) as e:
                 logger.warning("Failed to read draft envelope %s: %s", draft_path, e)
 
     if envelope_data is None:
@@ -454,8 +455,8 @@ def read_handoff_envelope(
         if committed_path.exists():
             try:
                 with committed_path.open("r", encoding="utf-8") as f:
-                    envelope_data = json.load(f)
-            except (json.JSONDecodeError, OSError) as e:
+                    envelope_data = json_codec.load(f)
+            except (json_codec.JSONDecodeError, OSError) as e:
                 logger.warning("Failed to read committed envelope %s: %s", committed_path, e)
 
     if envelope_data is None:
@@ -23,6 +23,10 @@ Usage:
     # Sort history by priority (highest first, then by recency)
     sorted_history = prioritize_history(ctx.history)
 
+    # Across steps of a run: classify each item once, fit to a budget
+    render = partial(render_history_step, recent_max=4000, older_max=1000)
+    selection = history_index_for(ctx.history).select(budget, render=render)
+
 Design Philosophy:
     - Critical path agents (decisions, critics, implementations) are preserved
     - Foundation context (requirements, ADRs) is kept when possible
@@ -33,8 +37,12 @@ Design Philosophy:
 from __future__ import annotations
 
 import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import IntEnum
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -271,6 +279,237 @@ def prioritize_history(
     return decorated
 
 
+# =============================================================================
+# Incremental History Index
+# =============================================================================
+
+# Word pieces, digit groups and single symbols, roughly as BPE tokenizers split
+_TOKEN_PIECE_RE = re.compile(r"[^\W\d_]+|\d{1,3}|[^\w\s]|_")
+
+# Average characters per token within a single word
+_CHARS_PER_WORD_TOKEN = 5
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a tokenizer.
+
+    Words cost one token per few characters, digits one token per group of
+    three and every symbol one token; whitespace is free. This tracks BPE
+    tokenizers closely enough for budget fitting (typically within ~15% on
+    prose and code) at regex speed.
+
+    Args:
+        text: Text to measure.
+
+    Returns:
+        Estimated number of tokens.
+    """
+    tokens = 0
+    for piece in _TOKEN_PIECE_RE.findall(text):
+        tokens += 1 + (len(piece) - 1) // _CHARS_PER_WORD_TOKEN
+    return tokens
+
+
+def render_history_step(
+    priority: HistoryPriority,
+    item: Dict[str, Any],
+    is_most_recent: bool,
+    recent_max: int,
+    older_max: int,
+) -> str:
+    """Render one history item as a prompt section.
+
+    CRITICAL items and the most recent step keep up to recent_max characters
+    of output; everything else is cut to older_max. Errors are cut to 200.
+
+    Args:
+        priority: Priority of the item.
+        item: History item dictionary.
+        is_most_recent: Whether this is the latest step in the history.
+        recent_max: Output limit for critical and most recent items.
+        older_max: Output limit for other items.
+
+    Returns:
+        The rendered section, ending with a blank line.
+    """
+    status_emoji = "[OK]" if item.get("status") == "succeeded" else "[FAIL]"
+    step_lines = [f"### Step: {item.get('step_id')} {status_emoji}"]
+
+    if item.get("output"):
+        output = str(item.get("output"))
+        if priority >= HistoryPriority.CRITICAL or is_most_recent:
+            max_chars = recent_max
+        else:
+            max_chars = older_max
+        if len(output) > max_chars:
+            output = output[:max_chars] + "... (truncated)"
+        step_lines.append(f"Output: {output}")
+
+    if item.get("error"):
+        error = str(item.get("error"))
+        max_error = 200
+        if len(error) > max_error:
+            error = error[:max_error] + "... (truncated)"
+        step_lines.append(f"Error: {error}")
+
+    step_lines.append("")
+    return "\n".join(step_lines)
+
+
+@dataclass
+class HistorySelection:
+    """History items chosen to fit a budget.
+
+    Attributes:
+        included: (priority, original_index, item, text) in chronological order.
+        used: Budget consumed, in the units of the measure used.
+        budget: The budget the selection was made against.
+        total: Number of history items considered.
+    """
+
+    included: List[Tuple[HistoryPriority, int, Dict[str, Any], str]]
+    used: int
+    budget: int
+    total: int
+
+    @property
+    def truncated(self) -> bool:
+        """True if any history item was left out."""
+        return len(self.included) < self.total
+
+    def priority_distribution(self) -> Dict[str, int]:
+        """Counts of included items by priority label."""
+        counts = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0}
+        for priority, _, _, _ in self.included:
+            counts[get_priority_label(priority)] += 1
+        return counts
+
+
+class HistoryIndex:
+    """Append-only index of run history, classified once per item.
+
+    Each item is classified when it is appended and queued under its
+    priority, so producing the prioritized order for the next step costs a
+    concatenation of the queues instead of a reclassification and sort of
+    the whole history.
+
+    Items are assumed not to change after they are appended (the stepwise
+    orchestrator only appends to its history list).
+
+    """
+
+    def __init__(self, history: Optional[List[Dict[str, Any]]] = None):
+        self._rebuild(history or [])
+
+    def _rebuild(self, history: List[Dict[str, Any]]) -> None:
+        """Drop the indexed items and index history from scratch."""
+        self._items: List[Dict[str, Any]] = []
+        self._queues: Dict[HistoryPriority, List[int]] = {p: [] for p in HistoryPriority}
+        self._priorities: List[HistoryPriority] = []
+        for item in history:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def append(self, item: Dict[str, Any]) -> HistoryPriority:
+        """Classify and index one history item."""
+        priority = classify_history_item(item)
+        self._queues[priority].append(len(self._items))
+        self._priorities.append(priority)
+        self._items.append(item)
+        return priority
+
+    def sync(self, history: List[Dict[str, Any]]) -> "HistoryIndex":
+        """Bring the index up to date with a history list.
+
+        New trailing items are appended. If the list no longer extends the
+        indexed items (items replaced or removed), the index is rebuilt.
+        """
+        count = len(self._items)
+        if len(history) < count or any(
+            indexed is not current for indexed, current in zip(self._items, history)
+        ):
+            self._rebuild(history)
+            return self
+        for item in history[count:]:
+            self.append(item)
+        return self
+
+    def prioritized(self) -> List[Tuple[HistoryPriority, int, Dict[str, Any]]]:
+        """Items by priority descending, chronological within a priority.
+
+        Same order as prioritize_history(history).
+        """
+        return [
+            (priority, idx, self._items[idx])
+            for priority in sorted(HistoryPriority, reverse=True)
+            for idx in self._queues[priority]
+        ]
+
+    def select(
+        self,
+        budget: int,
+        render: Callable[[HistoryPriority, Dict[str, Any], bool], str],
+        measure: Callable[[str], int] = len,
+    ) -> HistorySelection:
+        """Choose the items to include within a budget.
+
+        Items are taken in priority order and each is included if it still
+        fits. A large item that does not fit does not block smaller,
+        lower-priority items behind it. The result is the optimal set under
+        the priority order: no selection within the budget keeps a
+        higher-ranked item that this one drops.
+
+        Args:
+            budget: Budget in measure units (characters by default).
+            render: (priority, item, is_most_recent) -> rendered text, e.g.
+                a functools.partial of render_history_step.
+            measure: Size of rendered text; len for characters, or
+                estimate_tokens for a token budget.
+
+        Returns:
+            HistorySelection in chronological order.
+        """
+        most_recent_idx = len(self._items) - 1
+        chosen: List[Tuple[HistoryPriority, int, Dict[str, Any], str]] = []
+        used = 0
+        for priority, idx, item in self.prioritized():
+            text = render(priority, item, idx == most_recent_idx)
+            size = measure(text)
+            if used + size > budget:
+                continue
+            chosen.append((priority, idx, item, text))
+            used += size
+        chosen.sort(key=lambda entry: entry[1])
+        return HistorySelection(included=chosen, used=used, budget=budget, total=len(self._items))
+
+
+# Indexes of live history lists, keyed by list identity. sync() verifies the
+# items, so a recycled id() simply triggers a rebuild.
+_MAX_TRACKED_HISTORIES = 32
+_history_indexes: "OrderedDict[int, HistoryIndex]" = OrderedDict()
+_history_indexes_lock = threading.Lock()
+
+
+def history_index_for(history: List[Dict[str, Any]]) -> HistoryIndex:
+    """Return the up-to-date index for a history list.
+
+    The index persists across steps of the same run, so each step only
+    classifies the items appended since the previous one.
+    """
+    key = id(history)
+    with _history_indexes_lock:
+        index = _history_indexes.get(key)
+        if index is None:
+            index = HistoryIndex()
+            _history_indexes[key] = index
+        _history_indexes.move_to_end(key)
+        while len(_history_indexes) > _MAX_TRACKED_HISTORIES:
+            _history_indexes.popitem(last=False)
+        return index.sync(history)
+
+
 def get_priority_label(priority: HistoryPriority) -> str:
     """Get human-readable label for a priority level."""
     labels = {
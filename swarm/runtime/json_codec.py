@@ -0,0 +1,163 @@
+"""
+json_codec.py - Fast JSON encoding/decoding for runtime I/O.
+
+Event appends and reads, envelope I/O, run state journaling, tailing and
+DuckDB ingestion all serialize JSON on hot paths. This module routes them
+through one codec that uses orjson when it is installed and falls back to
+the stdlib json module otherwise:
+
+    from swarm.runtime import json_codec
+
+    line = json_codec.dumps(event_dict)          # compact, UTF-8 (not \\u-escaped)
+    text = json_codec.dumps(envelope, indent=True)  # 2-space indent
+    data = json_codec.loads(line)
+
+Both backends produce the same output for our schemas (str/int/float/bool/
+None/list/dict): compact separators (",", ":"), or indent=2 with ": ",
+non-ASCII characters written as-is, non-string keys coerced like the stdlib
+does. Decoded values are identical. Known differences, none of which occur
+in event or envelope payloads: orjson spells float exponents without "+"
+and leading zeros ("1e16" vs "1e+16") and writes NaN/Infinity as null.
+
+Anything orjson cannot handle (integers beyond 64 bits, NaN literals on
+input, types it does not know) is retried with the stdlib module, so errors
+and `default=` behaviour match json.dumps/json.loads. datetime and dataclass
+instances are passed to `default` rather than serialized natively, as with
+the stdlib.
+
+Set SWARM_JSON_CODEC=stdlib to force the stdlib backend.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import IO, Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+# Environment override for the backend ("stdlib" disables orjson)
+CODEC_ENV = "SWARM_JSON_CODEC"
+
+# Raised by loads() on invalid input, whichever backend parsed it
+JSONDecodeError = json.JSONDecodeError
+
+_USE_ORJSON = orjson is not None and os.environ.get(CODEC_ENV, "").lower() not in (
+    "stdlib",
+    "json",
+)
+
+if orjson is not None:
+    _ORJSON_BASE = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def backend() -> str:
+    """Name of the active backend ("orjson" or "json")."""
+    return "orjson" if _USE_ORJSON else "json"
+
+
+def _stdlib_dumps(
+    obj: Any, indent: bool, sort_keys: bool, default: Optional[Callable[[Any], Any]]
+) -> str:
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        sort_keys=sort_keys,
+        default=default,
+    )
+
+
+def dumpb(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialize to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Value to serialize.
+        indent: Pretty-print with 2-space indentation.
+        sort_keys: Sort object keys.
+        default: Called for values that are not natively serializable.
+
+    Raises:
+        TypeError: If a value cannot be serialized.
+    """
+    if _USE_ORJSON:
+        option = _ORJSON_BASE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except orjson.JSONEncodeError:
+            pass  # e.g. int > 64 bits; the stdlib decides
+    return _stdlib_dumps(obj, indent, sort_keys, default).encode("utf-8")
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Serialize to a JSON string. See dumpb() for arguments."""
+    if _USE_ORJSON:
+        return dumpb(obj, indent=indent, sort_keys=sort_keys, default=default).decode("utf-8")
+    return _stdlib_dumps(obj, indent, sort_keys, default)
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Parse JSON from str or bytes.
+
+    Raises:
+        JSONDecodeError: If the input is not valid JSON.
+    """
+    if _USE_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity literals, huge ints, or invalid; the stdlib decides
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def load(fp: IO) -> Any:
+    """Parse JSON from an open text or binary file."""
+    return loads(fp.read())
+
+
+def dump(
+    obj: Any,
+    fp: IO,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """Serialize to an open text file. See dumpb() for arguments."""
+    fp.write(dumps(obj, indent=indent, sort_keys=sort_keys, default=default))
+
+
+__all__ = [
+    "CODEC_ENV",
+    "JSONDecodeError",
+    "backend",
+    "dump",
+    "dumpb",
+    "dumps",
+    "load",
+    "loads",
+]
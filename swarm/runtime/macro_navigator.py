@@ -871,6 +871,45 @@ class MacroNavigator:
         # Default: advance to next flow in sequence
         return self._default_advance(completed_flow)
 
+    def predict_next_flow(self, current_flow: str) -> Optional[str]:
+        """Predict the flow route_after_flow will choose after current_flow.
+
+        Used to pre-warm the next flow while current_flow is still running,
+        before its result is known. The prediction is the most frequent
+        successor of current_flow so far in this run (a gate that keeps
+        bouncing to build predicts build), otherwise the next flow in the
+        sequence.
+
+        Args:
+            current_flow: The flow that is currently executing.
+
+        Returns:
+            The likely next flow, or None if the run is expected to stop or
+            pause after current_flow.
+        """
+        if self._total_flow_executions + 1 >= self._run_plan.max_total_flows:
+            return None
+        human_policy = self._run_plan.human_policy
+        if current_flow in human_policy.require_approval_flows or (
+            human_policy.mode == "per_flow" and human_policy.allow_pause_between_flows
+        ):
+            return None
+
+        successors: Dict[str, int] = {}
+        executed = [entry["flow"] for entry in self._routing_history]
+        for flow_key, next_flow in zip(executed, executed[1:]):
+            if flow_key == current_flow:
+                successors[next_flow] = successors.get(next_flow, 0) + 1
+        if successors:
+            return max(successors, key=successors.get)
+
+        sequence = self._run_plan.flow_sequence
+        if current_flow in sequence:
+            idx = sequence.index(current_flow)
+            if idx + 1 < len(sequence):
+                return sequence[idx + 1]
+        return None
+
     def _record_execution(self, flow_key: str) -> None:
         """Record a flow execution for tracking."""
         self._flow_execution_counts[flow_key] = self._flow_execution_counts.get(flow_key, 0) + 1
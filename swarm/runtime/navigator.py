@@ -50,7 +50,10 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .navigator_cache import NavigatorDecisionCache
 
 logger = logging.getLogger(__name__)
 
@@ -310,6 +313,10 @@ class NavigatorOutput:
     elimination_log: List[Dict[str, str]] = field(default_factory=list)
     factors_considered: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Set when the decision was replayed from the decision cache
+    # (hit, key, scope, age_ms, hits, source_run_id, source_flow_key)
+    cache: Optional[Dict[str, Any]] = None
+
 
 # =============================================================================
 # Progress Tracker (Traditional Tooling)
@@ -560,6 +567,8 @@ class Navigator:
         self,
         llm_call: Optional[Callable[[str, str], str]] = None,
         model: str = "haiku",  # Default to cheap/fast model
+        cache: Optional["NavigatorDecisionCache"] = None,
+        use_cache: bool = True,
     ):
         """Initialize Navigator.
 
@@ -567,9 +576,25 @@ class Navigator:
             llm_call: Callable that takes (system_prompt, user_prompt) and
                      returns LLM response. If None, uses deterministic fallback.
             model: Model to use for navigation (default: haiku for speed/cost).
+            cache: Decision cache for LLM decisions. If None, uses the
+                  process-wide cache configured in runtime.yaml.
+            use_cache: Set False to always call the LLM.
         """
         self._llm_call = llm_call
         self._model = model
+        self._cache = cache
+        self._use_cache = use_cache
+
+    @property
+    def cache(self) -> Optional["NavigatorDecisionCache"]:
+        """Decision cache used for LLM decisions (None if disabled)."""
+        if not self._use_cache:
+            return None
+        if self._cache is None:
+            from .navigator_cache import get_navigator_cache
+
+            return get_navigator_cache()
+        return self._cache
 
     def navigate(self, nav_input: NavigatorInput) -> NavigatorOutput:
         """Make navigation decision.
@@ -588,23 +613,62 @@ class Navigator:
         system_prompt = self._build_system_prompt()
         user_prompt = self._build_user_prompt(nav_input)
 
+        # Replay a previous decision for an identical packet
+        cache = self.cache
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.key_for(
+                nav_input,
+                self._cache_material(nav_input, system_prompt, user_prompt),
+                run_scoped=bool(nav_input.context_digest),
+            )
+            cached = cache.get(cache_key, nav_input)
+            if cached is not None:
+                return cached
+
         try:
             # Make LLM call
             response = self._llm_call(system_prompt, user_prompt)
 
             # Parse response
-            return self._parse_response(response, nav_input)
+            output = self._parse_response(response, nav_input, fallback=False)
+
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.warning("Failed to parse Navigator response: %s", e)
+            return self._deterministic_navigate(nav_input)
 
         except Exception as e:
             logger.warning("Navigator LLM call failed: %s, using fallback", e)
             return self._deterministic_navigate(nav_input)
 
+        # Only decisions the LLM actually made are cached, never fallbacks
+        if cache is not None:
+            cache.put(cache_key, nav_input, output)
+        return output
+
     async def navigate_async(self, nav_input: NavigatorInput) -> NavigatorOutput:
         """Async version of navigate."""
         # For now, just wrap sync version
         # TODO: Add async LLM call support
         return self.navigate(nav_input)
 
+    def _cache_material(
+        self, nav_input: NavigatorInput, system_prompt: str, user_prompt: str
+    ) -> Dict[str, Any]:
+        """Build the decision cache key material.
+
+        Everything the LLM sees, including the iteration counter (the model
+        weighs how long a loop has run), plus the ProgressTracker signature.
+        """
+        packet = json.loads(user_prompt)
+        stall = nav_input.stall_signals
+        return {
+            "model": self._model,
+            "system": hashlib.sha256(system_prompt.encode("utf-8")).hexdigest(),
+            "packet": packet,
+            "progress_signature": stall.last_change_signature if stall else "",
+        }
+
     def _build_system_prompt(self) -> str:
         """Build system prompt for Navigator."""
         return """You are a Navigator for a stepwise execution system.
@@ -767,8 +831,13 @@ Be concise. The next worker needs actionable instructions, not essays."""
         self,
         response: str,
         nav_input: NavigatorInput,
+        fallback: bool = True,
     ) -> NavigatorOutput:
-        """Parse LLM response into NavigatorOutput."""
+        """Parse LLM response into NavigatorOutput.
+
+        Malformed responses fall back to deterministic navigation, or raise
+        if fallback is False.
+        """
         try:
             # Try to extract JSON from response
             # Handle responses that may have text before/after JSON
@@ -861,6 +930,8 @@ Be concise. The next worker needs actionable instructions, not essays."""
             )
 
         except (json.JSONDecodeError, KeyError, ValueError) as e:
+            if not fallback:
+                raise
             logger.warning("Failed to parse Navigator response: %s", e)
             return self._deterministic_navigate(nav_input)
 
@@ -1047,6 +1118,9 @@ def navigator_output_to_dict(output: NavigatorOutput) -> Dict[str, Any]:
     if output.factors_considered:
         result["factors_considered"] = output.factors_considered
 
+    if output.cache:
+        result["cache"] = dict(output.cache)
+
     return result
 
 
@@ -1119,4 +1193,5 @@ def navigator_output_from_dict(data: Dict[str, Any]) -> NavigatorOutput:
         chosen_candidate_id=data.get("chosen_candidate_id"),
         elimination_log=data.get("elimination_log", []),
         factors_considered=data.get("factors_considered", []),
+        cache=data.get("cache"),
     )
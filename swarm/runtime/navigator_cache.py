@@ -0,0 +1,258 @@
+"""
+navigator_cache.py - Content-addressed cache of Navigator decisions
+
+Navigator.navigate() makes an LLM call for every routing decision, even when
+the decision packet is the same as one already answered: a resumed run
+re-deciding an iteration it already decided, or a rerun of a flow over
+unchanged inputs. This cache
+keys decisions by a hash of everything the LLM sees and replays the stored
+decision instead of calling the model again.
+
+Key material (built by the Navigator):
+    - Model and system prompt
+    - The user prompt packet: current node, iteration, routing candidates,
+      candidate edges, verification summary, stall signals, sidequest
+      options, context digest and forensic verdict
+    - The ProgressTracker signature of the iteration
+
+Scope decides who may reuse an entry:
+    - "run": only the run that produced it (default)
+    - "flow": any run of the same flow
+    - "global": any run of any flow
+Decisions made with a context digest are always run-scoped: the digest
+summarizes one run's artifacts and must not steer another run.
+
+Staleness rules:
+    - Entries expire after max_age_seconds.
+    - At most max_entries are kept; the least recently used is evicted.
+    - Deterministic fallbacks (LLM or parse failures) are never stored, so
+      a transient failure is retried on the next decision.
+    - Decisions that ask for a human are never stored.
+    - invalidate(run_id) drops a run's entries (NavigationOrchestrator.reset).
+
+Hits are marked on the returned NavigatorOutput (output.cache) and carried
+into the navigation_decision audit payload.
+
+Usage:
+    from swarm.runtime.navigator_cache import NavigatorDecisionCache
+
+    navigator = Navigator(llm_call=call, cache=NavigatorDecisionCache(scope="flow"))
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from .navigator import NavigatorInput, NavigatorOutput
+
+logger = logging.getLogger(__name__)
+
+CACHE_SCOPES = ("run", "flow", "global")
+
+DEFAULT_SCOPE = "run"
+DEFAULT_MAX_AGE_SECONDS = 3600.0
+DEFAULT_MAX_ENTRIES = 512
+
+
+@dataclass
+class _CacheEntry:
+    """A stored decision (serialized NavigatorOutput) and its provenance."""
+
+    output: Dict[str, Any]
+    created_at: float
+    run_id: str
+    flow_key: str
+    hits: int = 0
+
+
+class NavigatorDecisionCache:
+    """LRU cache of Navigator decisions keyed by input content.
+
+    Thread-safe. Stored decisions are serialized, so callers may mutate the
+    NavigatorOutput they get back without affecting later hits.
+    """
+
+    def __init__(
+        self,
+        scope: str = DEFAULT_SCOPE,
+        max_age_seconds: Optional[float] = DEFAULT_MAX_AGE_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            scope: "run", "flow" or "global" (see module docstring).
+            max_age_seconds: Entry lifetime. None or 0 disables expiry.
+            max_entries: Capacity before LRU eviction.
+            clock: Monotonic time source (injectable for tests).
+        """
+        if scope not in CACHE_SCOPES:
+            raise ValueError(f"Invalid navigator cache scope '{scope}'. Valid: {CACHE_SCOPES}")
+        self.scope = scope
+        self._max_age = max_age_seconds or None
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "expired": 0, "evicted": 0}
+
+    def key_for(
+        self, nav_input: "NavigatorInput", material: Dict[str, Any], run_scoped: bool = False
+    ) -> str:
+        """Compute the cache key of a decision.
+
+        Args:
+            nav_input: The navigator input (for the scope namespace).
+            material: Everything the decision depends on, JSON-serializable.
+            run_scoped: Confine the key to the run whatever the cache scope
+                (for material that only holds within one run).
+        """
+        if self.scope == "run" or run_scoped:
+            namespace = f"run:{nav_input.run_id}:{nav_input.flow_key}"
+        elif self.scope == "flow":
+            namespace = f"flow:{nav_input.flow_key}"
+        else:
+            namespace = "global"
+        canonical = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+        return f"{namespace}:{digest}"
+
+    def get(self, key: str, nav_input: "NavigatorInput") -> Optional["NavigatorOutput"]:
+        """Return the cached decision for key, marked as a cache hit, or None."""
+        from .navigator import navigator_output_from_dict
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            age = self._clock() - entry.created_at
+            if self._max_age is not None and age > self._max_age:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            self._stats["hits"] += 1
+            output_data = entry.output
+            cache_info = {
+                "hit": True,
+                "key": key,
+                "scope": self.scope,
+                "age_ms": int(age * 1000),
+                "hits": entry.hits,
+                "source_run_id": entry.run_id,
+                "source_flow_key": entry.flow_key,
+            }
+
+        output = navigator_output_from_dict(output_data)
+        output.cache = cache_info
+        logger.debug(
+            "Navigator cache hit for %s/%s (age=%dms, source_run=%s)",
+            nav_input.flow_key,
+            nav_input.current_node,
+            cache_info["age_ms"],
+            cache_info["source_run_id"],
+        )
+        return output
+
+    def put(self, key: str, nav_input: "NavigatorInput", output: "NavigatorOutput") -> bool:
+        """Store a decision. Returns False if the decision is not cacheable."""
+        from .navigator import navigator_output_to_dict
+
+        if output.signals.needs_human:
+            return False
+        entry = _CacheEntry(
+            output=navigator_output_to_dict(output),
+            created_at=self._clock(),
+            run_id=nav_input.run_id,
+            flow_key=nav_input.flow_key,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._stats["stores"] += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evicted"] += 1
+        return True
+
+    def invalidate(self, run_id: Optional[str] = None) -> int:
+        """Drop entries produced by a run (or all entries if run_id is None).
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            if run_id is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            stale = [k for k, e in self._entries.items() if e.run_id == run_id]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current size."""
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# =============================================================================
+# Global Instance (Singleton Pattern)
+# =============================================================================
+
+_global_cache: Optional[NavigatorDecisionCache] = None
+_global_cache_loaded = False
+_global_cache_lock = threading.Lock()
+
+
+def get_navigator_cache() -> Optional[NavigatorDecisionCache]:
+    """Get the process-wide decision cache, or None if disabled in config."""
+    global _global_cache, _global_cache_loaded
+
+    with _global_cache_lock:
+        if not _global_cache_loaded:
+            from swarm.config.runtime_config import get_navigator_cache_settings
+
+            settings = get_navigator_cache_settings()
+            if settings["enabled"]:
+                _global_cache = NavigatorDecisionCache(
+                    scope=settings["scope"],
+                    max_age_seconds=settings["max_age_seconds"],
+                    max_entries=settings["max_entries"],
+                )
+            _global_cache_loaded = True
+        return _global_cache
+
+
+def reset_navigator_cache() -> None:
+    """Discard the global cache so it is rebuilt from config (for testing)."""
+    global _global_cache, _global_cache_loaded
+
+    with _global_cache_lock:
+        _global_cache = None
+        _global_cache_loaded = False
+
+
+__all__ = [
+    "CACHE_SCOPES",
+    "NavigatorDecisionCache",
+    "get_navigator_cache",
+    "reset_navigator_cache",
+]
@@ -81,6 +81,7 @@ from .types import (
 from .forensic_comparator import (
     compare_claim_vs_evidence,
     forensic_verdict_to_dict,
+    get_forensic_verdict_cache,
 )
 from .forensic_types import (
     DiffScanResult,
@@ -1109,10 +1110,13 @@ class NavigationOrchestrator:
                         )
 
                 # Compute forensic verdict comparing claims vs evidence
+                # Verdicts are cached per run, keyed by the evidence hash
+                run_base = self._repo_root / "swarm" / "runs" / run_id / flow_key
                 verdict = compare_claim_vs_evidence(
                     handoff=handoff_dict,
                     diff_result=diff_result,
                     test_summary=None,  # TODO: wire in test_summary when available
+                    cache=get_forensic_verdict_cache(run_base),
                 )
 
                 # Convert to dict for NavigatorInput
@@ -1153,6 +1157,13 @@ class NavigationOrchestrator:
 
         # Run Navigator
         nav_output = self._navigator.navigate(nav_input)
+        if nav_output.cache:
+            emit_navigation_cache_hit_event(
+                run_id=run_id,
+                flow_key=flow_key,
+                step_id=current_node,
+                nav_output=nav_output,
+            )
 
         # =================================================================
         # CANDIDATE VALIDATION: Verify chosen_candidate_id is valid
@@ -1292,6 +1303,9 @@ class NavigationOrchestrator:
         """
         self._progress_tracker.clear_all()
         self._sidequest_catalog.reset_usage(run_id)
+        cache = self._navigator.cache
+        if cache is not None:
+            cache.invalidate(run_id)
 
 
 # =============================================================================
@@ -1330,3 +1344,44 @@ def emit_navigation_event(
     )
 
     append_event_fn(run_id, event)
+
+
+def emit_navigation_cache_hit_event(
+    run_id: str,
+    flow_key: str,
+    step_id: str,
+    nav_output: NavigatorOutput,
+    append_event_fn: Optional[Callable] = None,
+) -> None:
+    """Emit an audit event for a decision replayed from the decision cache.
+
+    Args:
+        run_id: Run identifier.
+        flow_key: Flow key.
+        step_id: Step the decision routes from.
+        nav_output: Navigator output with cache info set.
+        append_event_fn: Function to append events (for testing).
+    """
+    if append_event_fn is None:
+        from . import storage as storage_module
+
+        append_event_fn = storage_module.append_event
+
+    event = RunEvent(
+        run_id=run_id,
+        ts=datetime.now(timezone.utc),
+        kind="navigation_cache_hit",
+        flow_key=flow_key,
+        step_id=step_id,
+        payload={
+            **(nav_output.cache or {}),
+            "intent": nav_output.route.intent.value,
+            "target_node": nav_output.route.target_node,
+            "chosen_candidate_id": nav_output.chosen_candidate_id,
+        },
+    )
+
+    try:
+        append_event_fn(run_id, event)
+    except Exception as e:
+        logger.warning("Failed to emit navigation cache hit event: %s", e)
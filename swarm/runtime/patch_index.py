@@ -0,0 +1,376 @@
+"""
+patch_index.py - Persisted index of evolution patches across runs.
+
+Regenerating evolution patches means parsing every run's wisdom artifacts
+(flow_evolution.patch, station_tuning.md, pack_improvements.md,
+feedback_actions.md). This module parses each run once and keeps the result
+in an index next to the runs (<runs_root>/.evolution_patches.json):
+
+1. Each run entry stores a fingerprint (size + mtime) of its wisdom artifacts
+2. Patches are regenerated only when that fingerprint changes
+3. Patch status (pending/applied/rejected) follows the .applied_<id> and
+   .rejected_<id> markers written next to the artifacts
+
+Listing pending patches becomes a query: one directory scan per run to
+check fingerprints and markers, no artifact reads.
+
+Usage:
+    from swarm.runtime.patch_index import PatchStatus, get_patch_index
+
+    index = get_patch_index(runs_root)
+    index.refresh(limit=50)
+    for entry in index.query(status=PatchStatus.PENDING):
+        print(entry.run_id, entry.patch.id, entry.target_file)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .evolution import EvolutionPatch, generate_evolution_patch
+from .run_archive import is_archived
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = ".evolution_patches.json"
+INDEX_VERSION = 1
+
+# Wisdom artifacts that generate_evolution_patch() parses
+WISDOM_PATCH_SOURCES = (
+    "flow_evolution.patch",
+    "station_tuning.md",
+    "pack_improvements.md",
+    "feedback_actions.md",
+)
+
+APPLIED_MARKER_PREFIX = ".applied_"
+REJECTED_MARKER_PREFIX = ".rejected_"
+
+
+class PatchStatus(str, Enum):
+    """Review status of an indexed evolution patch."""
+
+    PENDING = "pending"
+    APPLIED = "applied"
+    REJECTED = "rejected"
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class IndexedPatch:
+    """An evolution patch together with its review status.
+
+    Attributes:
+        run_id: The run whose wisdom artifacts produced the patch.
+        patch: The generated evolution patch.
+        status: Current review status.
+    """
+
+    run_id: str
+    patch: EvolutionPatch
+    status: PatchStatus = PatchStatus.PENDING
+
+    @property
+    def target_file(self) -> str:
+        """Target file of the patch (relative to repo root)."""
+        return self.patch.target_file
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"status": self.status.value, "patch": self.patch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, run_id: str, data: Dict[str, Any]) -> "IndexedPatch":
+        """Create from dictionary."""
+        return cls(
+            run_id=run_id,
+            patch=EvolutionPatch.from_dict(data["patch"]),
+            status=PatchStatus(data.get("status", PatchStatus.PENDING.value)),
+        )
+
+
+@dataclass
+class _RunEntry:
+    """Index entry for one run's wisdom directory."""
+
+    fingerprint: str
+    indexed_at: str
+    patches: List[IndexedPatch]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "indexed_at": self.indexed_at,
+            "patches": [p.to_dict() for p in self.patches],
+        }
+
+    @classmethod
+    def from_dict(cls, run_id: str, data: Dict[str, Any]) -> "_RunEntry":
+        return cls(
+            fingerprint=data.get("fingerprint", ""),
+            indexed_at=data.get("indexed_at", ""),
+            patches=[IndexedPatch.from_dict(run_id, p) for p in data.get("patches", [])],
+        )
+
+
+def _scan_wisdom_dir(wisdom_dir: Path) -> Tuple[str, Dict[str, PatchStatus]]:
+    """Scan a wisdom directory once for artifact fingerprint and status markers.
+
+    Returns:
+        Tuple of (fingerprint of the patch source artifacts, patch_id -> status
+        for every applied/rejected marker). Rejection wins over application
+        if both markers exist, matching the autopilot's skip logic.
+    """
+    sources: Dict[str, str] = {}
+    statuses: Dict[str, PatchStatus] = {}
+    with os.scandir(wisdom_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name in WISDOM_PATCH_SOURCES:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                sources[name] = f"{name}:{st.st_size}:{st.st_mtime_ns}"
+            elif name.startswith(APPLIED_MARKER_PREFIX):
+                patch_id = name[len(APPLIED_MARKER_PREFIX) :]
+                statuses.setdefault(patch_id, PatchStatus.APPLIED)
+            elif name.startswith(REJECTED_MARKER_PREFIX):
+                statuses[name[len(REJECTED_MARKER_PREFIX) :]] = PatchStatus.REJECTED
+    fingerprint = "|".join(sources[name] for name in sorted(sources))
+    return fingerprint, statuses
+
+
+class PatchIndex:
+    """Index of generated evolution patches keyed by run.
+
+    The in-memory index is loaded from disk once and written back only when
+    a refresh regenerates patches, changes a status, or drops deleted runs.
+
+    Thread-safe.
+    """
+
+    def __init__(self, runs_root: Path):
+        """Initialize the index.
+
+        Args:
+            runs_root: Runs directory; the index file lives inside it.
+        """
+        self._runs_root = Path(runs_root)
+        self._path = self._runs_root / INDEX_FILE
+        self._lock = threading.Lock()
+        self._runs: Dict[str, _RunEntry] = self._load()
+
+    @property
+    def path(self) -> Path:
+        """Path to the index file."""
+        return self._path
+
+    # -------------------------------------------------------------------------
+    # Refresh
+    # -------------------------------------------------------------------------
+
+    def refresh(self, limit: Optional[int] = None) -> List[str]:
+        """Bring the index up to date with the runs directory.
+
+        Args:
+            limit: Only refresh the most recent `limit` runs (by run_id order,
+                newest first). None refreshes every run.
+
+        Returns:
+            Run IDs that were refreshed, newest first.
+        """
+        if not self._runs_root.exists():
+            return []
+
+        run_ids = sorted(
+            (e.name for e in os.scandir(self._runs_root) if e.is_dir() and not e.name.startswith(".")),
+            reverse=True,
+        )
+        present = set(run_ids)
+        if limit is not None:
+            run_ids = run_ids[:limit]
+
+        with self._lock:
+            changed = False
+            for run_id in [r for r in self._runs if r not in present]:
+                del self._runs[run_id]
+                changed = True
+            for run_id in run_ids:
+                changed |= self._refresh_run_locked(run_id)
+            if changed:
+                self._save_locked()
+        return run_ids
+
+    def refresh_run(self, run_id: str) -> bool:
+        """Refresh a single run. Returns True if the run has wisdom artifacts."""
+        with self._lock:
+            if self._refresh_run_locked(run_id):
+                self._save_locked()
+            return run_id in self._runs
+
+    def _refresh_run_locked(self, run_id: str) -> bool:
+        """Re-index one run if its artifacts or markers changed. Returns True on change."""
+        wisdom_dir = self._runs_root / run_id / "wisdom"
+        try:
+            fingerprint, statuses = _scan_wisdom_dir(wisdom_dir)
+        except OSError:
+            if run_id in self._runs and is_archived(self._runs_root / run_id):
+                # Archived runs keep their indexed patches (statuses frozen)
+                return False
+            return self._runs.pop(run_id, None) is not None
+
+        entry = self._runs.get(run_id)
+        changed = False
+        if entry is None or entry.fingerprint != fingerprint:
+            patches = generate_evolution_patch(wisdom_dir, run_id=run_id) if fingerprint else []
+            entry = _RunEntry(
+                fingerprint=fingerprint,
+                indexed_at=_now_iso(),
+                patches=[IndexedPatch(run_id=run_id, patch=p) for p in patches],
+            )
+            self._runs[run_id] = entry
+            changed = True
+
+        for indexed in entry.patches:
+            status = statuses.get(indexed.patch.id, PatchStatus.PENDING)
+            if indexed.status != status:
+                indexed.status = status
+                changed = True
+        return changed
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def query(
+        self,
+        status: Optional[PatchStatus] = None,
+        run_id: Optional[str] = None,
+        target_file: Optional[str] = None,
+        run_ids: Optional[List[str]] = None,
+    ) -> List[IndexedPatch]:
+        """Return indexed patches matching all given filters.
+
+        Args:
+            status: Only patches with this status.
+            run_id: Only patches from this run.
+            target_file: Only patches targeting this file.
+            run_ids: Only patches from these runs, in this order. Without it,
+                runs are ordered newest first.
+
+        Returns:
+            Matching patches, grouped by run in run order.
+        """
+        with self._lock:
+            if run_id is not None:
+                order = [run_id]
+            elif run_ids is not None:
+                order = list(run_ids)
+            else:
+                order = sorted(self._runs, reverse=True)
+            results: List[IndexedPatch] = []
+            for rid in order:
+                entry = self._runs.get(rid)
+                if entry is None:
+                    continue
+                for indexed in entry.patches:
+                    if status is not None and indexed.status != status:
+                        continue
+                    if target_file is not None and indexed.target_file != target_file:
+                        continue
+                    results.append(indexed)
+            return results
+
+    def get_run_patches(self, run_id: str) -> List[EvolutionPatch]:
+        """Return every patch generated for a run, refreshing it first."""
+        self.refresh_run(run_id)
+        return [indexed.patch for indexed in self.query(run_id=run_id)]
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> Dict[str, _RunEntry]:
+        """Read the index file. Missing or unreadable files yield an empty index."""
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return {}
+            return {run_id: _RunEntry.from_dict(run_id, entry) for run_id, entry in data.get("runs", {}).items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, AttributeError, TypeError) as e:
+            logger.warning("Ignoring unreadable evolution patch index %s: %s", self._path, e)
+            return {}
+
+    def _save_locked(self) -> None:
+        """Write the index atomically (temp file + os.replace). Caller holds the lock."""
+        data = {
+            "version": INDEX_VERSION,
+            "updated_at": _now_iso(),
+            "runs": {run_id: entry.to_dict() for run_id, entry in sorted(self._runs.items())},
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=INDEX_FILE + ".", dir=self._runs_root)
+        except OSError as e:
+            logger.warning("Failed to write evolution patch index %s: %s", self._path, e)
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.warning("Failed to write evolution patch index %s: %s", self._path, e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+# =============================================================================
+# Global Instances (one index per runs directory)
+# =============================================================================
+
+_indexes: Dict[Path, PatchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_patch_index(runs_root: Path) -> PatchIndex:
+    """Get the shared PatchIndex for a runs directory."""
+    key = Path(runs_root).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = PatchIndex(key)
+            _indexes[key] = index
+        return index
+
+
+def reset_patch_indexes() -> None:
+    """Forget all index instances (for testing)."""
+    with _indexes_lock:
+        _indexes.clear()
+
+
+__all__ = [
+    "INDEX_FILE",
+    "IndexedPatch",
+    "PatchIndex",
+    "PatchStatus",
+    "get_patch_index",
+    "reset_patch_indexes",
+]
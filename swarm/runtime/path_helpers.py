@@ -26,6 +26,8 @@ import re
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from .run_archive import list_run_files
+
 # Directory names
 LLM_DIR = "llm"
 RECEIPTS_DIR = "receipts"
@@ -299,25 +301,16 @@ def list_transcripts(run_base: Path, engine: Optional[str] = None) -> List[Path]
         engine: Optional engine to filter by (e.g., "claude", "gemini")
 
     Returns:
-        List of transcript file paths, sorted by name.
+        List of transcript file paths, sorted by name. Includes transcripts
+        of archived runs (open those with run_archive.open_run_file()).
         Returns empty list if directory doesn't exist.
 
     Example:
         >>> transcripts = list_transcripts(Path("/runs/abc/build"))
         >>> transcripts = list_transcripts(Path("/runs/abc/build"), engine="claude")
     """
-    llm_dir = run_base / LLM_DIR
-
-    if not llm_dir.exists():
-        return []
-
     transcripts: List[Path] = []
-    for entry in llm_dir.iterdir():
-        if not entry.is_file():
-            continue
-        if not entry.name.endswith(TRANSCRIPT_EXT):
-            continue
-
+    for entry in list_run_files(run_base / LLM_DIR, f"*{TRANSCRIPT_EXT}"):
         # Optionally filter by engine
         if engine is not None:
             parsed = parse_transcript_filename(entry.name)
@@ -336,24 +329,11 @@ def list_receipts(run_base: Path) -> List[Path]:
         run_base: The RUN_BASE path
 
     Returns:
-        List of receipt file paths, sorted by name.
+        List of receipt file paths, sorted by name. Includes receipts of
+        archived runs (open those with run_archive.open_run_file()).
         Returns empty list if directory doesn't exist.
 
     Example:
         >>> receipts = list_receipts(Path("/runs/abc/build"))
     """
-    receipts_dir = run_base / RECEIPTS_DIR
-
-    if not receipts_dir.exists():
-        return []
-
-    receipts: List[Path] = []
-    for entry in receipts_dir.iterdir():
-        if not entry.is_file():
-            continue
-        if not entry.name.endswith(RECEIPT_EXT):
-            continue
-
-        receipts.append(entry)
-
-    return sorted(receipts, key=lambda p: p.name)
+    return list_run_files(run_base / RECEIPTS_DIR, f"*{RECEIPT_EXT}")
@@ -22,22 +22,64 @@ Usage:
     # Full orchestrator access
     orchestrator = PreflightOrchestrator(repo_root=Path("/path/to/repo"))
     result = orchestrator.run_all_checks(run_spec, backend="gemini-step-orchestrator")
+
+Checks run concurrently, each with its own timeout (CHECK_TIMEOUTS). Passing
+and warning results are cached per process under explicit validity keys, so
+back-to-back run launches skip the git and CLI probes:
+- harness: repo HEAD, Python executable, environment fingerprint
+- credentials: environment fingerprint, runtime.yaml mtime
+- repo: repo HEAD, git index mtime
+- backend: CLI binary path and mtime, environment fingerprint
+The paths check is per-run and always runs, and so does the working tree
+status part of a cached repo result (edits do not touch HEAD or the index).
+Failed results are never cached,
+and every entry also expires after CACHE_MAX_AGE_SECONDS.
 """
 
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
 import logging
 import os
 import shutil
 import subprocess
-from dataclasses import dataclass, field
+import sys
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from swarm.runtime.git_probe import find_git_dir, read_git_head
+
 logger = logging.getLogger(__name__)
 
+# Per-check timeouts in seconds; a check that overruns fails
+CHECK_TIMEOUTS: Dict[str, float] = {
+    "harness": 30.0,
+    "credentials": 10.0,
+    "repo": 20.0,
+    "paths": 10.0,
+    "backend": 10.0,
+}
+
+# Upper bound on the lifetime of a cached check result
+CACHE_MAX_AGE_SECONDS = 600.0
+
+UNCOMMITTED_CHANGES_WARNING = "Repository has uncommitted changes"
+
+# What each backend needs: an SDK package or a CLI executable
+BACKEND_REQUIREMENTS: Dict[str, Dict[str, Optional[str]]] = {
+    "claude-harness": {"type": "cli", "cli": "claude", "package": None},
+    "claude-agent-sdk": {"type": "sdk", "cli": None, "package": "anthropic"},
+    "claude-step-orchestrator": {"type": "sdk", "cli": None, "package": "anthropic"},
+    "gemini-cli": {"type": "cli", "cli": "gemini", "package": None},
+    "gemini-step-orchestrator": {"type": "cli", "cli": "gemini", "package": None},
+}
+
 
 class CheckStatus(str, Enum):
     """Status of an individual preflight check."""
@@ -78,7 +120,10 @@ class PreflightResult:
         checks: List of individual check results.
         blocking_issues: List of issues that prevent execution.
         warnings: List of non-blocking warnings.
-        total_duration_ms: Total time for all checks.
+        total_duration_ms: Wall-clock launch latency of the preflight.
+        sequential_duration_ms: Sum of individual check durations, i.e. the
+            latency of running every check in sequence without the cache.
+        cached_checks: Names of checks answered from the result cache.
         timestamp: When the preflight was run.
         run_id: Run ID if available.
         backend: Backend that was checked.
@@ -89,6 +134,8 @@ class PreflightResult:
     blocking_issues: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     total_duration_ms: int = 0
+    sequential_duration_ms: int = 0
+    cached_checks: List[str] = field(default_factory=list)
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     run_id: Optional[str] = None
     backend: Optional[str] = None
@@ -111,12 +158,44 @@ class PreflightResult:
             "blocking_issues": self.blocking_issues,
             "warnings": self.warnings,
             "total_duration_ms": self.total_duration_ms,
+            "sequential_duration_ms": self.sequential_duration_ms,
+            "cached_checks": self.cached_checks,
             "timestamp": self.timestamp.isoformat(),
             "run_id": self.run_id,
             "backend": self.backend,
         }
 
 
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+# (check name, repo root, args) -> (validity key, result, stored at)
+_check_cache: Dict[Tuple[str, ...], Tuple[Tuple[Any, ...], CheckResult, float]] = {}
+_check_cache_lock = threading.Lock()
+
+
+def clear_preflight_cache() -> None:
+    """Drop all cached check results."""
+    with _check_cache_lock:
+        _check_cache.clear()
+
+
+def _env_fingerprint() -> str:
+    """Hash of the process environment (values are never stored)."""
+    digest = hashlib.sha256()
+    for key, value in sorted(os.environ.items()):
+        digest.update(f"{key}={value}\0".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()[:16]
+
+
+def _mtime_ns(path: Optional[Path]) -> int:
+    try:
+        return path.stat().st_mtime_ns if path else 0
+    except OSError:
+        return 0
+
+
 class PreflightOrchestrator:
     """Unified preflight orchestrator for environment validation.
 
@@ -127,6 +206,9 @@ class PreflightOrchestrator:
     4. check_paths() - RUN_BASE directories exist and writable
     5. check_backend_availability() - SDK/CLI available for selected backend
 
+    Independent checks run concurrently with per-check timeouts, and
+    passing results are reused while their validity keys are unchanged.
+
     Attributes:
         repo_root: Repository root path.
         skip_checks: Set of check names to skip.
@@ -136,15 +218,21 @@ class PreflightOrchestrator:
         self,
         repo_root: Optional[Path] = None,
         skip_checks: Optional[List[str]] = None,
+        use_cache: bool = True,
+        timeouts: Optional[Dict[str, float]] = None,
     ):
         """Initialize the preflight orchestrator.
 
         Args:
             repo_root: Repository root path. Defaults to auto-detection.
             skip_checks: List of check names to skip (e.g., ["credentials"]).
+            use_cache: Reuse cached results whose validity keys still match.
+            timeouts: Per-check timeout overrides in seconds (see CHECK_TIMEOUTS).
         """
         self._repo_root = repo_root or Path(__file__).resolve().parents[2]
         self._skip_checks = set(skip_checks or [])
+        self._use_cache = use_cache
+        self._timeouts = {**CHECK_TIMEOUTS, **(timeouts or {})}
 
     def _time_check(self, check_fn: Callable[[], CheckResult]) -> CheckResult:
         """Run a check function and measure duration.
@@ -155,8 +243,6 @@ class PreflightOrchestrator:
         Returns:
             CheckResult with duration_ms populated.
         """
-        import time
-
         start = time.perf_counter()
         try:
             result = check_fn()
@@ -415,23 +501,11 @@ class PreflightOrchestrator:
             )
 
         # Check for uncommitted changes (warning, not blocking)
-        try:
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                timeout=5,
-                cwd=str(self._repo_root),
-            )
-            if result.returncode == 0:
-                output = result.stdout.decode().strip()
-                if output:
-                    details["has_uncommitted_changes"] = True
-                    details["uncommitted_count"] = len(output.split("\n"))
-                    warnings.append("Repository has uncommitted changes")
-                else:
-                    details["has_uncommitted_changes"] = False
-        except Exception:
-            pass  # Non-fatal
+        tree_status = self._working_tree_status()
+        if tree_status is not None:
+            details.update(tree_status)
+            if tree_status["has_uncommitted_changes"]:
+                warnings.append(UNCOMMITTED_CHANGES_WARNING)
 
         # Check workspace is writable
         test_file = self._repo_root / ".preflight_test"
@@ -457,6 +531,44 @@ class PreflightOrchestrator:
             details=details,
         )
 
+    def _working_tree_status(self) -> Optional[Dict[str, Any]]:
+        """Uncommitted change details from git status, or None if unavailable."""
+        try:
+            result = subprocess.run(
+                ["git", "status", "--porcelain"],
+                capture_output=True,
+                timeout=5,
+                cwd=str(self._repo_root),
+            )
+        except Exception:
+            return None  # Non-fatal
+        if result.returncode != 0:
+            return None
+        output = result.stdout.decode().strip()
+        if not output:
+            return {"has_uncommitted_changes": False}
+        return {"has_uncommitted_changes": True, "uncommitted_count": len(output.split("\n"))}
+
+    def _refresh_working_tree(self, cached: CheckResult) -> CheckResult:
+        """Re-run the working tree status part of a cached repo result."""
+        tree_status = self._working_tree_status()
+        if tree_status is None:
+            return cached
+        details = {
+            key: value for key, value in cached.details.items() if key != "uncommitted_count"
+        }
+        details.update(tree_status)
+        if tree_status["has_uncommitted_changes"]:
+            return replace(
+                cached,
+                status=CheckStatus.WARNING,
+                message=UNCOMMITTED_CHANGES_WARNING,
+                details=details,
+            )
+        return replace(
+            cached, status=CheckStatus.PASSED, message="Repository is healthy", details=details
+        )
+
     def check_paths(self, run_id: Optional[str] = None) -> CheckResult:
         """Check RUN_BASE paths exist and are writable.
 
@@ -536,16 +648,7 @@ class PreflightOrchestrator:
         """
         details: Dict[str, Any] = {"backend": backend}
 
-        # Map backends to their requirements
-        backend_requirements = {
-            "claude-harness": {"type": "cli", "cli": "claude", "package": None},
-            "claude-agent-sdk": {"type": "sdk", "cli": None, "package": "anthropic"},
-            "claude-step-orchestrator": {"type": "sdk", "cli": None, "package": "anthropic"},
-            "gemini-cli": {"type": "cli", "cli": "gemini", "package": None},
-            "gemini-step-orchestrator": {"type": "cli", "cli": "gemini", "package": None},
-        }
-
-        requirements = backend_requirements.get(backend)
+        requirements = BACKEND_REQUIREMENTS.get(backend)
         if requirements is None:
             # Unknown backend - assume it's available
             return CheckResult(
@@ -555,7 +658,7 @@ class PreflightOrchestrator:
                 details=details,
             )
 
-        details["requirements"] = requirements
+        details["requirements"] = dict(requirements)
 
         # Check SDK availability
         if requirements["package"]:
@@ -626,8 +729,6 @@ class PreflightOrchestrator:
         Returns:
             PreflightResult with aggregate status.
         """
-        import time
-
         start_time = time.perf_counter()
 
         # Determine backend
@@ -640,8 +741,8 @@ class PreflightOrchestrator:
         checks: List[CheckResult] = []
         blocking_issues: List[str] = []
         warnings: List[str] = []
+        cached_checks: List[str] = []
 
-        # Run checks in sequence
         # Note: Using default args to capture variables in lambdas correctly
         check_functions: List[Tuple[str, Callable[[], CheckResult]]] = [
             ("harness", lambda: self.check_harness_health()),
@@ -650,19 +751,69 @@ class PreflightOrchestrator:
             ("paths", lambda r=run_id: self.check_paths(r)),
             ("backend", lambda b=backend: self.check_backend_availability(b)),
         ]
-
+        # Answer what we can from the cache, then run the rest concurrently
+        results: Dict[str, CheckResult] = {}
+        pending: List[Tuple[str, Callable[[], CheckResult], Tuple[str, ...], Any]] = []
         for check_name, check_fn in check_functions:
             if check_name in self._skip_checks:
-                checks.append(
-                    CheckResult(
-                        name=check_name,
-                        status=CheckStatus.SKIPPED,
-                        message="Skipped by configuration",
-                    )
+                results[check_name] = CheckResult(
+                    name=check_name,
+                    status=CheckStatus.SKIPPED,
+                    message="Skipped by configuration",
                 )
                 continue
 
-            result = self._time_check(check_fn)
+            validity_key = self._validity_key(check_name, backend) if self._use_cache else None
+            cache_key = (check_name, str(self._repo_root), str(backend))
+            cached = self._cache_get(cache_key, validity_key)
+            if cached is not None and check_name == "repo":
+                # Working tree edits do not change the validity key
+                cached_checks.append(check_name)
+                pending.append(
+                    (check_name, lambda c=cached: self._refresh_working_tree(c), cache_key, None)
+                )
+            elif cached is not None:
+                results[check_name] = cached
+                cached_checks.append(check_name)
+            else:
+                pending.append((check_name, check_fn, cache_key, validity_key))
+
+        if pending:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(pending), thread_name_prefix="preflight"
+            )
+            try:
+                submitted_at = time.perf_counter()
+                futures = [
+                    (name, executor.submit(self._time_check, fn), cache_key, validity_key)
+                    for name, fn, cache_key, validity_key in pending
+                ]
+                for check_name, future, cache_key, validity_key in futures:
+                    timeout = self._timeouts.get(check_name, 30.0)
+                    remaining = timeout - (time.perf_counter() - submitted_at)
+                    try:
+                        result = future.result(timeout=max(0.0, remaining))
+                    except concurrent.futures.TimeoutError:
+                        result = CheckResult(
+                            name=check_name,
+                            status=CheckStatus.FAILED,
+                            message=f"Check timed out after {timeout:g}s",
+                            duration_ms=int(timeout * 1000),
+                            fix_hint="Investigate the slow check or skip it with skip_checks",
+                        )
+                    results[check_name] = result
+                    # Failures are re-checked every time so fixes show up at once
+                    if validity_key is not None and result.status in (
+                        CheckStatus.PASSED,
+                        CheckStatus.WARNING,
+                    ):
+                        self._cache_put(cache_key, validity_key, result)
+            finally:
+                # Do not wait for checks that overran their timeout
+                executor.shutdown(wait=False)
+
+        for check_name, _ in check_functions:
+            result = results[check_name]
             checks.append(result)
 
             if result.status == CheckStatus.FAILED:
@@ -672,6 +823,9 @@ class PreflightOrchestrator:
 
         end_time = time.perf_counter()
         total_duration_ms = int((end_time - start_time) * 1000)
+        sequential_duration_ms = sum(
+            c.details.get("cached_duration_ms", c.duration_ms) for c in checks
+        )
 
         passed = len(blocking_issues) == 0
 
@@ -681,10 +835,71 @@ class PreflightOrchestrator:
             blocking_issues=blocking_issues,
             warnings=warnings,
             total_duration_ms=total_duration_ms,
+            sequential_duration_ms=sequential_duration_ms,
+            cached_checks=cached_checks,
             run_id=run_id,
             backend=backend,
         )
 
+    # -------------------------------------------------------------------------
+    # Result cache
+    # -------------------------------------------------------------------------
+
+    def _validity_key(
+        self, check_name: str, backend: Optional[str]
+    ) -> Optional[Tuple[Any, ...]]:
+        """Inputs a cached result of check_name depends on (None: never cache)."""
+        if check_name == "harness":
+            head = read_git_head(find_git_dir(self._repo_root))
+            return (head, sys.executable, _env_fingerprint())
+        if check_name == "credentials":
+            from swarm.config.runtime_config import _CONFIG_PATH
+
+            return (_env_fingerprint(), _mtime_ns(_CONFIG_PATH))
+        if check_name == "repo":
+            git_dir = find_git_dir(self._repo_root)
+            index = git_dir / "index" if git_dir else None
+            return (read_git_head(git_dir), _mtime_ns(index))
+        if check_name == "backend":
+            cli = (BACKEND_REQUIREMENTS.get(backend or "") or {}).get("cli")
+            cli_path = shutil.which(cli) if cli else None
+            cli_mtime = _mtime_ns(Path(cli_path) if cli_path else None)
+            return (cli_path, cli_mtime, _env_fingerprint())
+        # paths is run-specific and cheap
+        return None
+
+    def _cache_get(
+        self, cache_key: Tuple[str, ...], validity_key: Optional[Tuple[Any, ...]]
+    ) -> Optional[CheckResult]:
+        if validity_key is None:
+            return None
+        with _check_cache_lock:
+            entry = _check_cache.get(cache_key)
+            if entry is None:
+                return None
+            stored_key, result, stored_at = entry
+            age = time.monotonic() - stored_at
+            if stored_key != validity_key or age > CACHE_MAX_AGE_SECONDS:
+                del _check_cache[cache_key]
+                return None
+        details = {
+            **result.details,
+            "cached": True,
+            "cache_age_ms": int(age * 1000),
+            "cached_duration_ms": result.duration_ms,
+        }
+        return replace(result, duration_ms=0, details=details)
+
+    def _cache_put(
+        self,
+        cache_key: Tuple[str, ...],
+        validity_key: Tuple[Any, ...],
+        result: CheckResult,
+    ) -> None:
+        stored = replace(result, details=dict(result.details))
+        with _check_cache_lock:
+            _check_cache[cache_key] = (validity_key, stored, time.monotonic())
+
 
 def run_preflight(
     run_spec: Optional[Any] = None,
@@ -0,0 +1,112 @@
+"""
+quantile_sketch.py - Mergeable quantile sketch for duration rollups.
+
+A log-bucketed histogram (the DDSketch scheme): every value v > 0 falls in
+bucket ceil(log_gamma(v)) with gamma = (1 + a) / (1 - a), so any quantile
+estimate is within relative error `a` of the true value. Sketches merge by
+adding bucket counts, which lets StatsDB rollup rows (per day, flow,
+station, agent) be combined into p50/p95 over any slice without touching
+raw step rows.
+
+Usage:
+    from swarm.runtime.quantile_sketch import DurationSketch
+
+    sketch = DurationSketch()
+    for ms in durations:
+        sketch.add(ms)
+    p95 = sketch.quantile(0.95)
+
+    merged = DurationSketch.from_json(row_a).merge(DurationSketch.from_json(row_b))
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Dict, Optional
+
+# Relative accuracy of quantile estimates (2%)
+DEFAULT_RELATIVE_ACCURACY = 0.02
+
+
+class DurationSketch:
+    """Mergeable relative-error quantile sketch over non-negative values.
+
+    Values <= 0 are counted in a dedicated zero bucket.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates.
+        """
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value (e.g. a duration in ms) to the sketch."""
+        if count <= 0:
+            return
+        self.count += count
+        if value <= 0:
+            self.zero_count += count
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge(self, other: "DurationSketch") -> "DurationSketch":
+        """Add another sketch's counts into this one. Returns self."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (0 <= q <= 1). Returns None if empty."""
+        if self.count == 0:
+            return None
+        q = min(max(q, 0.0), 1.0)
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Bucket midpoint (in relative terms) bounds the error by `a`
+                return 2 * self._gamma**index / (self._gamma + 1)
+        return 2 * self._gamma ** max(self.buckets) / (self._gamma + 1)
+
+    def to_json(self) -> str:
+        """Serialize for storage in a JSON column."""
+        return json.dumps(
+            {
+                "a": self.relative_accuracy,
+                "z": self.zero_count,
+                "b": {str(k): v for k, v in sorted(self.buckets.items())},
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, data: Optional[str]) -> "DurationSketch":
+        """Deserialize a sketch. None or empty input yields an empty sketch."""
+        if not data:
+            return cls()
+        raw = json.loads(data) if isinstance(data, str) else data
+        sketch = cls(relative_accuracy=raw.get("a", DEFAULT_RELATIVE_ACCURACY))
+        sketch.zero_count = int(raw.get("z", 0))
+        sketch.buckets = {int(k): int(v) for k, v in raw.get("b", {}).items()}
+        sketch.count = sketch.zero_count + sum(sketch.buckets.values())
+        return sketch
+
+
+__all__ = ["DEFAULT_RELATIVE_ACCURACY", "DurationSketch"]
@@ -0,0 +1,604 @@
+"""
+rate_limiter.py - Token-bucket rate limiting for engine calls
+
+Concurrent runs and parallel branches call the Claude SDK/CLI and the
+Gemini CLI independently. Without coordination a burst of active runs
+exceeds provider rate limits and every run falls into retries at once.
+This module gives all engine calls in a process one shared limiter:
+
+    - One pair of token buckets per engine: requests per minute and LLM
+      tokens per minute. A bucket holds up to one minute's worth, so short
+      bursts pass and sustained load is smoothed to the rate.
+    - Models with their own limits get their own pair of buckets nested
+      under the engine's: a call takes from both, so the models together
+      never exceed the engine quota.
+    - Waiters for an engine are served priority-first, then FIFO, so
+      interactive runs overtake queued batch (autopilot) runs.
+    - Token usage is only known after a call. Callers reserve an estimate
+      and report the actual count on the permit; the difference is charged
+      afterwards, and a bucket in debt makes the next caller wait.
+    - With shared mode enabled, bucket levels live in a JSON file guarded
+      by a file lock, so every process on the host draws from the same
+      buckets. Priority ordering then applies within each process.
+
+Configuration (runtime.yaml ``rate_limits`` section, env vars override):
+    SWARM_<ENGINE>_REQUESTS_PER_MINUTE: e.g. SWARM_CLAUDE_REQUESTS_PER_MINUTE=50
+    SWARM_<ENGINE>_TOKENS_PER_MINUTE: e.g. SWARM_GEMINI_TOKENS_PER_MINUTE=1000000
+    SWARM_RATE_LIMIT_SHARED: "1" to share buckets across processes.
+Engines without limits are not throttled (the default).
+
+Usage:
+    from swarm.runtime.rate_limiter import get_rate_limiter, priority_for_spec
+
+    limiter = get_rate_limiter()
+    with limiter.acquire("claude", model, priority=priority_for_spec(spec)) as permit:
+        result = call_engine()
+        permit.record_tokens(result_tokens)
+
+    async with limiter.acquire_async("gemini", None) as permit:
+        ...
+
+    limiter.stats().to_dict()  # queue-wait metrics
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import itertools
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from . import json_codec
+from .file_lock import get_file_lock
+
+logger = logging.getLogger(__name__)
+
+# Priority classes (higher is served first). RunSpec.params["priority"] may
+# name a class or give an integer.
+PRIORITY_INTERACTIVE = 10
+PRIORITY_NORMAL = 0
+PRIORITY_BATCH = -10
+
+PRIORITY_CLASSES: Dict[str, int] = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "normal": PRIORITY_NORMAL,
+    "batch": PRIORITY_BATCH,
+}
+
+# Bucket file used in shared mode, inside the runs directory
+SHARED_STATE_FILE = ".rate_limits.json"
+
+# Model key for calls whose model is chosen by the engine's default
+DEFAULT_MODEL = "default"
+
+
+def priority_for_spec(spec: Any) -> int:
+    """Derive the limiter priority of a run from its RunSpec.
+
+    An explicit spec.params["priority"] (class name or integer) wins.
+    Otherwise autopilot runs (no_human_mid_flow, or params["autopilot"]) are
+    batch and everything else is interactive.
+    """
+    if spec is None:
+        return PRIORITY_NORMAL
+    params = getattr(spec, "params", None) or {}
+    value = params.get("priority")
+    if value is not None:
+        if isinstance(value, str) and value.lower() in PRIORITY_CLASSES:
+            return PRIORITY_CLASSES[value.lower()]
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            logger.debug("Ignoring invalid run priority %r", value)
+    if getattr(spec, "no_human_mid_flow", False) or params.get("autopilot"):
+        return PRIORITY_BATCH
+    return PRIORITY_INTERACTIVE
+
+
+# =============================================================================
+# Clock
+# =============================================================================
+
+
+class SystemClock:
+    """Wall clock (comparable across processes for shared buckets)."""
+
+    def time(self) -> float:
+        return time.time()
+
+    def wait(self, cond: threading.Condition, timeout: Optional[float]) -> None:
+        """Wait on cond (held by the caller) for up to timeout seconds."""
+        cond.wait(timeout)
+
+
+# =============================================================================
+# Limits and buckets
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Per-minute limits for an engine or one of its models. None means unlimited."""
+
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+
+    @property
+    def unlimited(self) -> bool:
+        return not self.requests_per_minute and not self.tokens_per_minute
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "RateLimit":
+        data = data or {}
+        rpm = data.get("requests_per_minute")
+        tpm = data.get("tokens_per_minute")
+        return cls(
+            requests_per_minute=float(rpm) if rpm else None,
+            tokens_per_minute=float(tpm) if tpm else None,
+        )
+
+
+def _refill(state: Dict[str, List[float]], key: str, per_minute: float, now: float) -> List[float]:
+    """Bring a bucket up to date and return its [level, updated_at] entry."""
+    entry = state.get(key)
+    if entry is None:
+        entry = state[key] = [per_minute, now]
+        return entry
+    elapsed = max(0.0, now - entry[1])
+    entry[0] = min(per_minute, entry[0] + elapsed * per_minute / 60.0)
+    entry[1] = now
+    return entry
+
+
+def _take(
+    state: Dict[str, List[float]],
+    buckets: List[Tuple[str, RateLimit]],
+    tokens: int,
+    now: float,
+) -> float:
+    """Take one request and `tokens` tokens from every bucket, or from none.
+
+    Returns:
+        0.0 if taken, otherwise seconds until the buckets could allow it.
+    """
+    # (bucket entry, level required to proceed, amount taken, per-minute rate)
+    needs: List[Tuple[List[float], float, float, float]] = []
+    for key, limit in buckets:
+        if limit.requests_per_minute:
+            entry = _refill(state, key + "|requests", limit.requests_per_minute, now)
+            needs.append((entry, 1.0, 1.0, limit.requests_per_minute))
+        if limit.tokens_per_minute:
+            entry = _refill(state, key + "|tokens", limit.tokens_per_minute, now)
+            # Require the bucket out of debt; a reservation above one minute's
+            # worth could never be met, so it only needs a full bucket
+            need = float(min(max(tokens, 1), limit.tokens_per_minute))
+            needs.append((entry, need, float(tokens), limit.tokens_per_minute))
+
+    delay = 0.0
+    for entry, need, _, per_minute in needs:
+        if entry[0] < need:
+            delay = max(delay, (need - entry[0]) * 60.0 / per_minute)
+    if delay > 0:
+        return delay
+
+    for entry, _, cost, _ in needs:
+        entry[0] -= cost
+    return 0.0
+
+
+class _MemoryStore:
+    """Bucket levels held by this process."""
+
+    def __init__(self) -> None:
+        self._state: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def transact(self, fn: Callable[[Dict[str, List[float]]], Any]) -> Any:
+        with self._lock:
+            return fn(self._state)
+
+
+class _FileStore:
+    """Bucket levels shared across processes through a locked JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = get_file_lock(self.path.with_name(self.path.name + ".lock"))
+
+    def transact(self, fn: Callable[[Dict[str, List[float]]], Any]) -> Any:
+        with self._lock:
+            try:
+                state = json_codec.loads(self.path.read_bytes())
+                if not isinstance(state, dict):
+                    state = {}
+            except FileNotFoundError:
+                state = {}
+            except (OSError, json_codec.JSONDecodeError) as e:
+                logger.warning("Resetting unreadable rate limit state %s: %s", self.path, e)
+                state = {}
+            result = fn(state)
+            self._write(state)
+            return result
+
+    def _write(self, state: Dict[str, List[float]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=self.path.name + ".", suffix=".tmp", dir=self.path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_codec.dumpb(state))
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+
+@dataclass
+class RateLimiterStats:
+    """Point-in-time limiter metrics.
+
+    Attributes:
+        queued: Calls currently waiting for a permit.
+        acquired: Total permits granted.
+        throttled: Permits that had to wait.
+        total_wait_ms: Cumulative wait across granted permits.
+        max_wait_ms: Longest wait observed.
+        wait_ms_by_priority: Cumulative wait per priority.
+        acquired_by_key: Permits granted per "engine/model".
+        tokens_by_key: Tokens charged per "engine/model".
+    """
+
+    queued: int = 0
+    acquired: int = 0
+    throttled: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    wait_ms_by_priority: Dict[int, float] = field(default_factory=dict)
+    acquired_by_key: Dict[str, int] = field(default_factory=dict)
+    tokens_by_key: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "queued": self.queued,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "avg_wait_ms": round(self.total_wait_ms / self.acquired, 2) if self.acquired else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 2),
+            "wait_ms_by_priority": {
+                str(p): round(ms, 2) for p, ms in sorted(self.wait_ms_by_priority.items())
+            },
+            "acquired_by_key": dict(self.acquired_by_key),
+            "tokens_by_key": dict(self.tokens_by_key),
+        }
+
+
+@dataclass
+class RatePermit:
+    """A granted engine call. Report actual token usage via record_tokens()."""
+
+    engine: str
+    model: str
+    priority: int
+    reserved_tokens: int
+    wait_ms: float
+    actual_tokens: Optional[int] = None
+
+    def record_tokens(self, tokens: Optional[int]) -> None:
+        """Record the tokens the call actually used (charged on release)."""
+        if tokens is not None:
+            self.actual_tokens = max(0, int(tokens))
+
+
+@dataclass(order=True)
+class _Waiter:
+    """Ordering uses sort_key only: (-priority, sequence)."""
+
+    sort_key: Tuple[int, int]
+
+
+# =============================================================================
+# Limiter
+# =============================================================================
+
+
+class EngineRateLimiter:
+    """Priority-ordered token-bucket limiter for engine calls.
+
+    Thread-safe: waiting and bookkeeping are guarded by one condition
+    variable; bucket levels are read and written outside it, under the
+    store's own lock, so shared-mode file I/O does not block other threads'
+    bookkeeping. Only the highest-priority waiter of an engine takes from
+    its buckets, so lower-priority callers cannot starve higher ones by
+    polling.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Dict[str, Any]]] = None,
+        shared_state_path: Optional[Path] = None,
+        clock: Optional[Any] = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            limits: Per-engine limits, e.g. {"claude": {"requests_per_minute":
+                50, "tokens_per_minute": 400000, "models": {"opus": {...}}}}.
+                Defaults to the configured limits (see get_engine_rate_limits).
+            shared_state_path: Share buckets with other processes through
+                this file. None keeps them in memory.
+            clock: Object with time() and wait(cond, timeout); defaults to the
+                system clock. Tests inject a fake clock.
+        """
+        self._limits_config = limits
+        self._limit_cache: Dict[Tuple[str, str], RateLimit] = {}
+        self._bucket_cache: Dict[Tuple[str, str], List[Tuple[str, RateLimit]]] = {}
+        self._store = _FileStore(shared_state_path) if shared_state_path else _MemoryStore()
+        self._clock = clock or SystemClock()
+        self._cond = threading.Condition()
+        self._waiters: Dict[str, List[_Waiter]] = {}
+        self._seq = itertools.count()
+        self._stats = RateLimiterStats()
+
+    @property
+    def shared(self) -> bool:
+        """Whether buckets are shared with other processes."""
+        return isinstance(self._store, _FileStore)
+
+    def limit_for(self, engine: str, model: Optional[str] = None) -> RateLimit:
+        """Return the most specific limit for an engine and model.
+
+        Calls are also held to the engine's limit (see _buckets_for()).
+        """
+        model = model or DEFAULT_MODEL
+        key = (engine, model)
+        limit = self._limit_cache.get(key)
+        if limit is None:
+            engine_limits = self._engine_limits(engine)
+            model_limits = (engine_limits.get("models", {}) or {}).get(model)
+            limit = RateLimit.from_dict(model_limits if model_limits else engine_limits)
+            self._limit_cache[key] = limit
+        return limit
+
+    def _engine_limits(self, engine: str) -> Dict[str, Any]:
+        if self._limits_config is not None:
+            return self._limits_config.get(engine, {}) or {}
+        from swarm.config.runtime_config import get_engine_rate_limits
+
+        return get_engine_rate_limits(engine)
+
+    def _buckets_for(self, engine: str, model: str) -> List[Tuple[str, RateLimit]]:
+        """Buckets a call takes from: the engine's, then the model's own.
+
+        Models without their own limits only draw from the engine buckets,
+        so they share one quota instead of each getting a copy of it.
+        """
+        key = (engine, model)
+        buckets = self._bucket_cache.get(key)
+        if buckets is None:
+            engine_limits = self._engine_limits(engine)
+            model_limits = (engine_limits.get("models", {}) or {}).get(model)
+            candidates = [(engine, RateLimit.from_dict(engine_limits))]
+            if model_limits:
+                candidates.append((f"{engine}/{model}", RateLimit.from_dict(model_limits)))
+            buckets = [(name, limit) for name, limit in candidates if not limit.unlimited]
+            self._bucket_cache[key] = buckets
+        return buckets
+
+    # -------------------------------------------------------------------------
+    # Acquisition
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def acquire(
+        self,
+        engine: str,
+        model: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
+        tokens: int = 0,
+    ) -> Iterator[RatePermit]:
+        """Block until a call may proceed, then hold the permit for its duration.
+
+        Args:
+            engine: Engine config name ("claude", "gemini", ...).
+            model: Model name, or None for the engine's default model.
+            priority: Higher values are served first.
+            tokens: Estimated tokens to reserve; corrected by record_tokens().
+        """
+        permit = self._acquire(engine, model, priority, tokens)
+        try:
+            yield permit
+        finally:
+            self._release(permit)
+
+    @asynccontextmanager
+    async def acquire_async(
+        self,
+        engine: str,
+        model: Optional[str] = None,
+        priority: int = PRIORITY_NORMAL,
+        tokens: int = 0,
+    ) -> AsyncIterator[RatePermit]:
+        """Async version of acquire(); waits on a worker thread."""
+        if not self._buckets_for(engine, model or DEFAULT_MODEL):
+            permit = self._acquire(engine, model, priority, tokens)
+        else:
+            permit = await asyncio.to_thread(self._acquire, engine, model, priority, tokens)
+        try:
+            yield permit
+        finally:
+            self._release(permit)
+
+    def _acquire(self, engine: str, model: Optional[str], priority: int, tokens: int) -> RatePermit:
+        model = model or DEFAULT_MODEL
+        key = f"{engine}/{model}"
+        buckets = self._buckets_for(engine, model)
+        tokens = max(0, int(tokens))
+        start = self._clock.time()
+
+        with self._cond:
+            if buckets:
+                waiter = _Waiter((-int(priority), next(self._seq)))
+                queue = self._waiters.setdefault(engine, [])
+                bisect.insort(queue, waiter)
+                self._stats.queued += 1
+                try:
+                    while True:
+                        delay: Optional[float] = None
+                        if queue[0] is waiter:
+                            now = self._clock.time()
+                            self._cond.release()
+                            try:
+                                delay = self._store.transact(
+                                    lambda state: _take(state, buckets, tokens, now)
+                                )
+                            finally:
+                                self._cond.acquire()
+                            if delay <= 0:
+                                break
+                        self._clock.wait(self._cond, delay)
+                finally:
+                    queue.remove(waiter)
+                    if not queue:
+                        del self._waiters[engine]
+                    self._stats.queued -= 1
+                    self._cond.notify_all()
+
+            wait_ms = max(0.0, (self._clock.time() - start) * 1000)
+            stats = self._stats
+            stats.acquired += 1
+            stats.acquired_by_key[key] = stats.acquired_by_key.get(key, 0) + 1
+            if wait_ms > 0:
+                stats.throttled += 1
+                stats.total_wait_ms += wait_ms
+                stats.max_wait_ms = max(stats.max_wait_ms, wait_ms)
+                stats.wait_ms_by_priority[priority] = (
+                    stats.wait_ms_by_priority.get(priority, 0.0) + wait_ms
+                )
+
+        if wait_ms >= 1000:
+            logger.info(
+                "Engine call %s (priority=%d) waited %.0f ms for rate limit", key, priority, wait_ms
+            )
+        return RatePermit(
+            engine=engine, model=model, priority=priority, reserved_tokens=tokens, wait_ms=wait_ms
+        )
+
+    def _release(self, permit: RatePermit) -> None:
+        """Charge the difference between actual and reserved tokens."""
+        key = f"{permit.engine}/{permit.model}"
+        used = permit.actual_tokens if permit.actual_tokens is not None else permit.reserved_tokens
+        with self._cond:
+            self._stats.tokens_by_key[key] = self._stats.tokens_by_key.get(key, 0) + used
+
+        correction = used - permit.reserved_tokens
+        buckets = [
+            (name, limit)
+            for name, limit in self._buckets_for(permit.engine, permit.model)
+            if limit.tokens_per_minute
+        ]
+        if not buckets or correction == 0:
+            return
+        now = self._clock.time()
+
+        def charge(state: Dict[str, List[float]]) -> None:
+            for name, limit in buckets:
+                entry = _refill(state, name + "|tokens", limit.tokens_per_minute, now)
+                entry[0] -= correction
+
+        self._store.transact(charge)
+        with self._cond:
+            self._cond.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Introspection
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> RateLimiterStats:
+        """Return a snapshot of limiter metrics."""
+        with self._cond:
+            s = self._stats
+            return RateLimiterStats(
+                queued=s.queued,
+                acquired=s.acquired,
+                throttled=s.throttled,
+                total_wait_ms=s.total_wait_ms,
+                max_wait_ms=s.max_wait_ms,
+                wait_ms_by_priority=dict(s.wait_ms_by_priority),
+                acquired_by_key=dict(s.acquired_by_key),
+                tokens_by_key=dict(s.tokens_by_key),
+            )
+
+
+# =============================================================================
+# Global Instance (Singleton Pattern)
+# =============================================================================
+
+_global_limiter: Optional[EngineRateLimiter] = None
+_global_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> EngineRateLimiter:
+    """Get the process-wide EngineRateLimiter, creating it from config if needed."""
+    global _global_limiter
+
+    with _global_limiter_lock:
+        if _global_limiter is None:
+            from swarm.config.runtime_config import is_rate_limit_shared
+
+            shared_path = None
+            if is_rate_limit_shared():
+                from .storage import RUNS_DIR
+
+                shared_path = RUNS_DIR / SHARED_STATE_FILE
+            _global_limiter = EngineRateLimiter(shared_state_path=shared_path)
+        return _global_limiter
+
+
+def set_rate_limiter(limiter: Optional[EngineRateLimiter]) -> None:
+    """Replace the global limiter (for testing; None resets to config)."""
+    global _global_limiter
+
+    with _global_limiter_lock:
+        _global_limiter = limiter
+
+
+def reset_rate_limiter() -> None:
+    """Discard the global limiter (for testing)."""
+    set_rate_limiter(None)
+
+
+__all__ = [
+    "DEFAULT_MODEL",
+    "PRIORITY_BATCH",
+    "PRIORITY_CLASSES",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_NORMAL",
+    "SHARED_STATE_FILE",
+    "EngineRateLimiter",
+    "RateLimit",
+    "RateLimiterStats",
+    "RatePermit",
+    "SystemClock",
+    "get_rate_limiter",
+    "priority_for_spec",
+    "reset_rate_limiter",
+    "set_rate_limiter",
+]
@@ -36,8 +36,10 @@ from .db import (
     RoutingDecisionRecord,
     RunStats,
     StatsDB,
+    StepResourceRecord,
     StepStats,
     ToolBreakdown,
+    VerdictCacheRecord,
     close_stats_db,
 )
 
@@ -338,6 +340,24 @@ class ResilientStatsDB:
             [],
         )
 
+    def get_step_resources_safe(
+        self, run_id: str, flow_key: Optional[str] = None
+    ) -> List[StepResourceRecord]:
+        """Get per-step resource usage safely, returning empty list on error."""
+        return self._safe_operation(
+            lambda: self._db.get_step_resources(run_id, flow_key) if self._db else [],
+            f"get_step_resources({run_id}, {flow_key})",
+            [],
+        )
+
+    def get_forensic_verdict_cache_stats_safe(self, run_id: str) -> List[VerdictCacheRecord]:
+        """Get forensic verdict cache counters safely, returning empty list on error."""
+        return self._safe_operation(
+            lambda: self._db.get_forensic_verdict_cache_stats(run_id) if self._db else [],
+            f"get_forensic_verdict_cache_stats({run_id})",
+            [],
+        )
+
     def get_recent_runs_safe(self, limit: int = 20) -> List[RunStats]:
         """Get recent runs safely, returning empty list on error."""
         return self._safe_operation(
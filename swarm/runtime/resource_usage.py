@@ -0,0 +1,249 @@
+"""
+resource_usage.py - Per-step local resource accounting.
+
+Runs record step durations and token usage, but not what a step cost the
+machine running it. measure_step() meters one step and reports:
+
+    cpu_ms                  CPU time of the orchestrator thread running the step
+    subprocess_count        Child processes reaped during the step (engine CLIs, git)
+    subprocess_cpu_ms       User + system CPU of those children
+    subprocess_peak_rss_kb  Largest peak RSS of any of them
+    git_commands / git_ms   Git invocations and their wall time
+    io_read_bytes           Bytes the step thread read (files and pipes; Linux only)
+    io_write_bytes          Bytes the step thread wrote (Linux only)
+
+Child process usage comes from os.wait4(), which returns the resource usage
+of exactly the child being reaped. Subprocesses started through
+MeasuredPopen are attributed to the step meter active in the context that
+started them; short-lived helpers such as git are counted (count and wall
+time only) with record_subprocess(). Outside a meter neither costs anything.
+
+DuckDB ingest time is measured separately when StatsDB projects the step's
+events (see StatsDB.ingest_events).
+
+Usage:
+    from swarm.runtime.resource_usage import MeasuredPopen, measure_step
+
+    with measure_step() as meter:
+        process = MeasuredPopen(cmd, kind="claude", stdout=subprocess.PIPE)
+        process.communicate()
+    usage = meter.usage  # StepResourceUsage
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Subprocess kinds with their own counters in StepResourceUsage
+GIT_KIND = "git"
+
+# /proc/<task>/io of the calling thread (Linux)
+_THREAD_IO_PATH = "/proc/thread-self/io"
+
+# ru_maxrss is in kilobytes on Linux and bytes on macOS
+_MAXRSS_DIVISOR = 1024 if sys.platform == "darwin" else 1
+
+_current_meter: ContextVar[Optional["StepResourceMeter"]] = ContextVar(
+    "swarm_step_resource_meter", default=None
+)
+
+
+@dataclass
+class StepResourceUsage:
+    """Local resources consumed by one step execution.
+
+    Attributes:
+        cpu_ms: CPU time of the thread that ran the step.
+        subprocess_count: Child processes reaped during the step.
+        subprocess_cpu_ms: User + system CPU time of those children.
+        subprocess_peak_rss_kb: Largest peak RSS of any child, in KiB.
+        git_commands: Git commands run during the step.
+        git_ms: Wall time spent in git commands.
+        io_read_bytes: Bytes read by the step thread (None if unavailable).
+        io_write_bytes: Bytes written by the step thread (None if unavailable).
+    """
+
+    cpu_ms: float = 0.0
+    subprocess_count: int = 0
+    subprocess_cpu_ms: float = 0.0
+    subprocess_peak_rss_kb: int = 0
+    git_commands: int = 0
+    git_ms: float = 0.0
+    io_read_bytes: Optional[int] = None
+    io_write_bytes: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for event payloads."""
+        return {
+            "cpu_ms": round(self.cpu_ms, 2),
+            "subprocess_count": self.subprocess_count,
+            "subprocess_cpu_ms": round(self.subprocess_cpu_ms, 2),
+            "subprocess_peak_rss_kb": self.subprocess_peak_rss_kb,
+            "git_commands": self.git_commands,
+            "git_ms": round(self.git_ms, 2),
+            "io_read_bytes": self.io_read_bytes,
+            "io_write_bytes": self.io_write_bytes,
+        }
+
+
+def _read_thread_io() -> Optional[Tuple[int, int]]:
+    """Return (rchar, wchar) for the calling thread, or None off Linux."""
+    try:
+        with open(_THREAD_IO_PATH, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    counters = {}
+    for line in data.splitlines():
+        key, _, value = line.partition(b":")
+        counters[key] = value
+    try:
+        return int(counters[b"rchar"]), int(counters[b"wchar"])
+    except (KeyError, ValueError):
+        return None
+
+
+class StepResourceMeter:
+    """Accumulates resource usage for one step.
+
+    Thread-safe: subprocesses may be reaped on threads other than the one
+    that opened the meter.
+    """
+
+    def __init__(self):
+        self.usage = StepResourceUsage()
+        self._lock = threading.Lock()
+        self._cpu_start = 0.0
+        self._io_start: Optional[Tuple[int, int]] = None
+
+    def start(self) -> None:
+        """Take the baseline readings."""
+        self._io_start = _read_thread_io()
+        self._cpu_start = time.thread_time()
+
+    def stop(self) -> StepResourceUsage:
+        """Take the final readings and return the step's usage."""
+        cpu_ms = (time.thread_time() - self._cpu_start) * 1000
+        io_end = _read_thread_io() if self._io_start is not None else None
+        with self._lock:
+            self.usage.cpu_ms = cpu_ms
+            if io_end is not None:
+                self.usage.io_read_bytes = io_end[0] - self._io_start[0]
+                self.usage.io_write_bytes = io_end[1] - self._io_start[1]
+        return self.usage
+
+    def add_subprocess(self, kind: str, wall_ms: float, rusage: Optional[Any] = None) -> None:
+        """Record a reaped child process.
+
+        Args:
+            kind: What the child was ("git", "claude", "gemini", ...).
+            wall_ms: Time from spawn to reap.
+            rusage: os.wait4() resource usage of the child, if captured.
+        """
+        with self._lock:
+            usage = self.usage
+            usage.subprocess_count += 1
+            if kind == GIT_KIND:
+                usage.git_commands += 1
+                usage.git_ms += wall_ms
+            if rusage is not None:
+                usage.subprocess_cpu_ms += (rusage.ru_utime + rusage.ru_stime) * 1000
+                peak_kb = int(rusage.ru_maxrss) // _MAXRSS_DIVISOR
+                usage.subprocess_peak_rss_kb = max(usage.subprocess_peak_rss_kb, peak_kb)
+
+
+def current_meter() -> Optional[StepResourceMeter]:
+    """Return the step meter active in this context, if any."""
+    return _current_meter.get()
+
+
+@contextmanager
+def measure_step() -> Iterator[StepResourceMeter]:
+    """Meter the resources used by the enclosed step.
+
+    The meter's usage is final once the block exits, including when it
+    exits with an exception.
+    """
+    meter = StepResourceMeter()
+    meter.start()
+    token = _current_meter.set(meter)
+    try:
+        yield meter
+    finally:
+        _current_meter.reset(token)
+        meter.stop()
+
+
+class MeasuredPopen(subprocess.Popen):
+    """Popen that reports the child's resource usage to the step meter.
+
+    Reaps the child with os.wait4() instead of os.waitpid() so the child's
+    own CPU time and peak RSS are available. Where os.wait4() does not exist
+    only the count and wall time are recorded.
+    """
+
+    def __init__(self, args: Any, *popen_args: Any, kind: str = "subprocess", **kwargs: Any):
+        self._meter = _current_meter.get()
+        self._kind = kind
+        self._spawned_at = time.perf_counter()
+        self.rusage: Optional[Any] = None
+        super().__init__(args, *popen_args, **kwargs)
+
+    if hasattr(os, "wait4"):
+
+        def _try_wait(self, wait_flags):
+            # Mirrors Popen._try_wait; callers hold self._waitpid_lock
+            try:
+                (pid, sts, rusage) = os.wait4(self.pid, wait_flags)
+            except ChildProcessError:
+                pid = self.pid
+                sts = 0
+            else:
+                if pid == self.pid:
+                    self.rusage = rusage
+            if pid == self.pid:
+                self._record_usage()
+            return (pid, sts)
+
+    else:
+
+        def _try_wait(self, wait_flags):
+            (pid, sts) = super()._try_wait(wait_flags)
+            if pid == self.pid:
+                self._record_usage()
+            return (pid, sts)
+
+    def _record_usage(self) -> None:
+        meter, self._meter = self._meter, None
+        if meter is not None:
+            wall_ms = (time.perf_counter() - self._spawned_at) * 1000
+            meter.add_subprocess(self._kind, wall_ms, self.rusage)
+
+
+def record_subprocess(kind: str, wall_ms: float) -> None:
+    """Attribute a child process run without MeasuredPopen to the current step.
+
+    Only the count and wall time are known for such children.
+    """
+    meter = _current_meter.get()
+    if meter is not None:
+        meter.add_subprocess(kind, wall_ms)
+
+
+__all__ = [
+    "GIT_KIND",
+    "MeasuredPopen",
+    "StepResourceMeter",
+    "StepResourceUsage",
+    "current_meter",
+    "measure_step",
+    "record_subprocess",
+]
@@ -0,0 +1,500 @@
+"""
+run_archive.py - Compressed bundles for finished runs.
+
+A finished run directory holds hundreds of small files (events.jsonl,
+run_state.json, handoff envelopes, transcripts, receipts, flow artifacts).
+Archiving packs everything except meta.json into a single ZIP bundle inside
+the run directory and removes the loose files:
+
+    swarm/runs/<run_id>/
+      meta.json          # stays loose: list_runs() and read_summary() are unchanged
+      run_state.lock     # stays loose (if present): cross-process writer lock
+      run.bundle.zip     # every other file, deflate-compressed
+
+ZIP compresses each member separately and keeps an index (the central
+directory) at the end of the file, so one member is read by seeking to it;
+nothing is unpacked. Readers use the helpers below, which prefer a loose
+file and fall back to the bundle:
+
+    from swarm.runtime.run_archive import list_run_files, open_run_file, run_path_exists
+
+    if run_path_exists(run_path / "events.jsonl"):
+        with open_run_file(run_path / "events.jsonl") as f:
+            for line in f:
+                ...
+
+Writes to an archived run land as loose files, which shadow the bundle.
+Appends (events.jsonl) must restore the run first with restore_run().
+
+Usage:
+    from swarm.runtime.run_archive import archive_cold_runs
+
+    archived = archive_cold_runs(RUNS_DIR, older_than_days=7)
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import io
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path, PurePosixPath
+from typing import IO, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FILE = "run.bundle.zip"
+
+# Files that stay loose next to the bundle: run discovery reads meta.json,
+# and a lock file must never be removed while another process may hold it
+LOOSE_FILES = frozenset({"meta.json", "run_state.lock"})
+
+# How far above a file to look for its run's bundle (run/flow/subdir/file)
+_MAX_BUNDLE_DEPTH = 4
+
+# Open bundles kept for repeated reads (inspector/API poll the same runs)
+_BUNDLE_CACHE_SIZE = 32
+
+# Run statuses that can be archived (mirrors storage._TERMINAL_STATUSES)
+_ARCHIVABLE_STATUSES = frozenset({"succeeded", "failed", "canceled", "stopped"})
+
+
+class RunBundle:
+    """Read-only view of a run bundle.
+
+    The member index is built once from the ZIP central directory. Members
+    are decompressed on demand; reads from several threads are safe.
+    """
+
+    def __init__(self, path: Path):
+        """Open a bundle.
+
+        Args:
+            path: Path to run.bundle.zip.
+        """
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path, "r")
+        self._files: Set[str] = set()
+        self._dirs: Set[str] = {""}
+        for name in self._zip.namelist():
+            if name.endswith("/"):
+                continue
+            self._files.add(name)
+            parent = PurePosixPath(name).parent
+            while str(parent) != ".":
+                self._dirs.add(str(parent))
+                parent = parent.parent
+
+    def namelist(self) -> List[str]:
+        """All member file names (POSIX paths relative to the run directory)."""
+        return sorted(self._files)
+
+    def has_file(self, name: str) -> bool:
+        """Check whether a member file exists."""
+        return name in self._files
+
+    def has_dir(self, name: str) -> bool:
+        """Check whether any member lives under directory `name`."""
+        return name in self._dirs
+
+    def list_files(self, directory: str) -> List[str]:
+        """Names of member files directly inside `directory` ("" for the run root)."""
+        prefix = f"{directory}/" if directory else ""
+        return sorted(
+            name[len(prefix) :]
+            for name in self._files
+            if name.startswith(prefix) and "/" not in name[len(prefix) :]
+        )
+
+    def open(self, name: str, mode: str = "r", encoding: str = "utf-8") -> IO:
+        """Open a member for streaming reads ("r" for text, "rb" for bytes)."""
+        if name not in self._files:
+            raise FileNotFoundError(f"{name} not found in {self.path}")
+        raw = self._zip.open(name, "r")
+        if "b" in mode:
+            return raw
+        return io.TextIOWrapper(raw, encoding=encoding)
+
+    def read_bytes(self, name: str) -> bytes:
+        """Read a whole member."""
+        if name not in self._files:
+            raise FileNotFoundError(f"{name} not found in {self.path}")
+        return self._zip.read(name)
+
+    def close(self) -> None:
+        """Close the bundle. Members already opened stay readable until closed."""
+        self._zip.close()
+
+
+# =============================================================================
+# Bundle Cache
+# =============================================================================
+
+_bundles: "OrderedDict[Path, Tuple[int, RunBundle]]" = OrderedDict()
+_bundles_lock = threading.Lock()
+
+
+def get_bundle(run_path: Path) -> Optional[RunBundle]:
+    """Return the open bundle of a run directory, or None if it is not archived.
+
+    Bundles are cached and reopened when the bundle file changes.
+    """
+    bundle_path = Path(run_path) / BUNDLE_FILE
+    try:
+        mtime_ns = bundle_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    with _bundles_lock:
+        cached = _bundles.get(bundle_path)
+        if cached is not None and cached[0] == mtime_ns:
+            _bundles.move_to_end(bundle_path)
+            return cached[1]
+
+    try:
+        bundle = RunBundle(bundle_path)
+    except (OSError, zipfile.BadZipFile) as e:
+        logger.warning("Unreadable run bundle %s: %s", bundle_path, e)
+        return None
+
+    # Replaced or evicted bundles are not closed here: another thread may
+    # still be reading from them. They close once unreferenced.
+    with _bundles_lock:
+        _bundles[bundle_path] = (mtime_ns, bundle)
+        _bundles.move_to_end(bundle_path)
+        while len(_bundles) > _BUNDLE_CACHE_SIZE:
+            _bundles.popitem(last=False)
+    return bundle
+
+
+def _forget_bundle(run_path: Path) -> None:
+    with _bundles_lock:
+        cached = _bundles.pop(Path(run_path) / BUNDLE_FILE, None)
+    if cached is not None:
+        cached[1].close()
+
+
+def reset_bundle_cache() -> None:
+    """Close and forget all cached bundles (for testing)."""
+    with _bundles_lock:
+        cached = list(_bundles.values())
+        _bundles.clear()
+    for _, bundle in cached:
+        bundle.close()
+
+
+def _locate(path: Path, include_self: bool = False) -> Optional[Tuple[RunBundle, str]]:
+    """Find the bundle holding `path` and the member name inside it.
+
+    Args:
+        path: File (or directory) path inside a run directory.
+        include_self: Also consider `path` itself as the run directory
+            (member name "" then means the run root).
+    """
+    path = Path(path)
+    candidates = list(path.parents)[:_MAX_BUNDLE_DEPTH]
+    if include_self:
+        candidates.insert(0, path)
+    for ancestor in candidates:
+        if (ancestor / BUNDLE_FILE).is_file():
+            bundle = get_bundle(ancestor)
+            if bundle is None:
+                return None
+            name = path.relative_to(ancestor).as_posix()
+            return bundle, "" if name == "." else name
+    return None
+
+
+# =============================================================================
+# Transparent Reads
+# =============================================================================
+
+
+def is_archived(run_path: Path) -> bool:
+    """Check whether a run directory has a bundle."""
+    return (Path(run_path) / BUNDLE_FILE).is_file()
+
+
+def run_path_exists(path: Path) -> bool:
+    """Like Path.exists(), but also true for files and directories in a run bundle."""
+    path = Path(path)
+    if path.exists():
+        return True
+    located = _locate(path)
+    if located is None:
+        return False
+    bundle, name = located
+    return bundle.has_file(name) or bundle.has_dir(name)
+
+
+def open_run_file(path: Path, mode: str = "r", encoding: str = "utf-8") -> IO:
+    """Open a run file for reading, from disk or from the run's bundle.
+
+    Args:
+        path: Path the file would have if the run were not archived.
+        mode: "r" (text) or "rb" (bytes).
+        encoding: Text encoding for "r".
+
+    Raises:
+        FileNotFoundError: If the file is neither on disk nor in a bundle.
+    """
+    path = Path(path)
+    try:
+        if "b" in mode:
+            return open(path, mode)
+        return open(path, mode, encoding=encoding)
+    except FileNotFoundError:
+        located = _locate(path)
+        if located is None:
+            raise
+        bundle, name = located
+        return bundle.open(name, mode, encoding)
+
+
+def list_run_files(directory: Path, pattern: str = "*") -> List[Path]:
+    """List files in a run directory, including files held in the run's bundle.
+
+    Loose files shadow bundle members with the same name.
+
+    Args:
+        directory: Directory the files would be in if the run were not archived.
+        pattern: fnmatch pattern for file names.
+
+    Returns:
+        Matching file paths, sorted by name. Paths of bundled files do not
+        exist on disk; open them with open_run_file().
+    """
+    directory = Path(directory)
+    names: Set[str] = set()
+    if directory.is_dir():
+        for entry in os.scandir(directory):
+            if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                names.add(entry.name)
+
+    located = _locate(directory, include_self=True)
+    if located is not None:
+        bundle, member = located
+        for name in bundle.list_files(member):
+            if fnmatch.fnmatch(name, pattern):
+                names.add(name)
+    return [directory / name for name in sorted(names)]
+
+
+# =============================================================================
+# Archive / Restore
+# =============================================================================
+
+
+@dataclass
+class ArchivedRun:
+    """Result of archiving one run.
+
+    Attributes:
+        run_id: The archived run.
+        files: Files packed into the bundle.
+        original_bytes: Total size of the packed files before compression.
+        bundle_bytes: Size of the bundle file.
+    """
+
+    run_id: str
+    files: int
+    original_bytes: int
+    bundle_bytes: int
+
+
+def archive_run(run_path: Path, compresslevel: int = 6) -> Optional[ArchivedRun]:
+    """Pack a run directory into its bundle and remove the loose files.
+
+    If the run already has a bundle (e.g. it was written to after archiving),
+    loose files are merged into a new bundle and take precedence.
+
+    Args:
+        run_path: The run directory.
+        compresslevel: zlib compression level.
+
+    Returns:
+        ArchivedRun, or None if there was nothing to pack.
+    """
+    run_path = Path(run_path)
+    bundle_path = run_path / BUNDLE_FILE
+    # Run age (GC) is based on the directory mtime, which packing would reset
+    run_stat = run_path.stat()
+
+    loose: Dict[str, Path] = {}
+    for root, dirs, files in os.walk(run_path):
+        dirs.sort()
+        for name in sorted(files):
+            path = Path(root) / name
+            member = path.relative_to(run_path).as_posix()
+            if member in LOOSE_FILES or member == BUNDLE_FILE or name.startswith(BUNDLE_FILE):
+                continue
+            loose[member] = path
+    if not loose:
+        return None
+
+    existing = get_bundle(run_path)
+    original_bytes = 0
+    files = 0
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{BUNDLE_FILE}.", suffix=".tmp", dir=run_path)
+    try:
+        with os.fdopen(fd, "wb") as raw, zipfile.ZipFile(
+            raw, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+        ) as zf:
+            for member, path in loose.items():
+                zf.write(path, member)
+                original_bytes += path.stat().st_size
+                files += 1
+            if existing is not None:
+                for member in existing.namelist():
+                    if member not in loose:
+                        data = existing.read_bytes(member)
+                        zf.writestr(member, data)
+                        original_bytes += len(data)
+                        files += 1
+        os.replace(tmp_name, bundle_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _forget_bundle(run_path)
+
+    # The bundle is in place; loose copies can go
+    for path in loose.values():
+        try:
+            path.unlink()
+        except OSError as e:
+            logger.warning("Failed to remove archived file %s: %s", path, e)
+    for root, dirs, _ in os.walk(run_path, topdown=False):
+        for name in dirs:
+            try:
+                (Path(root) / name).rmdir()
+            except OSError:
+                pass  # Not empty
+    os.utime(run_path, ns=(run_stat.st_atime_ns, run_stat.st_mtime_ns))
+
+    return ArchivedRun(
+        run_id=run_path.name,
+        files=files,
+        original_bytes=original_bytes,
+        bundle_bytes=bundle_path.stat().st_size,
+    )
+
+
+def restore_run(run_path: Path) -> int:
+    """Unpack a run's bundle back into loose files and delete the bundle.
+
+    Loose files already on disk are newer than their bundled copies and are
+    kept.
+
+    Returns:
+        Number of files restored.
+    """
+    run_path = Path(run_path)
+    bundle = get_bundle(run_path)
+    if bundle is None:
+        return 0
+
+    root = run_path.resolve()
+    restored = 0
+    for member in bundle.namelist():
+        target = (run_path / member).resolve()
+        if root not in target.parents:
+            logger.warning("Skipping bundle member outside run directory: %s", member)
+            continue
+        if target.exists():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with bundle.open(member, "rb") as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        restored += 1
+
+    _forget_bundle(run_path)
+    (run_path / BUNDLE_FILE).unlink()
+    logger.info("Restored %d files for archived run %s", restored, run_path.name)
+    return restored
+
+
+def archive_cold_runs(
+    runs_dir: Path,
+    older_than_days: int,
+    dry_run: bool = False,
+) -> List[ArchivedRun]:
+    """Archive finished runs that completed more than `older_than_days` ago.
+
+    Only runs with a meta.json in a terminal status are considered; runs
+    already archived without new loose files are skipped.
+
+    Args:
+        runs_dir: Runs directory.
+        older_than_days: Age threshold, measured from completion (or last update).
+        dry_run: Report candidates without archiving (bundle sizes are 0).
+
+    Returns:
+        Archived (or, in dry-run mode, archivable) runs.
+    """
+    from .disk_ledger import get_disk_ledger
+    from .storage import list_runs, read_summary
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    results: List[ArchivedRun] = []
+    for run_id in list_runs(runs_dir):
+        summary = read_summary(run_id, runs_dir)
+        if summary is None:
+            continue
+        status = getattr(summary.status, "value", summary.status)
+        if status not in _ARCHIVABLE_STATUSES:
+            continue
+        finished = summary.completed_at or summary.updated_at
+        if finished is None:
+            continue
+        if finished.tzinfo is None:
+            finished = finished.replace(tzinfo=timezone.utc)
+        if finished >= cutoff:
+            continue
+
+        run_path = runs_dir / run_id
+        if is_archived(run_path) and {e.name for e in os.scandir(run_path)} <= (
+            LOOSE_FILES | {BUNDLE_FILE}
+        ):
+            continue
+
+        if dry_run:
+            results.append(ArchivedRun(run_id=run_id, files=0, original_bytes=0, bundle_bytes=0))
+            continue
+
+        try:
+            archived = archive_run(run_path)
+        except (OSError, zipfile.BadZipFile) as e:
+            logger.warning("Failed to archive run %s: %s", run_id, e)
+            continue
+        if archived is not None:
+            get_disk_ledger(runs_dir).measure_run(run_id, run_path)
+            results.append(archived)
+
+    return results
+
+
+__all__ = [
+    "BUNDLE_FILE",
+    "LOOSE_FILES",
+    "ArchivedRun",
+    "RunBundle",
+    "archive_cold_runs",
+    "archive_run",
+    "get_bundle",
+    "is_archived",
+    "list_run_files",
+    "open_run_file",
+    "reset_bundle_cache",
+    "restore_run",
+    "run_path_exists",
+]
@@ -0,0 +1,387 @@
+"""
+run_scheduler.py - Bounded run admission queue and worker pool for backends
+
+This module provides the shared RunScheduler that all RunBackend
+implementations use to execute runs. Instead of spawning an unbounded
+thread per run, backends submit their execution callable to the scheduler,
+which admits runs from a priority queue onto a bounded worker pool.
+
+Design Philosophy:
+    - Admission is bounded globally AND per backend, so a burst of API
+      requests cannot oversubscribe CPU, git, or the engine CLIs
+    - Ordering is priority-first, then FIFO within a priority class
+    - Queued runs are cheap: they hold no thread and can be cancelled
+    - A run whose backend is saturated does not block runs for other
+      backends (no head-of-line blocking across backends)
+
+Configuration (runtime.yaml ``scheduler`` section, env vars override):
+    SWARM_MAX_CONCURRENT_RUNS: Global cap on concurrently executing runs.
+    SWARM_<BACKEND>_MAX_CONCURRENT_RUNS: Per-backend cap, e.g.
+        SWARM_GEMINI_CLI_MAX_CONCURRENT_RUNS=2.
+
+Usage:
+    from swarm.runtime.run_scheduler import get_run_scheduler
+
+    scheduler = get_run_scheduler()
+    scheduler.submit(run_id, "claude-harness", execute_fn, args=(run_id, spec))
+    position = scheduler.queue_position(run_id)  # 1-based, None if not queued
+    scheduler.cancel(run_id)  # True if removed from the queue
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .types import BackendId, RunId
+
+logger = logging.getLogger(__name__)
+
+# Default global concurrency when neither config nor env specify one
+DEFAULT_MAX_CONCURRENT_RUNS = 4
+
+
+@dataclass(order=True)
+class _QueuedRun:
+    """A run waiting for admission.
+
+    Ordering uses sort_key only: (-priority, sequence), so higher priority
+    runs are admitted first and equal priorities are admitted FIFO.
+    """
+
+    sort_key: Tuple[int, int]
+    run_id: RunId = field(compare=False)
+    backend_id: BackendId = field(compare=False)
+    target: Callable[..., Any] = field(compare=False)
+    args: Tuple[Any, ...] = field(compare=False, default=())
+    enqueued_at: float = field(compare=False, default=0.0)
+
+
+@dataclass
+class SchedulerStats:
+    """Point-in-time scheduler metrics.
+
+    Attributes:
+        queued: Number of runs waiting for admission.
+        active: Number of runs currently executing.
+        active_by_backend: Executing run count per backend.
+        completed: Total runs that finished executing.
+        cancelled: Total queued runs cancelled before admission.
+        max_concurrent: Effective global concurrency limit.
+        total_wait_ms: Cumulative queue wait across admitted runs.
+        max_wait_ms: Longest queue wait observed.
+    """
+
+    queued: int = 0
+    active: int = 0
+    active_by_backend: Dict[str, int] = field(default_factory=dict)
+    completed: int = 0
+    cancelled: int = 0
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT_RUNS
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        admitted = self.completed + self.active
+        return {
+            "queued": self.queued,
+            "active": self.active,
+            "active_by_backend": dict(self.active_by_backend),
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "max_concurrent": self.max_concurrent,
+            "avg_wait_ms": round(self.total_wait_ms / admitted, 2) if admitted else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 2),
+        }
+
+
+class RunScheduler:
+    """Bounded, priority-ordered admission of runs onto a worker pool.
+
+    Workers are started lazily on first submit, up to max_concurrent.
+    Each worker repeatedly takes the highest-priority queued run whose
+    backend is below its per-backend limit and executes it.
+
+    Thread-safe: all state is guarded by a single condition variable.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        backend_limits: Optional[Dict[BackendId, int]] = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrent: Global concurrency limit. Defaults to the
+                configured value (see get_scheduler_max_concurrent_runs).
+            backend_limits: Optional per-backend limits. Backends without an
+                explicit limit fall back to the configured per-backend value,
+                or the global limit when none is configured.
+        """
+        if max_concurrent is None:
+            from swarm.config.runtime_config import get_scheduler_max_concurrent_runs
+
+            max_concurrent = get_scheduler_max_concurrent_runs()
+        self._max_concurrent = max(1, int(max_concurrent))
+        self._backend_limits: Dict[BackendId, int] = dict(backend_limits or {})
+        self._explicit_limits = backend_limits is not None
+
+        self._cond = threading.Condition()
+        self._queue: List[_QueuedRun] = []
+        self._active: Dict[RunId, BackendId] = {}
+        self._active_by_backend: Dict[BackendId, int] = {}
+        self._workers: List[threading.Thread] = []
+        self._seq = itertools.count()
+        self._shutdown = False
+        self._stats = SchedulerStats(max_concurrent=self._max_concurrent)
+
+    @property
+    def max_concurrent(self) -> int:
+        """Effective global concurrency limit."""
+        return self._max_concurrent
+
+    def backend_limit(self, backend_id: BackendId) -> int:
+        """Return the effective concurrency limit for a backend."""
+        limit = self._backend_limits.get(backend_id)
+        if limit is None and not self._explicit_limits:
+            from swarm.config.runtime_config import get_scheduler_backend_limit
+
+            limit = get_scheduler_backend_limit(backend_id)
+            self._backend_limits[backend_id] = limit if limit is not None else 0
+        if not limit:
+            return self._max_concurrent
+        return min(max(1, int(limit)), self._max_concurrent)
+
+    # -------------------------------------------------------------------------
+    # Submission and cancellation
+    # -------------------------------------------------------------------------
+
+    def submit(
+        self,
+        run_id: RunId,
+        backend_id: BackendId,
+        target: Callable[..., Any],
+        args: Tuple[Any, ...] = (),
+        priority: int = 0,
+    ) -> int:
+        """Queue a run for execution.
+
+        Returns immediately. The target is called as target(*args) on a
+        worker thread once the run is admitted.
+
+        Args:
+            run_id: The run identifier (used for position and cancellation).
+            backend_id: The backend that owns the run (for per-backend limits).
+            target: Callable that executes the run.
+            args: Positional arguments for target.
+            priority: Higher values are admitted first. Default 0.
+
+        Returns:
+            1-based queue position at submission time.
+
+        Raises:
+            RuntimeError: If the scheduler has been shut down.
+        """
+        item = _QueuedRun(
+            sort_key=(-int(priority), next(self._seq)),
+            run_id=run_id,
+            backend_id=backend_id,
+            target=target,
+            args=tuple(args),
+            enqueued_at=time.monotonic(),
+        )
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("RunScheduler has been shut down")
+            bisect.insort(self._queue, item)
+            position = self._queue.index(item) + 1
+            self._ensure_workers_locked()
+            self._cond.notify_all()
+
+        logger.debug(
+            "Queued run %s on %s (priority=%d, position=%d)",
+            run_id,
+            backend_id,
+            priority,
+            position,
+        )
+        return position
+
+    def cancel(self, run_id: RunId) -> bool:
+        """Remove a queued run before it is admitted.
+
+        Runs that are already executing are not affected; their backend is
+        responsible for terminating them.
+
+        Returns:
+            True if the run was queued and has been removed.
+        """
+        with self._cond:
+            for i, item in enumerate(self._queue):
+                if item.run_id == run_id:
+                    del self._queue[i]
+                    self._stats.cancelled += 1
+                    return True
+        return False
+
+    # -------------------------------------------------------------------------
+    # Introspection
+    # -------------------------------------------------------------------------
+
+    def queue_position(self, run_id: RunId) -> Optional[int]:
+        """Return the 1-based queue position of a run, or None if not queued."""
+        with self._cond:
+            for i, item in enumerate(self._queue):
+                if item.run_id == run_id:
+                    return i + 1
+        return None
+
+    def is_queued(self, run_id: RunId) -> bool:
+        """Check whether a run is waiting for admission."""
+        return self.queue_position(run_id) is not None
+
+    def is_active(self, run_id: RunId) -> bool:
+        """Check whether a run is currently executing on a worker."""
+        with self._cond:
+            return run_id in self._active
+
+    def stats(self) -> SchedulerStats:
+        """Return a snapshot of scheduler metrics."""
+        with self._cond:
+            return SchedulerStats(
+                queued=len(self._queue),
+                active=len(self._active),
+                active_by_backend={k: v for k, v in self._active_by_backend.items() if v},
+                completed=self._stats.completed,
+                cancelled=self._stats.cancelled,
+                max_concurrent=self._max_concurrent,
+                total_wait_ms=self._stats.total_wait_ms,
+                max_wait_ms=self._stats.max_wait_ms,
+            )
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until no runs are queued or executing.
+
+        Args:
+            timeout: Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            True if the scheduler became idle, False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._active:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """Stop accepting runs, drop the queue, and stop workers.
+
+        Args:
+            wait: If True, join worker threads (running targets finish first).
+            timeout: Per-worker join timeout in seconds.
+        """
+        with self._cond:
+            self._shutdown = True
+            self._stats.cancelled += len(self._queue)
+            self._queue.clear()
+            self._cond.notify_all()
+            workers = list(self._workers)
+        if wait:
+            for worker in workers:
+                worker.join(timeout)
+
+    # -------------------------------------------------------------------------
+    # Worker pool
+    # -------------------------------------------------------------------------
+
+    def _ensure_workers_locked(self) -> None:
+        """Start workers lazily, up to the global limit. Caller holds the lock."""
+        self._workers = [w for w in self._workers if w.is_alive()]
+        wanted = min(self._max_concurrent, len(self._queue) + len(self._active))
+        while len(self._workers) < wanted:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"run-scheduler-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _next_admissible_locked(self) -> Optional[_QueuedRun]:
+        """Pop the highest-priority run whose backend has capacity."""
+        for i, item in enumerate(self._queue):
+            active = self._active_by_backend.get(item.backend_id, 0)
+            if active < self.backend_limit(item.backend_id):
+                return self._queue.pop(i)
+        return None
+
+    def _worker_loop(self) -> None:
+        """Admit and execute runs until shutdown."""
+        while True:
+            with self._cond:
+                item = None
+                while not self._shutdown:
+                    item = self._next_admissible_locked()
+                    if item is not None:
+                        break
+                    self._cond.wait()
+                if item is None:
+                    return
+
+                wait_ms = (time.monotonic() - item.enqueued_at) * 1000
+                self._stats.total_wait_ms += wait_ms
+                self._stats.max_wait_ms = max(self._stats.max_wait_ms, wait_ms)
+                self._active[item.run_id] = item.backend_id
+                self._active_by_backend[item.backend_id] = (
+                    self._active_by_backend.get(item.backend_id, 0) + 1
+                )
+
+            try:
+                item.target(*item.args)
+            except Exception:
+                logger.exception("Unhandled error executing run %s", item.run_id)
+            finally:
+                with self._cond:
+                    self._active.pop(item.run_id, None)
+                    self._active_by_backend[item.backend_id] -= 1
+                    self._stats.completed += 1
+                    self._cond.notify_all()
+
+
+# =============================================================================
+# Global Instance (Singleton Pattern)
+# =============================================================================
+
+_global_scheduler: Optional[RunScheduler] = None
+_global_scheduler_lock = threading.Lock()
+
+
+def get_run_scheduler() -> RunScheduler:
+    """Get the process-wide RunScheduler, creating it from config if needed."""
+    global _global_scheduler
+
+    with _global_scheduler_lock:
+        if _global_scheduler is None:
+            _global_scheduler = RunScheduler()
+        return _global_scheduler
+
+
+def reset_run_scheduler(wait: bool = False) -> None:
+    """Shut down and discard the global scheduler (for testing)."""
+    global _global_scheduler
+
+    with _global_scheduler_lock:
+        if _global_scheduler is not None:
+            _global_scheduler.shutdown(wait=wait)
+            _global_scheduler = None
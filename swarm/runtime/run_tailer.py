@@ -28,7 +28,6 @@ Usage:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
@@ -36,7 +35,9 @@ from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
 if TYPE_CHECKING:
     from .db import StatsDB
 
+from . import json_codec
 from .storage import RUNS_DIR, list_runs
+from .tracing import activate_tracer, get_run_tracer, trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -133,14 +134,13 @@ class RunTailer:
                         break
 
                     new_offset += len(line)
-                    line_str = line.decode("utf-8").strip()
-                    if not line_str:
+                    if not line.strip():
                         continue
                     try:
-                        event = json.loads(line_str)
+                        event = json_codec.loads(line)
                         new_events.append(event)
                         max_seq = max(max_seq, event.get("seq", 0))
-                    except json.JSONDecodeError as e:
+                    except json_codec.JSONDecodeError as e:
                         # Complete line but invalid JSON - this is a real error, log and skip
                         logger.warning(
                             "Skipping malformed event in %s at offset %d: %s",
@@ -157,7 +157,10 @@ class RunTailer:
 
         # Ingest events (idempotent - skips existing event_ids)
         try:
-            ingested_count = self._db.ingest_events(new_events, run_id)
+            # Shows up on the run's trace when it is traced in this process
+            with activate_tracer(get_run_tracer(run_id)):
+                with trace_span("db_ingest", events=len(new_events)):
+                    ingested_count = self._db.ingest_events(new_events, run_id)
         except Exception as e:
             # CRITICAL: Do NOT advance offset on failure
             logger.error(
@@ -28,6 +28,7 @@ from .backends import (
     ClaudeHarnessBackend,
     GeminiCliBackend,
     RunBackend,
+    with_queue_state,
 )
 from .storage import EXAMPLES_DIR
 from ..config.flow_registry import get_flow_order
@@ -147,7 +148,7 @@ class RunService:
         Checks storage first, then queries backends.
         """
         # Try storage first (works for all backends)
-        summary = storage.read_summary(run_id)
+        summary = with_queue_state(storage.read_summary(run_id))
         if summary:
             return summary
 
@@ -194,7 +195,7 @@ class RunService:
         for rid in storage.list_runs():
             if rid in seen_ids:
                 continue
-            summary = storage.read_summary(rid)
+            summary = with_queue_state(storage.read_summary(rid))
             if summary:
                 if flow_key is None or flow_key in summary.spec.flow_keys:
                     summaries.append(summary)
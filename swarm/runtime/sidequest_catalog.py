@@ -29,9 +29,10 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -439,6 +440,57 @@ def evaluate_trigger(
     return False
 
 
+# Context field each non-field_check condition type reads
+_CONDITION_FIELDS = {
+    "stall": "stall_signals",
+    "path_pattern": "changed_paths",
+    "iteration_count": "iteration",
+}
+
+# Fingerprint of a context field that is not present
+_ABSENT = "\x00absent"
+
+
+def watched_field(trigger: TriggerCondition) -> Optional[str]:
+    """Return the context field a trigger reads, or None if it reads none."""
+    if trigger.condition_type == "field_check":
+        return trigger.field
+    return _CONDITION_FIELDS.get(trigger.condition_type)
+
+
+def _matches(sq: SidequestDefinition, context: Dict[str, Any]) -> bool:
+    """Evaluate a sidequest's triggers with its trigger_mode."""
+    if sq.trigger_mode == "all":
+        # All triggers must match
+        return all(evaluate_trigger(t, context) for t in sq.triggers)
+    # Any trigger must match
+    return any(evaluate_trigger(t, context) for t in sq.triggers)
+
+
+def _field_fingerprint(value: Any) -> str:
+    try:
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+@dataclass
+class _TriggerIndex:
+    """Catalog triggers compiled for incremental evaluation.
+
+    Attributes:
+        watchers: Context field -> IDs of sidequests with a trigger reading it.
+        rank: Sidequest ID -> position in priority order (higher priority first,
+            catalog order among equals).
+        constant: IDs of sidequests whose triggers read no context field and
+            therefore always match (e.g. trigger_mode "all" with no triggers).
+    """
+
+    watchers: Dict[str, List[str]]
+    rank: Dict[str, int]
+    constant: Set[str]
+
+
 # =============================================================================
 # Parsing Helpers
 # =============================================================================
@@ -529,6 +581,12 @@ class SidequestCatalog:
 
     The catalog provides a bounded menu of sidequest options. The Navigator
     selects from this menu based on context signals.
+
+    Triggers are compiled once into an index keyed by the context field each
+    trigger reads. get_applicable_sidequests() re-evaluates only sidequests
+    watching a field whose value changed since the previous call and reuses
+    earlier results for the rest. Sidequests changed in place (rather than
+    through add_sidequest/remove_sidequest) need invalidate_index().
     """
 
     def __init__(self, sidequests: Optional[List[SidequestDefinition]] = None):
@@ -540,6 +598,12 @@ class SidequestCatalog:
         self._sidequests: Dict[str, SidequestDefinition] = {}
         self._usage_counts: Dict[str, int] = {}  # Track usage per run
 
+        # Incremental trigger evaluation state (see _compile_index)
+        self._index: Optional[_TriggerIndex] = None
+        self._field_fingerprints: Dict[str, str] = {}
+        self._matched: Set[str] = set()
+        self._index_lock = threading.Lock()
+
         if sidequests:
             for sq in sidequests:
                 self._sidequests[sq.sidequest_id] = sq
@@ -584,27 +648,70 @@ class SidequestCatalog:
         Returns:
             List of applicable sidequests, sorted by priority.
         """
-        applicable = []
+        with self._index_lock:
+            index = self._compile_index()
+
+            # Re-evaluate only sidequests watching a field that changed
+            changed: Dict[str, str] = {}
+            stale: Set[str] = set()
+            for field_name, sidequest_ids in index.watchers.items():
+                if field_name in context:
+                    fingerprint = _field_fingerprint(context[field_name])
+                else:
+                    fingerprint = _ABSENT
+                if self._field_fingerprints.get(field_name) != fingerprint:
+                    changed[field_name] = fingerprint
+                    stale.update(sidequest_ids)
+
+            for sidequest_id in stale:
+                if _matches(self._sidequests[sidequest_id], context):
+                    self._matched.add(sidequest_id)
+                else:
+                    self._matched.discard(sidequest_id)
+            # Only after every evaluation succeeded (a trigger may raise)
+            self._field_fingerprints.update(changed)
+
+            # Sort by priority (higher first)
+            matched = sorted(self._matched, key=index.rank.__getitem__)
 
-        for sq in self._sidequests.values():
+        applicable = []
+        for sidequest_id in matched:
+            sq = self._sidequests[sidequest_id]
             # Check usage limit
             usage_key = f"{run_id}:{sq.sidequest_id}" if run_id else sq.sidequest_id
-            current_usage = self._usage_counts.get(usage_key, 0)
-            if current_usage >= sq.max_uses_per_run:
-                continue
-
-            # Evaluate triggers
-            if sq.trigger_mode == "all":
-                # All triggers must match
-                if all(evaluate_trigger(t, context) for t in sq.triggers):
-                    applicable.append(sq)
-            else:  # "any"
-                # Any trigger must match
-                if any(evaluate_trigger(t, context) for t in sq.triggers):
-                    applicable.append(sq)
-
-        # Sort by priority (higher first)
-        return sorted(applicable, key=lambda s: -s.priority)
+            if self._usage_counts.get(usage_key, 0) < sq.max_uses_per_run:
+                applicable.append(sq)
+        return applicable
+
+    def invalidate_index(self) -> None:
+        """Recompile the trigger index on the next evaluation."""
+        with self._index_lock:
+            self._index = None
+
+    def _compile_index(self) -> _TriggerIndex:
+        """Build the field-keyed trigger index (caller holds _index_lock)."""
+        if self._index is not None:
+            return self._index
+
+        ordered = sorted(self._sidequests.values(), key=lambda s: -s.priority)
+        watchers: Dict[str, List[str]] = {}
+        constant: Set[str] = set()
+        for sq in ordered:
+            fields = {f for f in (watched_field(t) for t in sq.triggers) if f is not None}
+            for field_name in fields:
+                watchers.setdefault(field_name, []).append(sq.sidequest_id)
+            # Triggers that read nothing evaluate the same against any context
+            if not fields and _matches(sq, {}):
+                constant.add(sq.sidequest_id)
+
+        self._index = _TriggerIndex(
+            watchers=watchers,
+            rank={sq.sidequest_id: i for i, sq in enumerate(ordered)},
+            constant=constant,
+        )
+        self._field_fingerprints = {}
+        self._matched = set(constant)
+        return self._index
 
     def record_usage(self, sidequest_id: str, run_id: Optional[str] = None) -> None:
         """Record usage of a sidequest."""
@@ -623,11 +730,13 @@ class SidequestCatalog:
     def add_sidequest(self, sidequest: SidequestDefinition) -> None:
         """Add a sidequest to the catalog."""
         self._sidequests[sidequest.sidequest_id] = sidequest
+        self.invalidate_index()
 
     def remove_sidequest(self, sidequest_id: str) -> bool:
         """Remove a sidequest from the catalog."""
         if sidequest_id in self._sidequests:
             del self._sidequests[sidequest_id]
+            self.invalidate_index()
             return True
         return False
 
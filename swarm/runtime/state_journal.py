@@ -0,0 +1,460 @@
+"""
+state_journal.py - Journaled incremental persistence for RunState.
+
+Rewriting and fsyncing the whole run_state.json on every step costs
+O(state size), and the state grows with handoff envelopes, flow history and
+completed nodes over a long run. Instead, each write appends only what
+changed since the previous write to a journal next to the snapshot:
+
+    swarm/runs/<run_id>/
+      run_state.json               # snapshot, includes "_journal_seq"
+      run_state.journal.jsonl      # one delta per write since the snapshot
+
+Deltas are computed per top-level field: nested mappings (handoff_envelopes,
+loop_state, ...) record only added/changed/removed entries, and lists that
+grew by appending record only the new items. Appending one line and
+fsyncing it costs the same at step 3 and step 300.
+
+Every `compact_every` entries, and when the run reaches a terminal status,
+the current state is written as a new snapshot and the journal is removed.
+The snapshot records the sequence number of the last entry it contains, so
+a crash between writing the snapshot and removing the journal replays
+nothing twice. A torn last line (crash mid-append) is ignored on load and
+truncated before the next append.
+
+Note that run_state.json alone may lag behind the journal by up to
+`compact_every` writes while a run is active; read state through
+storage.read_run_state().
+
+Writers in different processes (API workers, the CLI, the orchestrator)
+serialize on an flock() of run_state.lock, and every cached state is
+revalidated against the files' stat (snapshot inode, mtime and size, plus
+journal size), so all processes see each other's writes. The same stat
+doubles as a cheap version for ETags: it changes whenever the persisted
+state may have changed, without hashing the state.
+
+Usage:
+    from swarm.runtime.state_journal import get_state_journal
+
+    journal = get_state_journal(run_path)
+    journal.write(run_state_to_dict(state))
+    data = journal.load()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from . import json_codec
+from .file_lock import FileLock, get_file_lock
+from .run_archive import open_run_file
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "run_state.json"
+JOURNAL_FILE = "run_state.journal.jsonl"
+LOCK_FILE = "run_state.lock"
+
+# Snapshot key holding the sequence number of the last folded journal entry
+SNAPSHOT_SEQ_KEY = "_journal_seq"
+
+# Fold the journal into a new snapshot after this many entries
+DEFAULT_COMPACT_EVERY = 32
+
+# RunState statuses after which no more deltas are expected
+_TERMINAL_STATUSES = frozenset({"succeeded", "failed", "canceled", "stopped"})
+
+_MISSING = object()
+
+
+def _copy(data: Any) -> Any:
+    """Detached JSON-normalized copy (tuples become lists, as after a reload)."""
+    return json_codec.loads(json_codec.dumpb(data))
+
+
+# =============================================================================
+# Deltas
+# =============================================================================
+
+
+def diff_state(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute the delta that turns `old` into `new`.
+
+    Returns:
+        A delta with any of the operations "set" (field -> value),
+        "unset" (fields), "merge" (mapping field -> changed entries),
+        "drop" (mapping field -> removed keys) and "extend" (list field ->
+        appended items). Empty if the states are equal.
+    """
+    delta: Dict[str, Any] = {}
+    for key, value in new.items():
+        prev = old.get(key, _MISSING)
+        if prev is _MISSING:
+            delta.setdefault("set", {})[key] = value
+        elif isinstance(prev, dict) and isinstance(value, dict):
+            merged = {k: v for k, v in value.items() if prev.get(k, _MISSING) != v}
+            dropped = [k for k in prev if k not in value]
+            if merged:
+                delta.setdefault("merge", {})[key] = merged
+            if dropped:
+                delta.setdefault("drop", {})[key] = dropped
+        elif (
+            isinstance(prev, list)
+            and isinstance(value, list)
+            and len(value) >= len(prev)
+            and value[: len(prev)] == prev
+        ):
+            if len(value) > len(prev):
+                delta.setdefault("extend", {})[key] = value[len(prev) :]
+        elif prev != value:
+            delta.setdefault("set", {})[key] = value
+
+    unset = [key for key in old if key not in new]
+    if unset:
+        delta["unset"] = unset
+    return delta
+
+
+def apply_delta(data: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """Apply a delta produced by diff_state() to `data` in place."""
+    for key, value in delta.get("set", {}).items():
+        data[key] = value
+    for key in delta.get("unset", ()):
+        data.pop(key, None)
+    for key, entries in delta.get("merge", {}).items():
+        target = data.get(key)
+        if not isinstance(target, dict):
+            target = data[key] = {}
+        target.update(entries)
+    for key, removed in delta.get("drop", {}).items():
+        target = data.get(key)
+        if isinstance(target, dict):
+            for k in removed:
+                target.pop(k, None)
+    for key, items in delta.get("extend", {}).items():
+        target = data.get(key)
+        if not isinstance(target, list):
+            target = data[key] = []
+        target.extend(items)
+
+
+# =============================================================================
+# Journal
+# =============================================================================
+
+
+class RunStateJournal:
+    """Snapshot + delta journal for one run's state.
+
+    The last persisted state is kept in memory, so a write only diffs and
+    appends. The in-memory copy is revalidated against the files' stat
+    before each operation and reloaded if another writer changed them.
+    States go in and out as JSON round-tripped copies, so callers mutating
+    their objects after a write cannot change what the next diff sees.
+
+    Thread-safe, and process-safe for writers: write(), apply() and compact()
+    hold the run's file lock. Hold locked() to make a read-check-write
+    sequence atomic across processes.
+    """
+
+    def __init__(self, run_path: Path, compact_every: int = DEFAULT_COMPACT_EVERY):
+        """Initialize the journal.
+
+        Args:
+            run_path: The run directory.
+            compact_every: Journal entries that trigger a compaction.
+        """
+        self.run_path = Path(run_path)
+        self.snapshot_path = self.run_path / SNAPSHOT_FILE
+        self.journal_path = self.run_path / JOURNAL_FILE
+        self._compact_every = max(1, compact_every)
+        self._lock = threading.Lock()
+        self._file_lock = get_file_lock(self.run_path / LOCK_FILE)
+        self._data: Optional[Dict[str, Any]] = None
+        self._seq = 0
+        self._entries = 0
+        self._journal_valid_size = 0
+        self._stamp: Optional[Tuple[int, int, int, int]] = None
+
+    @property
+    def pending_entries(self) -> int:
+        """Journal entries not yet folded into the snapshot."""
+        with self._lock:
+            return self._entries
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the current state (snapshot + journal), or None if none exists."""
+        with self._lock:
+            current = self._current()
+            return None if current is None else _copy(current)
+
+    def load_versioned(self) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Return the current state together with its version.
+
+        The version is derived from the files' stat, not the content, so it
+        is cheap and identical in every process looking at the same files.
+        Use it as an ETag.
+        """
+        with self._lock:
+            current = self._current()
+            return (None if current is None else _copy(current)), _version(self._stamp)
+
+    def version(self) -> str:
+        """Version of the persisted state (see load_versioned())."""
+        with self._lock:
+            self._current()
+            return _version(self._stamp)
+
+    def locked(self) -> FileLock:
+        """The run's cross-process write lock (reentrant within a thread)."""
+        return self._file_lock
+
+    def write(self, data: Dict[str, Any]) -> int:
+        """Persist a full state, appending only its delta to the journal.
+
+        Args:
+            data: Serialized RunState (run_state_to_dict()).
+
+        Returns:
+            Change in bytes on disk (for disk usage accounting).
+        """
+        data = _copy(data)
+        with self._file_lock, self._lock:
+            current = self._current()
+            if current is None:
+                return self._write_snapshot(data, seq=self._seq)
+            return self._append(diff_state(current, data), data)
+
+    def apply(self, delta: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+        """Apply and persist a delta without rebuilding the full state.
+
+        Args:
+            delta: Delta in diff_state() format.
+
+        Returns:
+            Tuple of (updated state, change in bytes on disk).
+
+        Raises:
+            FileNotFoundError: If the run has no state yet.
+        """
+        delta = _copy(delta)
+        with self._file_lock, self._lock:
+            current = self._current()
+            if current is None:
+                raise FileNotFoundError(f"Run state not found: {self.run_path.name}")
+            apply_delta(current, delta)
+            try:
+                written = self._append(delta, current)
+            except Exception:
+                self._data = None  # Reload from disk next time
+                raise
+            return _copy(current), written
+
+    def compact(self) -> int:
+        """Fold the journal into a new snapshot.
+
+        Returns:
+            Change in bytes on disk.
+        """
+        with self._file_lock, self._lock:
+            current = self._current()
+            if current is None or self._entries == 0:
+                return 0
+            return self._write_snapshot(current, seq=self._seq)
+
+    # -------------------------------------------------------------------------
+    # Internals (call with self._lock held)
+    # -------------------------------------------------------------------------
+
+    def _stat(self) -> Tuple[int, int, int, int]:
+        # The inode changes on every snapshot replace, which catches rewrites
+        # within the filesystem's mtime granularity
+        try:
+            st = self.snapshot_path.stat()
+            snapshot = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            snapshot = (0, 0, 0)
+        try:
+            journal_size = self.journal_path.stat().st_size
+        except OSError:
+            journal_size = 0
+        return (*snapshot, journal_size)
+
+    def _current(self) -> Optional[Dict[str, Any]]:
+        stamp = self._stat()
+        if self._data is None or stamp != self._stamp:
+            self._reload()
+            self._stamp = stamp
+        return self._data
+
+    def _reload(self) -> None:
+        self._data = None
+        self._seq = 0
+        self._entries = 0
+        self._journal_valid_size = 0
+        try:
+            with open_run_file(self.snapshot_path) as f:
+                data = json_codec.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json_codec.JSONDecodeError) as e:
+            logger.warning("Unreadable run state snapshot %s: %s", self.snapshot_path, e)
+            return
+        if not isinstance(data, dict):
+            return
+
+        self._seq = int(data.pop(SNAPSHOT_SEQ_KEY, 0) or 0)
+        try:
+            with open_run_file(self.journal_path, "rb") as f:
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # Torn append
+                    try:
+                        entry = json_codec.loads(raw)
+                    except json_codec.JSONDecodeError:
+                        logger.warning("Skipping corrupt entry in %s", self.journal_path)
+                        self._journal_valid_size += len(raw)
+                        continue
+                    self._journal_valid_size += len(raw)
+                    seq = int(entry.get("seq", 0))
+                    if seq <= self._seq:
+                        continue  # Already folded into the snapshot
+                    apply_delta(data, entry)
+                    self._seq = seq
+                    self._entries += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Failed to replay run state journal %s: %s", self.journal_path, e)
+        self._data = data
+
+    def _append(self, delta: Dict[str, Any], data: Dict[str, Any]) -> int:
+        written = 0
+        if delta:
+            seq = self._seq + 1
+            raw = json_codec.dumpb({"seq": seq, **delta}) + b"\n"
+            journal_size = self._stamp[-1] if self._stamp else 0
+            if journal_size != self._journal_valid_size:
+                # Drop a torn tail left by a crash so the new line parses
+                os.truncate(self.journal_path, self._journal_valid_size)
+                written -= journal_size - self._journal_valid_size
+            fd = os.open(self.journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, raw)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._seq = seq
+            self._entries += 1
+            self._journal_valid_size += len(raw)
+            written += len(raw)
+        self._data = data
+        self._stamp = self._stat()
+
+        if self._entries >= self._compact_every or (
+            self._entries and data.get("status") in _TERMINAL_STATUSES
+        ):
+            written += self._write_snapshot(data, seq=self._seq)
+        return written
+
+    def _write_snapshot(self, data: Dict[str, Any], seq: int) -> int:
+        self.run_path.mkdir(parents=True, exist_ok=True)
+        try:
+            old_size = self.snapshot_path.stat().st_size
+        except OSError:
+            old_size = 0
+
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=".tmp", prefix=self.snapshot_path.name + ".", dir=self.run_path
+        )
+        try:
+            payload = json_codec.dumpb({**data, SNAPSHOT_SEQ_KEY: seq}, indent=True)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            new_size = len(payload)
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        # The snapshot now covers every journal entry; the journal can go
+        journal_size = self._stat()[-1]
+        try:
+            self.journal_path.unlink()
+        except FileNotFoundError:
+            journal_size = 0
+
+        self._data = data
+        self._seq = seq
+        self._entries = 0
+        self._journal_valid_size = 0
+        self._stamp = self._stat()
+        return new_size - old_size - journal_size
+
+
+def _version(stamp: Optional[Tuple[int, ...]]) -> str:
+    return hashlib.sha256(repr(stamp).encode()).hexdigest()[:16]
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+_journals: Dict[Path, RunStateJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_state_journal(run_path: Path, register: bool = True) -> RunStateJournal:
+    """Get the shared state journal for a run directory.
+
+    Args:
+        run_path: The run directory.
+        register: Keep a new journal for reuse. Read-only callers pass False
+            so browsing many finished runs does not pin their states in memory.
+    """
+    key = Path(run_path)
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = RunStateJournal(key)
+            if register:
+                _journals[key] = journal
+        return journal
+
+
+def release_state_journal(run_path: Path) -> None:
+    """Drop the in-memory journal of a run (e.g. once it has finished)."""
+    with _journals_lock:
+        _journals.pop(Path(run_path), None)
+
+
+def reset_state_journals() -> None:
+    """Forget all journals (for testing)."""
+    with _journals_lock:
+        _journals.clear()
+
+
+__all__ = [
+    "DEFAULT_COMPACT_EVERY",
+    "JOURNAL_FILE",
+    "LOCK_FILE",
+    "SNAPSHOT_FILE",
+    "SNAPSHOT_SEQ_KEY",
+    "RunStateJournal",
+    "apply_delta",
+    "diff_state",
+    "get_state_journal",
+    "release_state_journal",
+    "reset_state_journals",
+]
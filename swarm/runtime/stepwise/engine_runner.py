@@ -8,8 +8,9 @@ execution logic and produces a unified result type.
 The engine runner:
 1. Executes the step via the appropriate engine method
 2. Captures progress evidence (file changes)
-3. Tracks timing
-4. Returns a unified result for the orchestrator
+3. Tracks timing, with a tracing span per phase when tracing is on
+4. Meters local resource usage (CPU, subprocesses, git, I/O, run dir growth)
+5. Returns a unified result for the orchestrator
 
 Usage:
     from swarm.runtime.stepwise.engine_runner import run_step, StepRunResult
@@ -34,6 +35,8 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from swarm.runtime.diff_scanner import scan_file_changes_sync
 from swarm.runtime.engines import StepContext, StepEngine
 from swarm.runtime.engines.base import LifecycleCapableEngine
+from swarm.runtime.resource_usage import StepResourceUsage, measure_step
+from swarm.runtime.tracing import trace_span
 from swarm.runtime.types import RunEvent, RoutingSignal
 
 if TYPE_CHECKING:
@@ -86,6 +89,9 @@ class StepRunResult:
     # Progress evidence for forensics/stall detection
     progress_evidence: Optional[ProgressEvidence] = None
 
+    # Local resource usage (CPU, subprocesses, git, I/O)
+    resources: Optional[StepResourceUsage] = None
+
     # Lifecycle-specific (only for LifecycleCapableEngine)
     handoff_data: Optional[Dict[str, Any]] = None
     routing_signal: Optional[RoutingSignal] = None
@@ -123,32 +129,40 @@ def run_step(
     routing_signal: Optional[RoutingSignal] = None
     is_lifecycle = False
 
-    if isinstance(engine, LifecycleCapableEngine):
-        is_lifecycle = True
-
-        # Phase 1: Work (The Grind)
-        step_result, work_events, work_summary = engine.run_worker(ctx)
-
-        # Capture progress evidence after work, before finalize
-        if capture_progress:
-            progress_evidence = _capture_progress_evidence(repo_root)
-
-        # Phase 2: Finalize (JIT extraction while context is hot)
-        fin_result = engine.finalize_step(ctx, step_result, work_summary)
-
-        # Phase 3: Route (fresh session for routing decision)
-        handoff_data = fin_result.handoff_data or {}
-        routing_signal = engine.route_step(ctx, handoff_data)
-
-        # Combine events from work and finalization phases
-        events = list(work_events) + fin_result.events
-    else:
-        # Fallback to single-phase execution for non-lifecycle engines
-        step_result, events = engine.run_step(ctx)
-
-        # Capture progress evidence after execution
-        if capture_progress:
-            progress_evidence = _capture_progress_evidence(repo_root)
+    step_span = trace_span(ctx.step_id, cat="step", flow_key=ctx.flow_key)
+    with measure_step() as meter, step_span:
+        if isinstance(engine, LifecycleCapableEngine):
+            is_lifecycle = True
+
+            # Phase 1: Work (The Grind)
+            with trace_span("work"):
+                step_result, work_events, work_summary = engine.run_worker(ctx)
+
+            # Capture progress evidence after work, before finalize
+            if capture_progress:
+                with trace_span("diff_scan"):
+                    progress_evidence = _capture_progress_evidence(repo_root)
+
+            # Phase 2: Finalize (JIT extraction while context is hot)
+            with trace_span("finalize"):
+                fin_result = engine.finalize_step(ctx, step_result, work_summary)
+
+            # Phase 3: Route (fresh session for routing decision)
+            handoff_data = fin_result.handoff_data or {}
+            with trace_span("route"):
+                routing_signal = engine.route_step(ctx, handoff_data)
+
+            # Combine events from work and finalization phases
+            events = list(work_events) + fin_result.events
+        else:
+            # Fallback to single-phase execution for non-lifecycle engines
+            with trace_span("work"):
+                step_result, events = engine.run_step(ctx)
+
+            # Capture progress evidence after execution
+            if capture_progress:
+                with trace_span("diff_scan"):
+                    progress_evidence = _capture_progress_evidence(repo_root)
 
     # Calculate step duration
     duration_ms = int((time.monotonic() - step_start) * 1000)
@@ -160,6 +174,7 @@ def run_step(
         duration_ms=duration_ms,
         started_at=step_start_time,
         progress_evidence=progress_evidence,
+        resources=meter.usage,
         handoff_data=handoff_data,
         routing_signal=routing_signal,
         is_lifecycle_execution=is_lifecycle,
@@ -202,6 +217,7 @@ def emit_step_execution_events(
     - file_changes: Progress evidence for forensics
     - lifecycle_phases_completed: For lifecycle engines
     - step_timing: Duration and timing info
+    - step_resources: Local resource usage (CPU, subprocesses, git, I/O)
 
     Args:
         run_id: The run identifier.
@@ -267,6 +283,23 @@ def emit_step_execution_events(
         )
     )
 
+    # Resource usage event (projected into StatsDB step_resources)
+    if result.resources is not None:
+        events.append(
+            RunEvent(
+                run_id=run_id,
+                ts=now,
+                kind="step_resources",
+                flow_key=flow_key,
+                step_id=step_id,
+                payload={
+                    **result.resources.to_dict(),
+                    "step_index": step_index,
+                    "iteration": iteration,
+                },
+            )
+        )
+
     return events
 
 
@@ -33,9 +33,10 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from swarm.config.flow_registry import (
     FlowDefinition,
@@ -44,6 +45,7 @@ from swarm.config.flow_registry import (
 )
 from swarm.runtime import storage as storage_module
 from swarm.runtime.engines import StepContext, StepEngine
+from swarm.runtime.forensic_comparator import forensic_verdict_cache_stats
 
 
 # Macro navigation imports (between-flow routing)
@@ -52,6 +54,12 @@ from swarm.runtime.macro_navigator import (
     extract_flow_result,
 )
 from swarm.runtime.router import FlowGraph  # For Navigator integration
+from swarm.runtime.tracing import (
+    TRACE_FILENAME,
+    trace_run,
+    trace_span,
+    tracing_enabled_from_env,
+)
 
 
 from swarm.runtime.types import (
@@ -76,6 +84,7 @@ from .envelope import ensure_step_envelope
 from .graph_bridge import build_flow_graph_from_definition
 from .models import FlowExecutionResult, FlowStepwiseSummary, ResolvedNode
 from .node_resolver import resolve_node
+from .prewarm import FlowPrewarmer, FlowTransitionStats, PrewarmedFlow
 from .receipt_compat import update_receipt_routing
 from .routing import (
     build_routing_context,
@@ -131,6 +140,8 @@ class StepwiseOrchestrator:
         navigation_orchestrator: Optional["NavigationOrchestrator"] = None,
         skip_preflight: bool = False,
         routing_mode: RoutingMode = RoutingMode.ASSIST,
+        prewarm_flows: bool = True,
+        trace_spans: Optional[bool] = None,
     ):
         """Initialize the orchestrator.
 
@@ -169,6 +180,12 @@ class StepwiseOrchestrator:
                 - DETERMINISTIC_ONLY: No LLM calls, fast-path only
                 - ASSIST: Fast-path + Navigator chooses among candidates
                 - AUTHORITATIVE: Navigator can propose EXTEND_GRAPH freely
+            prewarm_flows: If True, prepare the likely next flow in the
+                background during the final step of the current one (see
+                prewarm.py).
+            trace_spans: If True, record phase-level tracing spans to the
+                run's trace.json, next to events.jsonl (see tracing.py). Defaults to the
+                SWARM_TRACE_SPANS environment variable.
         """
         self._engine = engine
         self._repo_root = repo_root or Path(__file__).resolve().parents[3]
@@ -179,6 +196,7 @@ class StepwiseOrchestrator:
         self._lock = threading.Lock()
         self._skip_preflight = skip_preflight
         self._routing_mode = routing_mode
+        self._trace_spans = tracing_enabled_from_env() if trace_spans is None else trace_spans
 
         # Navigation orchestrator for intelligent routing
         # Only create NavigationOrchestrator if routing mode requires it
@@ -204,6 +222,13 @@ class StepwiseOrchestrator:
         self._injection_detector = InjectionTriggerDetector(self._utility_flow_registry)
         self._utility_flow_injector = UtilityFlowInjector(self._utility_flow_registry)
 
+        # Speculative preparation of the next flow and transition latency
+        self._flow_prewarmer = FlowPrewarmer(self._prewarm_flow if prewarm_flows else None)
+
+    def close(self) -> None:
+        """Stop background work (next-flow pre-warming). Idempotent."""
+        self._flow_prewarmer.shutdown()
+
     def request_stop(self, run_id: RunId) -> bool:
         """Request graceful stop of a running run.
 
@@ -296,10 +321,12 @@ class StepwiseOrchestrator:
         # Log preflight result
         if result.passed:
             logger.info(
-                "Preflight passed (%d checks, %d warnings) in %dms",
+                "Preflight passed (%d checks, %d cached, %d warnings) in %dms (%dms sequential)",
                 len(result.checks),
+                len(result.cached_checks),
                 len(result.warnings),
                 result.total_duration_ms,
+                result.sequential_duration_ms,
             )
         else:
             logger.warning(
@@ -329,6 +356,73 @@ class StepwiseOrchestrator:
 
         return result
 
+    # =========================================================================
+    # Next-Flow Pre-warming
+    # =========================================================================
+
+    def _prewarm_flow(self, flow_key: str) -> PrewarmedFlow:
+        """Prepare a flow ahead of time. Runs on a prewarmer thread.
+
+        Loads the flow definition and builds its FlowGraph. Only side-effect
+        free work belongs here: the speculation may be discarded.
+        """
+        start = time.perf_counter()
+        flow_def = self._load_flow_definition(flow_key)
+        flow_graph = None
+        if flow_def is not None and flow_def.steps:
+            flow_graph = build_flow_graph_from_definition(flow_def)
+
+        return PrewarmedFlow(
+            flow_key=flow_key,
+            flow_def=flow_def,
+            flow_graph=flow_graph,
+            duration_ms=int((time.perf_counter() - start) * 1000),
+        )
+
+    def _prewarm_hook(
+        self,
+        run_id: RunId,
+        next_flow: Optional[str],
+    ) -> Optional[Callable[[], None]]:
+        """Return a callback that starts pre-warming next_flow, or None."""
+        prewarmer = self._flow_prewarmer
+        if not prewarmer.enabled or not next_flow:
+            return None
+        return lambda: prewarmer.start(run_id, next_flow)
+
+    def _claim_prewarmed_flow(self, run_id: RunId, flow_key: str) -> Optional[PrewarmedFlow]:
+        """Take the run's speculation if it prepared flow_key (else discard it)."""
+        return self._flow_prewarmer.take(run_id, flow_key)
+
+    def _emit_flow_transition(
+        self,
+        run_id: RunId,
+        flow_key: str,
+        warmed: Optional[PrewarmedFlow],
+    ) -> None:
+        """Record and emit the latency of the transition into flow_key."""
+        payload = self._flow_prewarmer.record_transition(run_id, flow_key, warmed)
+        if payload is None:
+            return
+        logger.info(
+            "Flow transition %s -> %s in %.0fms (prewarmed=%s)",
+            payload["from_flow"],
+            flow_key,
+            payload["latency_ms"],
+            payload["prewarmed"],
+        )
+        storage_module.append_event(
+            run_id,
+            RunEvent(
+                run_id=run_id,
+                ts=datetime.now(timezone.utc),
+                kind="flow_transition",
+                flow_key=flow_key,
+                step_id=None,
+                payload=payload,
+            ),
+        )
+
     def run_stepwise_flow(
         self,
         flow_key: str,
@@ -419,6 +513,9 @@ class StepwiseOrchestrator:
         if resume:
             self.clear_stop_request(run_id)
 
+        # Claim the work a previous flow of this run did ahead of time
+        warmed = self._claim_prewarmed_flow(run_id, flow_key)
+
         # Run preflight checks before expensive work
         backend = spec.backend if spec else "claude-harness"
         preflight_result = self._run_preflight(run_id, spec, backend)
@@ -448,7 +545,10 @@ class StepwiseOrchestrator:
                 raise RuntimeError(error_msg)
 
         # Load flow definition - use pack specs if enabled
-        flow_def = self._load_flow_definition(flow_key)
+        if warmed is not None and warmed.flow_def is not None:
+            flow_def = warmed.flow_def
+        else:
+            flow_def = self._load_flow_definition(flow_key)
         if flow_def is None:
             raise ValueError(f"Unknown flow: {flow_key}")
 
@@ -478,8 +578,19 @@ class StepwiseOrchestrator:
 
         # Execute steps
         try:
+            self._emit_flow_transition(run_id, flow_key, warmed)
             summary = self._execute_stepwise(
-                run_id, flow_key, flow_def, spec, resume=resume, run_state=run_state
+                run_id,
+                flow_key,
+                flow_def,
+                spec,
+                resume=resume,
+                run_state=run_state,
+                flow_graph=warmed.flow_graph if warmed is not None else None,
+                on_final_step=self._prewarm_hook(
+                    run_id,
+                    macro_navigator.predict_next_flow(flow_key) if macro_navigator else None,
+                ),
             )
 
             # Perform macro routing if navigator provided
@@ -502,6 +613,12 @@ class StepwiseOrchestrator:
                     run_state=run_state,
                 )
 
+                # Time the transition into the next flow, unless the run stops here
+                if macro_decision.action in (MacroAction.TERMINATE, MacroAction.PAUSE):
+                    self._flow_prewarmer.discard(run_id)
+                else:
+                    self._flow_prewarmer.flow_completed(run_id, flow_key)
+
                 # Log the macro routing decision
                 logger.info(
                     "MacroNavigator: Flow '%s' completed -> %s (next: %s, reason: %s)",
@@ -692,8 +809,13 @@ class StepwiseOrchestrator:
                     flow_key,
                 )
 
-                # Get flow definition - use pack specs if enabled
-                flow_def = self._load_flow_definition(flow_key)
+                # Get flow definition - prepared during the previous flow's
+                # final step if routing went where it was predicted to
+                warmed = self._claim_prewarmed_flow(run_id, flow_key)
+                if warmed is not None and warmed.flow_def is not None:
+                    flow_def = warmed.flow_def
+                else:
+                    flow_def = self._load_flow_definition(flow_key)
                 if flow_def is None:
                     logger.error("Unknown flow in sequence: %s", flow_key)
                     break
@@ -715,6 +837,7 @@ class StepwiseOrchestrator:
                 )
 
                 # Execute the flow
+                self._emit_flow_transition(run_id, flow_key, warmed)
                 try:
                     self._execute_stepwise(
                         run_id=run_id,
@@ -722,6 +845,10 @@ class StepwiseOrchestrator:
                         flow_def=flow_def,
                         spec=spec,
                         run_state=run_state,
+                        flow_graph=warmed.flow_graph if warmed is not None else None,
+                        on_final_step=self._prewarm_hook(
+                            run_id, macro_nav.predict_next_flow(flow_key)
+                        ),
                     )
                 except Exception as e:
                     logger.error("Flow %s failed: %s", flow_key, e)
@@ -751,6 +878,7 @@ class StepwiseOrchestrator:
                     flow_result=flow_result,
                     run_state=run_state,
                 )
+                self._flow_prewarmer.flow_completed(run_id, flow_key)
 
                 # Emit macro routing event
                 storage_module.append_event(
@@ -884,6 +1012,10 @@ class StepwiseOrchestrator:
             )
             raise
 
+        finally:
+            # Drop any speculation for a flow that will not run
+            self._flow_prewarmer.discard(run_id)
+
     def _execute_stepwise(
         self,
         run_id: RunId,
@@ -894,6 +1026,39 @@ class StepwiseOrchestrator:
         run_state: Optional[RunState] = None,
         start_step: Optional[str] = None,
         end_step: Optional[str] = None,
+        flow_graph: Optional[FlowGraph] = None,
+        on_final_step: Optional[Callable[[], None]] = None,
+    ) -> FlowStepwiseSummary:
+        """Execute flow steps sequentially, traced when tracing is enabled.
+
+        See _execute_flow_steps for the arguments.
+        """
+        args = (run_id, flow_key, flow_def, spec, resume, run_state)
+        kwargs: Dict[str, Any] = {
+            "start_step": start_step,
+            "end_step": end_step,
+            "flow_graph": flow_graph,
+            "on_final_step": on_final_step,
+        }
+        if not self._trace_spans:
+            return self._execute_flow_steps(*args, **kwargs)
+
+        trace_path = storage_module.get_run_path(run_id) / TRACE_FILENAME
+        with trace_run(run_id, trace_path), trace_span(flow_key, cat="flow", run_id=run_id):
+            return self._execute_flow_steps(*args, **kwargs)
+
+    def _execute_flow_steps(
+        self,
+        run_id: RunId,
+        flow_key: str,
+        flow_def: FlowDefinition,
+        spec: RunSpec,
+        resume: bool = False,
+        run_state: Optional[RunState] = None,
+        start_step: Optional[str] = None,
+        end_step: Optional[str] = None,
+        flow_graph: Optional[FlowGraph] = None,
+        on_final_step: Optional[Callable[[], None]] = None,
     ) -> FlowStepwiseSummary:
         """Execute flow steps sequentially.
 
@@ -906,6 +1071,9 @@ class StepwiseOrchestrator:
             run_state: Optional existing run state for resumption.
             start_step: Optional step ID to start from.
             end_step: Optional step ID to stop at.
+            flow_graph: FlowGraph of flow_def, if already built (pre-warmed).
+            on_final_step: Called once when the last step of the flow starts
+                (used to pre-warm the next flow).
 
         Returns:
             FlowStepwiseSummary with final status.
@@ -935,7 +1103,8 @@ class StepwiseOrchestrator:
             )
 
         # Build FlowGraph for Navigator from flow definition
-        flow_graph = build_flow_graph_from_definition(flow_def)
+        if flow_graph is None:
+            flow_graph = build_flow_graph_from_definition(flow_def)
 
         # Use provided run_state or create new one for Navigator
         if run_state is None:
@@ -976,6 +1145,11 @@ class StepwiseOrchestrator:
 
             step = steps[current_step_idx]
 
+            # Final step: start preparing the likely next flow in the background
+            if on_final_step is not None and current_step_idx == len(steps) - 1:
+                on_final_step()
+                on_final_step = None
+
             # For injected nodes, resolve via the node resolver
             current_node_id = run_state.current_step_id or step.id
             resolved = resolve_node(current_node_id, flow_def, run_state)
@@ -1153,21 +1327,23 @@ class StepwiseOrchestrator:
             # 5. Escalate (last resort)
             # =================================================================
 
-            routing_outcome = route_step(
-                step=step,
-                step_result=step_result,
-                run_state=run_state,
-                loop_state=loop_state,
-                iteration=current_iteration,
-                routing_mode=self._routing_mode,
-                run_id=run_id,
-                flow_key=flow_key,
-                flow_graph=flow_graph,
-                flow_def=flow_def,
-                spec=spec,
-                run_base=run_base,
-                navigation_orchestrator=self._navigation_orchestrator,
-            )
+            with trace_span("routing", step_id=step.id) as routing_span:
+                routing_outcome = route_step(
+                    step=step,
+                    step_result=step_result,
+                    run_state=run_state,
+                    loop_state=loop_state,
+                    iteration=current_iteration,
+                    routing_mode=self._routing_mode,
+                    run_id=run_id,
+                    flow_key=flow_key,
+                    flow_graph=flow_graph,
+                    flow_def=flow_def,
+                    spec=spec,
+                    run_base=run_base,
+                    navigation_orchestrator=self._navigation_orchestrator,
+                )
+                routing_span.set(source=routing_outcome.routing_source)
 
             logger.debug(
                 "Routing for step %s: next=%s, reason=%s, source=%s",
@@ -1221,6 +1397,12 @@ class StepwiseOrchestrator:
                 break
 
         # Emit run_completed event
+        completed_payload: Dict[str, Any] = {"steps_completed": len(history)}
+        verdict_cache_stats = forensic_verdict_cache_stats(
+            self._repo_root / "swarm" / "runs" / run_id / flow_key
+        )
+        if verdict_cache_stats is not None:
+            completed_payload["forensic_verdict_cache"] = verdict_cache_stats
         storage_module.append_event(
             run_id,
             RunEvent(
@@ -1229,7 +1411,7 @@ class StepwiseOrchestrator:
                 kind="run_completed",
                 flow_key=flow_key,
                 step_id=None,
-                payload={"steps_completed": len(history)},
+                payload=completed_payload,
             ),
         )
 
@@ -1376,6 +1558,16 @@ class StepwiseOrchestrator:
         """
         return self._utility_flow_injector.check_utility_flow_completion(run_state)
 
+    def get_flow_transition_stats(self) -> FlowTransitionStats:
+        """Get flow transition latency and pre-warming metrics.
+
+        Transitions are measured whether or not pre-warming is enabled.
+
+        Returns:
+            FlowTransitionStats snapshot.
+        """
+        return self._flow_prewarmer.stats()
+
     def get_utility_flow_registry(self) -> UtilityFlowRegistry:
         """Get the utility flow registry for inspection.
 
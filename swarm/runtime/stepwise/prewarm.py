@@ -0,0 +1,291 @@
+"""
+prewarm.py - Speculative pre-warming of the next flow.
+
+When a flow finishes, the orchestrator used to start the next one cold:
+load (or compile from pack specs) the flow definition and build its
+FlowGraph while the operator waits. The FlowPrewarmer starts that work in
+the background while the final step of the current flow is still
+executing, for the flow the MacroNavigator is most likely to pick
+(MacroNavigator.predict_next_flow).
+
+Speculation rules:
+    - At most one speculation per run; starting another replaces it.
+    - take(run_id, flow_key) hands over the warmed flow only if it is the
+      flow routing actually chose. Otherwise the speculation is discarded
+      and the flow is loaded cold as before.
+    - Warm work is side-effect free (spec loading and graph building), so
+      discarded work leaves nothing behind. Preflight is not warmed: it
+      probes the repository and working tree, and must see them as they are
+      when the flow starts.
+    - The first context pack is not pre-built: it reads artifacts the final
+      step of the current flow may still be writing.
+
+Flow-transition latency (flow completed -> next flow's first step) is
+recorded for every transition, prewarmed or not, and reported in the
+flow_transition event and in stats(). A prewarmer without a warm function
+only measures transitions.
+
+Usage:
+    from swarm.runtime.stepwise.prewarm import FlowPrewarmer
+
+    prewarmer = FlowPrewarmer(warm_fn)
+    prewarmer.start(run_id, "gate")          # During build's final step
+    prewarmer.flow_completed(run_id, "build")
+    warmed = prewarmer.take(run_id, "gate")  # After macro routing
+    payload = prewarmer.record_transition(run_id, "gate", warmed)
+    prewarmer.shutdown()                     # When the orchestrator closes
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from swarm.runtime.quantile_sketch import DurationSketch
+
+if TYPE_CHECKING:
+    from swarm.config.flow_registry import FlowDefinition
+    from swarm.runtime.router import FlowGraph
+
+logger = logging.getLogger(__name__)
+
+# How long take() waits for an in-flight speculation before loading cold
+DEFAULT_WAIT_SECONDS = 10.0
+
+# Background workers shared by all runs of an orchestrator
+DEFAULT_MAX_WORKERS = 2
+
+
+@dataclass
+class PrewarmedFlow:
+    """Work done ahead of time for a flow.
+
+    Attributes:
+        flow_key: The flow that was warmed.
+        flow_def: Loaded flow definition (None if the flow is unknown).
+        flow_graph: FlowGraph built from the definition.
+        duration_ms: Time the warm work took in the background.
+    """
+
+    flow_key: str
+    flow_def: Optional["FlowDefinition"] = None
+    flow_graph: Optional["FlowGraph"] = None
+    duration_ms: int = 0
+
+
+@dataclass
+class FlowTransitionStats:
+    """Point-in-time flow transition metrics.
+
+    Attributes:
+        transitions: Flow transitions measured.
+        prewarm_started: Speculations started.
+        prewarm_hits: Transitions that used a speculation.
+        prewarm_discarded: Speculations dropped because routing went elsewhere
+            (or the run ended).
+        prewarm_failed: Speculations whose warm work raised.
+        latency: Sketch of transition latencies in milliseconds.
+    """
+
+    transitions: int = 0
+    prewarm_started: int = 0
+    prewarm_hits: int = 0
+    prewarm_discarded: int = 0
+    prewarm_failed: int = 0
+    latency: Optional[DurationSketch] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        p50 = self.latency.quantile(0.5) if self.latency else None
+        p95 = self.latency.quantile(0.95) if self.latency else None
+        return {
+            "transitions": self.transitions,
+            "prewarm_started": self.prewarm_started,
+            "prewarm_hits": self.prewarm_hits,
+            "prewarm_discarded": self.prewarm_discarded,
+            "prewarm_failed": self.prewarm_failed,
+            "p50_latency_ms": round(p50, 2) if p50 is not None else None,
+            "p95_latency_ms": round(p95, 2) if p95 is not None else None,
+        }
+
+
+class FlowPrewarmer:
+    """Background preparation of the next flow, one speculation per run.
+
+    Thread-safe. Workers are started lazily on the first speculation.
+    """
+
+    def __init__(
+        self,
+        warm_fn: Optional[Callable[..., PrewarmedFlow]],
+        wait_seconds: float = DEFAULT_WAIT_SECONDS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the prewarmer.
+
+        Args:
+            warm_fn: warm_fn(flow_key, **context) prepares a flow. Runs on a
+                background thread. None disables speculation; transitions
+                are still measured.
+            wait_seconds: How long take() waits for an unfinished speculation.
+            max_workers: Background worker threads.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._warm_fn = warm_fn
+        self._wait_seconds = wait_seconds
+        self._max_workers = max(1, int(max_workers))
+        self._clock = clock
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[str, Tuple[str, "Future[PrewarmedFlow]"]] = {}
+        self._completed_at: Dict[str, Tuple[str, float]] = {}
+        self._stats = FlowTransitionStats(latency=DurationSketch())
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """True if flows are warmed ahead of time."""
+        return self._warm_fn is not None
+
+    def start(self, run_id: str, flow_key: Optional[str], **context: Any) -> bool:
+        """Start warming flow_key for a run.
+
+        Args:
+            run_id: The run the speculation belongs to.
+            flow_key: The predicted next flow.
+            **context: Passed through to warm_fn.
+
+        Returns:
+            True if a speculation was started, False if speculation is
+            disabled, flow_key is None or the same flow is already being
+            warmed for this run.
+        """
+        if not flow_key or self._warm_fn is None:
+            return False
+        with self._lock:
+            pending = self._pending.get(run_id)
+            if pending is not None:
+                if pending[0] == flow_key:
+                    return False
+                self._stats.prewarm_discarded += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="flow-prewarm"
+                )
+            future = self._executor.submit(self._warm_fn, flow_key, **context)
+            self._pending[run_id] = (flow_key, future)
+            self._stats.prewarm_started += 1
+        logger.debug("Pre-warming flow %s for run %s", flow_key, run_id)
+        return True
+
+    def take(self, run_id: str, flow_key: Optional[str]) -> Optional[PrewarmedFlow]:
+        """Claim the run's speculation if it warmed flow_key.
+
+        A speculation for any other flow is discarded. If the warm work is
+        still running it is awaited for up to wait_seconds; past that (or if
+        it failed) None is returned and the caller loads the flow cold.
+        """
+        with self._lock:
+            pending = self._pending.pop(run_id, None)
+            if pending is None:
+                return None
+            if pending[0] != flow_key:
+                self._stats.prewarm_discarded += 1
+                logger.debug(
+                    "Discarding pre-warmed flow %s for run %s (routed to %s)",
+                    pending[0],
+                    run_id,
+                    flow_key,
+                )
+                return None
+
+        try:
+            warmed = pending[1].result(timeout=self._wait_seconds)
+        except FutureTimeoutError:
+            with self._lock:
+                self._stats.prewarm_discarded += 1
+            logger.debug("Pre-warming %s not ready after %.1fs", flow_key, self._wait_seconds)
+            return None
+        except Exception as e:
+            with self._lock:
+                self._stats.prewarm_failed += 1
+            logger.warning("Pre-warming flow %s failed: %s", flow_key, e)
+            return None
+
+        with self._lock:
+            self._stats.prewarm_hits += 1
+        return warmed
+
+    def discard(self, run_id: str) -> None:
+        """Drop the run's speculation and transition timer (run ended)."""
+        with self._lock:
+            if self._pending.pop(run_id, None) is not None:
+                self._stats.prewarm_discarded += 1
+            self._completed_at.pop(run_id, None)
+
+    def flow_completed(self, run_id: str, flow_key: str) -> None:
+        """Start the transition timer when a flow finishes."""
+        with self._lock:
+            self._completed_at[run_id] = (flow_key, self._clock())
+
+    def record_transition(
+        self,
+        run_id: str,
+        flow_key: str,
+        warmed: Optional[PrewarmedFlow] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Stop the transition timer as the next flow's first step starts.
+
+        Returns:
+            flow_transition event payload, or None if no flow of this run
+            completed before (the run's first flow).
+        """
+        with self._lock:
+            completed = self._completed_at.pop(run_id, None)
+            if completed is None:
+                return None
+            from_flow, completed_at = completed
+            latency_ms = max(0.0, (self._clock() - completed_at) * 1000)
+            self._stats.transitions += 1
+            self._stats.latency.add(latency_ms)
+        return {
+            "from_flow": from_flow,
+            "to_flow": flow_key,
+            "latency_ms": round(latency_ms, 2),
+            "prewarmed": warmed is not None,
+            "prewarm_ms": warmed.duration_ms if warmed is not None else None,
+        }
+
+    def stats(self) -> FlowTransitionStats:
+        """Return a snapshot of transition metrics."""
+        with self._lock:
+            latency = DurationSketch().merge(self._stats.latency)
+            return FlowTransitionStats(
+                transitions=self._stats.transitions,
+                prewarm_started=self._stats.prewarm_started,
+                prewarm_hits=self._stats.prewarm_hits,
+                prewarm_discarded=self._stats.prewarm_discarded,
+                prewarm_failed=self._stats.prewarm_failed,
+                latency=latency,
+            )
+
+    def shutdown(self) -> None:
+        """Stop the background workers without waiting for speculations."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "DEFAULT_WAIT_SECONDS",
+    "FlowPrewarmer",
+    "FlowTransitionStats",
+    "PrewarmedFlow",
+]
@@ -33,6 +33,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from swarm.runtime.forensic_comparator import (
     compare_claim_vs_evidence,
     forensic_verdict_to_dict,
+    get_forensic_verdict_cache,
 )
 from swarm.runtime.forensic_types import diff_scan_result_from_dict
 from swarm.runtime.handoff_io import update_envelope_routing
@@ -136,6 +137,7 @@ def route_via_navigator(
                 handoff=handoff_dict,
                 diff_result=diff_result,
                 test_summary=None,
+                cache=get_forensic_verdict_cache(run_base),
             )
 
             forensic_verdict = forensic_verdict_to_dict(verdict)
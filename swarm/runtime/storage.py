@@ -9,11 +9,20 @@ The storage layout is:
         meta.json          # RunSummary serialized
         spec.json          # RunSpec serialized
         events.jsonl       # newline-delimited RunEvent objects
-        run_state.json     # RunState serialized (durable program counter)
+        run_state.json     # RunState snapshot (durable program counter)
+        run_state.journal.jsonl  # RunState deltas since the snapshot
         <flow_key>/        # existing artifact directories (signal/, plan/, etc.)
           handoff/        # HandoffEnvelope JSON files for each step
             <step_id>.json
 
+Finished runs may be archived (see run_archive.py): everything except
+meta.json is packed into <run_id>/run.bundle.zip. The readers below fall
+back to the bundle transparently.
+
+RunState writes append deltas to a journal that is periodically compacted
+into run_state.json (see state_journal.py); use read_run_state() rather than
+reading run_state.json directly.
+
 Usage:
     from swarm.runtime.storage import (
         RUNS_DIR,
@@ -31,7 +40,6 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import tempfile
@@ -39,6 +47,11 @@ import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from . import json_codec
+from .disk_ledger import get_disk_ledger
+from .run_archive import is_archived, list_run_files, open_run_file, restore_run
+from .state_journal import get_state_journal, release_state_journal
+from .tracing import trace_span
 from .types import (
     HandoffEnvelope,
     RunEvent,
@@ -72,6 +85,9 @@ EVENTS_FILE = "events.jsonl"
 RUN_STATE_FILE = "run_state.json"
 LEGACY_META_FILE = "run.json"  # Old-style optional metadata
 
+# Run statuses after which a run's directory is measured for the disk ledger
+_TERMINAL_STATUSES = frozenset({"succeeded", "failed", "canceled", "stopped"})
+
 # -----------------------------------------------------------------------------
 # Per-run locking for thread safety
 # -----------------------------------------------------------------------------
@@ -124,18 +140,16 @@ def _init_seq_from_disk(run_id: str, run_dir: Path) -> None:
         run_dir: Path to the run directory.
     """
     events_file = run_dir / EVENTS_FILE
-    if not events_file.exists():
-        return
 
     max_seq = 0
     try:
-        with open(events_file, "r", encoding="utf-8") as f:
+        with open_run_file(events_file) as f:
             for line in f:
                 if line.strip():
                     try:
-                        event = json.loads(line)
+                        event = json_codec.loads(line)
                         max_seq = max(max_seq, event.get("seq", 0))
-                    except json.JSONDecodeError:
+                    except json_codec.JSONDecodeError:
                         continue
     except (OSError, IOError):
         pass
@@ -173,7 +187,7 @@ def _get_run_lock(run_id: RunId) -> threading.Lock:
 # -----------------------------------------------------------------------------
 
 
-def _atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
+def _atomic_write_json(path: Path, data: Any, indent: bool = True) -> int:
     """Write JSON data to a file atomically.
 
     Uses a temporary file + os.replace pattern to ensure atomicity.
@@ -182,10 +196,19 @@ def _atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
     Args:
         path: Destination file path.
         data: JSON-serializable data.
-        indent: JSON indentation level.
+        indent: Pretty-print with 2-space indentation.
+
+    Returns:
+        Change in the file's size in bytes (for disk usage accounting).
     """
     parent = path.parent
     parent.mkdir(parents=True, exist_ok=True)
+    payload = json_codec.dumpb(data, indent=indent)
+
+    try:
+        old_size = path.stat().st_size
+    except OSError:
+        old_size = 0
 
     # Write to temp file in same directory (ensures same filesystem for rename)
     fd, tmp_path = tempfile.mkstemp(
@@ -194,13 +217,15 @@ def _atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
         dir=parent,
     )
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())  # Ensure data is on disk
+        new_size = len(payload)
 
         # Atomic rename (POSIX guarantees)
         os.replace(tmp_path, path)
+        return new_size - old_size
     except Exception:
         # Clean up temp file on failure
         try:
@@ -210,6 +235,17 @@ def _atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
         raise
 
 
+def _record_disk_usage(run_id: RunId, delta: int, runs_dir: Path) -> None:
+    """Account bytes written for a run in the disk usage ledger.
+
+    Ledger updates are non-critical; failures are logged and ignored.
+    """
+    try:
+        get_disk_ledger(runs_dir).record_bytes(run_id, delta)
+    except Exception as e:
+        logger.debug("Failed to record disk usage for run '%s': %s", run_id, e)
+
+
 def _load_json_safe(path: Path, run_id: str, file_type: str = "file") -> Optional[Dict[str, Any]]:
     """Load JSON file with graceful error handling.
 
@@ -224,13 +260,12 @@ def _load_json_safe(path: Path, run_id: str, file_type: str = "file") -> Optiona
     Returns:
         Parsed JSON dict, or None if file doesn't exist or is corrupt.
     """
-    if not path.exists():
-        return None
-
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        with open_run_file(path) as f:
+            return json_codec.load(f)
+    except FileNotFoundError:
+        return None
+    except json_codec.JSONDecodeError as e:
         logger.warning(
             "Corrupt %s for run '%s' at %s: %s (marking as corrupt)", file_type, run_id, path, e
         )
@@ -374,7 +409,7 @@ def write_spec(run_id: RunId, spec: RunSpec, runs_dir: Path = RUNS_DIR) -> Path:
     spec_path = run_path / SPEC_FILE
 
     data = run_spec_to_dict(spec)
-    _atomic_write_json(spec_path, data)
+    _record_disk_usage(run_id, _atomic_write_json(spec_path, data), runs_dir)
 
     return spec_path
 
@@ -425,7 +460,9 @@ def write_summary(run_id: RunId, summary: RunSummary, runs_dir: Path = RUNS_DIR)
     meta_path = run_path / META_FILE
 
     data = run_summary_to_dict(summary)
-    _atomic_write_json(meta_path, data)
+    # Live scheduler state, overlaid on read by backends.with_queue_state
+    data.pop("queue_position", None)
+    _record_disk_usage(run_id, _atomic_write_json(meta_path, data), runs_dir)
 
     return meta_path
 
@@ -497,6 +534,13 @@ def update_summary(run_id: RunId, updates: Dict[str, Any], runs_dir: Path = RUNS
         updated_summary = run_summary_from_dict(data)
         write_summary(run_id, updated_summary, runs_dir)
 
+        # Run finished: replace accumulated deltas with an exact measurement
+        if data.get("status") in _TERMINAL_STATUSES:
+            try:
+                get_disk_ledger(runs_dir).measure_run(run_id, get_run_path(run_id, runs_dir))
+            except Exception as e:
+                logger.debug("Failed to measure disk usage for run '%s': %s", run_id, e)
+
         return updated_summary
 
 
@@ -607,20 +651,25 @@ def append_event(run_id: RunId, event: RunEvent, runs_dir: Path = RUNS_DIR) -> N
         runs_dir: Base directory for runs. Defaults to RUNS_DIR.
     """
     lock = _get_run_lock(run_id)
-    with lock:
+    with trace_span("event_append"), lock:
         run_path = create_run_dir(run_id, runs_dir)
         events_path = run_path / EVENTS_FILE
 
+        if not events_path.exists() and is_archived(run_path):
+            # Appending next to a bundled events.jsonl would shadow it
+            restore_run(run_path)
+
         try:
             # Assign monotonic sequence number before serialization
             event.seq = _next_seq(run_id)
 
             data = run_event_to_dict(event)
-            line = json.dumps(data, ensure_ascii=False)
+            line = json_codec.dumps(data)
 
             with open(events_path, "a", encoding="utf-8") as f:
                 f.write(line + "\n")
                 f.flush()  # Ensure data reaches OS buffer
+            _record_disk_usage(run_id, len(line.encode("utf-8")) + 1, runs_dir)
         except (OSError, IOError) as e:
             logger.warning(
                 "Failed to append event for run '%s' at %s: %s",
@@ -652,20 +701,17 @@ def read_events(run_id: RunId, runs_dir: Path = RUNS_DIR) -> List[RunEvent]:
     run_path = get_run_path(run_id, runs_dir)
     events_path = run_path / EVENTS_FILE
 
-    if not events_path.exists():
-        return []
-
     events: List[RunEvent] = []
     try:
-        with open(events_path, "r", encoding="utf-8") as f:
+        with open_run_file(events_path) as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    data = json.loads(line)
+                    data = json_codec.loads(line)
                     events.append(run_event_from_dict(data))
-                except (json.JSONDecodeError, KeyError, TypeError):
+                except (json_codec.JSONDecodeError, KeyError, TypeError):
                     # Skip malformed lines
                     continue
     except OSError:
@@ -680,6 +726,7 @@ NAVIGATOR_EVENT_TYPES = frozenset(
         "graph_patch_suggested",  # EXTEND_GRAPH - map gap detected
         "detour_taken",  # Sidequest invoked
         "navigation_decision",  # Navigator route choice
+        "navigation_cache_hit",  # Navigator decision replayed from cache
         "sidequest_start",  # Sidequest execution started
         "sidequest_complete",  # Sidequest finished
         "loop_stall_detected",  # Progress signature unchanged across loops
@@ -963,10 +1010,55 @@ def list_all_runs(include_examples: bool = True) -> List[Dict[str, Any]]:
 # -----------------------------------------------------------------------------
 
 
+def _state_journal(run_id: RunId, runs_dir: Path):
+    """Get the state journal of a run, restoring the run first if archived."""
+    run_path = create_run_dir(run_id, runs_dir)
+    if is_archived(run_path):
+        restore_run(run_path)
+        release_state_journal(run_path)
+    return get_state_journal(run_path)
+
+
+def _with_aliases(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the schema-compatibility aliases of run_state_to_dict() in sync."""
+    if "flow_key" in fields:
+        fields["flow_id"] = fields["flow_key"]
+    if "current_step_id" in fields:
+        fields["current_node"] = fields["current_step_id"]
+    return fields
+
+
+def _recover_envelopes(run_id: RunId, state: RunState, runs_dir: Path) -> None:
+    """Crash recovery: reconstruct handoff_envelopes from disk if empty."""
+    if not state.handoff_envelopes and state.flow_key:
+        disk_envelopes = list_envelopes(run_id, state.flow_key, runs_dir)
+        if disk_envelopes:
+            logger.info(
+                "Recovered %d envelope(s) from disk for run '%s' flow '%s'",
+                len(disk_envelopes),
+                run_id,
+                state.flow_key,
+            )
+            state.handoff_envelopes.update(disk_envelopes)
+
+
+def _persist_run_state(run_id: RunId, delta: Dict[str, Any], runs_dir: Path) -> RunState:
+    """Append a RunState delta to the journal and return the updated state."""
+    journal = _state_journal(run_id, runs_dir)
+    data, written = journal.apply(delta)
+    _record_disk_usage(run_id, written, runs_dir)
+    if journal.pending_entries == 0 and data.get("status") in _TERMINAL_STATUSES:
+        release_state_journal(journal.run_path)
+    return run_state_from_dict(data)
+
+
 def write_run_state(run_id: RunId, state: RunState, runs_dir: Path = RUNS_DIR) -> Path:
-    """Write RunState to run_state.json atomically.
+    """Persist RunState.
 
-    Uses atomic write (temp file + rename) to prevent partial writes.
+    The first write creates run_state.json atomically (temp file + rename).
+    Later writes append only the fields that changed to the state journal,
+    so the cost per step does not grow with the run; the journal is folded
+    back into run_state.json periodically and when the run finishes.
 
     Args:
         run_id: The unique run identifier.
@@ -974,19 +1066,18 @@ def write_run_state(run_id: RunId, state: RunState, runs_dir: Path = RUNS_DIR) -
         runs_dir: Base directory for runs. Defaults to RUNS_DIR.
 
     Returns:
-        Path to the written run_state.json file.
+        Path to the run_state.json snapshot.
     """
-    run_path = create_run_dir(run_id, runs_dir)
-    state_path = run_path / RUN_STATE_FILE
-
-    data = run_state_to_dict(state)
-    _atomic_write_json(state_path, data)
+    journal = _state_journal(run_id, runs_dir)
+    _record_disk_usage(run_id, journal.write(run_state_to_dict(state)), runs_dir)
+    if journal.pending_entries == 0 and state.status in _TERMINAL_STATUSES:
+        release_state_journal(journal.run_path)
 
-    return state_path
+    return journal.snapshot_path
 
 
 def read_run_state(run_id: RunId, runs_dir: Path = RUNS_DIR) -> Optional[RunState]:
-    """Read RunState from run_state.json with graceful error handling.
+    """Read RunState (snapshot + journal replay) with graceful error handling.
 
     Includes crash recovery logic: if handoff_envelopes is empty but envelope
     files exist on disk, reconstructs the envelope map from the files. This
@@ -1003,25 +1094,13 @@ def read_run_state(run_id: RunId, runs_dir: Path = RUNS_DIR) -> Optional[RunStat
     run_path = get_run_path(run_id, runs_dir)
     state_path = run_path / RUN_STATE_FILE
 
-    data = _load_json_safe(state_path, run_id, "run_state")
+    data = get_state_journal(run_path, register=False).load()
     if data is None:
         return None
 
     try:
         state = run_state_from_dict(data)
-
-        # Crash recovery: reconstruct handoff_envelopes from disk if empty
-        if not state.handoff_envelopes and state.flow_key:
-            disk_envelopes = list_envelopes(run_id, state.flow_key, runs_dir)
-            if disk_envelopes:
-                logger.info(
-                    "Recovered %d envelope(s) from disk for run '%s' flow '%s'",
-                    len(disk_envelopes),
-                    run_id,
-                    state.flow_key,
-                )
-                state.handoff_envelopes.update(disk_envelopes)
-
+        _recover_envelopes(run_id, state, runs_dir)
         return state
     except (KeyError, TypeError) as e:
         logger.warning("Invalid run_state data for run '%s' at %s: %s", run_id, state_path, e)
@@ -1031,8 +1110,8 @@ def read_run_state(run_id: RunId, runs_dir: Path = RUNS_DIR) -> Optional[RunStat
 def update_run_state(run_id: RunId, updates: Dict[str, Any], runs_dir: Path = RUNS_DIR) -> RunState:
     """Partial update of RunState fields.
 
-    Reads the existing state, applies updates, and writes back.
-    Only updates fields that are present in the updates dict.
+    Appends the updates to the state journal without rewriting the full
+    state. Only updates fields that already exist in the state.
 
     This function is thread-safe via per-run locking to prevent lost updates
     when multiple threads update the same run concurrently.
@@ -1051,21 +1130,14 @@ def update_run_state(run_id: RunId, updates: Dict[str, Any], runs_dir: Path = RU
     """
     lock = _get_run_lock(run_id)
     with lock:
-        state = read_run_state(run_id, runs_dir)
-        if state is None:
+        current = get_state_journal(get_run_path(run_id, runs_dir)).load()
+        if current is None:
             raise FileNotFoundError(f"Run state not found: {run_id}")
 
-        # Convert to dict, apply updates, convert back
-        data = run_state_to_dict(state)
-
-        for key, value in updates.items():
-            if key in data:
-                data[key] = value
-
-        updated_state = run_state_from_dict(data)
-        write_run_state(run_id, updated_state, runs_dir)
-
-        return updated_state
+        fields = _with_aliases({key: value for key, value in updates.items() if key in current})
+        state = _persist_run_state(run_id, {"set": fields}, runs_dir)
+        _recover_envelopes(run_id, state, runs_dir)
+        return state
 
 
 # -----------------------------------------------------------------------------
@@ -1104,7 +1176,7 @@ def write_envelope(
     handoff_dir.mkdir(parents=True, exist_ok=True)
 
     data = handoff_envelope_to_dict(envelope)
-    _atomic_write_json(envelope_path, data)
+    _record_disk_usage(run_id, _atomic_write_json(envelope_path, data), runs_dir)
 
     return envelope_path
 
@@ -1167,14 +1239,8 @@ def list_envelopes(
     flow_path = run_path / flow_key
     handoff_dir = flow_path / "handoff"
 
-    if not handoff_dir.exists():
-        return {}
-
     envelopes: Dict[str, HandoffEnvelope] = {}
-    for entry in handoff_dir.iterdir():
-        if not entry.is_file() or not entry.suffix == ".json":
-            continue
-
+    for entry in list_run_files(handoff_dir, "*.json"):
         step_id = entry.stem
         envelope = read_envelope(run_id, flow_key, step_id, runs_dir)
         if envelope:
@@ -1241,29 +1307,30 @@ def commit_step_completion(
         write_envelope(run_id, flow_key, step_id, envelope, runs_dir)
 
         # Step 2: Read current run_state
-        state = read_run_state(run_id, runs_dir)
-        if state is None:
+        current = get_state_journal(get_run_path(run_id, runs_dir)).load()
+        if current is None:
             raise FileNotFoundError(f"Run state not found: {run_id}")
 
-        # Step 3: Build updated state with envelope reference
-        data = run_state_to_dict(state)
-
-        # Add envelope to handoff_envelopes map
-        if "handoff_envelopes" not in data:
-            data["handoff_envelopes"] = {}
-        data["handoff_envelopes"][step_id] = handoff_envelope_to_dict(envelope)
-
-        # Apply caller-provided updates
-        for key, value in run_state_updates.items():
-            if key in data:
-                data[key] = value
+        # Step 3: Build the delta: envelope reference + caller-provided updates
+        fields = _with_aliases(
+            {key: value for key, value in run_state_updates.items() if key in current}
+        )
 
         # Update timestamp (using datetime from .types module via run_state_from_dict)
         from datetime import datetime as dt
         from datetime import timezone as tz
 
-        data["timestamp"] = dt.now(tz.utc).isoformat() + "Z"
+        fields["timestamp"] = dt.now(tz.utc).isoformat() + "Z"
 
-        # Step 4: Write updated run_state atomically
-        updated_state = run_state_from_dict(data)
-        write_run_state(run_id, updated_state, runs_dir)
+        # Step 4: Append the delta to the state journal
+        _persist_run_state(
+            run_id,
+            {
+                "set": fields,
+                "merge": {
+                    "handoff_envelopes": {step_id: handoff_envelope_to_dict(envelope)},
+                    "artifacts": {step_id: getattr(envelope, "artifacts", {})},
+                },
+            },
+            runs_dir,
+        )
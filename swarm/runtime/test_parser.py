@@ -10,15 +10,25 @@ Design Philosophy:
     - Extract error signatures for the Elephant Protocol stall detection
     - Support multiple frameworks without external dependencies
     - Produce consistent output regardless of input format
+    - Stream: pytest logs are consumed line by line and JUnit XML element by
+      element, so memory does not grow with the size of the test run
 
 Usage:
     from swarm.runtime.test_parser import (
-        TestSummary, parse_pytest_output, parse_junit_xml, parse_playwright_trace
+        TestSummary, PytestStreamParser, parse_pytest_output, parse_junit_xml,
+        parse_playwright_trace,
     )
 
     # Parse pytest console output
     summary = parse_pytest_output(raw_output)
 
+    # Parse a pytest log that is still being written
+    parser = PytestStreamParser()
+    for chunk in process_stdout:
+        parser.feed(chunk)
+        partial = parser.snapshot()
+    summary = parser.close()
+
     # Parse JUnit XML file
     summary = parse_junit_xml(Path("test-results.xml"))
 
@@ -33,6 +43,7 @@ Usage:
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 import re
 import xml.etree.ElementTree as ET
@@ -40,7 +51,7 @@ import zipfile
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from swarm.runtime.forensic_types import (
     FailureType,
@@ -250,13 +261,240 @@ def _extract_expected_actual(error_message: str) -> Tuple[Optional[str], Optiona
 # Pytest Parser
 # =============================================================================
 
+# Every console line (without color codes and surrounding whitespace) is
+# classified by one anchored match against this pattern. Most lines
+# (tracebacks, captured output) fail within a few characters, so a
+# multi-hundred-megabyte log costs a single regex attempt per line.
+_PYTEST_LINE_RE = re.compile(
+    # "===== FAILURES =====", "===== 5 passed, 2 failed in 1.23s ====="
+    r"=+ (?P<banner>.+?) =+$"
+    # "______ test_login_rejects_bad_token ______" (not the "_ _ _ _" separators)
+    r"|_+ (?P<test>[^_\s].*?) _+$"
+    # "tests/test_auth.py ..F.s   [ 40%]" or a wrapped "....   [ 80%]"
+    r"|(?:\S+\.py )?(?P<marks>[.FEsxX]+)(?:\s+\[\s*\d+%\])?$"
+    # "tests/test_auth.py::test_login PASSED   [ 40%]" (-v mode)
+    r"|\S+::\S+ (?P<outcome>PASSED|FAILED|ERROR|SKIPPED|XFAIL|XPASS)\b"
+)
+
+# Summary without a banner, anywhere in the line: "5 passed, 2 failed in 1.23s"
+# (-q mode) or "Results: 7 passed, 1 failed in 3.0s". Searched only in lines
+# containing " in " that the line pattern did not classify.
+_PYTEST_SUMMARY_RE = re.compile(
+    r"\d+ (?:passed|failed|skipped|errors?|xfailed|xpassed|deselected|warnings?)\b"
+    r".* in [\d.]+s\b"
+)
+
+# Color codes of --color=yes output
+_ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# "tests/test_auth.py:42: AssertionError", searched only inside a failure block
+# until the block's first location is found
+_PYTEST_FILE_LINE_RE = re.compile(r"(\S+\.py):(\d+):")
+
+_PYTEST_COUNT_RE = re.compile(r"(\d+)\s+(passed|failed|skipped|errors?|xfailed|xpassed)\b")
+_PYTEST_DURATION_RE = re.compile(r"\bin\s+([\d.]+)s\b")
+_PYTEST_ERROR_HEADER_RE = re.compile(r"ERROR at \w+ of (\S+)$")
+
+# Progress characters and verbose outcomes -> TestSummary counter.
+# xfail counts as skipped and xpass as passed, as in the summary line.
+_PYTEST_MARKS = {".": "passed", "F": "failed", "E": "errors", "s": "skipped",
+                 "x": "skipped", "X": "passed"}
+_PYTEST_OUTCOMES = {"PASSED": "passed", "FAILED": "failed", "ERROR": "errors",
+                    "SKIPPED": "skipped", "XFAIL": "skipped", "XPASS": "passed"}
+
+
+class PytestStreamParser:
+    """Incremental pytest console parser.
+
+    Feed output as it is produced (``feed`` for arbitrary chunks,
+    ``feed_line`` for whole lines) and call ``snapshot`` at any time for the
+    summary so far. Memory is bounded by the largest single failure block,
+    not by the size of the log.
+
+    Until the final summary line arrives, counts come from the progress
+    characters (``..F.s``) or verbose outcomes (``PASSED``) seen so far.
+    Once it arrives, its counts are authoritative.
+
+    Example:
+        parser = PytestStreamParser()
+        for chunk in process_output:
+            parser.feed(chunk)
+            partial = parser.snapshot()   # tests still running
+        summary = parser.close()
+    """
+
+    def __init__(self, raw_output_path: Optional[Path] = None):
+        self.raw_output_path = raw_output_path
+        self._pending = ""
+        self._progress = {"passed": 0, "failed": 0, "skipped": 0, "errors": 0}
+        self._final: Optional[Dict[str, int]] = None
+        self._duration_ms = 0
+        self._failures: List[TestFailure] = []
+        self._signatures: Dict[str, None] = {}
+        # Current FAILURES/ERRORS block
+        self._in_failures = False
+        self._test_name = ""
+        self._error_lines: List[str] = []
+        self._file = ""
+        self._line = 0
+
+    @property
+    def finished(self) -> bool:
+        """True once the final summary line has been seen."""
+        return self._final is not None
+
+    def feed(self, chunk: str) -> None:
+        """Feed a chunk of console output; partial lines are buffered."""
+        if not chunk:
+            return
+        lines = (self._pending + chunk).split("\n")
+        self._pending = lines.pop()
+        for line in lines:
+            self.feed_line(line)
+
+    def feed_line(self, line: str) -> None:
+        """Feed one complete line (without or with its trailing newline)."""
+        line = line.rstrip("\r\n")
+        if "\x1b" in line:
+            line = _ANSI_ESCAPE_RE.sub("", line)
+        text = line.strip()
+        match = _PYTEST_LINE_RE.match(text)
+        if match is None:
+            if self._in_failures:
+                self._on_error_line(line)
+            elif " in " in text and _PYTEST_SUMMARY_RE.search(text):
+                self._on_summary(text)
+            return
+
+        kind = match.lastgroup
+        if kind == "banner":
+            self._on_banner(match.group("banner"))
+        elif kind == "test" and self._in_failures:
+            self._flush_failure()
+            name = match.group("test").strip()
+            error_header = _PYTEST_ERROR_HEADER_RE.match(name)
+            self._test_name = error_header.group(1) if error_header else name
+        elif self._in_failures:
+            self._on_error_line(line)
+        elif self._final is None:
+            if kind == "marks":
+                marks = match.group("marks")
+                for mark, counter in _PYTEST_MARKS.items():
+                    self._progress[counter] += marks.count(mark)
+            elif kind == "outcome":
+                self._progress[_PYTEST_OUTCOMES[match.group("outcome")]] += 1
+
+    def snapshot(self) -> TestSummary:
+        """Return the summary so far without ending the stream.
+
+        Failure blocks are included once the next block or section starts.
+        """
+        counts = self._final if self._final is not None else self._progress
+        return TestSummary(
+            total=sum(counts.values()),
+            passed=counts["passed"],
+            failed=counts["failed"],
+            skipped=counts["skipped"],
+            errors=counts["errors"],
+            error_signatures=list(self._signatures),
+            duration_ms=self._duration_ms,
+            source_format="pytest",
+            raw_output_path=self.raw_output_path,
+            failures=list(self._failures),
+        )
+
+    def close(self) -> TestSummary:
+        """End the stream and return the final summary."""
+        if self._pending:
+            pending, self._pending = self._pending, ""
+            self.feed_line(pending)
+        self._flush_failure()
+        self._in_failures = False
+        return self.snapshot()
+
+    def _on_error_line(self, line: str) -> None:
+        if not self._file:
+            file_match = _PYTEST_FILE_LINE_RE.search(line)
+            if file_match:
+                self._file = file_match.group(1)
+                self._line = int(file_match.group(2))
+        self._error_lines.append(line)
+
+    def _on_banner(self, text: str) -> None:
+        upper = text.upper()
+        if upper in ("FAILURES", "ERRORS"):
+            self._flush_failure()
+            self._in_failures = True
+            return
+        # Any other section ends the failure blocks
+        if self._in_failures:
+            self._flush_failure()
+            self._in_failures = False
+        if _PYTEST_DURATION_RE.search(text):
+            self._on_summary(text)
+
+    def _on_summary(self, text: str) -> None:
+        counts = {"passed": 0, "failed": 0, "skipped": 0, "errors": 0}
+        for number, label in _PYTEST_COUNT_RE.findall(text):
+            if label in ("xfailed", "skipped"):
+                counts["skipped"] += int(number)
+            elif label in ("xpassed", "passed"):
+                counts["passed"] += int(number)
+            elif label == "failed":
+                counts["failed"] += int(number)
+            else:
+                counts["errors"] += int(number)
+        self._final = counts
+        duration = _PYTEST_DURATION_RE.search(text)
+        if duration:
+            self._duration_ms = int(float(duration.group(1)) * 1000)
+
+    def _flush_failure(self) -> None:
+        if self._test_name and self._error_lines:
+            error_msg = "\n".join(self._error_lines).strip()
+            expected, actual = _extract_expected_actual(error_msg)
+            self._failures.append(
+                TestFailure(
+                    test_name=self._test_name,
+                    error_message=error_msg[:2000],  # Truncate for sanity
+                    test_file=self._file or None,
+                    test_line=self._line or None,
+                    failure_type=_detect_failure_type(error_msg),
+                    expected=expected,
+                    actual=actual,
+                )
+            )
+            self._signatures[_compute_error_signature(self._test_name, error_msg)] = None
+        self._test_name = ""
+        self._error_lines = []
+        self._file = ""
+        self._line = 0
+
+
+def parse_pytest_stream(
+    lines: Iterable[str], raw_output_path: Optional[Path] = None
+) -> TestSummary:
+    """Parse pytest console output from an iterable of lines (e.g. an open file).
+
+    Args:
+        lines: Lines of console output, with or without trailing newlines.
+        raw_output_path: Optional path to the raw output file for reference.
+
+    Returns:
+        TestSummary with parsed test results.
+    """
+    parser = PytestStreamParser(raw_output_path)
+    for line in lines:
+        parser.feed_line(line)
+    return parser.close()
+
 
 def parse_pytest_output(raw: str, raw_output_path: Optional[Path] = None) -> TestSummary:
     """Parse pytest console output into a standardized TestSummary.
 
     Handles both verbose and summary output formats. Extracts:
     - Test counts from the summary line (e.g., "5 passed, 2 failed in 1.23s")
-    - Failure details from FAILURES section
+    - Failure details from FAILURES and ERRORS sections
     - Duration from timing information
 
     Args:
@@ -266,145 +504,155 @@ def parse_pytest_output(raw: str, raw_output_path: Optional[Path] = None) -> Tes
     Returns:
         TestSummary with parsed test results.
     """
-    summary = TestSummary(
-        total=0,
-        passed=0,
-        failed=0,
-        skipped=0,
-        source_format="pytest",
-        raw_output_path=raw_output_path,
-    )
+    return parse_pytest_stream(io.StringIO(raw or ""), raw_output_path)
 
-    if not raw or not raw.strip():
-        return summary
 
-    lines = raw.split("\n")
+# =============================================================================
+# JUnit XML Parser
+# =============================================================================
 
-    # Parse summary line patterns. Common pytest formats:
-    # "====== 13 passed, 2 failed in 3.45s ======"
-    # "===== 5 passed, 1 skipped, 2 failed in 1.23s ====="
-    # "5 passed in 1.23s"
-    # Note: parts can appear in any order
 
-    for line in lines:
-        # Look for lines with "passed" and timing info (likely summary lines)
-        if "passed" in line.lower() and ("in " in line or "==" in line):
-            # Extract all counts using individual patterns
-            passed_match = re.search(r"(\d+)\s+passed", line, re.IGNORECASE)
-            failed_match = re.search(r"(\d+)\s+failed", line, re.IGNORECASE)
-            skipped_match = re.search(r"(\d+)\s+skipped", line, re.IGNORECASE)
-            error_match = re.search(r"(\d+)\s+error(?:s)?", line, re.IGNORECASE)
-            xfailed_match = re.search(r"(\d+)\s+xfailed", line, re.IGNORECASE)
-            xpassed_match = re.search(r"(\d+)\s+xpassed", line, re.IGNORECASE)
-            duration_match = re.search(r"in\s+([\d.]+)s", line, re.IGNORECASE)
-
-            if passed_match:
-                summary.passed = int(passed_match.group(1))
-            if failed_match:
-                summary.failed = int(failed_match.group(1))
-            if skipped_match:
-                summary.skipped = int(skipped_match.group(1))
-            if error_match:
-                summary.errors = int(error_match.group(1))
-            if xfailed_match:
-                summary.skipped += int(xfailed_match.group(1))
-            if xpassed_match:
-                summary.passed += int(xpassed_match.group(1))
-            if duration_match:
-                summary.duration_ms = int(float(duration_match.group(1)) * 1000)
-
-            # If we found at least passed, this is likely the summary line
-            if passed_match:
-                break
-
-    summary.total = summary.passed + summary.failed + summary.skipped + summary.errors
-
-    # Parse FAILURES section for detailed failure info
-    in_failures = False
-    current_test_name = ""
-    current_error_lines: List[str] = []
-    current_file = ""
-    current_line = 0
-
-    failure_header_pattern = re.compile(r"_{5,}\s+(\S+)\s+_{5,}")
-    file_line_pattern = re.compile(r"(\S+\.py):(\d+):")
+class JUnitStreamParser:
+    """Incremental JUnit XML parser.
 
-    for line in lines:
-        if "= FAILURES =" in line or "= ERRORS =" in line:
-            in_failures = True
-            continue
-
-        if in_failures:
-            # Check for new failure header
-            header_match = failure_header_pattern.search(line)
-            if header_match:
-                # Save previous failure
-                if current_test_name and current_error_lines:
-                    error_msg = "\n".join(current_error_lines).strip()
-                    failure_type = _detect_failure_type(error_msg)
-                    expected, actual = _extract_expected_actual(error_msg)
-
-                    failure = TestFailure(
-                        test_name=current_test_name,
-                        error_message=error_msg[:2000],  # Truncate for sanity
-                        test_file=current_file or None,
-                        test_line=current_line or None,
-                        failure_type=failure_type,
-                        expected=expected,
-                        actual=actual,
-                    )
-                    summary.failures.append(failure)
-                    summary.error_signatures.append(
-                        _compute_error_signature(current_test_name, error_msg)
-                    )
-
-                current_test_name = header_match.group(1)
-                current_error_lines = []
-                current_file = ""
-                current_line = 0
-                continue
-
-            # Check for file:line reference
-            file_match = file_line_pattern.search(line)
-            if file_match and not current_file:
-                current_file = file_match.group(1)
-                current_line = int(file_match.group(2))
-
-            current_error_lines.append(line)
-
-            # Check for end of failures section
-            if line.startswith("=") and "short test summary" in line.lower():
-                in_failures = False
-
-    # Save last failure
-    if current_test_name and current_error_lines:
-        error_msg = "\n".join(current_error_lines).strip()
-        failure_type = _detect_failure_type(error_msg)
-        expected, actual = _extract_expected_actual(error_msg)
+    Elements are processed as they close and then discarded, so memory stays
+    flat however many test cases the report holds. ``feed`` accepts the
+    document in chunks (e.g. while a reporter is still writing it);
+    ``snapshot`` returns the summary so far.
 
-        failure = TestFailure(
-            test_name=current_test_name,
-            error_message=error_msg[:2000],
-            test_file=current_file or None,
-            test_line=current_line or None,
-            failure_type=failure_type,
-            expected=expected,
-            actual=actual,
-        )
-        summary.failures.append(failure)
-        summary.error_signatures.append(
-            _compute_error_signature(current_test_name, error_msg)
-        )
+    Suite totals come from the <testsuite> attributes, which are known as
+    soon as the suite element opens; failure details accumulate per
+    <testcase>.
+    """
 
-    # Deduplicate error signatures
-    summary.error_signatures = list(dict.fromkeys(summary.error_signatures))
+    def __init__(self, raw_output_path: Optional[Path] = None):
+        self.raw_output_path = raw_output_path
+        self._pull: Optional[ET.XMLPullParser] = None
+        self._stack: List[ET.Element] = []
+        self._counted: Set[int] = set()  # ids of suites whose totals are counted
+        self._valid = True
+        self.total = 0
+        self.failed = 0
+        self.errors = 0
+        self.skipped = 0
+        self._time = 0.0
+        self._failures: List[TestFailure] = []
+        self._signatures: Dict[str, None] = {}
+
+    def feed(self, data: str | bytes) -> None:
+        """Feed a chunk of the XML document.
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the document is malformed.
+        """
+        if self._pull is None:
+            self._pull = ET.XMLPullParser(events=("start", "end"))
+        self._pull.feed(data)
+        for event, elem in self._pull.read_events():
+            self.handle(event, elem)
+
+    def handle(self, event: str, elem: ET.Element) -> None:
+        """Process one ("start" | "end", element) event from iterparse."""
+        if event == "start":
+            parent = self._stack[-1] if self._stack else None
+            if parent is None and elem.tag not in ("testsuites", "testsuite"):
+                self._valid = False
+            elif elem.tag == "testsuite" and (
+                parent is None or (parent.tag == "testsuites" and len(self._stack) == 1)
+            ):
+                # Only top-level suites count, as with <testsuites>/<testsuite>
+                self._counted.add(id(elem))
+                self.total += int(elem.get("tests", 0))
+                self.failed += int(elem.get("failures", 0))
+                self.errors += int(elem.get("errors", 0))
+                self.skipped += int(elem.get("skipped", 0))
+                self._time += float(elem.get("time", 0))
+            self._stack.append(elem)
+            return
+
+        self._stack.pop()
+        parent = self._stack[-1] if self._stack else None
+        if not self._valid:
+            return
+        if elem.tag == "testcase" and parent is not None and id(parent) in self._counted:
+            self._on_testcase(elem)
+        if parent is not None and parent.tag in ("testsuites", "testsuite"):
+            # Done with this subtree; drop it so the tree never grows
+            parent.remove(elem)
+        if elem.tag == "testsuite":
+            self._counted.discard(id(elem))
+
+    def snapshot(self) -> TestSummary:
+        """Return the summary so far."""
+        if not self._valid:
+            return _empty_junit_summary(self.raw_output_path)
+        return TestSummary(
+            total=self.total,
+            # Calculate passed from total - failures - errors - skipped
+            passed=max(0, self.total - self.failed - self.errors - self.skipped),
+            failed=self.failed,
+            skipped=self.skipped,
+            errors=self.errors,
+            error_signatures=list(self._signatures),
+            duration_ms=int(self._time * 1000),
+            source_format="junit",
+            raw_output_path=self.raw_output_path,
+            failures=list(self._failures),
+        )
 
-    return summary
+    def close(self) -> TestSummary:
+        """End the document and return the final summary.
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the document is incomplete.
+        """
+        if self._pull is not None:
+            self._pull.close()
+            for event, elem in self._pull.read_events():
+                self.handle(event, elem)
+        return self.snapshot()
+
+    def _on_testcase(self, testcase: ET.Element) -> None:
+        test_name = testcase.get("name", "")
+        classname = testcase.get("classname", "")
+        full_name = f"{classname}::{test_name}" if classname else test_name
+        test_time = float(testcase.get("time", 0))
+
+        # Check for failure or error
+        failure = testcase.find("failure")
+        error = testcase.find("error")
+        node = failure if failure is not None else error
+        if node is None:
+            return
+
+        error_msg = node.get("message", "")
+        stack_trace = node.text or ""
+        expected, actual = (
+            _extract_expected_actual(error_msg) if failure is not None else (None, None)
+        )
+        self._failures.append(
+            TestFailure(
+                test_name=full_name,
+                error_message=error_msg[:2000],
+                stack_trace=stack_trace[:5000] if stack_trace else None,
+                failure_type=_detect_failure_type(error_msg, stack_trace),
+                expected=expected,
+                actual=actual,
+                duration_ms=int(test_time * 1000),
+            )
+        )
+        self._signatures[_compute_error_signature(full_name, error_msg)] = None
 
 
-# =============================================================================
-# JUnit XML Parser
-# =============================================================================
+def _empty_junit_summary(xml_path: Optional[Path]) -> TestSummary:
+    return TestSummary(
+        total=0,
+        passed=0,
+        failed=0,
+        skipped=0,
+        source_format="junit",
+        raw_output_path=xml_path,
+    )
 
 
 def parse_junit_xml(xml_path: Path) -> TestSummary:
@@ -416,111 +664,26 @@ def parse_junit_xml(xml_path: Path) -> TestSummary:
     - Cargo with cargo2junit
     - Maven/Gradle JUnit tests
 
+    The file is streamed with iterparse; each <testcase> is discarded once
+    processed. Use JUnitStreamParser to parse a report that is still being
+    written.
+
     Args:
         xml_path: Path to the JUnit XML file.
 
     Returns:
         TestSummary with parsed test results.
     """
-    summary = TestSummary(
-        total=0,
-        passed=0,
-        failed=0,
-        skipped=0,
-        source_format="junit",
-        raw_output_path=xml_path,
-    )
-
     if not xml_path.exists():
-        return summary
+        return _empty_junit_summary(xml_path)
 
+    parser = JUnitStreamParser(xml_path)
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        for event, elem in ET.iterparse(str(xml_path), events=("start", "end")):
+            parser.handle(event, elem)
     except ET.ParseError:
-        return summary
-
-    # Handle both <testsuites> and <testsuite> root elements
-    if root.tag == "testsuites":
-        testsuites = root.findall("testsuite")
-    elif root.tag == "testsuite":
-        testsuites = [root]
-    else:
-        return summary
-
-    total_time = 0.0
-
-    for testsuite in testsuites:
-        # Extract suite-level attributes
-        suite_tests = int(testsuite.get("tests", 0))
-        suite_failures = int(testsuite.get("failures", 0))
-        suite_errors = int(testsuite.get("errors", 0))
-        suite_skipped = int(testsuite.get("skipped", 0))
-        suite_time = float(testsuite.get("time", 0))
-
-        summary.total += suite_tests
-        summary.failed += suite_failures
-        summary.errors += suite_errors
-        summary.skipped += suite_skipped
-        total_time += suite_time
-
-        # Parse individual test cases for failure details
-        for testcase in testsuite.findall("testcase"):
-            test_name = testcase.get("name", "")
-            classname = testcase.get("classname", "")
-            full_name = f"{classname}::{test_name}" if classname else test_name
-            test_time = float(testcase.get("time", 0))
-
-            # Check for failure or error
-            failure = testcase.find("failure")
-            error = testcase.find("error")
-            skipped = testcase.find("skipped")
-
-            if failure is not None:
-                error_msg = failure.get("message", "")
-                stack_trace = failure.text or ""
-                failure_type = _detect_failure_type(error_msg, stack_trace)
-                expected, actual = _extract_expected_actual(error_msg)
-
-                test_failure = TestFailure(
-                    test_name=full_name,
-                    error_message=error_msg[:2000],
-                    stack_trace=stack_trace[:5000] if stack_trace else None,
-                    failure_type=failure_type,
-                    expected=expected,
-                    actual=actual,
-                    duration_ms=int(test_time * 1000),
-                )
-                summary.failures.append(test_failure)
-                summary.error_signatures.append(
-                    _compute_error_signature(full_name, error_msg)
-                )
-
-            elif error is not None:
-                error_msg = error.get("message", "")
-                stack_trace = error.text or ""
-                failure_type = _detect_failure_type(error_msg, stack_trace)
-
-                test_failure = TestFailure(
-                    test_name=full_name,
-                    error_message=error_msg[:2000],
-                    stack_trace=stack_trace[:5000] if stack_trace else None,
-                    failure_type=failure_type,
-                    duration_ms=int(test_time * 1000),
-                )
-                summary.failures.append(test_failure)
-                summary.error_signatures.append(
-                    _compute_error_signature(full_name, error_msg)
-                )
-
-    # Calculate passed from total - failures - errors - skipped
-    summary.passed = max(0, summary.total - summary.failed - summary.errors - summary.skipped)
-    summary.duration_ms = int(total_time * 1000)
-
-    # Deduplicate error signatures
-    summary.error_signatures = list(dict.fromkeys(summary.error_signatures))
-
-    return summary
+        return _empty_junit_summary(xml_path)
+    return parser.snapshot()
 
 
 # =============================================================================
@@ -762,10 +925,10 @@ def parse_test_output(
             # Could be Playwright JSON or other format
             return parse_playwright_trace(source)
         else:
-            # Try to read as text and parse as pytest
+            # Try to read as text and parse as pytest, line by line
             try:
-                content = source.read_text(encoding="utf-8")
-                return parse_pytest_output(content, source)
+                with open(source, "r", encoding="utf-8") as f:
+                    return parse_pytest_stream(f, source)
             except (IOError, UnicodeDecodeError):
                 return TestSummary(
                     total=0, passed=0, failed=0, skipped=0, source_format="unknown"
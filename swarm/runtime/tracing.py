@@ -0,0 +1,354 @@
+"""
+tracing.py - Phase-level tracing spans for step execution.
+
+step_start/step_end events say how long a step took, not where the time
+went. Spans break a step into its phases (hydrate, prompt, engine work,
+diff scan, finalize, route, routing, event append, DB ingest) and nest
+them under their step and flow.
+
+Spans are written to a per-run trace file (swarm/runs/<run-id>/trace.json,
+next to events.jsonl, shared by all flows of the run) in the Trace Event
+Format ("X" complete events, JSON array form), which Flow
+Studio renders as a flame chart and which also loads as-is in Perfetto
+or chrome://tracing. The closing bracket of the array is optional in that
+format, so the file is appended to as spans complete and stays loadable
+if a run dies mid-flow.
+
+Tracing is off unless a tracer is active in the current context, and
+instrumented code pays one context lookup per span then. When on, a span
+costs two clock reads and a buffered append; buffers are flushed to disk
+in batches.
+
+Usage:
+    from swarm.runtime.tracing import trace_run, trace_span
+
+    with trace_run(run_id, run_path / TRACE_FILENAME):
+        with trace_span("hydrate"):
+            ...
+
+    events = read_trace(run_path / TRACE_FILENAME)
+    gate_events = select_flow_events(events, "gate")
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from swarm.runtime import json_codec
+from swarm.runtime.run_archive import open_run_file
+
+logger = logging.getLogger(__name__)
+
+# Per-run trace file, next to events.jsonl
+TRACE_FILENAME = "trace.json"
+
+# Set to "true" to record spans for every run
+TRACE_ENV_VAR = "SWARM_TRACE_SPANS"
+
+# Flush the span buffer once it holds this many events...
+DEFAULT_FLUSH_EVENTS = 256
+
+# ...or when the oldest buffered span is this old
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+
+_current_tracer: ContextVar[Optional["RunTracer"]] = ContextVar("swarm_run_tracer", default=None)
+
+
+def tracing_enabled_from_env() -> bool:
+    """Check whether SWARM_TRACE_SPANS enables tracing."""
+    return os.environ.get(TRACE_ENV_VAR, "false").lower() == "true"
+
+
+class _Span:
+    """An open span. Records a complete event when the block exits."""
+
+    __slots__ = ("_tracer", "_name", "_cat", "_args", "_start_ns")
+
+    def __init__(self, tracer: "RunTracer", name: str, cat: str, args: Dict[str, Any]):
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._start_ns = 0
+
+    def set(self, **args: Any) -> None:
+        """Attach arguments known only once the phase has run."""
+        self._args.update(args)
+
+    def __enter__(self) -> "_Span":
+        self._start_ns = self._tracer._clock_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end_ns = self._tracer._clock_ns()
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer._complete(self._name, self._cat, self._start_ns, end_ns, self._args)
+        return False
+
+
+class _NullSpan:
+    """Span returned when tracing is off."""
+
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class RunTracer:
+    """Buffered span writer for one run's trace file.
+
+    Thread-safe. Spans from different threads land on separate tracks;
+    spans on one thread nest by time.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        path: Path,
+        flush_events: int = DEFAULT_FLUSH_EVENTS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        clock_ns: Callable[[], int] = time.perf_counter_ns,
+    ):
+        """Initialize the tracer.
+
+        Args:
+            run_id: The run being traced (names the trace process).
+            path: Trace file to append to. Created on first flush.
+            flush_events: Buffered events that trigger a flush.
+            flush_interval: Seconds after which buffered events are flushed.
+            clock_ns: Monotonic nanosecond clock (injectable for tests).
+        """
+        self.run_id = run_id
+        self.path = Path(path)
+        self._flush_events = max(1, int(flush_events))
+        self._flush_interval_ns = int(flush_interval * 1e9)
+        self._clock_ns = clock_ns
+        # Anchor the monotonic clock to wall time so traces of successive
+        # flows of a run (and of resumed runs) line up in one file
+        self._origin_ns = time.time_ns() - clock_ns()
+        self._pid = os.getpid()
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffer_since_ns = 0
+        self._named_threads: set = set()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._has_events: Optional[bool] = None
+        self.span_count = 0
+
+    def span(self, name: str, cat: str = "phase", **args: Any) -> _Span:
+        """Open a span; use as a context manager."""
+        return _Span(self, name, cat, args)
+
+    def _complete(
+        self, name: str, cat: str, start_ns: int, end_ns: int, args: Dict[str, Any]
+    ) -> None:
+        """Buffer a complete ("X") event."""
+        tid = threading.get_native_id()
+        event: Dict[str, Any] = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": (self._origin_ns + start_ns) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self._pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+
+        with self._lock:
+            if not self._buffer:
+                if self._has_events is None:
+                    self._buffer.append(self._metadata("process_name", None, f"run {self.run_id}"))
+                self._buffer_since_ns = end_ns
+            if tid not in self._named_threads:
+                self._named_threads.add(tid)
+                self._buffer.append(
+                    self._metadata("thread_name", tid, threading.current_thread().name)
+                )
+            self._buffer.append(event)
+            self.span_count += 1
+            due = (
+                len(self._buffer) >= self._flush_events
+                or end_ns - self._buffer_since_ns >= self._flush_interval_ns
+            )
+        if due:
+            self.flush()
+
+    def _metadata(self, name: str, tid: Optional[int], value: str) -> Dict[str, Any]:
+        event: Dict[str, Any] = {"name": name, "ph": "M", "pid": self._pid, "args": {"name": value}}
+        if tid is not None:
+            event["tid"] = tid
+        return event
+
+    def flush(self) -> None:
+        """Append buffered events to the trace file."""
+        with self._write_lock:
+            with self._lock:
+                events, self._buffer = self._buffer, []
+            if not events:
+                return
+            if self._has_events is None:
+                try:
+                    self._has_events = self.path.stat().st_size > 0
+                except OSError:
+                    self._has_events = False
+
+            chunks = []
+            for event in events:
+                chunks.append(b",\n" if self._has_events else b"[\n")
+                chunks.append(json_codec.dumpb(event))
+                self._has_events = True
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "ab") as f:
+                    f.write(b"".join(chunks))
+            except OSError as e:
+                # Tracing is diagnostic only - never fail the run over it
+                logger.warning("Failed to write trace for run %s: %s", self.run_id, e)
+
+
+_tracers: Dict[str, RunTracer] = {}
+_tracers_lock = threading.Lock()
+
+
+def get_run_tracer(run_id: str) -> Optional[RunTracer]:
+    """Return the tracer of a run being traced in this process, if any."""
+    return _tracers.get(run_id)
+
+
+@contextmanager
+def trace_run(run_id: str, path: Path, **tracer_kwargs: Any) -> Iterator[RunTracer]:
+    """Trace a run's spans into path for the duration of the block.
+
+    Reuses the run's tracer if one is already open (nested flows); the
+    tracer that opened it flushes and closes it on exit.
+    """
+    with _tracers_lock:
+        tracer = _tracers.get(run_id)
+        owner = tracer is None
+        if owner:
+            tracer = RunTracer(run_id, path, **tracer_kwargs)
+            _tracers[run_id] = tracer
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+        if owner:
+            with _tracers_lock:
+                _tracers.pop(run_id, None)
+        tracer.flush()
+
+
+@contextmanager
+def activate_tracer(tracer: Optional[RunTracer]) -> Iterator[Optional[RunTracer]]:
+    """Make tracer current for spans in this block (no-op for None).
+
+    Used where work for a traced run happens outside the orchestrator's
+    context, e.g. event ingestion on the tailer thread.
+    """
+    if tracer is None:
+        yield None
+        return
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+
+
+def trace_span(name: str, cat: str = "phase", **args: Any):
+    """Open a span on the current run's tracer.
+
+    Returns a shared no-op span when no tracer is active.
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, cat, args)
+
+
+def read_trace(path: Path) -> List[Dict[str, Any]]:
+    """Read a trace file written by RunTracer.
+
+    Accepts the unterminated array form and drops a partially written
+    final event. Archived runs are read from their bundle.
+
+    Returns:
+        Trace events, or an empty list if the file is missing or empty.
+    """
+    try:
+        with open_run_file(Path(path)) as f:
+            text = f.read().strip()
+    except OSError:
+        return []
+    if not text:
+        return []
+    if not text.endswith("]"):
+        text += "]"
+    try:
+        return json_codec.loads(text)
+    except json_codec.JSONDecodeError:
+        # Crashed mid-write: keep events up to the last complete separator
+        cut = text.rfind(",\n")
+        if cut <= 0:
+            return []
+        try:
+            return json_codec.loads(text[:cut] + "]")
+        except json_codec.JSONDecodeError:
+            logger.warning("Unreadable trace file %s", path)
+            return []
+
+
+def select_flow_events(events: List[Dict[str, Any]], flow_key: str) -> List[Dict[str, Any]]:
+    """Keep the spans recorded while flow_key was executing.
+
+    Returns metadata events plus every span that starts inside one of the
+    flow's spans (a flow can run more than once per run, e.g. bounces).
+    """
+    windows = [
+        (e["pid"], e["ts"], e["ts"] + e["dur"])
+        for e in events
+        if e.get("ph") == "X" and e.get("cat") == "flow" and e.get("name") == flow_key
+    ]
+    return [
+        e
+        for e in events
+        if e.get("ph") == "M"
+        or any(pid == e.get("pid") and start <= e["ts"] <= end for pid, start, end in windows)
+    ]
+
+
+__all__ = [
+    "DEFAULT_FLUSH_EVENTS",
+    "DEFAULT_FLUSH_INTERVAL_SECONDS",
+    "RunTracer",
+    "TRACE_ENV_VAR",
+    "TRACE_FILENAME",
+    "activate_tracer",
+    "get_run_tracer",
+    "read_trace",
+    "select_flow_events",
+    "trace_run",
+    "trace_span",
+    "tracing_enabled_from_env",
+]
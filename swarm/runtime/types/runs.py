@@ -86,6 +86,8 @@ class RunSummary:
         artifacts: Dictionary of produced artifacts by flow/step.
         is_exemplar: Whether this run is marked as a teaching example.
         tags: List of tags for categorization and filtering.
+        queue_position: 1-based position in the run scheduler queue while the
+            run is waiting for admission (None once admitted or if unknown).
     """
 
     id: RunId
@@ -103,6 +105,7 @@ class RunSummary:
     title: Optional[str] = None  # Human-readable run title
     path: Optional[str] = None  # Filesystem path to run directory
     description: Optional[str] = None  # Human-readable run description
+    queue_position: Optional[int] = None  # Set while queued in RunScheduler
 
 
 @dataclass
@@ -244,6 +247,7 @@ def run_summary_to_dict(summary: RunSummary) -> Dict[str, Any]:
         "title": summary.title,
         "path": summary.path,
         "description": summary.description,
+        "queue_position": summary.queue_position,
     }
 
 
@@ -282,6 +286,7 @@ def run_summary_from_dict(data: Dict[str, Any]) -> RunSummary:
         title=data.get("title"),
         path=data.get("path"),
         description=data.get("description"),
+        queue_position=data.get("queue_position"),
     )
 
 
@@ -13,6 +13,12 @@ The orchestrator uses this module to:
 3. Inject the utility flow using an interruption stack (stack-frame pattern)
 4. Handle "return" semantics when utility flow completes
 
+Detection is incremental: each detector declares the TriggerSignals it reads
+(step output, git status, lint result, file changes, verification result),
+and after a step only detectors whose signals changed are re-evaluated.
+Upstream divergence is a per-repository fact and is shared across runs
+(get_upstream_status).
+
 Usage:
     from swarm.runtime.utility_flow_injection import (
         UtilityFlowRegistry,
@@ -40,14 +46,19 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from swarm.config.flow_registry import FlowDefinition
+from swarm.runtime.git_probe import find_git_dir, git_common_dir, read_git_head
 from swarm.runtime.types import (
     InjectedNodeSpec,
     InterruptionFrame,
@@ -78,6 +89,34 @@ class InjectionTrigger:
     ENV_SETUP_FAILURE = "env_setup_failure"
 
 
+class TriggerSignal:
+    """Inputs that trigger detectors depend on.
+
+    Each detector declares the signals it reads. After a step, a detector is
+    re-evaluated only if the fingerprint of one of its signals changed since
+    its last evaluation in the same run; otherwise its previous result is
+    reused.
+    """
+
+    STEP_OUTPUT = "step_output"
+    GIT_STATUS = "git_status"
+    LINT_RESULT = "lint_result"  # Lint/format checks within the verification result
+    FILE_CHANGES = "file_changes"
+    VERIFICATION_RESULT = "verification_result"
+
+    ALL: Tuple[str, ...] = (
+        STEP_OUTPUT,
+        GIT_STATUS,
+        LINT_RESULT,
+        FILE_CHANGES,
+        VERIFICATION_RESULT,
+    )
+
+
+# Verification check names that count as lint/format checks
+LINT_CHECK_KEYWORDS = ("lint", "format", "style", "eslint", "prettier", "black", "ruff")
+
+
 @dataclass
 class UtilityFlowMetadata:
     """Metadata for a utility flow loaded from pack specs.
@@ -174,6 +213,11 @@ class UtilityFlowRegistry:
         self._flows_by_trigger: Dict[str, List[UtilityFlowMetadata]] = {}
         self._loaded = False
 
+    @property
+    def repo_root(self) -> Path:
+        """Repository the flows were loaded from."""
+        return self._repo_root
+
     def load(self) -> None:
         """Load utility flows from pack specs.
 
@@ -364,17 +408,143 @@ class UtilityFlowRegistry:
         return list(self._flows_by_id.values())
 
 
+# =============================================================================
+# Shared Upstream Status
+# =============================================================================
+
+# Upstream status is a property of the repository, not of a run, so every run
+# (and every detector) in the process shares one entry per repo. The entry is
+# refreshed only when HEAD or the remote-tracking refs change on disk, or when
+# it is older than UPSTREAM_STATUS_MAX_AGE_SECONDS.
+UPSTREAM_STATUS_MAX_AGE_SECONDS = 60.0
+
+_upstream_cache: Dict[str, Tuple[Tuple[Any, ...], float, Dict[str, Any]]] = {}
+_upstream_lock = threading.Lock()
+
+
+def _upstream_refs_key(repo_root: Path) -> Optional[Tuple[Any, ...]]:
+    """Cheap on-disk key that changes whenever HEAD or remote refs move."""
+    git_dir = find_git_dir(repo_root)
+    if git_dir is None:
+        return None
+    common = git_common_dir(git_dir)
+    # Ref updates are written with lock-and-rename, which bumps the mtime of
+    # the containing directory
+    mtimes = []
+    for path in (common / "FETCH_HEAD", common / "packed-refs", common / "refs" / "remotes"):
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    remotes = common / "refs" / "remotes"
+    if remotes.is_dir():
+        for remote in sorted(remotes.iterdir()):
+            try:
+                mtimes.append(remote.stat().st_mtime_ns)
+            except OSError:
+                continue
+    return (read_git_head(git_dir), *mtimes)
+
+
+def get_upstream_status(repo_root: Path) -> Dict[str, Any]:
+    """Return ahead/behind counts of HEAD against its upstream branch.
+
+    Shared across runs on the same repository; git is only invoked when the
+    refs changed since the last call.
+
+    Returns:
+        Dict with ahead_count, behind_count, diverged and upstream, or an
+        empty dict if the repository has no upstream configured.
+    """
+    from swarm.runtime.diff_scanner import _run_git_command
+
+    repo_key = str(Path(repo_root).resolve())
+    refs_key = _upstream_refs_key(Path(repo_root))
+    if refs_key is None:
+        return {}
+    now = time.monotonic()
+    with _upstream_lock:
+        cached = _upstream_cache.get(repo_key)
+        if (
+            cached is not None
+            and cached[0] == refs_key
+            and now - cached[1] <= UPSTREAM_STATUS_MAX_AGE_SECONDS
+        ):
+            return dict(cached[2])
+
+    status: Dict[str, Any] = {}
+    ok, upstream, _ = _run_git_command(
+        ["rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"], Path(repo_root), 10.0
+    )
+    if ok:
+        ok, counts, _ = _run_git_command(
+            ["rev-list", "--left-right", "--count", "HEAD...@{u}"], Path(repo_root), 10.0
+        )
+        parts = counts.split()
+        if ok and len(parts) == 2:
+            ahead, behind = int(parts[0]), int(parts[1])
+            status = {
+                "upstream": upstream.strip(),
+                "ahead_count": ahead,
+                "behind_count": behind,
+                "diverged": ahead > 0 and behind > 0,
+            }
+
+    with _upstream_lock:
+        _upstream_cache[repo_key] = (refs_key, now, status)
+    return dict(status)
+
+
+def clear_upstream_status_cache() -> None:
+    """Drop shared upstream status entries (for testing)."""
+    with _upstream_lock:
+        _upstream_cache.clear()
+
+
 # =============================================================================
 # Injection Trigger Detection
 # =============================================================================
 
 
+# Signal fingerprints a detector last ran with, and what it returned
+_MemoEntry = Tuple[Tuple[str, ...], TriggerDetectionResult]
+
+
+def _is_lint_check(check: Dict[str, Any]) -> bool:
+    name = check.get("name", "").lower()
+    return any(keyword in name for keyword in LINT_CHECK_KEYWORDS)
+
+
+def _fingerprint(value: Any) -> str:
+    """Stable digest of a JSON-like value."""
+    if isinstance(value, str):
+        canonical = value
+    else:
+        canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _signal_fingerprint(signal: str, context: Dict[str, Any]) -> str:
+    """Fingerprint one signal of a detection context."""
+    if signal == TriggerSignal.STEP_OUTPUT:
+        output = context.get("step_result", {}).get("output", "")
+        return _fingerprint(output if isinstance(output, str) else repr(output))
+    if signal == TriggerSignal.LINT_RESULT:
+        checks = context.get("verification_result", {}).get("checks", [])
+        return _fingerprint([c for c in checks if _is_lint_check(c)])
+    return _fingerprint(context.get(signal, {}))
+
+
 class InjectionTriggerDetector:
     """Detects when injection triggers fire based on execution context.
 
     Analyzes step results, git status, and verification results to
     determine if a utility flow should be injected.
 
+    Detectors declare the TriggerSignals they read. Results are remembered
+    per run together with the fingerprints of those signals, and a detector
+    is only re-evaluated when one of its signals changed.
+
     Usage:
         detector = InjectionTriggerDetector(registry)
         result = detector.check_triggers(step_result, run_state, git_status)
@@ -383,33 +553,111 @@ class InjectionTriggerDetector:
             injector.inject_utility_flow(result.flow_id, ...)
     """
 
+    # Runs whose detector results are remembered (least recently used dropped)
+    MAX_TRACKED_RUNS = 64
+
     def __init__(
         self,
         registry: UtilityFlowRegistry,
         custom_detectors: Optional[Dict[str, Callable]] = None,
+        track_upstream: bool = False,
     ):
         """Initialize the detector.
 
         Args:
             registry: UtilityFlowRegistry for looking up flows.
             custom_detectors: Optional dict of custom detector functions.
-                Each detector is (context) -> TriggerDetectionResult.
+                Each detector is (context) -> TriggerDetectionResult. A
+                detector may set a ``trigger_signals`` attribute listing the
+                TriggerSignals it reads; without it, it depends on all of them.
+            track_upstream: If True and the caller passes no git_status, fill
+                ahead/behind counts from the shared per-repo upstream status
+                (see get_upstream_status).
         """
         self._registry = registry
         self._custom_detectors = custom_detectors or {}
+        self._track_upstream = track_upstream
+
+        self._detectors: Dict[str, Callable] = {}
+        self._signals: Dict[str, Tuple[str, ...]] = {}
+        # run_id -> trigger_type -> (signal fingerprints, last result)
+        self._memo: "OrderedDict[str, Dict[str, _MemoEntry]]" = OrderedDict()
+        self._stats = {"evaluated": 0, "reused": 0}
 
         # Built-in trigger detectors
-        self._detectors: Dict[str, Callable] = {
-            InjectionTrigger.UPSTREAM_DIVERGED: self._detect_upstream_diverged,
-            InjectionTrigger.LINT_FAILURE: self._detect_lint_failure,
-            InjectionTrigger.SECURITY_CONCERN: self._detect_security_concern,
-            InjectionTrigger.CONFLICT_DETECTED: self._detect_conflict,
-            InjectionTrigger.TEST_FLAKE: self._detect_test_flake,
-            InjectionTrigger.ENV_SETUP_FAILURE: self._detect_env_setup_failure,
-        }
+        self.register_detector(
+            InjectionTrigger.UPSTREAM_DIVERGED,
+            self._detect_upstream_diverged,
+            (TriggerSignal.GIT_STATUS, TriggerSignal.STEP_OUTPUT),
+        )
+        self.register_detector(
+            InjectionTrigger.LINT_FAILURE,
+            self._detect_lint_failure,
+            (TriggerSignal.LINT_RESULT,),
+        )
+        self.register_detector(
+            InjectionTrigger.SECURITY_CONCERN,
+            self._detect_security_concern,
+            (TriggerSignal.VERIFICATION_RESULT, TriggerSignal.FILE_CHANGES),
+        )
+        self.register_detector(
+            InjectionTrigger.CONFLICT_DETECTED,
+            self._detect_conflict,
+            (TriggerSignal.GIT_STATUS, TriggerSignal.STEP_OUTPUT),
+        )
+        self.register_detector(
+            InjectionTrigger.TEST_FLAKE,
+            self._detect_test_flake,
+            (TriggerSignal.VERIFICATION_RESULT,),
+        )
+        self.register_detector(
+            InjectionTrigger.ENV_SETUP_FAILURE,
+            self._detect_env_setup_failure,
+            (TriggerSignal.STEP_OUTPUT,),
+        )
 
         # Merge custom detectors
-        self._detectors.update(self._custom_detectors)
+        for trigger_type, detector_fn in self._custom_detectors.items():
+            self.register_detector(
+                trigger_type, detector_fn, getattr(detector_fn, "trigger_signals", None)
+            )
+
+    def register_detector(
+        self,
+        trigger_type: str,
+        detector_fn: Callable,
+        signals: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Register (or replace) the detector for a trigger type.
+
+        Args:
+            trigger_type: Trigger the detector fires.
+            detector_fn: (context) -> TriggerDetectionResult.
+            signals: TriggerSignals the detector reads. None means all.
+
+        Raises:
+            ValueError: If a signal is unknown.
+        """
+        signals = tuple(signals) if signals is not None else TriggerSignal.ALL
+        unknown = [sig for sig in signals if sig not in TriggerSignal.ALL]
+        if unknown:
+            raise ValueError(f"Unknown trigger signal(s) {unknown}. Valid: {TriggerSignal.ALL}")
+        self._detectors[trigger_type] = detector_fn
+        self._signals[trigger_type] = signals
+        for results in self._memo.values():
+            results.pop(trigger_type, None)
+
+    def signals_for(self, trigger_type: str) -> Tuple[str, ...]:
+        """Return the signals a trigger's detector depends on."""
+        return self._signals.get(trigger_type, ())
+
+    def forget_run(self, run_id: str) -> None:
+        """Drop remembered detector results for a run."""
+        self._memo.pop(run_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many detector evaluations ran vs were reused."""
+        return dict(self._stats)
 
     def check_triggers(
         self,
@@ -434,6 +682,9 @@ class InjectionTriggerDetector:
         Returns:
             TriggerDetectionResult (triggered=False if no triggers fire).
         """
+        if git_status is None and self._track_upstream:
+            git_status = get_upstream_status(self._registry.repo_root)
+
         # Build detection context
         context = {
             "step_result": step_result,
@@ -443,6 +694,13 @@ class InjectionTriggerDetector:
             "file_changes": file_changes or {},
         }
 
+        run_id = getattr(run_state, "run_id", None) or ""
+        memo = self._memo.setdefault(run_id, {})
+        self._memo.move_to_end(run_id)
+        while len(self._memo) > self.MAX_TRACKED_RUNS:
+            self._memo.popitem(last=False)
+        fingerprints: Dict[str, str] = {}
+
         # Check each trigger type
         results: List[TriggerDetectionResult] = []
 
@@ -451,11 +709,26 @@ class InjectionTriggerDetector:
             if not self._registry.get_by_trigger(trigger_type):
                 continue
 
+            # Reuse the last result if none of the detector's signals changed
+            for signal in self._signals[trigger_type]:
+                if signal not in fingerprints:
+                    fingerprints[signal] = _signal_fingerprint(signal, context)
+            key = tuple(fingerprints[signal] for signal in self._signals[trigger_type])
+            previous = memo.get(trigger_type)
+            if previous is not None and previous[0] == key:
+                self._stats["reused"] += 1
+                if previous[1].triggered:
+                    results.append(previous[1])
+                continue
+
             try:
                 result = detector_fn(context)
+                self._stats["evaluated"] += 1
+                memo[trigger_type] = (key, result)
                 if result.triggered:
                     results.append(result)
             except Exception as e:
+                memo.pop(trigger_type, None)
                 logger.warning(
                     "Trigger detector for '%s' failed: %s",
                     trigger_type,
@@ -563,15 +836,7 @@ class InjectionTriggerDetector:
 
         # Check verification checks for lint failures
         checks = verification.get("checks", [])
-        lint_failures = [
-            c
-            for c in checks
-            if not c.get("passed", True)
-            and any(
-                keyword in c.get("name", "").lower()
-                for keyword in ["lint", "format", "style", "eslint", "prettier", "black", "ruff"]
-            )
-        ]
+        lint_failures = [c for c in checks if not c.get("passed", True) and _is_lint_check(c)]
 
         if lint_failures:
             flow = self._registry.get_by_trigger(InjectionTrigger.LINT_FAILURE)
@@ -1081,6 +1346,7 @@ def create_injection_components(
 __all__ = [
     # Trigger types
     "InjectionTrigger",
+    "TriggerSignal",
     # Data classes
     "UtilityFlowMetadata",
     "TriggerDetectionResult",
@@ -1092,4 +1358,5 @@ __all__ = [
     # Convenience functions
     "detect_injection_triggers",
     "create_injection_components",
+    "get_upstream_status",
 ]
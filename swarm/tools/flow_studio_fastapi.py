@@ -33,10 +33,12 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.concurrency import run_in_threadpool
 
+from swarm.api.responses import JSONResponse
+
 try:
     from swarm.flowstudio.core import FlowStudioCore
 except ImportError:
@@ -220,6 +222,7 @@ def create_fastapi_app() -> FastAPI:
         title="Flow Studio API",
         description="Interactive visualization of swarm flows, steps, agents, and artifacts",
         version="2.0.0",
+        default_response_class=JSONResponse,
     )
 
     # Add CORS middleware to allow all origins (adjust as needed for production)
@@ -234,10 +237,9 @@ def create_fastapi_app() -> FastAPI:
     # Repository root for path resolution
     REPO_ROOT = Path(__file__).resolve().parents[2]
 
-    # Initialize core
+    # Initialize core (loaded by the initial reload below)
     try:
         _core = FlowStudioCore()
-        _core.reload()
     except Exception:
         _core = None
 
@@ -249,13 +251,21 @@ def create_fastapi_app() -> FastAPI:
         except Exception:
             _run_inspector = None
 
-    # Initialize validation data
+    # Validation data comes from a validate_swarm.py subprocess, so it is
+    # loaded on first use rather than at startup
     _validation_data: Optional[Dict[str, Any]] = None
-    if get_validation_data is not None:
-        try:
-            _validation_data = get_validation_data()
-        except Exception:
-            _validation_data = None
+    _validation_loaded = get_validation_data is None
+
+    def _get_validation_data() -> Optional[Dict[str, Any]]:
+        """Load validation data on first call."""
+        nonlocal _validation_data, _validation_loaded
+        if not _validation_loaded:
+            try:
+                _validation_data = get_validation_data()
+            except Exception:
+                _validation_data = None
+            _validation_loaded = True
+        return _validation_data
 
     # Initialize RunService
     _run_service: Optional[Any] = None
@@ -324,8 +334,12 @@ def create_fastapi_app() -> FastAPI:
         _tours_cache = _load_tours()
         return _agents_cache, _flows_cache
 
-    # Initial load
-    _reload_from_disk()
+    # Initial load (a core that fails to load is treated as unavailable)
+    try:
+        _reload_from_disk()
+    except Exception:
+        _core = None
+        _tours_cache = _load_tours()
 
     # =========================================================================
     # Public Routes
@@ -369,7 +383,11 @@ def create_fastapi_app() -> FastAPI:
                 "runs": _run_inspector is not None,
                 "timeline": _run_inspector is not None,
                 "governance": _core is not None,
-                "validation": _validation_data is not None,
+                "validation": (
+                    _validation_data is not None
+                    if _validation_loaded
+                    else get_validation_data is not None
+                ),
             }
         }
 
@@ -903,9 +921,12 @@ def create_fastapi_app() -> FastAPI:
                 status_code=404
             )
 
-        # Look for transcript files in llm/ subdirectory
+        from swarm.runtime.run_archive import list_run_files, open_run_file
+
+        # Look for transcript files in llm/ subdirectory (loose or archived)
         llm_dir = Path(run_path) / flow_key / "llm"
-        if not llm_dir.exists():
+        all_transcripts = list_run_files(llm_dir, "*.jsonl")
+        if not all_transcripts:
             return JSONResponse(
                 {
                     "error": "No transcripts available for this step",
@@ -915,12 +936,12 @@ def create_fastapi_app() -> FastAPI:
             )
 
         # Find matching transcript file (pattern: <step_id>-<agent>-<engine>.jsonl)
-        transcripts = list(llm_dir.glob(f"{step_id}-*.jsonl"))
+        transcripts = list_run_files(llm_dir, f"{step_id}-*.jsonl")
         if not transcripts:
             return JSONResponse(
                 {
                     "error": f"No transcript found for step '{step_id}'",
-                    "available_files": [f.name for f in llm_dir.glob("*.jsonl")]
+                    "available_files": [f.name for f in all_transcripts]
                 },
                 status_code=404
             )
@@ -931,7 +952,7 @@ def create_fastapi_app() -> FastAPI:
         engine = None
 
         try:
-            with transcript_file.open("r", encoding="utf-8") as f:
+            with open_run_file(transcript_file) as f:
                 for line in f:
                     line = line.strip()
                     if not line:
@@ -1001,21 +1022,24 @@ def create_fastapi_app() -> FastAPI:
                 status_code=404
             )
 
-        # Look for receipt files
+        from swarm.runtime.run_archive import list_run_files, open_run_file
+
+        # Look for receipt files (loose or archived)
         receipts_dir = Path(run_path) / flow_key / "receipts"
-        if not receipts_dir.exists():
+        all_receipts = list_run_files(receipts_dir, "*.json")
+        if not all_receipts:
             return JSONResponse(
                 {"error": "No receipts available for this step"},
                 status_code=404
             )
 
         # Find matching receipt file (pattern: <step_id>-<agent>.json)
-        receipts = list(receipts_dir.glob(f"{step_id}-*.json"))
+        receipts = list_run_files(receipts_dir, f"{step_id}-*.json")
         if not receipts:
             return JSONResponse(
                 {
                     "error": f"No receipt found for step '{step_id}'",
-                    "available_files": [f.name for f in receipts_dir.glob("*.json")]
+                    "available_files": [f.name for f in all_receipts]
                 },
                 status_code=404
             )
@@ -1023,7 +1047,7 @@ def create_fastapi_app() -> FastAPI:
         receipt_file = receipts[0]
 
         try:
-            with receipt_file.open("r", encoding="utf-8") as f:
+            with open_run_file(receipt_file) as f:
                 receipt = json_module.load(f)
         except Exception as e:
             return JSONResponse(
@@ -1225,8 +1249,9 @@ def create_fastapi_app() -> FastAPI:
     @app.get("/api/validation", response_model=schema.ValidationData if schema else None)
     async def api_validation():
         """Return cached validation data (FR status badges and governance info)."""
-        if _validation_data is not None:
-            return {"data": _validation_data}
+        validation_data = await run_in_threadpool(_get_validation_data)
+        if validation_data is not None:
+            return {"data": validation_data}
         return JSONResponse(
             {"data": None, "error": "validation data not available"},
             status_code=503
@@ -1489,6 +1514,119 @@ def create_fastapi_app() -> FastAPI:
             "timing": _run_inspector.to_dict(timing)
         }
 
+    @app.get("/api/runs/{run_id}/trace", response_model=schema.RunTraceResponse if schema else None)
+    async def api_run_trace(run_id: str, flow: Optional[str] = None):
+        """Get phase-level tracing spans for a run.
+
+        The response is a Trace Event Format object: Flow Studio renders it as
+        a flame chart, and it loads as-is in Perfetto or chrome://tracing.
+        Spans are only recorded when tracing is enabled (SWARM_TRACE_SPANS=true).
+        """
+        from swarm.runtime import storage as runtime_storage
+        from swarm.runtime.tracing import TRACE_FILENAME, read_trace, select_flow_events
+
+        run_path = runtime_storage.find_run_path(run_id)
+        if run_path is None:
+            return JSONResponse(
+                {"error": f"Run '{run_id}' not found"},
+                status_code=404
+            )
+
+        events = await run_in_threadpool(read_trace, Path(run_path) / TRACE_FILENAME)
+        if flow:
+            events = select_flow_events(events, flow)
+        response: Dict[str, Any] = {
+            "run_id": run_id,
+            "flow_key": flow,
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+        }
+        if not any(e.get("ph") == "X" for e in events):
+            response["message"] = "No spans recorded (run with SWARM_TRACE_SPANS=true)"
+        return response
+
+    @app.get("/api/runs/{run_id}/resources", response_model=schema.RunResourcesResponse if schema else None)
+    async def api_run_resources(run_id: str, flow: Optional[str] = None):
+        """Get local resource usage per step (CPU, subprocesses, git, I/O).
+
+        Read from the run's step_resources events. DuckDB ingest time per step
+        is only known to the stats projection (/api/db/runs/{run_id}/resources).
+        """
+        from swarm.runtime import storage as runtime_storage
+
+        run_path = runtime_storage.find_run_path(run_id)
+        if run_path is None:
+            return JSONResponse(
+                {"error": f"Run '{run_id}' not found"},
+                status_code=404
+            )
+
+        events = await run_in_threadpool(
+            runtime_storage.read_events, run_id, Path(run_path).parent
+        )
+        steps: List[Dict[str, Any]] = []
+        totals: Dict[str, Any] = {}
+        for event in events:
+            if event.kind != "step_resources" or (flow and event.flow_key != flow):
+                continue
+            steps.append({"flow_key": event.flow_key, "step_id": event.step_id, **event.payload})
+            for name, value in event.payload.items():
+                if name in ("step_index", "iteration") or not isinstance(value, (int, float)):
+                    continue
+                if name == "subprocess_peak_rss_kb":
+                    totals[name] = max(totals.get(name, 0), value)
+                else:
+                    totals[name] = totals.get(name, 0) + value
+
+        response: Dict[str, Any] = {
+            "run_id": run_id,
+            "flow_key": flow,
+            "steps": steps,
+            "totals": totals,
+        }
+        if not steps:
+            response["message"] = "No resource usage recorded for this run"
+        return response
+
+    @app.get(
+        "/api/runs/{run_id}/forensics/verdicts",
+        response_model=schema.RunForensicVerdictsResponse if schema else None,
+    )
+    async def api_run_forensic_verdicts(run_id: str, flow: Optional[str] = None):
+        """Get the forensic verdicts cached for a run, with hit rates per flow.
+
+        Read from each flow's forensics/verdict_cache.json; reading does not
+        count as a cache lookup.
+        """
+        from swarm.runtime import storage as runtime_storage
+        from swarm.runtime.forensic_comparator import read_forensic_verdict_cache
+
+        run_path = runtime_storage.find_run_path(run_id)
+        if run_path is None:
+            return JSONResponse(
+                {"error": f"Run '{run_id}' not found"},
+                status_code=404
+            )
+
+        def read_caches() -> Dict[str, Dict[str, Any]]:
+            if flow:
+                flow_keys = [flow]
+            else:
+                events = runtime_storage.read_events(run_id, Path(run_path).parent)
+                flow_keys = sorted({e.flow_key for e in events if e.flow_key})
+            caches = {}
+            for flow_key in flow_keys:
+                cache = read_forensic_verdict_cache(Path(run_path) / flow_key)
+                if cache is not None:
+                    caches[flow_key] = cache
+            return caches
+
+        flows = await run_in_threadpool(read_caches)
+        response: Dict[str, Any] = {"run_id": run_id, "flow_key": flow, "flows": flows}
+        if not flows:
+            response["message"] = "No forensic verdicts cached for this run"
+        return response
+
     @app.get("/api/runs/compare", response_class=JSONResponse)
     async def api_runs_compare(
         run_a: str = Query(None, description="First run identifier (baseline)"),
@@ -1,4 +1,4 @@
-import type { RunsResponse, RunSummary, RunTimeline, RunEventsResponse, ComparisonData, FlowsResponse, FlowDetail, FlowGraph, FlowKey, SearchResponse, GovernanceStatus, ValidationData, ToursResponse, Tour, SelftestPlan, BackendsResponse, StepTranscriptResponse, StepReceiptResponse, WisdomSummary, BoundaryReviewResponse } from "./domain.js";
+import type { RunsResponse, RunSummary, RunTimeline, RunTraceResponse, RunResourcesResponse, RunEventsResponse, ComparisonData, FlowsResponse, FlowDetail, FlowGraph, FlowKey, SearchResponse, GovernanceStatus, ValidationData, ToursResponse, Tour, SelftestPlan, BackendsResponse, StepTranscriptResponse, StepReceiptResponse, WisdomSummary, BoundaryReviewResponse } from "./domain.js";
 /**
  * Fetch JSON with error handling
  */
@@ -47,6 +47,15 @@ export declare const Api: {
      * Get flow-specific timing for a run
      */
     getFlowTiming(runId: string, flowKey: FlowKey): Promise<object>;
+    /**
+     * Get phase-level tracing spans for a run (Trace Event Format),
+     * optionally limited to one flow
+     */
+    getRunTrace(runId: string, flowKey?: FlowKey): Promise<RunTraceResponse>;
+    /**
+     * Get local resource usage per step for a run, optionally limited to one flow
+     */
+    getRunResources(runId: string, flowKey?: FlowKey): Promise<RunResourcesResponse>;
     /**
      * Compare two runs
      */
@@ -78,6 +78,21 @@ export const Api = {
     getFlowTiming(runId, flowKey) {
         return fetchJSON(`/api/runs/${encodeURIComponent(runId)}/flows/${encodeURIComponent(flowKey)}/timing`);
     },
+    /**
+     * Get phase-level tracing spans for a run (Trace Event Format),
+     * optionally limited to one flow
+     */
+    getRunTrace(runId, flowKey) {
+        const query = flowKey ? `?flow=${encodeURIComponent(flowKey)}` : "";
+        return fetchJSON(`/api/runs/${encodeURIComponent(runId)}/trace${query}`);
+    },
+    /**
+     * Get local resource usage per step for a run, optionally limited to one flow
+     */
+    getRunResources(runId, flowKey) {
+        const query = flowKey ? `?flow=${encodeURIComponent(flowKey)}` : "";
+        return fetchJSON(`/api/runs/${encodeURIComponent(runId)}/resources${query}`);
+    },
     /**
      * Compare two runs
      */
@@ -1,4 +1,4 @@
-import type { FlowKey, NodeData, AgentUsage, StepTiming, StepDetailsCallbacks, AgentDetailsCallbacks, AgentUsageCallbacks } from "./domain.js";
+import type { FlowKey, NodeData, AgentUsage, StepTiming, StepDetailsCallbacks, AgentDetailsCallbacks, AgentUsageCallbacks, TraceEvent } from "./domain.js";
 /**
  * Show the default empty state in the details panel.
  * Called when no node is selected.
@@ -16,6 +16,41 @@ export declare function renderFlowTiming(container: HTMLElement, flowKey: FlowKe
  * Render step timing inline
  */
 export declare function renderStepTiming(timing: StepTiming): string;
+/** A complete span placed on the flame chart */
+export interface FlameSpan {
+    event: TraceEvent;
+    /** Thread track the span belongs to ("pid:tid") */
+    track: string;
+    /** Nesting depth within its track */
+    depth: number;
+    /** Duration not covered by child spans (microseconds) */
+    selfTime: number;
+}
+/**
+ * Lay out complete ("X") trace events as a flame chart.
+ *
+ * Spans on the same thread nest under the innermost open span that still
+ * contains their start; each thread gets its own track.
+ */
+export declare function layoutFlameSpans(events: TraceEvent[]): FlameSpan[];
+/**
+ * Render the phase-level trace of a flow as a flame chart in the container.
+ *
+ * Tracing is opt-in (SWARM_TRACE_SPANS=true), so nothing is rendered for
+ * runs without spans.
+ */
+export declare function renderRunTrace(container: HTMLElement, flowKey: FlowKey): Promise<void>;
+/**
+ * Format a byte count (null when the platform does not report it)
+ */
+export declare function formatBytes(bytes: number | null | undefined): string;
+/**
+ * Render the local resource usage of each step of a flow as a table.
+ *
+ * One row per step execution: orchestrator CPU, engine/git subprocess CPU
+ * and peak RSS, git commands, thread I/O and run directory growth.
+ */
+export declare function renderStepResources(container: HTMLElement, flowKey: FlowKey): Promise<void>;
 /**
  * Render agent usage as clickable links
  */
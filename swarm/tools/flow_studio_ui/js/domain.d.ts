@@ -385,6 +385,51 @@ export interface StepReceiptResponse {
 export interface RunTimeline {
     events: TimelineEvent[];
 }
+/** Trace Event Format event (complete "X" span or "M" metadata) */
+export interface TraceEvent {
+    name: string;
+    ph: "X" | "M";
+    cat?: string;
+    /** Start, in microseconds */
+    ts: number;
+    /** Duration, in microseconds (complete events only) */
+    dur?: number;
+    pid: number;
+    tid?: number;
+    args?: Record<string, unknown>;
+}
+/** Response from /api/runs/:id/trace */
+export interface RunTraceResponse {
+    run_id: string;
+    flow_key?: string | null;
+    traceEvents: TraceEvent[];
+    displayTimeUnit: string;
+    message?: string;
+}
+/** Local resource usage of one step execution (step_resources event) */
+export interface StepResourceUsage {
+    flow_key: string;
+    step_id: string;
+    iteration?: number;
+    step_index?: number;
+    cpu_ms: number;
+    subprocess_count: number;
+    subprocess_cpu_ms: number;
+    subprocess_peak_rss_kb: number;
+    git_commands: number;
+    git_ms: number;
+    /** Null where per-thread I/O counters are unavailable */
+    io_read_bytes?: number | null;
+    io_write_bytes?: number | null;
+}
+/** Response from /api/runs/:id/resources */
+export interface RunResourcesResponse {
+    run_id: string;
+    flow_key?: string | null;
+    steps: StepResourceUsage[];
+    totals: Record<string, number>;
+    message?: string;
+}
 /** Flow status within a wisdom summary */
 export interface FlowWisdomStatus {
     status: "succeeded" | "failed" | "skipped";
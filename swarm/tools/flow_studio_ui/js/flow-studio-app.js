@@ -16,7 +16,7 @@ import { qsByUiid, qsAllByUiidPrefix } from "./domain.js";
 // Selection management
 import { configure as configureSelection, selectNode, selectStep, selectAgent, clearSelection, getSelectionForUrl, parseStepParam } from "./selection.js";
 // Details panel
-import { showStepDetails as showStepDetailsBase, showAgentDetails as showAgentDetailsBase, showArtifactDetails, showEmptyState, renderRunTimeline, renderFlowTiming } from "./details.js";
+import { showStepDetails as showStepDetailsBase, showAgentDetails as showAgentDetailsBase, showArtifactDetails, showEmptyState, renderRunTimeline, renderFlowTiming, renderRunTrace, renderStepResources } from "./details.js";
 // Graph
 import { renderGraphCore } from "./graph.js";
 // Runs/flows orchestration
@@ -262,6 +262,8 @@ function setMode(mode) {
         if (timelineContainer) {
             renderRunTimeline(timelineContainer);
             renderFlowTiming(timelineContainer, state.currentFlowKey);
+            renderRunTrace(timelineContainer, state.currentFlowKey);
+            renderStepResources(timelineContainer, state.currentFlowKey);
         }
     }
 }
@@ -556,6 +558,8 @@ function showFlowDetails(detail) {
     if (state.currentMode === "operator" && state.currentRunId && flow.key) {
         renderRunTimeline(operatorHint);
         renderFlowTiming(operatorHint, flow.key);
+        renderRunTrace(operatorHint, flow.key);
+        renderStepResources(operatorHint, flow.key);
     }
 }
 /**
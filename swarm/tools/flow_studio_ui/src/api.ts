@@ -5,6 +5,8 @@ import type {
   RunsResponse,
   RunSummary,
   RunTimeline,
+  RunTraceResponse,
+  RunResourcesResponse,
   RunEventsResponse,
   ComparisonData,
   FlowsResponse,
@@ -115,6 +117,23 @@ export const Api = {
     return fetchJSON<object>(`/api/runs/${encodeURIComponent(runId)}/flows/${encodeURIComponent(flowKey)}/timing`);
   },
 
+  /**
+   * Get phase-level tracing spans for a run (Trace Event Format),
+   * optionally limited to one flow
+   */
+  getRunTrace(runId: string, flowKey?: FlowKey): Promise<RunTraceResponse> {
+    const query = flowKey ? `?flow=${encodeURIComponent(flowKey)}` : "";
+    return fetchJSON<RunTraceResponse>(`/api/runs/${encodeURIComponent(runId)}/trace${query}`);
+  },
+
+  /**
+   * Get local resource usage per step for a run, optionally limited to one flow
+   */
+  getRunResources(runId: string, flowKey?: FlowKey): Promise<RunResourcesResponse> {
+    const query = flowKey ? `?flow=${encodeURIComponent(flowKey)}` : "";
+    return fetchJSON<RunResourcesResponse>(`/api/runs/${encodeURIComponent(runId)}/resources${query}`);
+  },
+
   /**
    * Compare two runs
    */
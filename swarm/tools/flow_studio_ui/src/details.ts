@@ -6,6 +6,8 @@
 // - Agent details (with usage information)
 // - Artifact details
 // - Timeline and timing visualizations
+// - Phase trace flame chart
+// - Per-step resource usage
 
 import { state } from "./state.js";
 import { Api } from "./api.js";
@@ -30,6 +32,8 @@ import type {
   StepTranscriptResponse,
   StepReceiptResponse,
   StepReceipt,
+  TraceEvent,
+  StepResourceUsage,
 } from "./domain.js";
 import {
   renderSelectNodeHint,
@@ -260,6 +264,233 @@ export function renderStepTiming(timing: StepTiming): string {
   return html;
 }
 
+// ============================================================================
+// Trace Flame Chart
+// ============================================================================
+
+/** Height of one flame chart row in pixels */
+const FLAME_ROW_HEIGHT = 18;
+
+/** A complete span placed on the flame chart */
+export interface FlameSpan {
+  event: TraceEvent;
+  /** Thread track the span belongs to ("pid:tid") */
+  track: string;
+  /** Nesting depth within its track */
+  depth: number;
+  /** Duration not covered by child spans (microseconds) */
+  selfTime: number;
+}
+
+/**
+ * Lay out complete ("X") trace events as a flame chart.
+ *
+ * Spans on the same thread nest under the innermost open span that still
+ * contains their start; each thread gets its own track.
+ */
+export function layoutFlameSpans(events: TraceEvent[]): FlameSpan[] {
+  const spans = events
+    .filter(e => e.ph === "X" && typeof e.dur === "number")
+    .sort((a, b) => a.ts - b.ts || (b.dur ?? 0) - (a.dur ?? 0));
+
+  const stacks = new Map<string, FlameSpan[]>();
+  const laidOut: FlameSpan[] = [];
+  spans.forEach(event => {
+    const track = `${event.pid}:${event.tid ?? 0}`;
+    const stack = stacks.get(track) ?? [];
+    while (stack.length > 0) {
+      const top = stack[stack.length - 1].event;
+      if (top.ts + (top.dur ?? 0) > event.ts) break;
+      stack.pop();
+    }
+    const span: FlameSpan = { event, track, depth: stack.length, selfTime: event.dur ?? 0 };
+    if (stack.length > 0) {
+      stack[stack.length - 1].selfTime -= span.selfTime;
+    }
+    stack.push(span);
+    stacks.set(track, stack);
+    laidOut.push(span);
+  });
+  return laidOut;
+}
+
+/**
+ * Format a span duration given in microseconds
+ */
+function formatSpanDuration(us: number): string {
+  const ms = us / 1000;
+  if (ms < 10) return `${ms.toFixed(1)}ms`;
+  if (ms < 1000) return `${Math.round(ms)}ms`;
+  if (ms < 60000) return `${(ms / 1000).toFixed(2)}s`;
+  return formatDuration(ms / 1000);
+}
+
+/**
+ * Render the phase-level trace of a flow as a flame chart in the container.
+ *
+ * Tracing is opt-in (SWARM_TRACE_SPANS=true), so nothing is rendered for
+ * runs without spans.
+ */
+export async function renderRunTrace(container: HTMLElement, flowKey: FlowKey): Promise<void> {
+  if (!state.currentRunId || !flowKey) {
+    return;
+  }
+
+  try {
+    const data = await Api.getRunTrace(state.currentRunId, flowKey);
+    const spans = layoutFlameSpans(data.traceEvents || []);
+    if (spans.length === 0) {
+      return;
+    }
+
+    const start = Math.min(...spans.map(s => s.event.ts));
+    const end = Math.max(...spans.map(s => s.event.ts + (s.event.dur ?? 0)));
+    const total = Math.max(end - start, 1);
+
+    // Stack thread tracks vertically, in order of first activity
+    const trackRows = new Map<string, number>();
+    const trackDepths = new Map<string, number>();
+    spans.forEach(s => {
+      trackDepths.set(s.track, Math.max(trackDepths.get(s.track) ?? 0, s.depth + 1));
+    });
+    let rows = 0;
+    trackDepths.forEach((depth, track) => {
+      trackRows.set(track, rows);
+      rows += depth;
+    });
+
+    let html = '<div class="trace-flame">';
+    html += '<div class="timing-summary-header">';
+    html += '<span class="fs-text-sm fs-text-muted">Phase Trace</span>';
+    html += `<span class="timing-summary-range">${formatSpanDuration(total)}</span>`;
+    html += '</div>';
+
+    html += `<div class="trace-flame-chart" style="height: ${rows * FLAME_ROW_HEIGHT}px">`;
+    spans.forEach(s => {
+      const e = s.event;
+      const left = ((e.ts - start) / total) * 100;
+      const width = Math.max(((e.dur ?? 0) / total) * 100, 0.2);
+      const top = ((trackRows.get(s.track) ?? 0) + s.depth) * FLAME_ROW_HEIGHT;
+      const label = `${e.name} — ${formatSpanDuration(e.dur ?? 0)}`;
+      html += `
+        <div class="trace-span trace-span-${escapeHtml(e.cat || "phase")}"
+             style="left: ${left.toFixed(3)}%; width: ${width.toFixed(3)}%; top: ${top}px"
+             title="${escapeHtml(label)}">${escapeHtml(e.name)}</div>
+      `;
+    });
+    html += '</div>';
+
+    // Where the time went: self time per phase, largest first
+    const selfTimes = new Map<string, number>();
+    spans
+      .filter(s => s.event.cat === "phase")
+      .forEach(s => selfTimes.set(s.event.name, (selfTimes.get(s.event.name) ?? 0) + s.selfTime));
+    const phases = Array.from(selfTimes.entries()).sort((a, b) => b[1] - a[1]).slice(0, 6);
+    if (phases.length > 0) {
+      const maxSelf = Math.max(phases[0][1], 1);
+      html += '<div class="timing-bar-container">';
+      html += '<div class="fs-text-sm fs-text-muted" style="margin-bottom: 6px;">Self Time by Phase</div>';
+      phases.forEach(([name, selfTime]) => {
+        const pct = Math.round((selfTime / maxSelf) * 100);
+        html += `
+          <div class="timing-bar-label">
+            <span>${escapeHtml(name)}</span>
+            <span>${formatSpanDuration(selfTime)}</span>
+          </div>
+          <div class="timing-bar">
+            <div class="timing-bar-fill" style="width: ${pct}%"></div>
+          </div>
+        `;
+      });
+      html += '</div>';
+    }
+
+    html += '</div>';
+    container.insertAdjacentHTML('beforeend', html);
+  } catch (err) {
+    console.error("Failed to load run trace", err);
+    // Silently fail - tracing is optional
+  }
+}
+
+// ============================================================================
+// Step Resource Usage
+// ============================================================================
+
+/**
+ * Format a byte count (null when the platform does not report it)
+ */
+export function formatBytes(bytes: number | null | undefined): string {
+  if (bytes === null || bytes === undefined) return "\u2014";
+  if (bytes < 1024) return `${bytes} B`;
+  if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`;
+  if (bytes < 1024 * 1024 * 1024) return `${(bytes / (1024 * 1024)).toFixed(1)} MB`;
+  return `${(bytes / (1024 * 1024 * 1024)).toFixed(2)} GB`;
+}
+
+/**
+ * Format a millisecond amount of CPU or wall time
+ */
+function formatMs(ms: number): string {
+  return ms >= 1000 ? `${(ms / 1000).toFixed(2)}s` : `${Math.round(ms)}ms`;
+}
+
+/**
+ * Render the local resource usage of each step of a flow as a table.
+ *
+ * One row per step execution: orchestrator CPU, engine/git subprocess CPU
+ * and peak RSS, git commands, thread I/O and run directory growth.
+ */
+export async function renderStepResources(container: HTMLElement, flowKey: FlowKey): Promise<void> {
+  if (!state.currentRunId || !flowKey) {
+    return;
+  }
+
+  try {
+    const data = await Api.getRunResources(state.currentRunId, flowKey);
+    const steps: StepResourceUsage[] = data.steps || [];
+    if (steps.length === 0) {
+      return;
+    }
+
+    let html = '<div class="step-resources">';
+    html += '<div class="timing-summary-header">';
+    html += '<span class="fs-text-sm fs-text-muted">Resource Usage</span>';
+    const cpuTotal = (data.totals.cpu_ms ?? 0) + (data.totals.subprocess_cpu_ms ?? 0);
+    html += `<span class="timing-summary-range">${formatMs(cpuTotal)} CPU</span>`;
+    html += '</div>';
+
+    html += '<table class="artifact-table">';
+    html += '<thead><tr>';
+    html += '<th>Step</th><th class="num" title="Orchestrator thread CPU">CPU</th>';
+    html += '<th class="num" title="CPU of engine and git subprocesses">Child CPU</th>';
+    html += '<th class="num" title="Largest subprocess peak RSS">Peak RSS</th>';
+    html += '<th class="num" title="Git commands (wall time)">Git</th>';
+    html += '<th class="num" title="Bytes read / written by the step thread">I/O</th>';
+    html += '</tr></thead><tbody>';
+    steps.forEach(step => {
+      const label = (step.iteration ?? 1) > 1 ? `${step.step_id} #${step.iteration}` : step.step_id;
+      html += `
+        <tr>
+          <td>${escapeHtml(label)}</td>
+          <td class="num">${formatMs(step.cpu_ms)}</td>
+          <td class="num">${step.subprocess_count ? formatMs(step.subprocess_cpu_ms) : "\u2014"}</td>
+          <td class="num">${step.subprocess_peak_rss_kb ? formatBytes(step.subprocess_peak_rss_kb * 1024) : "\u2014"}</td>
+          <td class="num">${step.git_commands} (${formatMs(step.git_ms)})</td>
+          <td class="num">${formatBytes(step.io_read_bytes)} / ${formatBytes(step.io_write_bytes)}</td>
+        </tr>
+      `;
+    });
+    html += '</tbody></table>';
+
+    html += '</div>';
+    container.insertAdjacentHTML('beforeend', html);
+  } catch (err) {
+    console.error("Failed to load step resources", err);
+    // Silently fail - resource usage is optional
+  }
+}
+
 // ============================================================================
 // Agent Usage Rendering
 // ============================================================================
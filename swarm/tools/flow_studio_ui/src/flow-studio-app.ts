@@ -45,7 +45,9 @@ import {
   showArtifactDetails,
   showEmptyState,
   renderRunTimeline,
-  renderFlowTiming
+  renderFlowTiming,
+  renderRunTrace,
+  renderStepResources
 } from "./details.js";
 
 // Graph
@@ -403,6 +405,8 @@ function setMode(mode: UIMode): void {
     if (timelineContainer) {
       renderRunTimeline(timelineContainer);
       renderFlowTiming(timelineContainer, state.currentFlowKey);
+      renderRunTrace(timelineContainer, state.currentFlowKey);
+      renderStepResources(timelineContainer, state.currentFlowKey);
     }
   }
 }
@@ -743,6 +747,8 @@ function showFlowDetails(detail: FlowDetail | FlowDetailExtended): void {
   if (state.currentMode === "operator" && state.currentRunId && flow.key) {
     renderRunTimeline(operatorHint);
     renderFlowTiming(operatorHint, flow.key as FlowKey);
+    renderRunTrace(operatorHint, flow.key as FlowKey);
+    renderStepResources(operatorHint, flow.key as FlowKey);
   }
 }
 
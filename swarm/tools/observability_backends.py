@@ -26,8 +26,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
-
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
@@ -628,6 +626,8 @@ class BackendManager:
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
+        import yaml  # Lazy import: keeps selftest CLI startup light
+
         try:
             with open(self.config_path, "r") as f:
                 return yaml.safe_load(f)
@@ -32,6 +32,7 @@ if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
 from swarm.config.flow_registry import get_sdlc_flow_keys  # noqa: E402
+from swarm.runtime.run_archive import open_run_file, run_path_exists  # noqa: E402
 from swarm.flowstudio.schema import StepStatusEnum  # noqa: E402
 
 # Canonical step artifact status - imported from flowstudio.schema
@@ -175,10 +176,10 @@ class RunInspector:
             Dict with title, description, tags, or empty dict if no metadata.
         """
         metadata_path = run_path / "run.json"
-        if not metadata_path.exists():
+        if not run_path_exists(metadata_path):
             return {}
         try:
-            with open(metadata_path) as f:
+            with open_run_file(metadata_path) as f:
                 data = json.load(f)
             return {
                 "title": data.get("title", ""),
@@ -338,7 +339,7 @@ class RunInspector:
         # Check required artifacts
         for artifact in required:
             path = flow_dir / artifact if flow_dir else None
-            present = path.exists() if path else False
+            present = run_path_exists(path) if path else False
             if present:
                 required_present += 1
             artifacts.append(ArtifactResult(
@@ -350,7 +351,7 @@ class RunInspector:
         # Check optional artifacts
         for artifact in optional:
             path = flow_dir / artifact if flow_dir else None
-            present = path.exists() if path else False
+            present = run_path_exists(path) if path else False
             if present:
                 optional_present += 1
             artifacts.append(ArtifactResult(
@@ -399,10 +400,10 @@ class RunInspector:
         decision_artifact = flow_config.get("decision_artifact")
 
         # Check flow directory and decision artifact
-        if flow_dir is None or not flow_dir.exists():
+        if flow_dir is None or not run_path_exists(flow_dir):
             flow_status = FlowStatus.NOT_STARTED
             decision_present = False
-        elif decision_artifact and (flow_dir / decision_artifact).exists():
+        elif decision_artifact and run_path_exists(flow_dir / decision_artifact):
             flow_status = FlowStatus.DONE
             decision_present = True
         else:
@@ -590,11 +591,11 @@ class RunInspector:
 
         # Try wisdom/flow_history.json
         history_path = run_path / "wisdom" / "flow_history.json"
-        if not history_path.exists():
+        if not run_path_exists(history_path):
             return []
 
         try:
-            with open(history_path) as f:
+            with open_run_file(history_path) as f:
                 data = json.load(f)
 
             events = []
@@ -780,9 +781,9 @@ class RunInspector:
 
         # Try pre-computed timing file first
         timing_path = run_path / "wisdom" / "run_timing.json"
-        if timing_path.exists():
+        if run_path_exists(timing_path):
             try:
-                with open(timing_path) as f:
+                with open_run_file(timing_path) as f:
                     data = json.load(f)
 
                 # Reconstruct RunTiming from JSON
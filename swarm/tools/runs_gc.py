@@ -5,12 +5,21 @@ Provides commands for managing run lifecycle:
 - list: Show run counts, sizes, and statistics
 - prune: Apply retention policy to delete old runs
 - quarantine: Move corrupt runs to _corrupt/ directory
+- reconcile: Rescan every run directory and repair the disk usage ledger
+- archive: Pack finished runs into compressed bundles (see run_archive.py)
+
+Run sizes come from the disk usage ledger (swarm/runtime/disk_ledger.py),
+which storage keeps up to date as runs write artifacts and finish. Only runs
+missing from the ledger are measured; pass --rescan (or use reconcile) to
+walk every run directory.
 
 Usage:
     uv run swarm/tools/runs_gc.py list
     uv run swarm/tools/runs_gc.py prune --keep 200 --days 7
     uv run swarm/tools/runs_gc.py prune --dry-run
     uv run swarm/tools/runs_gc.py quarantine
+    uv run swarm/tools/runs_gc.py reconcile
+    uv run swarm/tools/runs_gc.py archive --days 7 --dry-run
 """
 
 from __future__ import annotations
@@ -23,13 +32,15 @@ import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from swarm.config.runs_retention_config import (
+    get_archive_after_days,
     get_max_count,
+    get_max_total_size_mb,
     get_preserved_named_runs,
     get_preserved_prefixes,
     get_preserved_tags,
@@ -38,6 +49,8 @@ from swarm.config.runs_retention_config import (
     is_retention_enabled,
     should_log_deletions,
 )
+from swarm.runtime.disk_ledger import DiskLedger, get_disk_ledger, measure_dir
+from swarm.runtime.run_archive import archive_cold_runs
 from swarm.runtime.storage import (
     EXAMPLES_DIR,
     META_FILE,
@@ -73,21 +86,20 @@ class RunInfo:
 
 def get_dir_size(path: Path) -> int:
     """Get total size of a directory in bytes."""
-    total = 0
-    try:
-        for entry in path.rglob("*"):
-            if entry.is_file():
-                try:
-                    total += entry.stat().st_size
-                except OSError:
-                    pass
-    except OSError:
-        pass
-    return total
+    return measure_dir(path)
 
 
-def get_run_info(run_id: str, run_path: Path, run_type: str) -> RunInfo:
-    """Collect information about a single run."""
+def get_run_info(
+    run_id: str,
+    run_path: Path,
+    run_type: str,
+    ledger: Optional[DiskLedger] = None,
+) -> RunInfo:
+    """Collect information about a single run.
+
+    The size is read from the disk usage ledger when available. Runs the
+    ledger has not seen yet are measured once and recorded.
+    """
     meta_path = run_path / META_FILE
     has_meta = meta_path.exists()
     is_corrupt = False
@@ -109,8 +121,15 @@ def get_run_info(run_id: str, run_path: Path, run_type: str) -> RunInfo:
     except OSError:
         mtime = datetime.now(timezone.utc)
 
-    # Get size
-    size_bytes = get_dir_size(run_path)
+    # Get size (ledger first, tree walk only for unaccounted runs)
+    entry = ledger.get(run_id) if ledger is not None else None
+    if entry is not None:
+        size_bytes = entry.size_bytes
+    elif ledger is not None:
+        size_bytes = get_dir_size(run_path)
+        ledger.set_size(run_id, size_bytes, flush=False)
+    else:
+        size_bytes = get_dir_size(run_path)
 
     return RunInfo(
         run_id=run_id,
@@ -124,34 +143,48 @@ def get_run_info(run_id: str, run_path: Path, run_type: str) -> RunInfo:
     )
 
 
-def discover_all_runs() -> List[RunInfo]:
-    """Discover all runs from runs/ and examples/ directories."""
-    runs: List[RunInfo] = []
-    seen: set[str] = set()
+def discover_run_paths() -> Dict[str, tuple[Path, str]]:
+    """Map run_id -> (run directory, run type) for runs/ and examples/."""
+    paths: Dict[str, tuple[Path, str]] = {}
 
     # Examples (always preserved)
     if EXAMPLES_DIR.exists():
         for entry in EXAMPLES_DIR.iterdir():
             if entry.is_dir() and not entry.name.startswith("."):
-                if entry.name not in seen:
-                    seen.add(entry.name)
-                    runs.append(get_run_info(entry.name, entry, "example"))
+                paths.setdefault(entry.name, (entry, "example"))
 
-    # Active runs with meta.json
+    # Active runs with meta.json; legacy runs have none
     if RUNS_DIR.exists():
         for entry in RUNS_DIR.iterdir():
             if entry.is_dir() and not entry.name.startswith("."):
-                if entry.name in seen:
+                if entry.name in paths:
                     continue
-                seen.add(entry.name)
+                run_type = "active" if (entry / META_FILE).exists() else "legacy"
+                paths[entry.name] = (entry, run_type)
+
+    return paths
+
+
+def discover_all_runs(rescan: bool = False) -> List[RunInfo]:
+    """Discover all runs from runs/ and examples/ directories.
+
+    Args:
+        rescan: If True, reconcile the disk usage ledger by measuring every
+            run directory before reading sizes.
+    """
+    paths = discover_run_paths()
+    ledger = get_disk_ledger(RUNS_DIR)
 
-                meta_path = entry / META_FILE
-                if meta_path.exists():
-                    runs.append(get_run_info(entry.name, entry, "active"))
-                else:
-                    # Legacy run (no meta.json)
-                    runs.append(get_run_info(entry.name, entry, "legacy"))
+    if rescan:
+        ledger.reconcile({run_id: path for run_id, (path, _) in paths.items()})
+    else:
+        ledger.forget_missing(paths)
 
+    runs = [
+        get_run_info(run_id, path, run_type, ledger)
+        for run_id, (path, run_type) in paths.items()
+    ]
+    ledger.flush()
     return runs
 
 
@@ -199,7 +232,7 @@ def format_size(size_bytes: int) -> str:
 
 def cmd_list(args: argparse.Namespace) -> int:
     """List runs with statistics."""
-    runs = discover_all_runs()
+    runs = discover_all_runs(rescan=args.rescan)
 
     if not runs:
         logger.info("No runs found.")
@@ -226,6 +259,16 @@ def cmd_list(args: argparse.Namespace) -> int:
     logger.info(f"Total size:     {format_size(total_size)}")
     logger.info("")
 
+    # Size quota (soft limit, informational)
+    quota_bytes = get_max_total_size_mb() * 1024 * 1024
+    if quota_bytes > 0:
+        used_pct = total_size / quota_bytes * 100
+        over = " [OVER QUOTA]" if total_size > quota_bytes else ""
+        logger.info("SIZE QUOTA")
+        logger.info(f"  Limit:        {format_size(quota_bytes)}")
+        logger.info(f"  Used:         {used_pct:.1f}%{over}")
+        logger.info("")
+
     # Retention policy
     retention_days = get_retention_days()
     max_count = get_max_count()
@@ -279,7 +322,7 @@ def cmd_prune(args: argparse.Namespace) -> int:
         logger.info("Retention policy is disabled. Use --force to override.")
         return 0
 
-    runs = discover_all_runs()
+    runs = discover_all_runs(rescan=args.rescan)
     if not runs:
         logger.info("No runs found.")
         return 0
@@ -325,6 +368,7 @@ def cmd_prune(args: argparse.Namespace) -> int:
         return 0
 
     # Delete
+    ledger = get_disk_ledger(RUNS_DIR)
     deleted_count = 0
     for run in to_delete:
         if dry_run:
@@ -332,6 +376,7 @@ def cmd_prune(args: argparse.Namespace) -> int:
         else:
             try:
                 shutil.rmtree(run.path)
+                ledger.remove(run.run_id, flush=False)
                 if should_log_deletions():
                     logger.info(f"  Deleted: {run.run_id}")
                 deleted_count += 1
@@ -339,6 +384,7 @@ def cmd_prune(args: argparse.Namespace) -> int:
                 logger.error(f"  Failed to delete {run.run_id}: {e}")
 
     if not dry_run:
+        ledger.flush()
         logger.info("")
         logger.info(f"Deleted {deleted_count} runs.")
 
@@ -378,6 +424,7 @@ def cmd_quarantine(args: argparse.Namespace) -> int:
                 if dest.exists():
                     shutil.rmtree(dest)
                 shutil.move(str(run.path), str(dest))
+                get_disk_ledger(RUNS_DIR).remove(run.run_id)
                 logger.info(f"  Quarantined: {run.run_id}")
                 quarantined_count += 1
             except OSError as e:
@@ -390,6 +437,57 @@ def cmd_quarantine(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_reconcile(args: argparse.Namespace) -> int:
+    """Rescan every run directory and repair the disk usage ledger."""
+    paths = discover_run_paths()
+    ledger = get_disk_ledger(RUNS_DIR)
+    drift = ledger.reconcile({run_id: path for run_id, (path, _) in paths.items()})
+
+    logger.info("=" * 60)
+    logger.info("LEDGER RECONCILE")
+    logger.info("=" * 60)
+    logger.info(f"Runs scanned:    {len(paths)}")
+    logger.info(f"Runs corrected:  {len(drift)}")
+    logger.info(f"Net drift:       {sum(drift.values()):+d} bytes")
+    logger.info(f"Total size:      {format_size(ledger.total_bytes())}")
+
+    if args.verbose:
+        for run_id, delta in sorted(drift.items(), key=lambda kv: -abs(kv[1]))[:50]:
+            logger.info(f"  {run_id:<30} {delta:+d} bytes")
+
+    return 0
+
+
+def cmd_archive(args: argparse.Namespace) -> int:
+    """Pack finished runs past the age threshold into compressed bundles."""
+    dry_run = args.dry_run or is_dry_run_enabled()
+    days = args.days if args.days is not None else get_archive_after_days()
+    if days is None:
+        logger.info("Run archiving is disabled (runs.archive_after_days = 0).")
+        return 0
+
+    archived = archive_cold_runs(RUNS_DIR, older_than_days=days, dry_run=dry_run)
+
+    logger.info("=" * 60)
+    logger.info("ARCHIVE OPERATION" + (" (DRY RUN)" if dry_run else ""))
+    logger.info("=" * 60)
+    logger.info(f"Policy: archive finished runs older than {days} days")
+    logger.info(f"Runs archived:   {len(archived)}")
+    if not dry_run:
+        original = sum(a.original_bytes for a in archived)
+        packed = sum(a.bundle_bytes for a in archived)
+        logger.info(f"Files packed:    {sum(a.files for a in archived)}")
+        logger.info(f"Size:            {format_size(original)} -> {format_size(packed)}")
+
+    for entry in archived:
+        if dry_run:
+            logger.info(f"  [DRY-RUN] Would archive: {entry.run_id}")
+        elif args.verbose:
+            logger.info(f"  Archived: {entry.run_id} ({entry.files} files)")
+
+    return 0
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -401,6 +499,7 @@ def main() -> int:
     # list command
     list_parser = subparsers.add_parser("list", help="List runs with statistics")
     list_parser.add_argument("-v", "--verbose", action="store_true", help="Show individual runs")
+    list_parser.add_argument("--rescan", action="store_true", help="Reconcile ledger sizes first")
 
     # prune command
     prune_parser = subparsers.add_parser("prune", help="Apply retention policy")
@@ -408,11 +507,22 @@ def main() -> int:
     prune_parser.add_argument("--days", type=int, help="Keep runs younger than N days")
     prune_parser.add_argument("--dry-run", action="store_true", help="Show what would be deleted")
     prune_parser.add_argument("--force", action="store_true", help="Run even if retention disabled")
+    prune_parser.add_argument("--rescan", action="store_true", help="Reconcile ledger sizes first")
 
     # quarantine command
     quarantine_parser = subparsers.add_parser("quarantine", help="Move corrupt runs to quarantine")
     quarantine_parser.add_argument("--dry-run", action="store_true", help="Show what would be moved")
 
+    # reconcile command
+    reconcile_parser = subparsers.add_parser("reconcile", help="Rescan runs and repair size ledger")
+    reconcile_parser.add_argument("-v", "--verbose", action="store_true", help="Show corrected runs")
+
+    # archive command
+    archive_parser = subparsers.add_parser("archive", help="Pack finished runs into bundles")
+    archive_parser.add_argument("--days", type=int, help="Archive runs finished over N days ago")
+    archive_parser.add_argument("--dry-run", action="store_true", help="Show what would be archived")
+    archive_parser.add_argument("-v", "--verbose", action="store_true", help="Show archived runs")
+
     args = parser.parse_args()
 
     if args.command == "list":
@@ -421,6 +531,10 @@ def main() -> int:
         return cmd_prune(args)
     elif args.command == "quarantine":
         return cmd_quarantine(args)
+    elif args.command == "reconcile":
+        return cmd_reconcile(args)
+    elif args.command == "archive":
+        return cmd_archive(args)
     else:
         parser.print_help()
         return 1
@@ -63,7 +63,6 @@ import socket
 import subprocess
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
@@ -1187,6 +1186,8 @@ class DistributedSelfTestRunner:
         else:
             # Multiple steps, run in parallel
             self._print(f"Wave {wave_idx}: Running {len(step_ids)} steps in parallel...")
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
             with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
                 futures = {
                     executor.submit(_run_step_in_process, sd): sd
@@ -0,0 +1,254 @@
+"""Tests for AutopilotScheduler interleaved multi-run execution.
+
+Covers:
+- Many autopilot runs driven concurrently on a bounded worker pool
+- Fair (least-progress-first) interleaving of ticks between runs
+- Boundary evolution deferred off the tick critical path
+- Parking paused runs and resuming them
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from swarm.runtime.autopilot import (
+    AutopilotConfig,
+    AutopilotController,
+    AutopilotStatus,
+    EvolutionBoundary,
+    WisdomApplyResult,
+)
+from swarm.runtime.autopilot_scheduler import AutopilotScheduler
+
+
+class FakeOrchestrator:
+    """Orchestrator stub that records flow executions and peak concurrency."""
+
+    def __init__(self, duration: float = 0.0, on_flow=None):
+        self.duration = duration
+        self.on_flow = on_flow
+        self.lock = threading.Lock()
+        self.calls: List[Tuple[str, str]] = []
+        self.current = 0
+        self.peak = 0
+
+    def run_stepwise_flow(self, flow_key, spec, run_id, resume=False):
+        with self.lock:
+            self.calls.append((run_id, flow_key))
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        if self.on_flow:
+            self.on_flow(run_id, flow_key)
+        time.sleep(self.duration)
+        with self.lock:
+            self.current -= 1
+
+
+@pytest.fixture(autouse=True)
+def mock_storage():
+    """Keep autopilot runs off disk."""
+    with patch("swarm.runtime.autopilot.storage_module") as storage:
+        yield storage
+
+
+def _make_scheduler(orchestrator, config=None, **kwargs):
+    controller = AutopilotController(orchestrator=orchestrator, default_config=config)
+    return controller, AutopilotScheduler(controller, **kwargs)
+
+
+class TestConcurrentRuns:
+    def test_drives_many_runs_to_completion(self):
+        orchestrator = FakeOrchestrator(duration=0.01)
+        controller, scheduler = _make_scheduler(orchestrator, max_workers=4)
+        try:
+            run_ids = [scheduler.start(flow_keys=["signal", "plan", "build"]) for _ in range(12)]
+            results = [scheduler.wait(run_id, timeout=10) for run_id in run_ids]
+        finally:
+            scheduler.shutdown()
+
+        assert all(r.status == AutopilotStatus.SUCCEEDED for r in results)
+        assert all(r.flows_completed == ["signal", "plan", "build"] for r in results)
+        assert len(orchestrator.calls) == 36
+        assert 1 < orchestrator.peak <= 4
+        stats = scheduler.stats()
+        assert stats.completed == 12
+        assert stats.in_flight == 0
+
+    def test_ticks_for_one_run_never_overlap(self):
+        active = set()
+        overlap = []
+        lock = threading.Lock()
+
+        def on_flow(run_id, flow_key):
+            with lock:
+                if run_id in active:
+                    overlap.append(run_id)
+                active.add(run_id)
+            time.sleep(0.005)
+            with lock:
+                active.discard(run_id)
+
+        orchestrator = FakeOrchestrator(on_flow=on_flow)
+        controller, scheduler = _make_scheduler(orchestrator, max_workers=4)
+        try:
+            run_ids = [scheduler.start(flow_keys=["signal", "plan"]) for _ in range(3)]
+            assert scheduler.wait_all(timeout=10)
+        finally:
+            scheduler.shutdown()
+
+        assert overlap == []
+        assert all(controller.is_complete(run_id) for run_id in run_ids)
+
+
+class TestFairness:
+    def test_round_robin_between_runs(self):
+        orchestrator = FakeOrchestrator()
+        controller = AutopilotController(orchestrator=orchestrator)
+        flows = ["signal", "plan", "build"]
+        run_ids = [controller.start(flow_keys=flows) for _ in range(3)]
+
+        scheduler = AutopilotScheduler(controller, max_workers=1)
+        try:
+            for run_id in run_ids:
+                scheduler.submit(run_id)
+            assert scheduler.wait_all(timeout=10)
+        finally:
+            scheduler.shutdown()
+
+        # Every run advances one flow before any run advances two
+        expected = [(run_id, flow) for flow in flows for run_id in run_ids]
+        assert orchestrator.calls == expected
+
+
+class TestDeferredEvolution:
+    def test_evolution_runs_off_the_tick_path(self):
+        release = threading.Event()
+
+        def slow_evolution(self, state, boundary):
+            release.wait(5)
+            return WisdomApplyResult(patches_processed=1, patches_suggested=1)
+
+        config = AutopilotConfig(evolution_boundary=EvolutionBoundary.RUN_END)
+        orchestrator = FakeOrchestrator()
+        controller, scheduler = _make_scheduler(orchestrator, config=config, max_workers=2)
+        try:
+            with patch.object(
+                AutopilotController, "_process_evolution_at_boundary", slow_evolution
+            ):
+                slow = scheduler.start(flow_keys=["wisdom"])
+                fast = scheduler.start(flow_keys=["signal", "plan"])
+
+                # Both runs finish their flows while evolution is still blocked
+                deadline = time.monotonic() + 5
+                while not (controller.is_complete(slow) and controller.is_complete(fast)):
+                    assert time.monotonic() < deadline
+                    time.sleep(0.005)
+                assert controller.has_pending_evolution(slow)
+                assert controller.get_result(slow).wisdom_apply_result is None
+
+                release.set()
+                result = scheduler.wait(slow, timeout=5)
+        finally:
+            release.set()
+            scheduler.shutdown()
+
+        assert result.status == AutopilotStatus.SUCCEEDED
+        assert result.wisdom_apply_result is not None
+        assert result.wisdom_apply_result.patches_suggested == 1
+        assert not controller.has_pending_evolution(slow)
+
+    def test_flow_end_boundary_processes_after_wisdom(self):
+        config = AutopilotConfig(evolution_boundary=EvolutionBoundary.FLOW_END)
+        controller = AutopilotController(orchestrator=FakeOrchestrator(), default_config=config)
+        with patch.object(
+            AutopilotController,
+            "_process_evolution_at_boundary",
+            return_value=WisdomApplyResult(patches_processed=2),
+        ) as process:
+            run_id = controller.start(flow_keys=["wisdom"])
+            result = controller.run_to_completion(run_id)
+
+        process.assert_called_once()
+        assert process.call_args[0][1] == "flow_end"
+        assert result.wisdom_apply_result.patches_processed == 2
+
+    def test_flow_end_with_legacy_auto_apply_processes_once(self):
+        config = AutopilotConfig(
+            auto_apply_wisdom=True, evolution_boundary=EvolutionBoundary.FLOW_END
+        )
+        controller = AutopilotController(orchestrator=FakeOrchestrator(), default_config=config)
+        with patch.object(
+            AutopilotController,
+            "_process_evolution_at_boundary",
+            return_value=WisdomApplyResult(patches_processed=1),
+        ) as process:
+            controller.run_to_completion(controller.start(flow_keys=["wisdom"]))
+
+        assert [c[0][1] for c in process.call_args_list] == ["flow_end"]
+
+    def test_wait_covers_every_deferred_job_of_a_run(self):
+        release = threading.Event()
+        boundaries: List[str] = []
+
+        def slow_evolution(self, state, boundary):
+            release.wait(5)
+            boundaries.append(boundary)
+            return WisdomApplyResult(patches_processed=len(boundaries))
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        controller = AutopilotController(
+            orchestrator=FakeOrchestrator(), evolution_executor=executor
+        )
+        try:
+            with patch.object(
+                AutopilotController, "_process_evolution_at_boundary", slow_evolution
+            ):
+                run_id = controller.start(flow_keys=["wisdom"])
+                state = controller._states[run_id]
+                assert controller._run_boundary_evolution(state, "flow_end") is None
+                assert controller._run_boundary_evolution(state, "run_end") is None
+                assert controller.pending_evolution_count() == 1
+
+                release.set()
+                controller.wait_for_evolution(run_id, timeout=5)
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert sorted(boundaries) == ["flow_end", "run_end"]
+        assert not controller.has_pending_evolution(run_id)
+        assert controller.pending_evolution_count() == 0
+
+
+class TestPauseResume:
+    def test_paused_run_is_parked_and_resumes(self):
+        gate = threading.Event()
+        orchestrator = FakeOrchestrator(on_flow=lambda run_id, flow_key: gate.wait(5))
+        controller, scheduler = _make_scheduler(orchestrator, max_workers=1)
+        try:
+            run_id = scheduler.start(flow_keys=["signal", "plan"])
+            deadline = time.monotonic() + 5
+            while not orchestrator.calls:
+                assert time.monotonic() < deadline
+                time.sleep(0.005)
+            assert controller.pause(run_id)
+            gate.set()
+
+            result = scheduler.wait(run_id, timeout=5)
+            assert result.status == AutopilotStatus.PAUSED
+            assert scheduler.stats().parked == 1
+
+            assert scheduler.resume(run_id)
+            result = scheduler.wait(run_id, timeout=5)
+        finally:
+            gate.set()
+            scheduler.shutdown()
+
+        assert result.status == AutopilotStatus.SUCCEEDED
+        assert result.flows_completed == ["signal", "plan"]
@@ -0,0 +1,154 @@
+"""Tests for the watermark-keyed StatsDB query result cache.
+
+Covers:
+- Repeated queries are served from the cache
+- Ingestion for a run invalidates only that run's cached results
+- Cross-run queries invalidate on any write
+- Writes through another StatsDB instance on the same file invalidate
+- Cached rows are deep-copied for each caller
+- Cache metrics (hits, misses, hit rate, saved time) and LRU bound
+- Disabling the cache
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from swarm.runtime.db import StatsDB
+
+
+def _step_events(run_id: str, start: int, count: int) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = []
+    if start == 0:
+        events.append(
+            {
+                "event_id": f"{run_id}-start",
+                "seq": 0,
+                "kind": "run_started",
+                "flow_key": "build",
+                "ts": "2025-01-01T00:00:00Z",
+                "payload": {"flow_keys": ["build"]},
+            }
+        )
+    for i in range(start, start + count):
+        events.append(
+            {
+                "event_id": f"{run_id}-step-{i}",
+                "seq": i + 1,
+                "kind": "step_start",
+                "flow_key": "build",
+                "step_id": f"step-{i}",
+                "ts": "2025-01-01T00:00:01Z",
+                "payload": {"step_index": i, "agent_key": "agent"},
+            }
+        )
+    return events
+
+
+@pytest.fixture
+def db(tmp_path):
+    stats_db = StatsDB(tmp_path / "stats.duckdb", query_cache_size=64)
+    stats_db.ingest_events(_step_events("run-a", 0, 2), "run-a")
+    stats_db.ingest_events(_step_events("run-b", 0, 3), "run-b")
+    yield stats_db
+    stats_db.close()
+
+
+class TestQueryCache:
+    def test_repeated_query_is_served_from_cache(self, db):
+        first = db.get_step_stats("run-a")
+        with patch.object(db, "_read_snapshot", wraps=db._read_snapshot) as snapshot:
+            second = db.get_step_stats("run-a")
+
+        snapshot.assert_called_once_with()  # Watermark lookup only
+        assert [s.step_id for s in second] == [s.step_id for s in first]
+        assert second is not first  # callers get their own list
+        stats = db.query_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+        second[0].step_id = "mutated"
+        assert db.get_step_stats("run-a")[0].step_id == first[0].step_id
+
+    def test_ingest_invalidates_only_that_run(self, db):
+        assert len(db.get_step_stats("run-a")) == 2
+        assert len(db.get_step_stats("run-b")) == 3
+
+        db.ingest_events(_step_events("run-a", 2, 1), "run-a")
+
+        assert len(db.get_step_stats("run-a")) == 3
+        assert len(db.get_step_stats("run-b")) == 3
+        stats = db.query_cache_stats()
+        assert stats.hits == 1  # run-b only
+        assert stats.misses == 3
+
+    def test_cross_run_query_invalidates_on_any_write(self, db):
+        assert len(db.get_recent_runs()) == 2
+        assert len(db.get_recent_runs()) == 2
+        assert db.query_cache_stats().hits == 1
+
+        db.ingest_events(_step_events("run-c", 0, 1), "run-c")
+        assert len(db.get_recent_runs()) == 3
+
+    def test_writes_through_another_instance_invalidate(self, db, tmp_path):
+        assert len(db.get_step_stats("run-a")) == 2
+        assert len(db.get_recent_runs()) == 2
+
+        tailer_db = StatsDB(tmp_path / "stats.duckdb", query_cache_size=64)
+        try:
+            tailer_db.ingest_events(_step_events("run-a", 2, 1), "run-a")
+            tailer_db.set_ingestion_offset("run-a", 100, 3)
+            tailer_db.ingest_events(_step_events("run-c", 0, 1), "run-c")
+        finally:
+            tailer_db.close()
+
+        assert len(db.get_step_stats("run-a")) == 3
+        assert len(db.get_recent_runs()) == 3
+        assert db.get_ingestion_offset("run-a") == (100, 3)
+        assert db.get_ingestion_offset("run-c") == (0, 0)
+
+    def test_distinct_arguments_are_cached_separately(self, db):
+        db.get_recent_runs(limit=1)
+        db.get_recent_runs(limit=5)
+        db.get_recent_runs(limit=1)
+        stats = db.query_cache_stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+
+    def test_saved_time_and_lru_bound(self, tmp_path):
+        small = StatsDB(tmp_path / "small.duckdb", query_cache_size=2)
+        try:
+            for run_id in ("run-1", "run-2", "run-3"):
+                small.ingest_events(_step_events(run_id, 0, 1), run_id)
+                small.get_run_stats(run_id)
+            stats = small.query_cache_stats()
+            assert stats.entries == 2
+
+            small.get_run_stats("run-3")
+            assert small.query_cache_stats().saved_ms > 0
+            small.get_run_stats("run-1")  # evicted
+            assert small.query_cache_stats().misses == 4
+        finally:
+            small.close()
+
+    def test_cache_disabled(self, tmp_path):
+        stats_db = StatsDB(tmp_path / "off.duckdb", query_cache_size=0)
+        try:
+            stats_db.ingest_events(_step_events("run-a", 0, 1), "run-a")
+            stats_db.get_step_stats("run-a")
+            stats_db.get_step_stats("run-a")
+            stats = stats_db.query_cache_stats()
+            assert (stats.hits, stats.misses, stats.capacity) == (0, 0, 0)
+        finally:
+            stats_db.close()
+
+    def test_stats_to_dict(self, db):
+        db.get_run_stats("run-a")
+        db.get_run_stats("run-a")
+        data = db.query_cache_stats().to_dict()
+        assert set(data) == {"hits", "misses", "hit_rate", "entries", "capacity", "saved_ms"}
+        assert data["hit_rate"] == 0.5
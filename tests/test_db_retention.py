@@ -0,0 +1,272 @@
+"""Tests for StatsDB projection retention (Parquet archives for cold runs).
+
+Covers:
+- Cold run selection by age and status
+- Archived runs leave the hot tables but stay queryable
+- Parquet files are hive-partitioned by run start month and run id
+- Ingestion and rebuild skip archived runs
+- A rebuilt database folds archived runs back into the rollups
+- Archives and the manifest survive reopening the DB
+- Interrupted archives are completed on open
+- Retention config and env override
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from swarm.config import runs_retention_config
+from swarm.runtime.db import ARCHIVE_DIR_NAME, ARCHIVE_MANIFEST, StatsDB
+from swarm.runtime.event_validator import validate_run_from_db
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _run_events(run_id: str, started: datetime, completed: bool = True) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = [
+        {
+            "event_id": f"{run_id}-start",
+            "seq": 0,
+            "kind": "run_started",
+            "flow_key": "build",
+            "ts": _iso(started),
+            "payload": {"flow_keys": ["build"]},
+        },
+        {
+            "event_id": f"{run_id}-step-start",
+            "seq": 1,
+            "kind": "step_start",
+            "flow_key": "build",
+            "step_id": "implement",
+            "ts": _iso(started + timedelta(seconds=1)),
+            "payload": {"step_index": 0, "agent_key": "code-implementer"},
+        },
+        {
+            "event_id": f"{run_id}-tool",
+            "seq": 2,
+            "kind": "tool_end",
+            "flow_key": "build",
+            "step_id": "implement",
+            "ts": _iso(started + timedelta(seconds=2)),
+            "payload": {"tool": "Bash", "duration_ms": 40},
+        },
+        {
+            "event_id": f"{run_id}-step-end",
+            "seq": 3,
+            "kind": "step_end",
+            "flow_key": "build",
+            "step_id": "implement",
+            "ts": _iso(started + timedelta(seconds=3)),
+            "payload": {"status": "succeeded", "duration_ms": 2000, "prompt_tokens": 5},
+        },
+    ]
+    if completed:
+        events.append(
+            {
+                "event_id": f"{run_id}-end",
+                "seq": 4,
+                "kind": "run_completed",
+                "flow_key": "build",
+                "ts": _iso(started + timedelta(seconds=4)),
+                "payload": {"status": "succeeded", "total_steps": 1, "steps_completed": 1},
+            }
+        )
+    return events
+
+
+NOW = datetime.now(timezone.utc)
+OLD = NOW - timedelta(days=40)
+
+
+@pytest.fixture
+def db(tmp_path):
+    stats_db = StatsDB(tmp_path / "stats.duckdb")
+    stats_db.ingest_events(_run_events("old-run", OLD), "old-run")
+    stats_db.ingest_events(_run_events("old-running", OLD, completed=False), "old-running")
+    stats_db.ingest_events(_run_events("new-run", NOW - timedelta(hours=1)), "new-run")
+    yield stats_db
+    stats_db.close()
+
+
+def _hot_count(db: StatsDB, table: str, run_id: str) -> int:
+    return db.connection.execute(f"SELECT COUNT(*) FROM {table} WHERE run_id = ?", [run_id]).fetchone()[0]
+
+
+class TestArchiveColdRuns:
+    def test_only_completed_runs_past_window_are_archived(self, db):
+        assert db.archive_cold_runs(older_than_days=30, dry_run=True).run_ids == ["old-run"]
+        assert _hot_count(db, "events", "old-run") == 5
+
+        result = db.archive_cold_runs(older_than_days=30)
+        assert result.run_ids == ["old-run"]
+        assert result.rows == {"runs": 1, "steps": 1, "tool_calls": 1, "events": 5}
+        assert db.is_archived("old-run")
+        assert not db.is_archived("old-running")
+
+        for table in ("runs", "steps", "tool_calls", "events"):
+            assert _hot_count(db, table, "old-run") == 0
+        assert _hot_count(db, "events", "new-run") == 5
+
+    def test_files_partitioned_by_start_month_and_run(self, db, tmp_path):
+        result = db.archive_cold_runs(older_than_days=30)
+        month = OLD.strftime("%Y-%m")
+        archive = tmp_path / ARCHIVE_DIR_NAME
+        assert sorted(p.relative_to(archive).parts[:3] for p in archive.rglob("*.parquet")) == [
+            (table, f"month={month}", "run_id=old-run")
+            for table in ("events", "runs", "steps", "tool_calls")
+        ]
+        assert len(result.files) == 4
+
+    def test_archived_run_query_reads_only_its_files(self, db):
+        db.archive_cold_runs(run_ids=["old-run", "new-run"])
+        with db.read_snapshot("old-run") as conn:
+            plan = conn.execute(
+                "EXPLAIN ANALYZE SELECT * FROM events WHERE run_id = ?", ["old-run"]
+            ).fetchall()[0][1]
+            count = conn.execute(
+                "SELECT COUNT(*) FROM events WHERE run_id = ?", ["old-run"]
+            ).fetchone()[0]
+        assert "Scanning Files: 1/2" in plan
+        assert count == 5
+
+    def test_archived_run_queries_are_unchanged(self, db):
+        before = (
+            db.get_run_stats("old-run"),
+            db.get_step_stats("old-run"),
+            db.get_tool_breakdown("old-run"),
+        )
+        db.archive_cold_runs(older_than_days=30)
+        after = (
+            db.get_run_stats("old-run"),
+            db.get_step_stats("old-run"),
+            db.get_tool_breakdown("old-run"),
+        )
+        assert after == before
+        assert after[0].tool_call_count == 1
+        assert validate_run_from_db("old-run", db) == validate_run_from_db("new-run", db)
+
+    def test_recent_runs_hot_only_unless_requested(self, db):
+        db.archive_cold_runs(older_than_days=30)
+        assert {r.run_id for r in db.get_recent_runs()} == {"new-run", "old-running"}
+        assert {r.run_id for r in db.get_recent_runs(include_archived=True)} == {
+            "new-run",
+            "old-running",
+            "old-run",
+        }
+
+    def test_rollups_keep_archived_runs(self, db):
+        total = db.get_step_rollup(group_by=())[0].step_count
+        db.archive_cold_runs(older_than_days=30)
+        assert db.get_step_rollup(group_by=())[0].step_count == total
+
+    def test_ingest_and_rebuild_skip_archived_runs(self, db, tmp_path):
+        db.archive_cold_runs(run_ids=["old-run"])
+        assert db.ingest_events(_run_events("old-run", OLD), "old-run") == 0
+        assert _hot_count(db, "events", "old-run") == 0
+
+        run_dir = tmp_path / "runs" / "old-run"
+        run_dir.mkdir(parents=True)
+        (run_dir / "events.jsonl").write_text(
+            "\n".join(json.dumps(e) for e in _run_events("old-run", OLD))
+        )
+        assert db.rebuild_from_events("old-run", tmp_path / "runs")["events_ingested"] == 0
+        assert _hot_count(db, "runs", "old-run") == 0
+
+    def test_rebuilt_database_rollups_include_archived_runs(self, db, tmp_path):
+        db.archive_cold_runs(older_than_days=30)
+        steps_before = db.get_step_rollup(group_by=("day",))
+        tools_before = db.get_tool_rollup(group_by=("day",))
+        db.close()
+
+        # A projection version bump starts a new file next to the same archive
+        runs_dir = tmp_path / "runs"
+        for run_id, started, completed in (
+            ("new-run", NOW - timedelta(hours=1), True),
+            ("old-running", OLD, False),
+        ):
+            (runs_dir / run_id).mkdir(parents=True)
+            (runs_dir / run_id / "events.jsonl").write_text(
+                "\n".join(json.dumps(e) for e in _run_events(run_id, started, completed))
+            )
+        rebuilt = StatsDB(tmp_path / "rebuilt.duckdb", archive_dir=tmp_path / ARCHIVE_DIR_NAME)
+        try:
+            stats = rebuilt.rebuild_all_from_events(runs_dir=runs_dir)
+            assert stats["archived_runs_folded"] == 1
+            assert rebuilt.get_step_rollup(group_by=("day",)) == steps_before
+            assert rebuilt.get_tool_rollup(group_by=("day",)) == tools_before
+
+            # A later full rebuild does not count archived runs twice
+            rebuilt.rebuild_all_from_events(runs_dir=runs_dir)
+            assert rebuilt.get_step_rollup(group_by=("day",)) == steps_before
+        finally:
+            rebuilt.close()
+
+    def test_explicit_run_ids_never_archive_running_runs(self, db):
+        assert db.archive_cold_runs(run_ids=["old-running", "new-run"]).run_ids == ["new-run"]
+
+
+class TestArchivePersistence:
+    def test_reopen_keeps_archived_runs_queryable(self, db, tmp_path):
+        db.archive_cold_runs(older_than_days=30)
+        db.close()
+
+        reopened = StatsDB(tmp_path / "stats.duckdb")
+        try:
+            assert reopened.is_archived("old-run")
+            assert reopened.get_run_stats("old-run").status == "succeeded"
+            manifest = json.loads((tmp_path / ARCHIVE_DIR_NAME / ARCHIVE_MANIFEST).read_text())
+            assert list(manifest["runs"]) == ["old-run"]
+        finally:
+            reopened.close()
+
+    def test_interrupted_archive_is_completed_on_open(self, db, tmp_path):
+        db.archive_cold_runs(older_than_days=30)
+        db.close()
+
+        # Simulate a crash after the manifest was written but before the
+        # hot rows were dropped: the run shows up in the hot tables again.
+        other = StatsDB(tmp_path / "stats.duckdb", archive_dir=tmp_path / "elsewhere")
+        other.ingest_events(_run_events("old-run", OLD), "old-run")
+        other.close()
+
+        reopened = StatsDB(tmp_path / "stats.duckdb")
+        try:
+            assert _hot_count(reopened, "runs", "old-run") == 0
+            assert len(reopened.get_step_stats("old-run")) == 1
+        finally:
+            reopened.close()
+
+    def test_in_memory_db_does_not_archive(self):
+        stats_db = StatsDB()
+        try:
+            stats_db.ingest_events(_run_events("old-run", OLD), "old-run")
+            assert stats_db.archive_cold_runs(older_than_days=1).run_ids == []
+        finally:
+            stats_db.close()
+
+
+class TestRetentionConfig:
+    def test_default_and_env_override(self, monkeypatch):
+        runs_retention_config.reload_config()
+        monkeypatch.delenv("SWARM_DB_HOT_RETENTION_DAYS", raising=False)
+        assert runs_retention_config.get_projection_hot_retention_days() == 14
+
+        monkeypatch.setenv("SWARM_DB_HOT_RETENTION_DAYS", "3")
+        assert runs_retention_config.get_projection_hot_retention_days() == 3
+
+        monkeypatch.setenv("SWARM_DB_HOT_RETENTION_DAYS", "0")
+        assert runs_retention_config.get_projection_hot_retention_days() is None
+
+    def test_archive_uses_configured_window(self, db, monkeypatch):
+        monkeypatch.setenv("SWARM_DB_HOT_RETENTION_DAYS", "60")
+        assert db.archive_cold_runs().run_ids == []
+        monkeypatch.setenv("SWARM_DB_HOT_RETENTION_DAYS", "30")
+        assert db.archive_cold_runs().run_ids == ["old-run"]
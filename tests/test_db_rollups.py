@@ -0,0 +1,156 @@
+"""Tests for materialized cross-run rollups in StatsDB.
+
+Covers:
+- DurationSketch accuracy, merging and serialization
+- Step and tool rollups maintained during event ingestion
+- Per-agent p95, failure rate by station, tool-call volume per day
+- Re-ingesting the same events does not double count
+- Rollup totals agree with the raw steps table
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date
+from typing import Any, Dict, List
+
+import pytest
+
+from swarm.runtime.quantile_sketch import DurationSketch
+
+duckdb = pytest.importorskip("duckdb")
+
+from swarm.runtime.db import StatsDB
+
+
+class TestDurationSketch:
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(6, 1) for _ in range(5000)]
+        sketch = DurationSketch(relative_accuracy=0.02)
+        for v in values:
+            sketch.add(v)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.9, 0.95, 0.99):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.021)
+
+    def test_merge_equals_single_sketch(self):
+        a, b, both = DurationSketch(), DurationSketch(), DurationSketch()
+        for v in range(1, 200):
+            (a if v % 2 else b).add(v)
+            both.add(v)
+        merged = DurationSketch.from_json(a.to_json()).merge(b)
+        assert merged.count == both.count
+        assert merged.quantile(0.95) == both.quantile(0.95)
+
+    def test_zero_values_and_empty(self):
+        sketch = DurationSketch()
+        assert sketch.quantile(0.5) is None
+        sketch.add(0, count=3)
+        sketch.add(100)
+        assert sketch.quantile(0.5) == 0.0
+        assert DurationSketch.from_json(None).count == 0
+
+
+def _step_events(
+    run_id: str, step_id: str, agent: str, duration_ms: int, status: str, day: str, seq: int
+) -> List[Dict[str, Any]]:
+    return [
+        {
+            "event_id": f"{run_id}-{step_id}-start",
+            "seq": seq,
+            "kind": "step_start",
+            "flow_key": "build",
+            "step_id": step_id,
+            "ts": f"{day}T10:00:00Z",
+            "payload": {"step_index": seq, "agent_key": agent},
+        },
+        {
+            "event_id": f"{run_id}-{step_id}-tool",
+            "seq": seq + 1,
+            "kind": "tool_end",
+            "flow_key": "build",
+            "step_id": step_id,
+            "ts": f"{day}T10:00:01Z",
+            "payload": {"tool": "Bash", "duration_ms": 50, "success": status == "succeeded"},
+        },
+        {
+            "event_id": f"{run_id}-{step_id}-end",
+            "seq": seq + 2,
+            "kind": "step_end",
+            "flow_key": "build",
+            "step_id": step_id,
+            "ts": f"{day}T10:05:00Z",
+            "payload": {"status": status, "duration_ms": duration_ms, "prompt_tokens": 10},
+        },
+    ]
+
+
+@pytest.fixture
+def db(tmp_path):
+    stats_db = StatsDB(tmp_path / "stats.duckdb")
+    for i in range(10):
+        run_id = f"run-{i}"
+        day = "2025-01-01" if i < 5 else "2025-01-02"
+        events = _step_events(run_id, "implement", "code-implementer", 1000 * (i + 1), "succeeded", day, 1)
+        events += _step_events(
+            run_id, "test", "test-author", 200, "failed" if i % 2 else "succeeded", day, 4
+        )
+        stats_db.ingest_events(events, run_id)
+    yield stats_db
+    stats_db.close()
+
+
+class TestRollups:
+    def test_per_agent_duration_quantiles(self, db):
+        by_agent = {r.group["agent_key"]: r for r in db.get_step_rollup(group_by=("agent_key",))}
+
+        impl = by_agent["code-implementer"]
+        assert impl.step_count == 10
+        assert impl.max_duration_ms == 10000
+        assert impl.avg_duration_ms == 5500
+        assert impl.p95_duration_ms == pytest.approx(9000, rel=0.02)
+        assert impl.p50_duration_ms == pytest.approx(5000, rel=0.02)
+
+    def test_failure_rate_by_station(self, db):
+        by_station = {r.group["station_id"]: r for r in db.get_step_rollup(group_by="station_id")}
+        assert by_station["test"].failure_rate == 0.5
+        assert by_station["implement"].failure_rate == 0.0
+        assert by_station["implement"].total_tokens == 100
+
+    def test_tool_volume_per_day(self, db):
+        per_day = db.get_tool_rollup(group_by=("day",))
+        assert [(r.group["day"], r.call_count) for r in per_day] == [
+            (date(2025, 1, 1), 10),
+            (date(2025, 1, 2), 10),
+        ]
+        assert per_day[0].success_rate == pytest.approx(0.8)
+
+    def test_filters_and_grand_total(self, db):
+        total = db.get_step_rollup(group_by=())
+        assert len(total) == 1 and total[0].step_count == 20
+
+        day2 = db.get_step_rollup(group_by=("flow_key",), since="2025-01-02")
+        assert day2[0].step_count == 10
+
+        assert db.get_step_rollup(group_by=(), since="2030-01-01") == []
+        with pytest.raises(ValueError):
+            db.get_step_rollup(group_by=("run_id; DROP TABLE steps",))
+
+    def test_reingest_does_not_double_count(self, db):
+        events = _step_events("run-0", "implement", "code-implementer", 1000, "succeeded", "2025-01-01", 1)
+        assert db.ingest_events(events, "run-0") == 0
+        assert db.get_step_rollup(group_by=())[0].step_count == 20
+
+    def test_rollup_matches_raw_steps(self, db):
+        raw = db.connection.execute(
+            "SELECT step_id, COUNT(*), SUM(duration_ms) FROM steps "
+            "WHERE status != 'running' GROUP BY step_id ORDER BY step_id"
+        ).fetchall()
+        rolled = [
+            (r.group["station_id"], r.step_count, r.total_duration_ms)
+            for r in db.get_step_rollup(group_by=("station_id",))
+        ]
+        assert rolled == [tuple(row) for row in raw]
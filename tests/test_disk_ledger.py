@@ -0,0 +1,200 @@
+"""Tests for the incremental per-run disk usage ledger.
+
+Covers:
+- Delta accounting, exact measurement, removal and persistence
+- Merge-on-flush between two ledger instances sharing one file
+- Flushes from several processes never lose each other's deltas
+- Reconcile drift reporting
+- Storage writes and terminal status updates feeding the ledger
+- runs_gc reading sizes from the ledger instead of walking run trees
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime import disk_ledger, storage
+from swarm.runtime.disk_ledger import LEDGER_FILE, DiskLedger, measure_dir
+from swarm.runtime.types import RunEvent, RunSpec, RunStatus, RunSummary, SDLCStatus
+
+
+@pytest.fixture(autouse=True)
+def fresh_ledgers():
+    disk_ledger.reset_disk_ledgers()
+    yield
+    disk_ledger.reset_disk_ledgers()
+
+
+def _write_file(path: Path, size: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+def _summary(run_id: str) -> RunSummary:
+    now = datetime.now(timezone.utc)
+    return RunSummary(
+        id=run_id,
+        spec=RunSpec(flow_keys=["signal"], backend="claude-harness", initiator="test"),
+        status=RunStatus.RUNNING,
+        sdlc_status=SDLCStatus.UNKNOWN,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestDiskLedger:
+    def test_measure_dir_counts_nested_files(self, tmp_path):
+        _write_file(tmp_path / "a.txt", 10)
+        _write_file(tmp_path / "sub" / "deep" / "b.txt", 32)
+        assert measure_dir(tmp_path) == 42
+        assert measure_dir(tmp_path / "missing") == 0
+
+    def test_deltas_accumulate_and_persist_on_flush(self, tmp_path):
+        ledger = DiskLedger(tmp_path, flush_every=1000)
+        ledger.record_bytes("run-a", 100)
+        ledger.record_bytes("run-a", 50)
+        ledger.record_bytes("run-b", 7)
+
+        assert ledger.get("run-a").size_bytes == 150
+        assert ledger.total_bytes() == 157
+        assert not (tmp_path / LEDGER_FILE).exists()
+
+        ledger.flush()
+        reloaded = DiskLedger(tmp_path)
+        assert reloaded.sizes() == {"run-a": 150, "run-b": 7}
+
+    def test_exact_measurement_replaces_deltas(self, tmp_path):
+        run_path = tmp_path / "run-a"
+        _write_file(run_path / "meta.json", 64)
+        ledger = DiskLedger(tmp_path)
+        ledger.record_bytes("run-a", 5)
+
+        assert ledger.measure_run("run-a", run_path) == 64
+        entry = DiskLedger(tmp_path).get("run-a")
+        assert entry.size_bytes == 64
+        assert entry.measured_at is not None
+
+    def test_flush_merges_concurrent_writers(self, tmp_path):
+        backend = DiskLedger(tmp_path, flush_every=1000)
+        gc_tool = DiskLedger(tmp_path, flush_every=1000)
+
+        backend.record_bytes("run-a", 10)
+        gc_tool.set_size("run-b", 300)
+        backend.record_bytes("run-b", 20)
+        gc_tool.remove("run-c")
+        backend.flush()
+
+        assert DiskLedger(tmp_path).sizes() == {"run-a": 10, "run-b": 320}
+
+    def test_flushes_from_many_processes_are_serialized(self, tmp_path):
+        code = (
+            "import sys; from swarm.runtime.disk_ledger import DiskLedger; "
+            "ledger = DiskLedger(sys.argv[1], flush_every=1); "
+            "[ledger.record_bytes('run-a', 1) for _ in range(50)]"
+        )
+        repo_root = Path(__file__).resolve().parent.parent
+        workers = [
+            subprocess.Popen([sys.executable, "-c", code, str(tmp_path)], cwd=repo_root)
+            for _ in range(4)
+        ]
+        assert [worker.wait(timeout=60) for worker in workers] == [0] * 4
+
+        assert DiskLedger(tmp_path).sizes() == {"run-a": 200}
+
+    def test_reconcile_reports_drift_and_drops_missing(self, tmp_path):
+        _write_file(tmp_path / "run-a" / "events.jsonl", 90)
+        ledger = DiskLedger(tmp_path)
+        ledger.set_size("run-a", 40)
+        ledger.set_size("gone", 12)
+
+        drift = ledger.reconcile({"run-a": tmp_path / "run-a"})
+
+        assert drift == {"run-a": 50, "gone": -12}
+        assert DiskLedger(tmp_path).sizes() == {"run-a": 90}
+
+
+class TestStorageAccounting:
+    def test_storage_writes_match_directory_size(self, tmp_path):
+        run_id = "run-ledger"
+        storage.write_summary(run_id, _summary(run_id), runs_dir=tmp_path)
+        for i in range(5):
+            storage.append_event(
+                run_id,
+                RunEvent(
+                    run_id=run_id,
+                    ts=datetime.now(timezone.utc),
+                    kind="log",
+                    flow_key="signal",
+                    payload={"i": i},
+                ),
+                runs_dir=tmp_path,
+            )
+        # Rewriting meta.json records only the size difference
+        storage.write_summary(run_id, _summary(run_id), runs_dir=tmp_path)
+
+        ledger = disk_ledger.get_disk_ledger(tmp_path)
+        assert ledger.get(run_id).size_bytes == measure_dir(tmp_path / run_id)
+
+    def test_terminal_status_measures_run(self, tmp_path):
+        run_id = "run-finished"
+        storage.write_summary(run_id, _summary(run_id), runs_dir=tmp_path)
+        # Artifact written outside storage is picked up when the run finishes
+        _write_file(tmp_path / run_id / "signal" / "requirements.md", 2048)
+
+        storage.update_summary(run_id, {"status": RunStatus.SUCCEEDED.value}, runs_dir=tmp_path)
+
+        data = json.loads((tmp_path / LEDGER_FILE).read_text())
+        entry = data["runs"][run_id]
+        assert entry["size_bytes"] == measure_dir(tmp_path / run_id)
+        assert entry["measured_at"] is not None
+
+
+class TestRunsGcUsesLedger:
+    @pytest.fixture
+    def gc_env(self, tmp_path, monkeypatch):
+        from swarm.tools import runs_gc
+
+        runs_dir = tmp_path / "runs"
+        examples_dir = tmp_path / "examples"
+        runs_dir.mkdir()
+        examples_dir.mkdir()
+        monkeypatch.setattr(runs_gc, "RUNS_DIR", runs_dir)
+        monkeypatch.setattr(runs_gc, "EXAMPLES_DIR", examples_dir)
+        return runs_gc, runs_dir
+
+    def test_known_runs_are_not_walked(self, gc_env, monkeypatch):
+        runs_gc, runs_dir = gc_env
+        _write_file(runs_dir / "run-a" / "meta.json", 10)
+        _write_file(runs_dir / "run-b" / "meta.json", 20)
+        disk_ledger.get_disk_ledger(runs_dir).set_size("run-a", 1000)
+
+        walked = []
+        real_measure = runs_gc.measure_dir
+        monkeypatch.setattr(runs_gc, "measure_dir", lambda p: walked.append(p.name) or real_measure(p))
+
+        sizes = {r.run_id: r.size_bytes for r in runs_gc.discover_all_runs()}
+
+        assert sizes == {"run-a": 1000, "run-b": 20}
+        assert walked == ["run-b"]
+        # Second discovery reads everything from the ledger
+        walked.clear()
+        runs_gc.discover_all_runs()
+        assert walked == []
+
+    def test_rescan_reconciles_and_forgets_deleted_runs(self, gc_env):
+        runs_gc, runs_dir = gc_env
+        _write_file(runs_dir / "run-a" / "meta.json", 10)
+        ledger = disk_ledger.get_disk_ledger(runs_dir)
+        ledger.set_size("run-a", 1000)
+        ledger.set_size("deleted", 500)
+
+        sizes = {r.run_id: r.size_bytes for r in runs_gc.discover_all_runs(rescan=True)}
+
+        assert sizes == {"run-a": 10}
+        assert ledger.sizes() == {"run-a": 10}
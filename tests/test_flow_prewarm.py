@@ -0,0 +1,262 @@
+"""Tests for speculative pre-warming of the next flow.
+
+Covers:
+- FlowPrewarmer hands over a speculation only for the flow routing chose
+- Mispredictions, run ends, timeouts and failures fall back to a cold load
+- Flow-transition latency is measured for every transition
+- MacroNavigator.predict_next_flow follows the sequence and observed bounces
+- Orchestrator warm work matches a cold load and has no side effects; the
+  final step starts it; close() stops the workers
+- Transitions are measured with pre-warming disabled
+"""
+
+from __future__ import annotations
+
+import shutil
+import threading
+import uuid
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime import storage
+from swarm.runtime.engines.claude import ClaudeStepEngine
+from swarm.runtime.macro_navigator import MacroNavigator
+from swarm.runtime.stepwise import StepwiseOrchestrator
+from swarm.runtime.stepwise.prewarm import FlowPrewarmer, PrewarmedFlow
+from swarm.runtime.types import HumanPolicy, RoutingMode, RunPlanSpec, RunSpec
+
+repo_root = Path(__file__).resolve().parent.parent
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _warm(flow_key: str, **context) -> PrewarmedFlow:
+    return PrewarmedFlow(flow_key=flow_key, duration_ms=context.get("duration_ms", 5))
+
+
+class TestFlowPrewarmer:
+    def test_hit_hands_over_warmed_flow(self):
+        prewarmer = FlowPrewarmer(_warm)
+        assert prewarmer.start("run-1", "gate", duration_ms=7)
+        assert not prewarmer.start("run-1", "gate")  # Already warming
+
+        warmed = prewarmer.take("run-1", "gate")
+        assert warmed == PrewarmedFlow(flow_key="gate", duration_ms=7)
+        assert prewarmer.take("run-1", "gate") is None  # Claimed once
+
+        stats = prewarmer.stats()
+        assert (stats.prewarm_started, stats.prewarm_hits, stats.prewarm_discarded) == (1, 1, 0)
+        prewarmer.shutdown()
+
+    def test_misprediction_is_discarded(self):
+        prewarmer = FlowPrewarmer(_warm)
+        prewarmer.start("run-1", "gate")
+        prewarmer.start("run-2", "deploy")
+        assert prewarmer.take("run-1", "build") is None
+        assert prewarmer.take("run-2", "deploy").flow_key == "deploy"
+
+        prewarmer.start("run-2", "wisdom")
+        prewarmer.start("run-2", "review")  # Replaces wisdom
+        prewarmer.discard("run-2")
+        assert prewarmer.take("run-2", "review") is None
+        assert prewarmer.stats().to_dict()["prewarm_discarded"] == 3
+        prewarmer.shutdown()
+
+    def test_no_prediction(self):
+        prewarmer = FlowPrewarmer(_warm)
+        assert not prewarmer.start("run-1", None)
+        assert prewarmer.take("run-1", "gate") is None
+        assert prewarmer.stats().prewarm_started == 0
+
+    def test_slow_or_failing_warm_falls_back(self):
+        release = threading.Event()
+
+        def slow(flow_key, **context):
+            release.wait(5)
+            return PrewarmedFlow(flow_key=flow_key)
+
+        prewarmer = FlowPrewarmer(slow, wait_seconds=0.01)
+        prewarmer.start("run-1", "gate")
+        assert prewarmer.take("run-1", "gate") is None
+        release.set()
+
+        def failing(flow_key, **context):
+            raise RuntimeError("spec compile failed")
+
+        failing_prewarmer = FlowPrewarmer(failing)
+        failing_prewarmer.start("run-1", "gate")
+        assert failing_prewarmer.take("run-1", "gate") is None
+
+        assert prewarmer.stats().prewarm_discarded == 1
+        assert failing_prewarmer.stats().prewarm_failed == 1
+        prewarmer.shutdown()
+        failing_prewarmer.shutdown()
+
+    def test_transition_latency(self):
+        clock = FakeClock()
+        prewarmer = FlowPrewarmer(_warm, clock=clock)
+        assert prewarmer.record_transition("run-1", "signal") is None  # First flow
+
+        prewarmer.flow_completed("run-1", "signal")
+        clock.now += 0.25
+        payload = prewarmer.record_transition("run-1", "plan", PrewarmedFlow("plan", duration_ms=9))
+        assert payload == {
+            "from_flow": "signal",
+            "to_flow": "plan",
+            "latency_ms": 250.0,
+            "prewarmed": True,
+            "prewarm_ms": 9,
+        }
+
+        prewarmer.flow_completed("run-1", "plan")
+        clock.now += 0.75
+        assert prewarmer.record_transition("run-1", "build")["prewarmed"] is False
+
+        stats = prewarmer.stats().to_dict()
+        assert stats["transitions"] == 2
+        assert 250.0 <= stats["p50_latency_ms"] <= stats["p95_latency_ms"] <= 760.0
+
+
+class TestPredictNextFlow:
+    def _navigator(self, **overrides) -> MacroNavigator:
+        plan = RunPlanSpec(
+            flow_sequence=["signal", "plan", "build", "gate", "deploy"],
+            human_policy=overrides.pop("human_policy", HumanPolicy.autopilot()),
+            **overrides,
+        )
+        return MacroNavigator(plan)
+
+    def test_follows_sequence(self):
+        nav = self._navigator()
+        assert nav.predict_next_flow("signal") == "plan"
+        assert nav.predict_next_flow("gate") == "deploy"
+        assert nav.predict_next_flow("deploy") is None
+        assert nav.predict_next_flow("unknown") is None
+
+    def test_prefers_observed_successor(self):
+        nav = self._navigator()
+        for flow_key in ["build", "gate", "build", "gate", "build", "gate"]:
+            nav._record_execution(flow_key)
+        assert nav.predict_next_flow("gate") == "build"
+
+    def test_no_prediction_when_run_will_stop_or_pause(self):
+        assert self._navigator(max_total_flows=1).predict_next_flow("signal") is None
+        supervised = self._navigator(human_policy=HumanPolicy.supervised())
+        assert supervised.predict_next_flow("signal") is None
+        approval = self._navigator(human_policy=HumanPolicy(require_approval_flows=["gate"]))
+        assert approval.predict_next_flow("gate") is None
+        assert approval.predict_next_flow("build") == "gate"
+
+
+@pytest.fixture
+def orchestrator():
+    orch = StepwiseOrchestrator(
+        engine=ClaudeStepEngine(repo_root, mode="stub"),
+        repo_root=repo_root,
+        skip_preflight=True,
+        routing_mode=RoutingMode.DETERMINISTIC_ONLY,
+    )
+    run_ids = []
+    yield orch, run_ids
+    orch.close()
+    for run_id in run_ids:
+        shutil.rmtree(storage.get_run_path(run_id), ignore_errors=True)
+
+
+class TestOrchestratorPrewarm:
+    def test_warm_work_matches_cold_load(self, orchestrator):
+        orch, _ = orchestrator
+        warmed = orch._prewarm_flow("gate")
+        cold = orch._load_flow_definition("gate")
+        assert [s.id for s in warmed.flow_def.steps] == [s.id for s in cold.steps]
+        assert sorted(warmed.flow_graph.nodes) == sorted(s.id for s in cold.steps)
+
+    def test_warm_work_has_no_side_effects(self, monkeypatch, tmp_path):
+        import swarm.runtime.preflight as preflight
+
+        monkeypatch.setattr(
+            preflight, "run_preflight", lambda *a, **kw: pytest.fail("preflight was pre-warmed")
+        )
+        orch = StepwiseOrchestrator(
+            engine=ClaudeStepEngine(repo_root, mode="stub"),
+            repo_root=repo_root,
+            routing_mode=RoutingMode.DETERMINISTIC_ONLY,
+        )
+        orch._prewarm_hook("run-1", "gate")()
+        assert orch._claim_prewarmed_flow("run-1", "gate").flow_def.key == "gate"
+        orch.close()
+
+    def test_close_stops_workers(self, orchestrator):
+        orch, _ = orchestrator
+        orch._prewarm_hook("run-1", "gate")()
+        executor = orch._flow_prewarmer._executor
+        assert executor is not None
+
+        orch.close()
+        assert executor._shutdown
+        assert orch._flow_prewarmer._executor is None
+        orch.close()
+
+    def test_final_step_starts_prewarm_and_transition_is_recorded(self, orchestrator):
+        orch, run_ids = orchestrator
+        run_id = f"prewarm-{uuid.uuid4().hex[:8]}"
+        run_ids.append(run_id)
+        spec = RunSpec(
+            flow_keys=["signal", "plan"],
+            profile_id=None,
+            backend="claude-step-orchestrator",
+            initiator="test",
+        )
+        flow_def = orch._load_flow_definition("signal")
+        started_at = []
+
+        def hook():
+            started_at.append(len(storage.read_events(run_id)))
+            orch._prewarm_hook(run_id, "plan")()
+
+        orch._execute_stepwise(run_id, "signal", flow_def, spec, on_final_step=hook)
+        orch._flow_prewarmer.flow_completed(run_id, "signal")
+        assert len(started_at) == 1
+
+        warmed = orch._claim_prewarmed_flow(run_id, "plan")
+        assert warmed is not None and warmed.flow_def.key == "plan"
+        orch._emit_flow_transition(run_id, "plan", warmed)
+
+        transitions = [e for e in storage.read_events(run_id) if e.kind == "flow_transition"]
+        assert len(transitions) == 1
+        assert transitions[0].payload["from_flow"] == "signal"
+        assert transitions[0].payload["prewarmed"] is True
+        stats = orch.get_flow_transition_stats()
+        assert (stats.transitions, stats.prewarm_hits) == (1, 1)
+
+    def test_disabled(self):
+        orch = StepwiseOrchestrator(
+            engine=ClaudeStepEngine(repo_root, mode="stub"),
+            repo_root=repo_root,
+            skip_preflight=True,
+            prewarm_flows=False,
+        )
+        assert orch._prewarm_hook("run-1", "plan") is None
+        assert orch._claim_prewarmed_flow("run-1", "plan") is None
+
+        # Transitions are still measured
+        run_id = f"prewarm-{uuid.uuid4().hex[:8]}"
+        orch._flow_prewarmer.flow_completed(run_id, "signal")
+        try:
+            orch._emit_flow_transition(run_id, "plan", None)
+            (transition,) = [
+                e for e in storage.read_events(run_id) if e.kind == "flow_transition"
+            ]
+        finally:
+            shutil.rmtree(storage.get_run_path(run_id), ignore_errors=True)
+        assert transition.payload["prewarmed"] is False
+        stats = orch.get_flow_transition_stats()
+        assert (stats.transitions, stats.prewarm_started) == (1, 0)
+        assert orch._flow_prewarmer._executor is None
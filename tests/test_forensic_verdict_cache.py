@@ -0,0 +1,327 @@
+"""Tests for the evidence-hash keyed forensic verdict cache.
+
+Covers:
+- Cached verdicts equal freshly computed ones and are independent copies
+- Changed diff, test evidence, coverage or claims miss; irrelevant handoff fields hit
+- build_forensic_verdict keys include the previous test summary
+- Persistence under RUN_BASE/forensics: reruns reuse verdicts, hit counters accumulate
+- Writers sharing a file merge entries and counters under its file lock
+- Per-run registry and the stats reported for run metrics
+- Read-only access for viewers (archived runs, Flow Studio endpoint)
+- StatsDB projection of run_completed verdict cache stats
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from swarm.runtime import forensic_comparator as fc
+from swarm.runtime import forensic_types, run_archive, storage
+from swarm.runtime.diff_scanner import FileDiff
+from swarm.runtime.forensic_comparator import (
+    ForensicVerdictCache,
+    VerdictRecommendation,
+    build_forensic_verdict,
+    compare_claim_vs_evidence,
+    forensic_verdict_cache_stats,
+    forensic_verdict_to_dict,
+    get_forensic_verdict_cache,
+    read_forensic_verdict_cache,
+    reset_forensic_verdict_caches,
+)
+from swarm.runtime.forensic_types import DiffScanResult
+
+HANDOFF = {
+    "status": "VERIFIED",
+    "summary": "Updated the parser; all tests pass",
+    "confidence": "high",
+    "can_further_iteration_help": False,
+    "timestamp": "2026-01-01T00:00:00Z",
+}
+
+
+def _diff(insertions: int = 10) -> DiffScanResult:
+    return DiffScanResult(
+        files=[FileDiff(path="src/parser.py", status="M", insertions=insertions)],
+        total_insertions=insertions,
+    )
+
+
+def _tests(failed: int = 2, coverage=None) -> forensic_types.TestParseResult:
+    return forensic_types.TestParseResult(
+        total_tests=10, passed=10 - failed, failed=failed, skipped=0, coverage_percent=coverage
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    reset_forensic_verdict_caches()
+    yield
+    reset_forensic_verdict_caches()
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    calls = []
+    real = fc._extract_handoff_claims
+
+    def counting(handoff):
+        calls.append(handoff)
+        return real(handoff)
+
+    # Called once for the key and once more for each computed verdict
+    monkeypatch.setattr(fc, "_extract_handoff_claims", counting)
+    return calls
+
+
+def _without_timestamp(verdict):
+    data = forensic_verdict_to_dict(verdict)
+    data.pop("timestamp")
+    return data
+
+
+class TestCompareCache:
+    def test_hit_returns_equal_independent_copy(self):
+        cache = ForensicVerdictCache()
+        first = compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+        first.discrepancies.clear()
+        second = compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+
+        expected = compare_claim_vs_evidence(HANDOFF, _diff(), _tests())
+        assert _without_timestamp(second) == _without_timestamp(expected)
+        assert second.recommendation == VerdictRecommendation.REJECT
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "stores": 1,
+            "entries": 1,
+            "hit_rate": 0.5,
+        }
+
+    def test_evidence_changes_invalidate(self, counted):
+        cache = ForensicVerdictCache()
+        compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+        counted.clear()
+
+        compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+        assert len(counted) == 1  # Key only
+
+        variants = [
+            (HANDOFF, _diff(insertions=11), _tests()),
+            (HANDOFF, _diff(), _tests(failed=0)),
+            (HANDOFF, _diff(), _tests(coverage=80.0)),
+            (HANDOFF, None, _tests()),
+            ({**HANDOFF, "status": "UNVERIFIED"}, _diff(), _tests()),
+            ({**HANDOFF, "test_count": 50}, _diff(), _tests()),
+        ]
+        for handoff, diff, tests in variants:
+            counted.clear()
+            verdict = compare_claim_vs_evidence(handoff, diff, tests, cache=cache)
+            assert len(counted) == 2, (handoff, diff, tests)
+            assert _without_timestamp(verdict) == _without_timestamp(
+                compare_claim_vs_evidence(handoff, diff, tests)
+            )
+
+    def test_irrelevant_handoff_fields_hit(self):
+        cache = ForensicVerdictCache()
+        compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+        compare_claim_vs_evidence(
+            {**HANDOFF, "timestamp": "later", "artifacts": {"x": 1}}, _diff(), _tests(), cache=cache
+        )
+        assert cache.stats()["hits"] == 1
+
+    def test_build_keys_include_previous_summary(self):
+        cache = ForensicVerdictCache()
+        previous = forensic_types.TestParseResult(total_tests=12, passed=12, failed=0, skipped=0)
+        regressed = build_forensic_verdict(HANDOFF, _diff(), _tests(), previous, cache=cache)
+        plain = build_forensic_verdict(HANDOFF, _diff(), _tests(), cache=cache)
+        assert len(regressed.discrepancies) == len(plain.discrepancies) + 1
+
+        again = build_forensic_verdict(HANDOFF, _diff(), _tests(), previous, cache=cache)
+        assert _without_timestamp(again) == _without_timestamp(regressed)
+        assert cache.stats()["hits"] == 1
+
+
+class TestPersistence:
+    def test_rerun_reuses_persisted_verdicts(self, tmp_path):
+        path = tmp_path / "forensics" / fc.VERDICT_CACHE_FILENAME
+        cache = ForensicVerdictCache(path)
+        first = compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+        compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+        cache.flush()
+
+        rerun = ForensicVerdictCache(path)
+        replayed = compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=rerun)
+        assert forensic_verdict_to_dict(replayed) == forensic_verdict_to_dict(first)
+        assert rerun.stats() == {
+            "hits": 2,
+            "misses": 1,
+            "stores": 1,
+            "entries": 1,
+            "hit_rate": 0.6667,
+        }
+
+    def test_writers_merge_entries_and_counters(self, tmp_path):
+        path = tmp_path / "forensics" / fc.VERDICT_CACHE_FILENAME
+        # Two processes with the same run open, both loaded before either wrote
+        first, second = ForensicVerdictCache(path), ForensicVerdictCache(path)
+        assert len(first) == len(second) == 0
+
+        compare_claim_vs_evidence(HANDOFF, _diff(1), _tests(), cache=first)
+        compare_claim_vs_evidence(HANDOFF, _diff(2), _tests(), cache=second)
+        compare_claim_vs_evidence(HANDOFF, _diff(1), _tests(), cache=second)
+        first.flush()
+        second.flush()
+
+        assert second.stats() == {
+            "hits": 1,
+            "misses": 2,
+            "stores": 2,
+            "entries": 2,
+            "hit_rate": 0.3333,
+        }
+        assert ForensicVerdictCache(path).stats() == second.stats()
+        assert (tmp_path / "forensics" / "verdict_cache.json.lock").exists()
+
+    def test_unreadable_or_outdated_file_is_ignored(self, tmp_path):
+        path = tmp_path / "verdict_cache.json"
+        path.write_text("{not json")
+        assert len(ForensicVerdictCache(path)) == 0
+
+        path.write_text(json.dumps({"version": 0, "entries": {"k": {}}}))
+        assert len(ForensicVerdictCache(path)) == 0
+
+    def test_eviction(self):
+        cache = ForensicVerdictCache(max_entries=2)
+        for insertions in (1, 2, 3):
+            compare_claim_vs_evidence(HANDOFF, _diff(insertions), _tests(), cache=cache)
+        assert len(cache) == 2
+        compare_claim_vs_evidence(HANDOFF, _diff(1), _tests(), cache=cache)
+        assert cache.stats()["hits"] == 0
+
+
+class TestRunRegistry:
+    def test_shared_per_run_and_reported_for_metrics(self, tmp_path):
+        run_base = tmp_path / "swarm" / "runs" / "run-1" / "build"
+        assert forensic_verdict_cache_stats(run_base) is None
+
+        cache = get_forensic_verdict_cache(run_base)
+        assert get_forensic_verdict_cache(tmp_path / "swarm/runs/run-1/build/.") is cache
+        assert get_forensic_verdict_cache(tmp_path / "swarm/runs/run-2/build") is not cache
+
+        compare_claim_vs_evidence(HANDOFF, _diff(), None, cache=cache)
+        compare_claim_vs_evidence(HANDOFF, _diff(), None, cache=cache)
+        stats = forensic_verdict_cache_stats(run_base)
+        assert stats["hit_rate"] == 0.5
+
+        saved = json.loads((run_base / "forensics" / "verdict_cache.json").read_text())
+        assert saved["stats"] == {"hits": 1, "misses": 1, "stores": 1}
+
+
+class TestReader:
+    def test_reads_without_counting(self, tmp_path):
+        run_base = tmp_path / "run-1" / "build"
+        assert read_forensic_verdict_cache(run_base) is None
+
+        cache = get_forensic_verdict_cache(run_base)
+        verdict = compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+        compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+        cache.flush()
+
+        for _ in range(2):
+            cached = read_forensic_verdict_cache(run_base)
+            assert cached["stats"] == cache.stats()
+        (saved,) = cached["verdicts"].values()
+        assert saved == forensic_verdict_to_dict(verdict)
+
+    def test_archived_run(self, tmp_path):
+        run_archive.reset_bundle_cache()
+        run_path = storage.create_run_dir("run-1", tmp_path)
+        cache = ForensicVerdictCache(run_path / "build" / "forensics" / fc.VERDICT_CACHE_FILENAME)
+        compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+        run_archive.archive_run(run_path)
+
+        assert not (run_path / "build").exists()
+        cached = read_forensic_verdict_cache(run_path / "build")
+        assert cached["stats"]["stores"] == 1
+        assert len(cached["verdicts"]) == 1
+        run_archive.reset_bundle_cache()
+
+    def test_flow_studio_endpoint(self, tmp_path, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        from swarm.runtime.types import RunEvent
+        from swarm.tools.flow_studio_fastapi import app
+
+        run_path = storage.create_run_dir("run-1", tmp_path)
+        storage.append_event(
+            "run-1",
+            RunEvent(run_id="run-1", ts=None, kind="run_completed", flow_key="build", payload={}),
+            tmp_path,
+        )
+        cache = get_forensic_verdict_cache(run_path / "build")
+        compare_claim_vs_evidence(HANDOFF, _diff(), _tests(), cache=cache)
+        monkeypatch.setattr(
+            storage, "find_run_path", lambda run_id: run_path if run_id == "run-1" else None
+        )
+
+        client = TestClient(app)
+        data = client.get("/api/runs/run-1/forensics/verdicts").json()
+        assert list(data["flows"]) == ["build"]
+        assert data["flows"]["build"]["stats"]["misses"] == 1
+        assert len(data["flows"]["build"]["verdicts"]) == 1
+
+        empty = client.get("/api/runs/run-1/forensics/verdicts", params={"flow": "gate"}).json()
+        assert empty["flows"] == {} and empty["message"]
+        assert client.get("/api/runs/no-such-run/forensics/verdicts").status_code == 404
+
+
+class TestStatsDBProjection:
+    def test_run_completed_stats_are_projected(self):
+        pytest.importorskip("duckdb")
+        from swarm.runtime.db import StatsDB
+
+        db = StatsDB(None)
+        try:
+            db.ingest_events(
+                [
+                    {
+                        "event_id": f"evt-{seq}",
+                        "seq": seq,
+                        "ts": f"2026-01-01T00:00:0{seq}+00:00",
+                        "kind": kind,
+                        "flow_key": flow_key,
+                        "step_id": None,
+                        "payload": payload,
+                    }
+                    for seq, kind, flow_key, payload in [
+                        (1, "run_started", "signal", {"flow_keys": ["signal", "build"]}),
+                        (2, "run_completed", "signal", {"steps_completed": 2}),
+                        (
+                            3,
+                            "run_completed",
+                            "build",
+                            {
+                                "steps_completed": 5,
+                                "forensic_verdict_cache": {
+                                    "hits": 3,
+                                    "misses": 1,
+                                    "stores": 1,
+                                    "entries": 1,
+                                    "hit_rate": 0.75,
+                                },
+                            },
+                        ),
+                    ]
+                ],
+                "run-1",
+            )
+
+            (row,) = db.get_forensic_verdict_cache_stats("run-1")
+            assert (row.flow_key, row.hits, row.misses, row.entries) == ("build", 3, 1, 1)
+            assert row.hit_rate == 0.75
+            assert db.get_run_stats("run-1").verdict_cache_hit_rate == 0.75
+        finally:
+            db.close()
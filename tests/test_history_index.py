@@ -0,0 +1,162 @@
+"""Tests for the incremental history index.
+
+Covers:
+- Prioritized order matches prioritize_history
+- Budgeted selection is identical to the classify-sort-greedy reference
+- Items are classified once, as they are appended; rebuild on rewritten history
+- Per-list indexes persist across prompt builds
+- Local token estimator sanity
+"""
+
+from __future__ import annotations
+
+import random
+from functools import partial
+from typing import Any, Dict, List
+
+import pytest
+
+from swarm.runtime import history_priority as hp
+from swarm.runtime.history_priority import (
+    HistoryIndex,
+    estimate_tokens,
+    get_priority_label,
+    history_index_for,
+    prioritize_history,
+    render_history_step,
+)
+
+STEP_IDS = [
+    "signal_normalizer",
+    "requirements_author",
+    "adr_author",
+    "code_implementer",
+    "code_critic",
+    "test_author",
+    "context_loader",
+    "gh_reporter",
+    "clarifier",
+    "merge_decider",
+]
+
+
+def _history(n: int, rng: random.Random) -> List[Dict[str, Any]]:
+    history = []
+    for i in range(n):
+        item: Dict[str, Any] = {
+            "step_id": rng.choice(STEP_IDS),
+            "status": rng.choice(["succeeded", "failed"]),
+            "output": "x" * rng.randint(0, 3000),
+        }
+        if rng.random() < 0.2:
+            item["error"] = "e" * rng.randint(1, 400)
+        if rng.random() < 0.1:
+            item["agent_key"] = "deploy-decider"
+        history.append(item)
+    return history
+
+
+def _reference(history, budget, recent_max, older_max):
+    """The per-step algorithm: classify, sort, render and fit greedily."""
+    most_recent_idx = len(history) - 1
+    included = []
+    used = 0
+    for priority, idx, item in prioritize_history(history):
+        text = render_history_step(
+            priority, item, idx == most_recent_idx, recent_max=recent_max, older_max=older_max
+        )
+        if used + len(text) > budget:
+            continue
+        included.append((idx, text))
+        used += len(text)
+    included.sort()
+    return included, used
+
+
+class TestSelection:
+    def test_prioritized_matches_prioritize_history(self):
+        history = _history(200, random.Random(1))
+        assert HistoryIndex(history).prioritized() == prioritize_history(history)
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_identical_selection_under_equal_budgets(self, seed):
+        rng = random.Random(seed)
+        history = _history(rng.randint(1, 80), rng)
+        index = HistoryIndex()
+        for count in range(1, len(history) + 1):
+            index.sync(history[:count])
+            budget = rng.randint(0, 40000)
+            render = partial(render_history_step, recent_max=2000, older_max=500)
+            selection = index.select(budget, render=render)
+
+            expected, used = _reference(history[:count], budget, 2000, 500)
+            assert [(idx, text) for _, idx, _, text in selection.included] == expected
+            assert selection.used == used <= budget
+            assert selection.truncated == (len(expected) < count)
+
+    def test_distribution_and_token_budget(self):
+        history = _history(40, random.Random(5))
+        render = partial(render_history_step, recent_max=1000, older_max=200)
+        selection = HistoryIndex(history).select(3000, render=render, measure=estimate_tokens)
+
+        assert selection.used <= 3000
+        assert selection.used == sum(estimate_tokens(t) for _, _, _, t in selection.included)
+        counts = selection.priority_distribution()
+        assert sum(counts.values()) == len(selection.included)
+        for priority, _, _, _ in selection.included:
+            assert counts[get_priority_label(priority)] > 0
+
+
+class TestIncremental:
+    def test_items_are_classified_once(self, monkeypatch):
+        calls: List[str] = []
+        real = hp.classify_history_item
+
+        def counting(item):
+            calls.append(item["step_id"])
+            return real(item)
+
+        monkeypatch.setattr(hp, "classify_history_item", counting)
+        history = _history(10, random.Random(2))
+        index = HistoryIndex()
+        for count in range(1, len(history) + 1):
+            index.sync(history[:count])
+        index.sync(history)
+        assert len(calls) == 10
+
+    def test_rewritten_history_rebuilds(self):
+        history = _history(10, random.Random(3))
+        index = HistoryIndex(history)
+        history[4] = {"step_id": "merge_decider", "status": "succeeded", "output": "ok"}
+        index.sync(history)
+        assert index.prioritized() == prioritize_history(history)
+
+        del history[6:]
+        index.sync(history)
+        assert len(index) == 6
+        assert index.prioritized() == prioritize_history(history)
+
+    def test_index_persists_per_history_list(self):
+        history = _history(5, random.Random(4))
+        index = history_index_for(history)
+        history.append({"step_id": "code_critic", "status": "succeeded", "output": "ok"})
+        assert history_index_for(history) is index
+        assert len(index) == 6
+        assert history_index_for(list(history)) is not index
+
+
+class TestEstimateTokens:
+    def test_estimates(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("   \n\t") == 0
+        assert estimate_tokens("hello world") == 2
+        assert estimate_tokens("1234567") == 3
+        assert estimate_tokens("a.b(c)") == 6
+        assert estimate_tokens("internationalization") == 4
+
+    def test_in_range_of_chars_per_token(self):
+        text = (
+            "def prioritize_history(history):\n"
+            "    return sorted(history, key=lambda item: -classify(item))\n"
+        ) * 20
+        assert len(text) / 6 < estimate_tokens(text) < len(text) / 2
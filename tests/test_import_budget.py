@@ -0,0 +1,244 @@
+"""Import-time budget for the CLI and server entry points.
+
+Each entry point is started in a fresh interpreter with `-X importtime`;
+imports made after interpreter startup (everything after `site`) count
+towards its budget.
+
+Covers:
+- Entry points stay within their import-time budget (wall clock; only with
+  SWARM_PERF_ASSERTIONS=1, as machine load makes it flaky)
+- Heavy modules (DuckDB, engines, the stepwise orchestrator, the spec
+  compiler, API routes) stay out of startup until they are used
+- swarm.api exposes the server lazily; the API app is built once, on first
+  access, even when threads race for it
+- Flow Studio runs the validator on first use, not at startup
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from typing import Dict, List, Tuple
+from unittest.mock import Mock
+
+import pytest
+
+repo_root = Path(__file__).resolve().parent.parent
+
+# Best of this many runs is compared against the budget
+RUNS = 3
+
+PERF_ASSERTIONS_ENV = "SWARM_PERF_ASSERTIONS"
+
+# (name, python arguments, budget in ms, modules that must not be imported).
+# Budgets are about twice the measured time on a developer laptop.
+ENTRY_POINTS: List[Tuple[str, List[str], float, Tuple[str, ...]]] = [
+    (
+        "validate_swarm --help",
+        ["swarm/tools/validate_swarm.py", "--help"],
+        150,
+        ("yaml", "fastapi", "pydantic", "duckdb", "swarm.runtime", "swarm.spec"),
+    ),
+    (
+        "validate_swarm --check-modified",
+        ["swarm/tools/validate_swarm.py", "--check-modified"],
+        150,
+        ("fastapi", "pydantic", "duckdb", "swarm.runtime", "swarm.spec"),
+    ),
+    (
+        "selftest --help",
+        ["swarm/tools/selftest.py", "--help"],
+        200,
+        ("yaml", "fastapi", "duckdb", "swarm.runtime", "concurrent.futures.process"),
+    ),
+    (
+        "swarm.api.server --help",
+        ["-m", "swarm.api.server", "--help"],
+        900,
+        ("duckdb", "swarm.api.routes", "swarm.runtime.engines", "swarm.spec"),
+    ),
+    (
+        "swarm.api.server:app",
+        ["-c", "from swarm.api.server import app"],
+        1300,
+        (
+            "duckdb",
+            "swarm.runtime.db",
+            "swarm.runtime.engines",
+            "swarm.runtime.stepwise",
+            "swarm.spec",
+        ),
+    ),
+    (
+        "flow_studio_fastapi:app",
+        ["-c", "from swarm.tools.flow_studio_fastapi import app"],
+        1600,
+        (
+            "duckdb",
+            "swarm.api.server",
+            "swarm.api.routes",
+            "swarm.runtime.db",
+            "swarm.runtime.engines",
+            "swarm.runtime.stepwise",
+            "swarm.spec",
+        ),
+    ),
+]
+
+
+def parse_importtime(stderr: str) -> Tuple[float, Dict[str, float]]:
+    """Parse `-X importtime` output.
+
+    Returns:
+        (milliseconds spent importing after interpreter startup,
+         cumulative milliseconds per imported module)
+    """
+    total_us = 0
+    modules: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        module = name.strip()
+        modules[module] = int(cumulative) / 1000
+        if not name.startswith("  "):  # Top-level import
+            total_us = 0 if module == "site" else total_us + int(cumulative)
+    return total_us / 1000, modules
+
+
+def measure(args: List[str]) -> Tuple[float, Dict[str, float]]:
+    env = dict(os.environ, PYTHONPATH=str(repo_root))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=repo_root,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    return parse_importtime(result.stderr)
+
+
+def test_parse_importtime():
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 | encodings",
+            "import time:      2000 |       5000 | site",
+            "import time:       300 |        300 |     re._parser",
+            "import time:       700 |       1000 |   re",
+            "import time:       500 |       1500 | argparse",
+            "import time:       250 |        250 | json",
+        ]
+    )
+    total_ms, modules = parse_importtime(stderr)
+    assert total_ms == 1.75
+    assert modules["re"] == 1.0
+    assert "site" in modules
+
+
+@pytest.mark.parametrize(
+    "args,forbidden",
+    [(entry[1], entry[3]) for entry in ENTRY_POINTS],
+    ids=[entry[0] for entry in ENTRY_POINTS],
+)
+def test_entry_point_skips_heavy_modules(args, forbidden):
+    _, modules = measure(args)
+    loaded = [name for name in forbidden if name in modules]
+    assert loaded == [], f"Heavy modules imported at startup: {loaded}"
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(
+    os.environ.get(PERF_ASSERTIONS_ENV) != "1",
+    reason=f"wall-clock import budget; set {PERF_ASSERTIONS_ENV}=1 to run",
+)
+@pytest.mark.parametrize(
+    "args,budget_ms",
+    [entry[1:3] for entry in ENTRY_POINTS],
+    ids=[entry[0] for entry in ENTRY_POINTS],
+)
+def test_entry_point_import_budget(args, budget_ms):
+    samples = [measure(args) for _ in range(RUNS)]
+    total_ms, modules = min(samples, key=lambda sample: sample[0])
+
+    slowest = sorted(modules.items(), key=lambda item: -item[1])[:5]
+    assert total_ms <= budget_ms, f"{total_ms:.0f}ms > {budget_ms}ms; slowest: {slowest}"
+
+
+class TestLazyExports:
+    def test_api_package_loads_server_on_access(self):
+        code = (
+            "import sys, swarm.api.responses; "
+            "assert 'swarm.api.server' not in sys.modules; "
+            "from swarm.api import create_app, specs_router; "
+            "import swarm.api.server as server; "
+            "assert 'app' not in vars(server); "
+            "from swarm.api import app; "
+            "assert vars(server)['app'] is app"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=repo_root,
+            env=dict(os.environ, PYTHONPATH=str(repo_root)),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_concurrent_first_access_builds_one_app(self):
+        code = textwrap.dedent(
+            """
+            import threading
+            import swarm.api.server as server
+
+            calls = []
+            real = server.create_app
+            server.create_app = lambda: calls.append(1) or real()
+            barrier = threading.Barrier(8)
+            apps = []
+
+            def get():
+                barrier.wait()
+                apps.append(server.app)
+
+            threads = [threading.Thread(target=get) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert len(calls) == 1, calls
+            assert all(a is apps[0] for a in apps)
+            """
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=repo_root,
+            env=dict(os.environ, PYTHONPATH=str(repo_root)),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_flow_studio_validation_loads_on_first_use(self, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        from swarm.tools import flow_studio_fastapi
+
+        validation = Mock(return_value={"version": "1.0.0", "summary": {}})
+        monkeypatch.setattr(flow_studio_fastapi, "get_validation_data", validation)
+        client = TestClient(flow_studio_fastapi.create_fastapi_app())
+        assert validation.call_count == 0
+
+        health = client.get("/api/health").json()
+        assert health["capabilities"]["validation"] is True
+        assert validation.call_count == 0
+
+        for _ in range(2):
+            assert client.get("/api/validation").json()["data"]["version"] == "1.0.0"
+        assert validation.call_count == 1
@@ -0,0 +1,262 @@
+"""Tests for signal-driven utility-flow trigger detection.
+
+Covers:
+- Detectors are only re-evaluated when one of their declared signals changes
+- Lint detection depends on lint checks only, not the whole verification result
+- Results are remembered per run; triggered results are replayed unchanged
+- Custom detectors with and without declared signals
+- Shared upstream status: one git query per repo until refs move
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from swarm.runtime import diff_scanner
+from swarm.runtime import utility_flow_injection as ufi
+from swarm.runtime.types import RunState
+from swarm.runtime.utility_flow_injection import (
+    InjectionTrigger,
+    InjectionTriggerDetector,
+    TriggerDetectionResult,
+    TriggerSignal,
+    UtilityFlowRegistry,
+)
+
+ALL_TRIGGERS = [
+    InjectionTrigger.UPSTREAM_DIVERGED,
+    InjectionTrigger.LINT_FAILURE,
+    InjectionTrigger.SECURITY_CONCERN,
+    InjectionTrigger.CONFLICT_DETECTED,
+    InjectionTrigger.TEST_FLAKE,
+    InjectionTrigger.ENV_SETUP_FAILURE,
+    "custom",
+]
+
+
+@pytest.fixture
+def registry(tmp_path) -> UtilityFlowRegistry:
+    flows = tmp_path / "swarm" / "spec" / "flows"
+    flows.mkdir(parents=True)
+    for trigger in ALL_TRIGGERS:
+        spec = {
+            "id": f"{trigger}-flow",
+            "metadata": {"is_utility_flow": True, "injection_trigger": trigger},
+            "nodes": [{"node_id": "uf-fix"}],
+        }
+        (flows / f"{trigger}.graph.json").write_text(json.dumps(spec))
+    return UtilityFlowRegistry(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def fresh_upstream_cache():
+    ufi.clear_upstream_status_cache()
+    yield
+    ufi.clear_upstream_status_cache()
+
+
+def _counting(detector: InjectionTriggerDetector) -> List[str]:
+    """Wrap every registered detector so evaluations are recorded."""
+    calls: List[str] = []
+    for trigger in list(detector._detectors):
+        fn = detector._detectors[trigger]
+
+        def wrapped(context, _trigger=trigger, _fn=fn):
+            calls.append(_trigger)
+            return _fn(context)
+
+        detector.register_detector(trigger, wrapped, detector.signals_for(trigger))
+    return calls
+
+
+def _run(run_id: str = "run-1") -> RunState:
+    return RunState(run_id=run_id, flow_key="build")
+
+
+VERIFICATION = {"checks": [{"name": "unit-tests", "passed": False}]}
+
+
+class TestIncrementalEvaluation:
+    def test_unchanged_signals_are_not_re_evaluated(self, registry):
+        detector = InjectionTriggerDetector(registry)
+        calls = _counting(detector)
+        step = {"status": "succeeded", "output": "done"}
+
+        detector.check_triggers(step, _run(), verification_result=VERIFICATION)
+        assert len(calls) == 6
+        calls.clear()
+
+        detector.check_triggers(step, _run(), verification_result=VERIFICATION)
+        assert calls == []
+        assert detector.stats() == {"evaluated": 6, "reused": 6}
+
+    def test_only_affected_detectors_rerun(self, registry):
+        detector = InjectionTriggerDetector(registry)
+        calls = _counting(detector)
+        step = {"output": "done"}
+        detector.check_triggers(step, _run(), verification_result=VERIFICATION)
+
+        calls.clear()
+        detector.check_triggers({"output": "next step"}, _run(), verification_result=VERIFICATION)
+        assert sorted(calls) == sorted(
+            [
+                InjectionTrigger.UPSTREAM_DIVERGED,
+                InjectionTrigger.CONFLICT_DETECTED,
+                InjectionTrigger.ENV_SETUP_FAILURE,
+            ]
+        )
+
+        calls.clear()
+        detector.check_triggers(
+            {"output": "next step"},
+            _run(),
+            file_changes={"modified": ["src/app.py"]},
+            verification_result=VERIFICATION,
+        )
+        assert calls == [InjectionTrigger.SECURITY_CONCERN]
+
+    def test_lint_detector_ignores_non_lint_checks(self, registry):
+        detector = InjectionTriggerDetector(registry)
+        calls = _counting(detector)
+        step = {"output": "done"}
+        detector.check_triggers(step, _run(), verification_result=VERIFICATION)
+        calls.clear()
+
+        other = {"checks": [{"name": "unit-tests", "passed": True}]}
+        detector.check_triggers(step, _run(), verification_result=other)
+        assert InjectionTrigger.LINT_FAILURE not in calls
+        assert InjectionTrigger.TEST_FLAKE in calls
+
+        lint = {"checks": [{"name": "ruff", "passed": False}]}
+        result = detector.check_triggers(step, _run(), verification_result=lint)
+        assert result.trigger_type == InjectionTrigger.LINT_FAILURE
+
+    def test_triggered_result_is_replayed(self, registry):
+        detector = InjectionTriggerDetector(registry)
+        step = {"output": "pip install failed: no network"}
+        first = detector.check_triggers(step, _run())
+        second = detector.check_triggers(step, _run())
+        assert first.triggered and second.triggered
+        assert second.trigger_type == InjectionTrigger.ENV_SETUP_FAILURE
+        assert second.flow_id == "env_setup_failure-flow"
+        assert detector.stats()["reused"] == 6
+
+    def test_results_are_per_run(self, registry):
+        detector = InjectionTriggerDetector(registry)
+        calls = _counting(detector)
+        detector.check_triggers({"output": "x"}, _run("run-1"))
+        detector.check_triggers({"output": "x"}, _run("run-2"))
+        assert len(calls) == 12
+
+        detector.forget_run("run-1")
+        calls.clear()
+        detector.check_triggers({"output": "x"}, _run("run-1"))
+        assert len(calls) == 6
+
+
+class TestCustomDetectors:
+    def test_declared_and_undeclared_signals(self, registry):
+        seen: List[str] = []
+
+        def custom(context):
+            seen.append(context["git_status"].get("branch", ""))
+            return TriggerDetectionResult(triggered=False)
+
+        custom.trigger_signals = (TriggerSignal.GIT_STATUS,)
+        detector = InjectionTriggerDetector(registry, custom_detectors={"custom": custom})
+        assert detector.signals_for("custom") == (TriggerSignal.GIT_STATUS,)
+
+        detector.check_triggers({"output": "a"}, _run(), git_status={"branch": "main"})
+        detector.check_triggers({"output": "b"}, _run(), git_status={"branch": "main"})
+        detector.check_triggers({"output": "b"}, _run(), git_status={"branch": "feat"})
+        assert seen == ["main", "feat"]
+
+        detector.register_detector("custom", custom)
+        assert detector.signals_for("custom") == TriggerSignal.ALL
+
+    def test_unknown_signal_rejected(self, registry):
+        detector = InjectionTriggerDetector(registry)
+        with pytest.raises(ValueError, match="Unknown trigger signal"):
+            detector.register_detector("custom", lambda ctx: None, ["weather"])
+
+    def test_failing_detector_is_retried(self, registry):
+        attempts: List[int] = []
+
+        def flaky(context):
+            attempts.append(1)
+            raise RuntimeError("boom")
+
+        detector = InjectionTriggerDetector(registry, custom_detectors={"custom": flaky})
+        detector.check_triggers({"output": "a"}, _run())
+        detector.check_triggers({"output": "a"}, _run())
+        assert len(attempts) == 2
+
+
+def _git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def diverged_clone(tmp_path):
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git(origin, "init", "-q", "-b", "main")
+    _git(origin, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "--allow-empty",
+         "-m", "one")
+    clone = tmp_path / "clone"
+    _git(tmp_path, "clone", "-q", str(origin), str(clone))
+    _git(origin, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q",
+         "--allow-empty", "-m", "two")
+    return origin, clone
+
+
+class TestUpstreamStatus:
+    def test_shared_status_refreshes_when_refs_move(self, diverged_clone, monkeypatch):
+        origin, clone = diverged_clone
+        calls: List[List[str]] = []
+        real = diff_scanner._run_git_command
+
+        def counting(args, cwd, timeout=30.0):
+            calls.append(args)
+            return real(args, cwd, timeout)
+
+        monkeypatch.setattr(diff_scanner, "_run_git_command", counting)
+
+        status = ufi.get_upstream_status(clone)
+        assert status["behind_count"] == 0
+        assert ufi.get_upstream_status(clone) == status
+        assert len(calls) == 2  # Second call served from the shared entry
+
+        _git(clone, "fetch", "-q")
+        status = ufi.get_upstream_status(clone)
+        assert status["behind_count"] == 1
+        assert status["upstream"] == "origin/main"
+        assert not status["diverged"]
+
+    def test_no_upstream(self, tmp_path):
+        _git(tmp_path, "init", "-q")
+        assert ufi.get_upstream_status(tmp_path) == {}
+        assert ufi.get_upstream_status(tmp_path / "missing") == {}
+
+    def test_detector_uses_shared_status(self, diverged_clone, registry):
+        _, clone = diverged_clone
+        _git(clone, "fetch", "-q")
+        registry.load()
+        registry._repo_root = clone
+
+        result = InjectionTriggerDetector(registry, track_upstream=True).check_triggers(
+            {"output": "ok"}, _run()
+        )
+        assert result.trigger_type == InjectionTrigger.UPSTREAM_DIVERGED
+        assert result.evidence["behind_count"] == 1
+
+        untracked = InjectionTriggerDetector(registry).check_triggers({"output": "ok"}, _run())
+        assert not untracked.triggered
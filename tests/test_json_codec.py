@@ -0,0 +1,225 @@
+"""Tests and benchmarks for the runtime JSON codec.
+
+Covers:
+- orjson and stdlib backends emit identical bytes for event and envelope payloads
+- Decoding fallbacks (NaN literals, huge ints) and error types match the stdlib
+- `default=` handling for datetimes, dataclasses and unknown types
+- Storage and the API response class use the codec
+- Encode/decode benchmarks over realistic event and envelope payloads
+
+Usage:
+    uv run pytest tests/test_json_codec.py -v --benchmark-only
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
+
+from swarm.runtime import json_codec, storage
+from swarm.runtime.types import (
+    HandoffEnvelope,
+    RoutingDecision,
+    RoutingSignal,
+    RunEvent,
+    handoff_envelope_to_dict,
+    run_event_to_dict,
+)
+
+BACKENDS = ["json"] + (["orjson"] if json_codec.orjson is not None else [])
+
+T0 = datetime(2025, 3, 14, 9, 26, 53, 589000, tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(json_codec, "_USE_ORJSON", request.param == "orjson")
+    assert json_codec.backend() == request.param
+    return request.param
+
+
+def _events(n: int = 200) -> List[Dict[str, Any]]:
+    kinds = [
+        ("step_start", {"step_index": 3, "agent_key": "code-implementer", "attempt": 1}),
+        ("tool_end", {"tool": "Bash", "duration_ms": 412, "success": True, "output_bytes": 5120}),
+        (
+            "step_end",
+            {
+                "status": "succeeded",
+                "duration_ms": 84213,
+                "prompt_tokens": 18234,
+                "completion_tokens": 2211,
+                "cost_usd": 0.4127,
+                "summary": "Implemented retry with jitter — all 42 tests pass ✓",
+            },
+        ),
+        (
+            "navigation_decision",
+            {
+                "decision": "advance",
+                "confidence": 0.87,
+                "candidates": [{"node": "critique_code", "score": 0.87}, {"node": "implement", "score": 0.13}],
+                "reason": None,
+            },
+        ),
+    ]
+    events = []
+    for i in range(n):
+        kind, payload = kinds[i % len(kinds)]
+        event = RunEvent(
+            run_id="run-20250314-092653-a1b2c3",
+            ts=T0 + timedelta(milliseconds=37 * i),
+            kind=kind,
+            flow_key="build",
+            step_id="implement",
+            agent_key="code-implementer",
+            payload=dict(payload),
+        )
+        event.seq = i + 1
+        events.append(run_event_to_dict(event))
+    return events
+
+
+def _envelope() -> Dict[str, Any]:
+    envelope = HandoffEnvelope(
+        step_id="implement",
+        flow_key="build",
+        run_id="run-20250314-092653-a1b2c3",
+        routing_signal=RoutingSignal(
+            decision=RoutingDecision.ADVANCE,
+            reason="Tests pass; critic found no blocking issues",
+            confidence=0.92,
+            needs_human=False,
+        ),
+        summary="Added exponential backoff to the HTTP client. " * 20,
+        artifacts={f"artifact_{i}": f"build/implement/out_{i}.md" for i in range(12)},
+        file_changes={
+            "files": [
+                {"path": f"src/pkg/module_{i}.py", "change_type": "modified", "lines_added": i, "lines_removed": 1}
+                for i in range(40)
+            ]
+        },
+        duration_ms=84213,
+        timestamp=T0,
+    )
+    return handoff_envelope_to_dict(envelope)
+
+
+def _stdlib(obj: Any, indent: bool = False) -> str:
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+class TestByteIdentity:
+    def test_events_match_stdlib(self, backend):
+        for event in _events(40):
+            assert json_codec.dumps(event) == _stdlib(event)
+            assert json_codec.dumpb(event) == _stdlib(event).encode("utf-8")
+
+    def test_envelopes_match_stdlib(self, backend):
+        envelope = _envelope()
+        assert json_codec.dumps(envelope, indent=True) == _stdlib(envelope, indent=True)
+        assert json_codec.dumps(envelope, sort_keys=True) == json.dumps(
+            envelope, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+        )
+
+    def test_non_string_keys_and_empty_containers(self, backend):
+        data = {1: [], "a": {}, "nested": {2: {"x": None}}}
+        assert json_codec.dumps(data) == _stdlib(data)
+        assert json_codec.dumps(data, indent=True) == _stdlib(data, indent=True)
+
+    def test_round_trip(self, backend):
+        for value in (_events(10), _envelope(), {"u": "naïve ✓  "}, [0.1, -0.0, 2**63 - 1]):
+            assert json_codec.loads(json_codec.dumps(value)) == value
+            assert json_codec.loads(json_codec.dumpb(value)) == value
+
+
+class TestStdlibSemantics:
+    def test_loads_falls_back_for_stdlib_only_input(self, backend):
+        assert math.isnan(json_codec.loads('{"x": NaN}')["x"])
+        assert json_codec.loads(str(2**70)) == 2**70
+        assert json_codec.dumps(2**70) == str(2**70)
+
+    def test_decode_errors_are_json_decode_errors(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads('{"truncated": ')
+        with pytest.raises(json_codec.JSONDecodeError):
+            json_codec.loads(b"")
+
+    def test_default_hook_sees_datetimes_and_dataclasses(self, backend):
+        @dataclass
+        class Point:
+            x: int
+
+        data = {"ts": T0, "p": Point(1)}
+        assert json_codec.dumps(data, default=str) == json.dumps(data, default=str, separators=(",", ":"))
+        with pytest.raises(TypeError):
+            json_codec.dumps({"ts": T0})
+        with pytest.raises(TypeError):
+            json_codec.dumps(object())
+
+    def test_load_and_dump_files(self, backend, tmp_path):
+        path = tmp_path / "envelope.json"
+        with path.open("w", encoding="utf-8") as f:
+            json_codec.dump(_envelope(), f, indent=True)
+        with path.open("rb") as f:
+            assert json_codec.load(f) == _envelope()
+
+
+class TestIntegration:
+    def test_event_lines_are_compact_and_readable(self, backend, tmp_path):
+        storage.create_run_dir("run-a", tmp_path)
+        storage.append_event(
+            "run-a",
+            RunEvent(run_id="run-a", ts=T0, kind="log", flow_key="build", payload={"msg": "héllo"}),
+            tmp_path,
+        )
+        line = (tmp_path / "run-a" / "events.jsonl").read_text(encoding="utf-8").strip()
+        assert '"msg":"héllo"' in line
+        assert storage.read_events("run-a", tmp_path)[0].payload == {"msg": "héllo"}
+
+    def test_api_response_matches_starlette(self, backend):
+        from starlette.responses import JSONResponse as StarletteJSONResponse
+
+        from swarm.api.responses import JSONResponse
+
+        content = {"events": _events(5), "envelope": _envelope()}
+        assert JSONResponse(content).body == StarletteJSONResponse(content).body
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+
+
+@pytest.mark.performance
+class TestCodecBenchmark:
+    """Encode/decode throughput over a 200-event run log and one envelope."""
+
+    @pytest.mark.benchmark(group="json-codec-events-encode")
+    def test_encode_events(self, benchmark, backend):
+        events = _events()
+        lines = benchmark(lambda: [json_codec.dumps(e) for e in events])
+        assert len(lines) == len(events)
+
+    @pytest.mark.benchmark(group="json-codec-events-decode")
+    def test_decode_events(self, benchmark, backend):
+        lines = [_stdlib(e) for e in _events()]
+        decoded = benchmark(lambda: [json_codec.loads(line) for line in lines])
+        assert decoded[0]["seq"] == 1
+
+    @pytest.mark.benchmark(group="json-codec-envelope-encode")
+    def test_encode_envelope(self, benchmark, backend):
+        envelope = _envelope()
+        assert benchmark(json_codec.dumpb, envelope, indent=True)
+
+    @pytest.mark.benchmark(group="json-codec-envelope-decode")
+    def test_decode_envelope(self, benchmark, backend):
+        raw = _stdlib(_envelope(), indent=True).encode("utf-8")
+        assert benchmark(json_codec.loads, raw)["step_id"] == "implement"
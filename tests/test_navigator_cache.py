@@ -0,0 +1,250 @@
+"""Tests for the Navigator decision cache.
+
+Covers:
+- Identical packets replay the stored decision without an LLM call
+- The iteration counter and the evidence are part of the key
+- Run / flow / global scopes; context digests never leave their run
+- Staleness: expiry, LRU eviction, invalidation, uncached fallbacks
+- Cache hits are marked on the output and emitted as audit events
+"""
+
+from __future__ import annotations
+
+import json
+from typing import List
+
+import pytest
+
+from swarm.runtime import navigator_cache
+from swarm.runtime.navigator import (
+    EdgeCandidate,
+    Navigator,
+    NavigatorInput,
+    StallSignals,
+    VerificationSummary,
+    navigator_output_from_dict,
+    navigator_output_to_dict,
+)
+from swarm.runtime.navigator_cache import NavigatorDecisionCache
+from swarm.runtime.navigator_integration import emit_navigation_cache_hit_event
+
+RESPONSE = json.dumps(
+    {
+        "route": {"intent": "loop", "target_node": "implement", "reasoning": "tests fail"},
+        "next_step_brief": {"objective": "Fix the failing retry test"},
+        "signals": {"stall": "none", "risk": "low", "uncertainty": "low"},
+    }
+)
+
+
+class FakeLLM:
+    def __init__(self, response: str = RESPONSE):
+        self.response = response
+        self.calls = 0
+
+    def __call__(self, system_prompt: str, user_prompt: str) -> str:
+        self.calls += 1
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    navigator_cache.reset_navigator_cache()
+    yield
+    navigator_cache.reset_navigator_cache()
+
+
+def _input(run_id: str = "run-1", flow_key: str = "build", **overrides) -> NavigatorInput:
+    values = dict(
+        run_id=run_id,
+        flow_key=flow_key,
+        current_node="critique",
+        iteration=1,
+        candidate_edges=[
+            EdgeCandidate(edge_id="e1", target_node="implement", edge_type="loop"),
+            EdgeCandidate(edge_id="e2", target_node="commit", edge_type="sequence"),
+        ],
+        verification=VerificationSummary(passed=False, failure_summary="test_retry failed"),
+        stall_signals=StallSignals(last_change_signature="abc123"),
+    )
+    values.update(overrides)
+    return NavigatorInput(**values)
+
+
+class TestDecisionReuse:
+    def test_identical_packet_skips_llm_call(self):
+        llm = FakeLLM()
+        navigator = Navigator(llm_call=llm, cache=NavigatorDecisionCache())
+
+        first = navigator.navigate(_input(iteration=1))
+        second = navigator.navigate(_input(iteration=1))
+
+        assert llm.calls == 1
+        assert first.cache is None
+        assert second.cache["hit"] is True
+        assert second.cache["source_run_id"] == "run-1"
+        assert second.route.intent == first.route.intent
+        assert second.route.target_node == "implement"
+        assert second.next_step_brief.objective == first.next_step_brief.objective
+
+    def test_changed_evidence_misses(self):
+        llm = FakeLLM()
+        navigator = Navigator(llm_call=llm, cache=NavigatorDecisionCache())
+
+        navigator.navigate(_input())
+        navigator.navigate(_input(stall_signals=StallSignals(last_change_signature="def456")))
+        navigator.navigate(
+            _input(verification=VerificationSummary(passed=False, failure_summary="other"))
+        )
+        navigator.navigate(_input(current_node="implement"))
+        # The model weighs how long a loop has run
+        navigator.navigate(_input(iteration=2))
+        assert llm.calls == 5
+
+    def test_hits_are_detached_copies(self):
+        navigator = Navigator(llm_call=FakeLLM(), cache=NavigatorDecisionCache())
+        navigator.navigate(_input())
+        hit = navigator.navigate(_input())
+        hit.route.target_node = "mutated"
+        assert navigator.navigate(_input()).route.target_node == "implement"
+
+    def test_use_cache_false_always_calls(self):
+        llm = FakeLLM()
+        navigator = Navigator(llm_call=llm, cache=NavigatorDecisionCache(), use_cache=False)
+        navigator.navigate(_input())
+        navigator.navigate(_input())
+        assert llm.calls == 2
+
+
+class TestScopes:
+    @pytest.mark.parametrize(
+        "scope,other_run,other_flow,expected_calls",
+        [
+            ("run", "run-1", "build", 1),
+            ("run", "run-2", "build", 2),
+            ("flow", "run-2", "build", 1),
+            ("flow", "run-2", "gate", 2),
+            ("global", "run-2", "gate", 1),
+        ],
+    )
+    def test_scope(self, scope, other_run, other_flow, expected_calls):
+        llm = FakeLLM()
+        navigator = Navigator(llm_call=llm, cache=NavigatorDecisionCache(scope=scope))
+        navigator.navigate(_input())
+        navigator.navigate(_input(run_id=other_run, flow_key=other_flow))
+        assert llm.calls == expected_calls
+
+    def test_context_digest_stays_within_the_run(self):
+        llm = FakeLLM()
+        navigator = Navigator(llm_call=llm, cache=NavigatorDecisionCache(scope="global"))
+        navigator.navigate(_input(context_digest="run-1 artifacts"))
+        assert navigator.navigate(_input(context_digest="run-1 artifacts")).cache["hit"]
+        navigator.navigate(_input(run_id="run-2", context_digest="run-1 artifacts"))
+        assert llm.calls == 2
+
+    def test_invalid_scope(self):
+        with pytest.raises(ValueError, match="scope"):
+            NavigatorDecisionCache(scope="session")
+
+
+class TestStaleness:
+    def test_entries_expire(self):
+        clock = FakeClock()
+        llm = FakeLLM()
+        navigator = Navigator(
+            llm_call=llm, cache=NavigatorDecisionCache(max_age_seconds=60, clock=clock)
+        )
+        navigator.navigate(_input())
+        clock.now += 30
+        assert navigator.navigate(_input()).cache["age_ms"] == 30_000
+        clock.now += 31
+        assert navigator.navigate(_input()).cache is None
+        assert llm.calls == 2
+        assert navigator.cache.stats()["expired"] == 1
+
+    def test_lru_eviction(self):
+        llm = FakeLLM()
+        navigator = Navigator(llm_call=llm, cache=NavigatorDecisionCache(max_entries=2))
+        for node in ("a", "b", "a", "c", "a", "b"):
+            navigator.navigate(_input(current_node=node))
+        # a, b stored; a hit; c evicts b; a hit; b missed again
+        assert llm.calls == 4
+        assert navigator.cache.stats()["evicted"] == 2
+
+    def test_fallbacks_are_not_cached(self):
+        llm = FakeLLM(response="not json at all")
+        navigator = Navigator(llm_call=llm, cache=NavigatorDecisionCache())
+        navigator.navigate(_input())
+        llm.response = RuntimeError("rate limited")
+        navigator.navigate(_input())
+        assert llm.calls == 2
+        assert len(navigator.cache) == 0
+
+    def test_human_escalations_are_not_cached(self):
+        cache = NavigatorDecisionCache()
+        output = Navigator()._deterministic_navigate(_input())
+        output.signals.needs_human = True
+        assert cache.put("k", _input(), output) is False
+        assert len(cache) == 0
+
+    def test_invalidate_run(self):
+        cache = NavigatorDecisionCache(scope="global")
+        navigator = Navigator(llm_call=FakeLLM(), cache=cache)
+        navigator.navigate(_input(run_id="run-1"))
+        navigator.navigate(_input(run_id="run-2", current_node="implement"))
+        assert cache.invalidate("run-1") == 1
+        assert len(cache) == 1
+
+
+class TestAudit:
+    def test_cache_info_round_trips_in_decision_payload(self):
+        navigator = Navigator(llm_call=FakeLLM(), cache=NavigatorDecisionCache())
+        navigator.navigate(_input())
+        hit = navigator.navigate(_input())
+
+        data = navigator_output_to_dict(hit)
+        assert data["cache"]["hit"] is True
+        assert navigator_output_from_dict(data).cache == hit.cache
+        miss = navigator.navigate(_input(current_node="x"))
+        assert "cache" not in navigator_output_to_dict(miss)
+
+    def test_cache_hit_event(self):
+        navigator = Navigator(llm_call=FakeLLM(), cache=NavigatorDecisionCache())
+        navigator.navigate(_input())
+        hit = navigator.navigate(_input())
+
+        events: List = []
+        emit_navigation_cache_hit_event(
+            "run-1", "build", "critique", hit, append_event_fn=lambda rid, e: events.append(e)
+        )
+        assert events[0].kind == "navigation_cache_hit"
+        assert events[0].payload["key"] == hit.cache["key"]
+        assert events[0].payload["target_node"] == "implement"
+
+
+class TestConfig:
+    def test_global_cache_from_config(self, monkeypatch):
+        monkeypatch.setenv("SWARM_NAVIGATOR_CACHE_SCOPE", "flow")
+        cache = navigator_cache.get_navigator_cache()
+        assert cache is navigator_cache.get_navigator_cache()
+        assert cache.scope == "flow"
+        assert Navigator(llm_call=FakeLLM()).cache is cache
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("SWARM_NAVIGATOR_CACHE", "0")
+        llm = FakeLLM()
+        navigator = Navigator(llm_call=llm)
+        assert navigator.cache is None
+        navigator.navigate(_input())
+        navigator.navigate(_input())
+        assert llm.calls == 2
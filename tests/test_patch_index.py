@@ -0,0 +1,136 @@
+"""Tests for the persisted evolution patch index.
+
+Covers:
+- Patches are generated once per run and served from the index afterwards
+- Regeneration when wisdom artifacts change
+- Status tracking from .applied_/.rejected_ markers
+- Queries by status, run and target file
+- Index persistence and pruning of deleted runs
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from swarm.runtime import patch_index
+from swarm.runtime.evolution import list_pending_patches
+from swarm.runtime.patch_index import INDEX_FILE, PatchIndex, PatchStatus
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes():
+    patch_index.reset_patch_indexes()
+    yield
+    patch_index.reset_patch_indexes()
+
+
+def _write_flow_patches(runs_root: Path, run_id: str, patch_ids, target: str = "test.yaml") -> Path:
+    wisdom = runs_root / run_id / "wisdom"
+    wisdom.mkdir(parents=True, exist_ok=True)
+    data = {
+        "schema_version": "flow_evolution_v1",
+        "patches": [{"id": pid, "target_flow": target, "reason": "Test"} for pid in patch_ids],
+    }
+    (wisdom / "flow_evolution.patch").write_text(json.dumps(data))
+    return wisdom
+
+
+class TestPatchIndex:
+    def test_patches_generated_once_until_artifacts_change(self, tmp_path):
+        wisdom = _write_flow_patches(tmp_path, "run-001", ["PATCH-001"])
+        index = PatchIndex(tmp_path)
+
+        with patch.object(
+            patch_index, "generate_evolution_patch", wraps=patch_index.generate_evolution_patch
+        ) as gen:
+            index.refresh()
+            index.refresh()
+            assert gen.call_count == 1
+
+            # Rewrite the artifact with different content (size changes)
+            _write_flow_patches(tmp_path, "run-001", ["PATCH-001", "PATCH-002"])
+            st = (wisdom / "flow_evolution.patch").stat()
+            os.utime(wisdom / "flow_evolution.patch", ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+            index.refresh()
+            assert gen.call_count == 2
+
+        assert [p.patch.id for p in index.query(run_id="run-001")] == ["PATCH-001", "PATCH-002"]
+
+    def test_status_follows_markers_without_regeneration(self, tmp_path):
+        wisdom = _write_flow_patches(tmp_path, "run-001", ["PATCH-001", "PATCH-002", "PATCH-003"])
+        index = PatchIndex(tmp_path)
+        index.refresh()
+
+        (wisdom / ".applied_PATCH-001").write_text("{}")
+        (wisdom / ".rejected_PATCH-002").write_text("{}")
+
+        with patch.object(patch_index, "generate_evolution_patch") as gen:
+            index.refresh()
+            gen.assert_not_called()
+
+        statuses = {p.patch.id: p.status for p in index.query()}
+        assert statuses == {
+            "PATCH-001": PatchStatus.APPLIED,
+            "PATCH-002": PatchStatus.REJECTED,
+            "PATCH-003": PatchStatus.PENDING,
+        }
+        assert [p.patch.id for p in index.query(status=PatchStatus.PENDING)] == ["PATCH-003"]
+
+    def test_query_by_target_file(self, tmp_path):
+        _write_flow_patches(tmp_path, "run-001", ["PATCH-A"], target="a.yaml")
+        _write_flow_patches(tmp_path, "run-002", ["PATCH-B"], target="b.yaml")
+        index = PatchIndex(tmp_path)
+        index.refresh()
+
+        matches = index.query(target_file=index.query(run_id="run-002")[0].target_file)
+        assert [(p.run_id, p.patch.id) for p in matches] == [("run-002", "PATCH-B")]
+
+    def test_index_persists_and_drops_deleted_runs(self, tmp_path):
+        _write_flow_patches(tmp_path, "run-001", ["PATCH-001"])
+        _write_flow_patches(tmp_path, "run-002", ["PATCH-002"])
+        PatchIndex(tmp_path).refresh()
+        assert (tmp_path / INDEX_FILE).exists()
+
+        reloaded = PatchIndex(tmp_path)
+        with patch.object(patch_index, "generate_evolution_patch") as gen:
+            reloaded.refresh()
+            gen.assert_not_called()
+        assert {p.run_id for p in reloaded.query()} == {"run-001", "run-002"}
+
+        shutil.rmtree(tmp_path / "run-001")
+        reloaded.refresh()
+        assert {p.run_id for p in reloaded.query()} == {"run-002"}
+        data = json.loads((tmp_path / INDEX_FILE).read_text())
+        assert set(data["runs"]) == {"run-002"}
+
+    def test_refresh_limit_keeps_newest_runs(self, tmp_path):
+        for n in range(1, 4):
+            _write_flow_patches(tmp_path, f"run-00{n}", [f"PATCH-{n}"])
+        index = PatchIndex(tmp_path)
+
+        assert index.refresh(limit=2) == ["run-003", "run-002"]
+        assert {p.run_id for p in index.query()} == {"run-003", "run-002"}
+
+
+class TestListPendingPatchesFromIndex:
+    def test_list_pending_patches_uses_index(self, tmp_path):
+        wisdom = _write_flow_patches(tmp_path, "run-001", ["PATCH-001", "PATCH-002"])
+        _write_flow_patches(tmp_path, "run-002", ["PATCH-003"])
+
+        pending = list_pending_patches(tmp_path)
+        assert [(run_id, [p.id for p in patches]) for run_id, patches in pending] == [
+            ("run-002", ["PATCH-003"]),
+            ("run-001", ["PATCH-001", "PATCH-002"]),
+        ]
+
+        (wisdom / ".rejected_PATCH-001").write_text("{}")
+        with patch.object(patch_index, "generate_evolution_patch") as gen:
+            pending = dict(list_pending_patches(tmp_path))
+            gen.assert_not_called()
+        assert [p.id for p in pending["run-001"]] == ["PATCH-002"]
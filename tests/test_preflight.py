@@ -0,0 +1,233 @@
+"""Tests for concurrent, cached preflight checks.
+
+Covers:
+- Checks run concurrently; results keep their declared order
+- Per-check timeouts fail the overrunning check without waiting for it
+- Passing results are reused until a validity key changes (repo HEAD,
+  environment fingerprint, CLI binary mtime); failures are never cached
+- Cached repo results still re-run the working tree status
+- Latency reporting: total_duration_ms vs sequential_duration_ms
+- HEAD resolution without git for loose, packed and detached refs
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from swarm.runtime import preflight
+from swarm.runtime.git_probe import find_git_dir, read_git_head
+from swarm.runtime.preflight import (
+    CheckResult,
+    CheckStatus,
+    PreflightOrchestrator,
+    clear_preflight_cache,
+)
+
+CHECK_METHODS = {
+    "harness": "check_harness_health",
+    "credentials": "check_credentials",
+    "repo": "check_repo_health",
+    "paths": "check_paths",
+    "backend": "check_backend_availability",
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_preflight_cache()
+    yield
+    clear_preflight_cache()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+    (git_dir / "index").write_text("")
+    return tmp_path
+
+
+def _fake_checks(monkeypatch, delay: float = 0.0, status=CheckStatus.PASSED, calls=None):
+    """Replace every check with a sleep that records its calls."""
+    calls = calls if calls is not None else []
+    lock = threading.Lock()
+
+    for name, method in CHECK_METHODS.items():
+
+        def check(self, *args, _name=name, **kwargs):
+            with lock:
+                calls.append(_name)
+            time.sleep(delay)
+            return CheckResult(name=_name, status=status, message="ok")
+
+        monkeypatch.setattr(PreflightOrchestrator, method, check)
+    return calls
+
+
+class TestConcurrency:
+    def test_checks_run_concurrently_in_order(self, monkeypatch, repo):
+        _fake_checks(monkeypatch, delay=0.2)
+        result = PreflightOrchestrator(repo_root=repo, use_cache=False).run_all_checks()
+
+        assert [c.name for c in result.checks] == list(CHECK_METHODS)
+        assert result.passed
+        assert result.sequential_duration_ms >= 1000
+        assert result.total_duration_ms < 700
+
+    def test_timeout_fails_only_the_slow_check(self, monkeypatch, repo):
+        _fake_checks(monkeypatch)
+        release = threading.Event()
+
+        def slow_repo(self):
+            release.wait(5)
+            return CheckResult(name="repo_health", status=CheckStatus.PASSED, message="ok")
+
+        monkeypatch.setattr(PreflightOrchestrator, "check_repo_health", slow_repo)
+        orchestrator = PreflightOrchestrator(repo_root=repo, timeouts={"repo": 0.1})
+        try:
+            start = time.perf_counter()
+            result = orchestrator.run_all_checks()
+            assert time.perf_counter() - start < 2
+        finally:
+            release.set()
+
+        statuses = {c.name: c.status for c in result.checks}
+        assert statuses["repo"] == CheckStatus.FAILED
+        assert statuses["harness"] == CheckStatus.PASSED
+        assert result.blocking_issues == ["repo: Check timed out after 0.1s"]
+
+    def test_skipped_checks(self, monkeypatch, repo):
+        calls = _fake_checks(monkeypatch)
+        result = PreflightOrchestrator(repo_root=repo, skip_checks=["harness"]).run_all_checks()
+        assert result.checks[0].status == CheckStatus.SKIPPED
+        assert "harness" not in calls
+
+
+class TestCache:
+    def test_back_to_back_launches_reuse_results(self, monkeypatch, repo):
+        calls = _fake_checks(monkeypatch, delay=0.05)
+        PreflightOrchestrator(repo_root=repo).run_all_checks(run_id="run-1")
+        calls.clear()
+
+        result = PreflightOrchestrator(repo_root=repo).run_all_checks(run_id="run-2")
+        assert calls == ["paths"]  # Run-specific, never cached
+        assert result.cached_checks == ["harness", "credentials", "repo", "backend"]
+        harness = result.checks[0]
+        assert harness.details["cached"] is True
+        assert harness.duration_ms == 0
+        assert result.sequential_duration_ms >= 200
+        assert result.to_dict()["cached_checks"] == result.cached_checks
+
+    def test_cached_repo_result_rechecks_the_working_tree(self, monkeypatch, repo):
+        calls = _fake_checks(monkeypatch)
+        tree = {"has_uncommitted_changes": False}
+        monkeypatch.setattr(PreflightOrchestrator, "_working_tree_status", lambda self: tree)
+        PreflightOrchestrator(repo_root=repo).run_all_checks()
+        calls.clear()
+
+        tree = {"has_uncommitted_changes": True, "uncommitted_count": 2}
+        result = PreflightOrchestrator(repo_root=repo).run_all_checks()
+        repo_check = result.checks[2]
+        assert "repo" not in calls and "repo" in result.cached_checks
+        assert repo_check.status == CheckStatus.WARNING
+        assert repo_check.details["uncommitted_count"] == 2
+        assert repo_check.details["cached"] is True
+        assert result.warnings == ["repo: Repository has uncommitted changes"]
+
+        tree = {"has_uncommitted_changes": False}
+        repo_check = PreflightOrchestrator(repo_root=repo).run_all_checks().checks[2]
+        assert repo_check.status == CheckStatus.PASSED
+        assert "uncommitted_count" not in repo_check.details
+
+    def test_head_change_invalidates_repo_checks(self, monkeypatch, repo):
+        calls = _fake_checks(monkeypatch)
+        PreflightOrchestrator(repo_root=repo).run_all_checks()
+        (repo / ".git" / "refs" / "heads" / "main").write_text("b" * 40 + "\n")
+        calls.clear()
+
+        PreflightOrchestrator(repo_root=repo).run_all_checks()
+        assert sorted(calls) == ["harness", "paths", "repo"]
+
+    def test_env_change_invalidates_env_checks(self, monkeypatch, repo):
+        calls = _fake_checks(monkeypatch)
+        PreflightOrchestrator(repo_root=repo).run_all_checks()
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-new")
+        calls.clear()
+
+        PreflightOrchestrator(repo_root=repo).run_all_checks()
+        assert sorted(calls) == ["backend", "credentials", "harness", "paths"]
+
+    def test_cli_binary_change_invalidates_backend(self, monkeypatch, repo, tmp_path_factory):
+        calls = _fake_checks(monkeypatch)
+        bin_dir = tmp_path_factory.mktemp("bin")
+        cli = bin_dir / "gemini"
+        cli.write_text("#!/bin/sh\n")
+        cli.chmod(0o755)
+        monkeypatch.setattr(preflight.shutil, "which", lambda name: str(cli))
+
+        PreflightOrchestrator(repo_root=repo).run_all_checks(backend="gemini-cli")
+        calls.clear()
+        PreflightOrchestrator(repo_root=repo).run_all_checks(backend="gemini-cli")
+        assert "backend" not in calls
+
+        stat = cli.stat()
+        os.utime(cli, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        PreflightOrchestrator(repo_root=repo).run_all_checks(backend="gemini-cli")
+        assert "backend" in calls
+
+    def test_failures_are_not_cached(self, monkeypatch, repo):
+        calls = _fake_checks(monkeypatch, status=CheckStatus.FAILED)
+        PreflightOrchestrator(repo_root=repo).run_all_checks()
+        calls.clear()
+        result = PreflightOrchestrator(repo_root=repo).run_all_checks()
+        assert len(calls) == 5
+        assert result.cached_checks == []
+
+    def test_entries_expire(self, monkeypatch, repo):
+        calls = _fake_checks(monkeypatch)
+        PreflightOrchestrator(repo_root=repo).run_all_checks()
+        monkeypatch.setattr(preflight, "CACHE_MAX_AGE_SECONDS", 0.0)
+        calls.clear()
+        PreflightOrchestrator(repo_root=repo).run_all_checks()
+        assert len(calls) == 5
+
+
+class TestGitHead:
+    def test_loose_packed_and_detached(self, repo):
+        git_dir = find_git_dir(repo / "sub" / "dir")
+        assert git_dir == repo / ".git"
+        assert read_git_head(git_dir) == "a" * 40
+
+        (git_dir / "refs" / "heads" / "main").unlink()
+        (git_dir / "packed-refs").write_text(
+            "# pack-refs with: peeled\n" + "c" * 40 + " refs/heads/main\n"
+        )
+        assert read_git_head(git_dir) == "c" * 40
+
+        (git_dir / "HEAD").write_text("d" * 40 + "\n")
+        assert read_git_head(git_dir) == "d" * 40
+
+    def test_real_checks_against_this_repo(self):
+        """The real checks still run end to end (cached on the second pass)."""
+        repo_root = Path(__file__).resolve().parents[1]
+        orchestrator = PreflightOrchestrator(repo_root=repo_root, skip_checks=["harness"])
+        first = orchestrator.run_all_checks(backend="claude-step-orchestrator")
+        second = orchestrator.run_all_checks(backend="claude-step-orchestrator")
+        assert [c.name for c in first.checks][1:] == [
+            "credentials",
+            "repo_health",
+            "paths",
+            "backend_availability",
+        ]
+        for check in second.checks:
+            if check.name in ("repo_health", "backend_availability") and (
+                check.status != CheckStatus.FAILED
+            ):
+                assert check.details.get("cached") is True
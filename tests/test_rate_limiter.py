@@ -0,0 +1,308 @@
+"""Tests for the engine call rate limiter.
+
+Covers:
+- Token-bucket math: bursts up to one minute's worth, then the configured rate
+- Token reservations and post-call charging (debt makes the next call wait)
+- Per-model overrides nested under the engine quota, and the unlimited fast path
+- Priority ordering between queued waiters
+- Buckets shared between limiter instances through the state file
+- Run priority derived from RunSpec
+- Engines acquiring permits through the global limiter, charged to the
+  spec model and the tokens the call reported
+
+A fake clock stands in for wall time, so no test sleeps for real.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import List, Optional
+
+import pytest
+
+from swarm.runtime import rate_limiter
+from swarm.runtime.engines import StepContext
+from swarm.runtime.engines.claude.engine import ClaudeStepEngine
+from swarm.runtime.rate_limiter import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_NORMAL,
+    EngineRateLimiter,
+    RateLimit,
+    priority_for_spec,
+)
+from swarm.runtime.types import RunSpec
+
+
+class FakeClock:
+    """Manual clock. With auto_advance, waits jump time forward instead of blocking."""
+
+    def __init__(self, auto_advance: bool = True):
+        self.now = 1_000_000.0
+        self.auto_advance = auto_advance
+        self.waits: List[Optional[float]] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def wait(self, cond: threading.Condition, timeout: Optional[float]) -> None:
+        self.waits.append(timeout)
+        if self.auto_advance and timeout is not None:
+            self.now += timeout
+        else:
+            cond.wait(0.01)  # Poll; the test advances time
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter():
+    rate_limiter.reset_rate_limiter()
+    yield
+    rate_limiter.reset_rate_limiter()
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+class TestBuckets:
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        limiter = EngineRateLimiter({"claude": {"requests_per_minute": 6}}, clock=clock)
+
+        for _ in range(6):
+            with limiter.acquire("claude") as permit:
+                assert permit.wait_ms == 0
+        with limiter.acquire("claude") as permit:
+            assert permit.wait_ms == pytest.approx(10_000)
+
+        stats = limiter.stats().to_dict()
+        assert stats["acquired"] == 7
+        assert stats["throttled"] == 1
+        assert stats["max_wait_ms"] == pytest.approx(10_000)
+        assert stats["acquired_by_key"] == {"claude/default": 7}
+
+    def test_token_debt_delays_next_call(self):
+        clock = FakeClock()
+        limiter = EngineRateLimiter({"claude": {"tokens_per_minute": 6000}}, clock=clock)
+
+        with limiter.acquire("claude") as permit:
+            permit.record_tokens(9000)  # 3000 tokens in debt afterwards
+        with limiter.acquire("claude") as permit:
+            # Needs 3001 tokens of refill at 100 tokens/second
+            assert permit.wait_ms == pytest.approx(30_010)
+        assert limiter.stats().tokens_by_key == {"claude/default": 9000}
+
+    def test_reservation_larger_than_bucket_waits_for_full_bucket(self):
+        clock = FakeClock()
+        limiter = EngineRateLimiter({"gemini": {"tokens_per_minute": 600}}, clock=clock)
+
+        with limiter.acquire("gemini", tokens=300):
+            pass
+        with limiter.acquire("gemini", tokens=10_000) as permit:
+            assert permit.wait_ms == pytest.approx(30_000)
+
+    def test_per_model_override_and_unlimited(self):
+        limiter = EngineRateLimiter(
+            {"claude": {"requests_per_minute": 50, "models": {"opus": {"requests_per_minute": 5}}}}
+        )
+        assert limiter.limit_for("claude", "opus") == RateLimit(requests_per_minute=5)
+        assert limiter.limit_for("claude", "sonnet") == RateLimit(requests_per_minute=50)
+        assert limiter.limit_for("gemini").unlimited
+
+        clock = FakeClock()
+        limiter = EngineRateLimiter({}, clock=clock)
+        for _ in range(100):
+            with limiter.acquire("claude"):
+                pass
+        assert clock.waits == []
+        assert limiter.stats().acquired == 100
+
+    def test_models_share_the_engine_quota(self):
+        clock = FakeClock()
+        limiter = EngineRateLimiter(
+            {"claude": {"requests_per_minute": 4, "models": {"opus": {"requests_per_minute": 2}}}},
+            clock=clock,
+        )
+
+        waits = []
+        for model in ["opus", "opus", "sonnet", "haiku", "sonnet"]:
+            with limiter.acquire("claude", model) as permit:
+                waits.append(permit.wait_ms)
+        # The engine bucket is empty after four calls, whichever models made them
+        assert waits == [0, 0, 0, 0, pytest.approx(15_000)]
+        with limiter.acquire("claude", "opus") as permit:
+            # Half an opus request refilled during the last wait; it needs both buckets
+            assert permit.wait_ms == pytest.approx(15_000)
+        assert limiter.stats().acquired_by_key == {
+            "claude/opus": 3,
+            "claude/sonnet": 2,
+            "claude/haiku": 1,
+        }
+
+    def test_async_acquire(self):
+        import asyncio
+
+        clock = FakeClock()
+        limiter = EngineRateLimiter({"claude": {"requests_per_minute": 1}}, clock=clock)
+
+        async def scenario():
+            waits = []
+            for _ in range(2):
+                async with limiter.acquire_async("claude", "haiku") as permit:
+                    waits.append(permit.wait_ms)
+            return waits
+
+        assert asyncio.run(scenario()) == [0, pytest.approx(60_000)]
+
+
+class TestPriority:
+    def test_interactive_overtakes_queued_batch(self):
+        clock = FakeClock(auto_advance=False)
+        limiter = EngineRateLimiter({"claude": {"requests_per_minute": 1}}, clock=clock)
+        with limiter.acquire("claude"):
+            pass  # Bucket now empty
+
+        served: List[str] = []
+
+        def call(name: str, priority: int) -> None:
+            with limiter.acquire("claude", priority=priority):
+                served.append(name)
+
+        batch = threading.Thread(target=call, args=("batch", PRIORITY_BATCH))
+        batch.start()
+        _wait_until(lambda: limiter.stats().queued == 1)
+        interactive = threading.Thread(target=call, args=("interactive", PRIORITY_INTERACTIVE))
+        interactive.start()
+        _wait_until(lambda: limiter.stats().queued == 2)
+
+        clock.now += 60.0  # Refill exactly one request
+        _wait_until(lambda: len(served) == 1)
+        assert served == ["interactive"]
+
+        clock.now += 60.0
+        batch.join(5)
+        interactive.join(5)
+        assert served == ["interactive", "batch"]
+        assert set(limiter.stats().wait_ms_by_priority) == {PRIORITY_BATCH, PRIORITY_INTERACTIVE}
+
+    def test_priority_for_spec(self):
+        assert priority_for_spec(None) == PRIORITY_NORMAL
+        assert priority_for_spec(RunSpec(flow_keys=["build"])) == PRIORITY_INTERACTIVE
+        assert priority_for_spec(RunSpec(flow_keys=["build"], no_human_mid_flow=True)) == (
+            PRIORITY_BATCH
+        )
+        assert priority_for_spec(RunSpec(flow_keys=["build"], params={"autopilot": True})) == (
+            PRIORITY_BATCH
+        )
+        spec = RunSpec(flow_keys=["build"], params={"priority": "normal"}, no_human_mid_flow=True)
+        assert priority_for_spec(spec) == PRIORITY_NORMAL
+        assert priority_for_spec(RunSpec(flow_keys=["build"], params={"priority": 3})) == 3
+
+
+class TestSharedState:
+    def test_instances_share_buckets_through_file(self, tmp_path):
+        clock = FakeClock()
+        limits = {"claude": {"requests_per_minute": 2}}
+        path = tmp_path / ".rate_limits.json"
+        a = EngineRateLimiter(limits, shared_state_path=path, clock=clock)
+        b = EngineRateLimiter(limits, shared_state_path=path, clock=clock)
+        assert a.shared and b.shared
+
+        with a.acquire("claude"):
+            pass
+        with b.acquire("claude") as permit:
+            assert permit.wait_ms == 0
+        with a.acquire("claude") as permit:
+            assert permit.wait_ms == pytest.approx(30_000)
+        assert path.exists()
+
+    def test_global_limiter_uses_config(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SWARM_CLAUDE_REQUESTS_PER_MINUTE", "30")
+        monkeypatch.setenv("SWARM_RATE_LIMIT_SHARED", "1")
+        monkeypatch.setattr("swarm.runtime.storage.RUNS_DIR", tmp_path)
+
+        limiter = rate_limiter.get_rate_limiter()
+        assert limiter is rate_limiter.get_rate_limiter()
+        assert limiter.shared
+        assert limiter.limit_for("claude") == RateLimit(requests_per_minute=30)
+
+
+def _step_context(repo_root) -> StepContext:
+    return StepContext(
+        repo_root=repo_root,
+        run_id="test-run",
+        flow_key="build",
+        step_id="implement",
+        step_index=1,
+        total_steps=3,
+        spec=RunSpec(flow_keys=["build"], no_human_mid_flow=True),
+        flow_title="Build",
+        step_role="Implement",
+        step_agents=("code-implementer",),
+        history=[],
+        extra={"context_pack": object()},
+    )
+
+
+class TestEngineIntegration:
+    def test_stub_engine_calls_take_permits(self, tmp_path):
+        limiter = EngineRateLimiter({"claude": {"requests_per_minute": 100}}, clock=FakeClock())
+        rate_limiter.set_rate_limiter(limiter)
+        engine = ClaudeStepEngine(repo_root=tmp_path, mode="stub", enable_stats_db=False)
+
+        step_result, _, _ = engine.run_worker(_step_context(tmp_path))
+        assert step_result.status == "succeeded"
+        stats = limiter.stats()
+        assert stats.acquired == 1
+        assert stats.acquired_by_key == {"claude/default": 1}
+
+    def test_sdk_worker_is_charged_to_the_spec_model(self, tmp_path, monkeypatch):
+        from types import SimpleNamespace
+
+        from swarm.runtime.engines.claude import engine as engine_module
+        from swarm.runtime.engines.models import StepResult
+
+        limiter = EngineRateLimiter({"claude": {"requests_per_minute": 100}}, clock=FakeClock())
+        rate_limiter.set_rate_limiter(limiter)
+        spec_result = ("prompt", None, SimpleNamespace(model="opus"))
+        monkeypatch.setattr(engine_module, "try_compile_from_spec", lambda ctx, root: spec_result)
+        received = []
+
+        async def fake_worker(ctx, compiled=None):
+            received.append(compiled)
+            result = StepResult(step_id=ctx.step_id, status="succeeded", output="")
+            result.artifacts = {"token_counts": {"total": 1234}}
+            return result, [], ""
+
+        engine = ClaudeStepEngine(repo_root=tmp_path, mode="sdk", enable_stats_db=False)
+        monkeypatch.setattr(engine, "_check_sdk_available", lambda: True)
+        monkeypatch.setattr(engine, "_hydrate_context", lambda ctx: ctx)
+        monkeypatch.setattr(engine, "_run_worker_async", fake_worker)
+
+        engine.run_worker(_step_context(tmp_path))
+
+        assert received == [spec_result]
+        stats = limiter.stats()
+        assert stats.acquired_by_key == {"claude/opus": 1}
+        assert stats.tokens_by_key == {"claude/opus": 1234}
+
+    def test_gemini_records_reported_tokens(self, tmp_path, monkeypatch):
+        from swarm.runtime.engines.gemini import GeminiStepEngine
+
+        limiter = EngineRateLimiter({"gemini": {"tokens_per_minute": 10_000}}, clock=FakeClock())
+        rate_limiter.set_rate_limiter(limiter)
+        engine = GeminiStepEngine(tmp_path)
+        engine.stub_mode = False
+        engine.cli_available = True
+        monkeypatch.setattr(
+            engine, "_execute_gemini", lambda ctx, prompt, info: ("done", [], {"total": 700})
+        )
+
+        result, _ = engine.run_step(_step_context(tmp_path))
+
+        assert result.status == "succeeded"
+        assert limiter.stats().tokens_by_key == {"gemini/default": 700}
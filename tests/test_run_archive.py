@@ -0,0 +1,228 @@
+"""Tests for compressed run bundles (cold-run archiving).
+
+Covers:
+- Packing a run keeps meta.json loose and preserves the run's age
+- Storage and path helper reads of archived runs
+- API run listings and the SSE event reader see archived runs
+- Appending events restores the run first
+- Loose files written after archiving shadow bundle members
+- Cold run selection by status and age, dry-run
+- Archive retention config and env override
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from swarm.config import runs_retention_config
+from swarm.runtime import disk_ledger, run_archive, storage
+from swarm.runtime.path_helpers import list_receipts, list_transcripts
+from swarm.runtime.run_archive import (
+    BUNDLE_FILE,
+    archive_cold_runs,
+    archive_run,
+    is_archived,
+    list_run_files,
+    open_run_file,
+    restore_run,
+    run_path_exists,
+)
+from swarm.runtime.types import RunEvent, RunSpec, RunState, RunStatus, RunSummary, SDLCStatus
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    run_archive.reset_bundle_cache()
+    disk_ledger.reset_disk_ledgers()
+    yield
+    run_archive.reset_bundle_cache()
+    disk_ledger.reset_disk_ledgers()
+
+
+def _make_run(
+    runs_dir: Path,
+    run_id: str,
+    status: RunStatus = RunStatus.SUCCEEDED,
+    age_days: float = 30,
+) -> Path:
+    finished = datetime.now(timezone.utc) - timedelta(days=age_days)
+    run_path = storage.create_run_dir(run_id, runs_dir)
+    storage.write_summary(
+        run_id,
+        RunSummary(
+            id=run_id,
+            spec=RunSpec(flow_keys=["build"], backend="claude-harness", initiator="test"),
+            status=status,
+            sdlc_status=SDLCStatus.UNKNOWN,
+            created_at=finished,
+            updated_at=finished,
+            completed_at=finished if status != RunStatus.RUNNING else None,
+        ),
+        runs_dir,
+    )
+    for i in range(3):
+        storage.append_event(
+            run_id,
+            RunEvent(run_id=run_id, ts=finished, kind="log", flow_key="build", payload={"i": i}),
+            runs_dir,
+        )
+    storage.write_run_state(run_id, RunState(run_id=run_id, flow_key="build", status="succeeded"), runs_dir)
+
+    flow = run_path / "build"
+    (flow / "llm").mkdir(parents=True)
+    (flow / "llm" / "implement-code-implementer-claude.jsonl").write_text('{"role": "user"}\n')
+    (flow / "receipts").mkdir()
+    (flow / "receipts" / "implement-code-implementer.json").write_text('{"status": "ok"}')
+    (flow / "handoff").mkdir()
+    (flow / "handoff" / "implement.json").write_text(json.dumps({"step_id": "implement", "status": "VERIFIED"}))
+    return run_path
+
+
+class TestArchiveRun:
+    def test_packs_everything_but_meta(self, tmp_path):
+        run_path = _make_run(tmp_path, "run-a")
+        mtime = run_path.stat().st_mtime_ns
+
+        result = archive_run(run_path)
+
+        assert result is not None and result.files == 5
+        # The state writer lock stays loose: other processes may hold it
+        assert sorted(p.name for p in run_path.iterdir()) == ["meta.json", BUNDLE_FILE, "run_state.lock"]
+        assert is_archived(run_path)
+        assert run_path.stat().st_mtime_ns == mtime
+        assert archive_run(run_path) is None
+
+    def test_storage_reads_are_transparent(self, tmp_path):
+        run_path = _make_run(tmp_path, "run-a")
+        before = (
+            storage.read_events("run-a", tmp_path),
+            storage.read_run_state("run-a", tmp_path),
+            storage.read_summary("run-a", tmp_path),
+        )
+        archive_run(run_path)
+
+        events = storage.read_events("run-a", tmp_path)
+        assert [e.payload["i"] for e in events] == [0, 1, 2]
+        assert [e.payload for e in events] == [e.payload for e in before[0]]
+        assert storage.read_run_state("run-a", tmp_path).flow_key == before[1].flow_key
+        assert storage.read_summary("run-a", tmp_path).status == RunStatus.SUCCEEDED
+
+    def test_path_helpers_and_file_access(self, tmp_path):
+        run_path = _make_run(tmp_path, "run-a")
+        flow = run_path / "build"
+        archive_run(run_path)
+
+        transcripts = list_transcripts(flow)
+        assert [p.name for p in transcripts] == ["implement-code-implementer-claude.jsonl"]
+        with open_run_file(transcripts[0]) as f:
+            assert json.loads(f.readline()) == {"role": "user"}
+        assert [p.name for p in list_receipts(flow)] == ["implement-code-implementer.json"]
+        assert [p.name for p in list_run_files(flow / "handoff", "*.json")] == ["implement.json"]
+
+        assert run_path_exists(flow / "llm")
+        assert run_path_exists(run_path / "events.jsonl")
+        assert not run_path_exists(flow / "missing.json")
+        with pytest.raises(FileNotFoundError):
+            open_run_file(flow / "missing.json")
+
+    def test_api_listings_and_event_stream(self, tmp_path):
+        import asyncio
+
+        from swarm.api.routes.events import read_events_file
+        from swarm.api.routes.runs import RunStateManager
+
+        run_path = _make_run(tmp_path, "run-a")
+        (run_path / "wisdom").mkdir()
+        (run_path / "wisdom" / "learnings.md").write_text("# Learnings\n")
+        archive_run(run_path)
+
+        assert [r["run_id"] for r in RunStateManager(tmp_path).list_runs()] == ["run-a"]
+        events, position = asyncio.run(read_events_file(run_path / "events.jsonl"))
+        assert [e["payload"]["i"] for e in events] == [0, 1, 2]
+        assert asyncio.run(read_events_file(run_path / "events.jsonl", position)) == ([], position)
+        assert run_path_exists(run_path / "wisdom")
+
+    def test_loose_writes_shadow_bundle_and_merge_on_rearchive(self, tmp_path):
+        run_path = _make_run(tmp_path, "run-a")
+        receipt = run_path / "build" / "receipts" / "implement-code-implementer.json"
+        archive_run(run_path)
+
+        receipt.parent.mkdir(parents=True)
+        receipt.write_text('{"status": "updated"}')
+        with open_run_file(receipt) as f:
+            assert json.load(f) == {"status": "updated"}
+
+        archive_run(run_path)
+        assert not receipt.exists()
+        with open_run_file(receipt) as f:
+            assert json.load(f) == {"status": "updated"}
+        assert len(storage.read_events("run-a", tmp_path)) == 3
+
+    def test_append_event_restores_run(self, tmp_path):
+        run_path = _make_run(tmp_path, "run-a")
+        archive_run(run_path)
+
+        storage.append_event(
+            "run-a",
+            RunEvent(run_id="run-a", ts=datetime.now(timezone.utc), kind="log", flow_key="build", payload={"i": 3}),
+            tmp_path,
+        )
+
+        assert not is_archived(run_path)
+        assert (run_path / "build" / "llm" / "implement-code-implementer-claude.jsonl").is_file()
+        assert [e.payload["i"] for e in storage.read_events("run-a", tmp_path)] == [0, 1, 2, 3]
+
+    def test_restore_keeps_newer_loose_files(self, tmp_path):
+        run_path = _make_run(tmp_path, "run-a")
+        archive_run(run_path)
+        handoff = run_path / "build" / "handoff" / "implement.json"
+        handoff.parent.mkdir(parents=True)
+        handoff.write_text("{}")
+
+        assert restore_run(run_path) == 4
+        assert handoff.read_text() == "{}"
+        assert not (run_path / BUNDLE_FILE).exists()
+
+
+class TestArchiveColdRuns:
+    def test_selects_finished_runs_past_threshold(self, tmp_path):
+        _make_run(tmp_path, "old-done", age_days=30)
+        _make_run(tmp_path, "old-failed", status=RunStatus.FAILED, age_days=30)
+        _make_run(tmp_path, "old-running", status=RunStatus.RUNNING, age_days=30)
+        _make_run(tmp_path, "new-done", age_days=1)
+
+        preview = archive_cold_runs(tmp_path, older_than_days=7, dry_run=True)
+        assert sorted(a.run_id for a in preview) == ["old-done", "old-failed"]
+        assert not is_archived(tmp_path / "old-done")
+
+        archived = archive_cold_runs(tmp_path, older_than_days=7)
+        assert sorted(a.run_id for a in archived) == ["old-done", "old-failed"]
+        assert all(a.files == 5 and a.bundle_bytes > 0 for a in archived)
+        assert not is_archived(tmp_path / "new-done")
+
+        assert archive_cold_runs(tmp_path, older_than_days=7) == []
+        assert storage.list_runs(tmp_path) == sorted(["new-done", "old-done", "old-failed", "old-running"])
+
+    def test_ledger_records_packed_size(self, tmp_path):
+        run_path = _make_run(tmp_path, "old-done", age_days=30)
+        archive_cold_runs(tmp_path, older_than_days=7)
+        sizes = disk_ledger.get_disk_ledger(tmp_path).sizes()
+        assert sizes["old-done"] == sum(e.stat().st_size for e in os.scandir(run_path))
+
+
+class TestArchiveConfig:
+    def test_default_and_env_override(self, monkeypatch):
+        runs_retention_config.reload_config()
+        monkeypatch.delenv("SWARM_RUNS_ARCHIVE_AFTER_DAYS", raising=False)
+        assert runs_retention_config.get_archive_after_days() == 7
+
+        monkeypatch.setenv("SWARM_RUNS_ARCHIVE_AFTER_DAYS", "2")
+        assert runs_retention_config.get_archive_after_days() == 2
+
+        monkeypatch.setenv("SWARM_RUNS_ARCHIVE_AFTER_DAYS", "0")
+        assert runs_retention_config.get_archive_after_days() is None
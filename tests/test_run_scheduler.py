@@ -0,0 +1,284 @@
+"""Tests for RunScheduler bounded admission and backend integration.
+
+Covers:
+- Global and per-backend concurrency limits
+- Priority-then-FIFO admission ordering
+- Queue position reporting and cancellation of queued runs
+- Burst throughput and tail latency with stub workloads
+- Backend start()/cancel() routed through the shared scheduler
+- Running stepwise runs stop after their current step when cancelled
+- queue_position is computed on read, never persisted to meta.json
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import threading
+import time
+from typing import List
+
+import pytest
+
+from swarm.runtime import run_scheduler, storage
+from swarm.runtime.backends import ClaudeStepwiseBackend, GeminiCliBackend
+from swarm.runtime.run_scheduler import RunScheduler
+from swarm.runtime.types import RunSpec, RunStatus
+
+
+class _ConcurrencyProbe:
+    """Stub run target that records peak concurrency per backend."""
+
+    def __init__(self, duration: float = 0.02):
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+        self.current_by_backend: dict = {}
+        self.peak_by_backend: dict = {}
+        self.order: List[str] = []
+
+    def __call__(self, run_id: str, backend_id: str) -> None:
+        with self.lock:
+            self.order.append(run_id)
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+            n = self.current_by_backend.get(backend_id, 0) + 1
+            self.current_by_backend[backend_id] = n
+            self.peak_by_backend[backend_id] = max(self.peak_by_backend.get(backend_id, 0), n)
+        time.sleep(self.duration)
+        with self.lock:
+            self.current -= 1
+            self.current_by_backend[backend_id] -= 1
+
+
+def _wait_active(sched: RunScheduler, run_id: str, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not sched.is_active(run_id) and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert sched.is_active(run_id)
+
+
+@pytest.fixture
+def scheduler():
+    sched = RunScheduler(max_concurrent=3, backend_limits={})
+    yield sched
+    sched.shutdown(wait=True, timeout=5)
+
+
+class TestConcurrencyLimits:
+    def test_global_limit_is_enforced(self, scheduler):
+        probe = _ConcurrencyProbe()
+        for i in range(12):
+            scheduler.submit(f"run-{i}", "claude-harness", probe, args=(f"run-{i}", "claude-harness"))
+
+        assert scheduler.wait_idle(timeout=10)
+        assert probe.peak <= 3
+        assert len(probe.order) == 12
+        assert scheduler.stats().completed == 12
+
+    def test_per_backend_limit_does_not_block_other_backends(self):
+        sched = RunScheduler(max_concurrent=4, backend_limits={"gemini-cli": 1})
+        probe = _ConcurrencyProbe(duration=0.03)
+        try:
+            for i in range(4):
+                sched.submit(f"g-{i}", "gemini-cli", probe, args=(f"g-{i}", "gemini-cli"))
+            for i in range(4):
+                sched.submit(f"c-{i}", "claude-harness", probe, args=(f"c-{i}", "claude-harness"))
+
+            assert sched.wait_idle(timeout=10)
+            assert probe.peak_by_backend["gemini-cli"] == 1
+            # Saturated gemini queue must not stall claude-harness admissions
+            assert probe.peak_by_backend["claude-harness"] >= 2
+        finally:
+            sched.shutdown(wait=True, timeout=5)
+
+
+class TestOrdering:
+    def test_priority_then_fifo(self):
+        sched = RunScheduler(max_concurrent=1, backend_limits={})
+        gate = threading.Event()
+        order: List[str] = []
+        try:
+            sched.submit("blocker", "claude-harness", gate.wait, args=(5,))
+            _wait_active(sched, "blocker")
+            for run_id, priority in [("low-a", 0), ("high", 10), ("low-b", 0), ("mid", 5)]:
+                sched.submit(run_id, "claude-harness", order.append, args=(run_id,), priority=priority)
+
+            assert sched.queue_position("high") == 1
+            assert sched.queue_position("low-b") == 4
+            gate.set()
+            assert sched.wait_idle(timeout=5)
+            assert order == ["high", "mid", "low-a", "low-b"]
+        finally:
+            sched.shutdown(wait=True, timeout=5)
+
+
+class TestCancellation:
+    def test_cancel_queued_run(self):
+        sched = RunScheduler(max_concurrent=1, backend_limits={})
+        gate = threading.Event()
+        ran: List[str] = []
+        try:
+            sched.submit("blocker", "claude-harness", gate.wait, args=(5,))
+            _wait_active(sched, "blocker")
+            sched.submit("victim", "claude-harness", ran.append, args=("victim",))
+            sched.submit("survivor", "claude-harness", ran.append, args=("survivor",))
+
+            assert sched.cancel("victim") is True
+            assert sched.cancel("victim") is False
+            assert sched.queue_position("survivor") == 1
+
+            gate.set()
+            assert sched.wait_idle(timeout=5)
+            assert ran == ["survivor"]
+            assert sched.stats().cancelled == 1
+        finally:
+            sched.shutdown(wait=True, timeout=5)
+
+    def test_cancel_active_run_is_noop(self, scheduler):
+        gate = threading.Event()
+        scheduler.submit("active", "claude-harness", gate.wait, args=(5,))
+        _wait_active(scheduler, "active")
+
+        assert scheduler.cancel("active") is False
+        gate.set()
+        assert scheduler.wait_idle(timeout=5)
+
+
+@pytest.mark.performance
+class TestBurstLoad:
+    def test_burst_throughput_and_tail_latency(self):
+        """A burst of 40 stub runs drains at ~limit-parallel throughput."""
+        duration = 0.02
+        limit = 4
+        sched = RunScheduler(max_concurrent=limit, backend_limits={})
+        probe = _ConcurrencyProbe(duration=duration)
+        try:
+            start = time.monotonic()
+            for i in range(40):
+                sched.submit(f"b-{i}", "claude-harness", probe, args=(f"b-{i}", "claude-harness"))
+            assert sched.wait_idle(timeout=20)
+            elapsed = time.monotonic() - start
+        finally:
+            sched.shutdown(wait=True, timeout=5)
+
+        stats = sched.stats().to_dict()
+        serial = 40 * duration
+        assert probe.peak <= limit
+        # Bounded pool still parallelizes: well under serial time
+        assert elapsed < serial * 0.75
+        # Tail latency is bounded by queue depth / limit, plus slack
+        assert stats["max_wait_ms"] < (40 / limit) * duration * 1000 * 3
+
+
+class TestBackendIntegration:
+    @pytest.fixture
+    def shared_scheduler(self, monkeypatch):
+        sched = RunScheduler(max_concurrent=1, backend_limits={})
+        monkeypatch.setattr(run_scheduler, "_global_scheduler", sched)
+        yield sched
+        sched.shutdown(wait=True, timeout=10)
+
+    def test_queued_run_reports_position_and_can_be_cancelled(
+        self, shared_scheduler, monkeypatch
+    ):
+        monkeypatch.setenv("SWARM_GEMINI_STUB", "1")
+        backend = GeminiCliBackend()
+        gate = threading.Event()
+        shared_scheduler.submit("blocker", "gemini-cli", gate.wait, args=(10,))
+        _wait_active(shared_scheduler, "blocker")
+
+        spec = RunSpec(
+            flow_keys=["signal"],
+            profile_id=None,
+            backend="gemini-cli",
+            initiator="test",
+        )
+        run_id = backend.start(spec)
+        try:
+            summary = backend.get_summary(run_id)
+            assert summary is not None
+            assert summary.status == RunStatus.PENDING
+            assert summary.queue_position == 1
+            meta = json.loads((storage.get_run_path(run_id) / "meta.json").read_text())
+            assert "queue_position" not in meta
+
+            assert backend.cancel(run_id) is True
+            summary = backend.get_summary(run_id)
+            assert summary.status == RunStatus.CANCELED
+            assert summary.queue_position is None
+            kinds = [e.kind for e in backend.get_events(run_id)]
+            assert kinds == ["run_created", "run_canceled"]
+        finally:
+            gate.set()
+            shared_scheduler.wait_idle(timeout=10)
+            shutil.rmtree(storage.get_run_path(run_id), ignore_errors=True)
+
+    def test_stub_runs_complete_through_scheduler(self, shared_scheduler, monkeypatch):
+        monkeypatch.setenv("SWARM_GEMINI_STUB", "1")
+        backend = GeminiCliBackend()
+        spec = RunSpec(
+            flow_keys=["signal"],
+            profile_id=None,
+            backend="gemini-cli",
+            initiator="test",
+        )
+        run_ids = [backend.start(spec) for _ in range(3)]
+        try:
+            assert shared_scheduler.wait_idle(timeout=30)
+            for run_id in run_ids:
+                summary = backend.get_summary(run_id)
+                assert summary.status == RunStatus.SUCCEEDED
+        finally:
+            for run_id in run_ids:
+                shutil.rmtree(storage.get_run_path(run_id), ignore_errors=True)
+
+    def test_running_stepwise_run_stops_on_cancel(self, shared_scheduler):
+        class _BlockingOrchestrator:
+            """Holds the first step until a stop is requested."""
+
+            def __init__(self):
+                self.started = threading.Event()
+                self.stop = threading.Event()
+                self.flows: List[str] = []
+                self._flow_registry = self
+
+            def get_flow(self, flow_key):
+                return flow_key
+
+            def _execute_stepwise(self, run_id, flow_key, **kwargs):
+                self.flows.append(flow_key)
+                self.started.set()
+                self.stop.wait(10)
+
+            def request_stop(self, run_id):
+                self.stop.set()
+                return True
+
+            def clear_stop_request(self, run_id):
+                pass
+
+        backend = ClaudeStepwiseBackend()
+        orchestrator = _BlockingOrchestrator()
+        backend._orchestrator = orchestrator
+        spec = RunSpec(
+            flow_keys=["build", "gate"],
+            profile_id=None,
+            backend="claude-step-orchestrator",
+            initiator="test",
+        )
+        run_id = backend.start(spec)
+        try:
+            assert orchestrator.started.wait(10)
+            assert backend.cancel(run_id) is True
+            assert backend.cancel(run_id) is False  # Already cancelling
+            assert shared_scheduler.wait_idle(timeout=10)
+
+            assert orchestrator.flows == ["build"]
+            assert backend.get_summary(run_id).status == RunStatus.CANCELED
+            canceled = [e for e in backend.get_events(run_id) if e.kind == "run_canceled"]
+            assert [e.payload for e in canceled] == [{"queued": False}]
+            assert backend.cancel(run_id) is False  # Finished
+        finally:
+            shutil.rmtree(storage.get_run_path(run_id), ignore_errors=True)
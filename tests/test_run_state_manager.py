@@ -0,0 +1,181 @@
+"""Tests for cross-process coherent run state in the API.
+
+Covers:
+- FileLock reentrancy and exclusion across processes
+- Stat-derived journal versions (cheap ETags) shared between instances
+- RunStateManager instances sharing a runs root (as API workers do) see
+  each other's writes, and stale ETags are rejected
+- Concurrent updates from several processes are not lost
+- Read paths do not keep journals or file locks alive
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from swarm.api.routes.runs import RunStateManager
+from swarm.runtime import state_journal
+from swarm.runtime.file_lock import FileLock, get_file_lock
+from swarm.runtime.state_journal import LOCK_FILE, RunStateJournal
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+fcntl = pytest.importorskip("fcntl")
+
+
+@pytest.fixture(autouse=True)
+def fresh_journals():
+    state_journal.reset_state_journals()
+    yield
+    state_journal.reset_state_journals()
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+class TestFileLock:
+    def test_reentrant_within_thread(self, tmp_path):
+        lock = FileLock(tmp_path / "x.lock")
+        with lock:
+            with lock:
+                pass
+            assert lock._fd is not None
+        assert lock._fd is None
+        assert get_file_lock(tmp_path / "x.lock") is get_file_lock(tmp_path / "x.lock")
+
+    def test_excludes_other_processes(self, tmp_path):
+        probe = f"""
+            import fcntl, os
+            fd = os.open({str(tmp_path / "x.lock")!r}, os.O_RDWR)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                print("acquired")
+            except BlockingIOError:
+                print("blocked")
+        """
+        with FileLock(tmp_path / "x.lock"):
+            assert _run_python(probe).stdout.strip() == "blocked"
+        assert _run_python(probe).stdout.strip() == "acquired"
+
+
+class TestJournalVersion:
+    def test_version_tracks_writes_across_instances(self, tmp_path):
+        a = RunStateJournal(tmp_path)
+        b = RunStateJournal(tmp_path)
+        a.write({"status": "pending", "n": 0})
+        state, version = b.load_versioned()
+        assert state == {"status": "pending", "n": 0}
+        assert version == a.version()
+
+        a.write({"status": "running", "n": 1})
+        state, new_version = b.load_versioned()
+        assert state["n"] == 1 and new_version != version
+        assert new_version == a.version()
+        assert (tmp_path / LOCK_FILE).exists()
+
+
+class TestRunStateManager:
+    def test_workers_share_state_and_etags(self, tmp_path):
+        worker_a = RunStateManager(tmp_path)
+        worker_b = RunStateManager(tmp_path)
+
+        async def scenario():
+            await worker_a.create_run("build", run_id="run-1")
+            state, etag = await worker_b.get_run("run-1")
+            assert state["status"] == "pending"
+
+            _, new_etag = await worker_a.update_run("run-1", {"status": "running"}, expected_etag=etag)
+            state, etag_b = await worker_b.get_run("run-1")
+            assert state["status"] == "running"
+            assert etag_b == new_etag != etag
+
+            with pytest.raises(ValueError, match="ETag mismatch"):
+                await worker_b.update_run("run-1", {"status": "paused"}, expected_etag=etag)
+
+            assert [r["status"] for r in worker_b.list_runs()] == ["running"]
+
+        asyncio.run(scenario())
+
+    def test_returned_state_is_detached(self, tmp_path):
+        manager = RunStateManager(tmp_path)
+
+        async def scenario():
+            await manager.create_run("build", run_id="run-1")
+            state, _ = await manager.get_run("run-1")
+            state["status"] = "mutated"
+            assert (await manager.get_run("run-1"))[0]["status"] == "pending"
+
+        asyncio.run(scenario())
+
+    def test_reads_do_not_grow_registries(self, tmp_path):
+        from swarm.api.server import SpecManager
+        from swarm.runtime import file_lock
+
+        writer = RunStateManager(tmp_path)
+        for i in range(5):
+            asyncio.run(writer.create_run("build", run_id=f"run-{i}"))
+        state_journal.reset_state_journals()
+        gc.collect()
+        assert not any(path.parent.parent == tmp_path for path in file_lock._locks)
+
+        reader = RunStateManager(tmp_path)
+        spec_manager = SpecManager(tmp_path)
+        spec_manager.runs_root = tmp_path
+        for i in range(5):
+            assert asyncio.run(reader.get_run(f"run-{i}"))[0]["status"] == "pending"
+            assert spec_manager.get_run_state(f"run-{i}")[0]["run_id"] == f"run-{i}"
+        gc.collect()
+        assert state_journal._journals == {}
+        assert not any(path.parent.parent == tmp_path for path in file_lock._locks)
+
+    def test_missing_run(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(RunStateManager(tmp_path).get_run("nope"))
+
+    def test_concurrent_process_updates_are_not_lost(self, tmp_path):
+        asyncio.run(RunStateManager(tmp_path).create_run("build", run_id="run-1", context={"n": 0}))
+        worker = f"""
+            import asyncio
+            from pathlib import Path
+            from swarm.api.routes.runs import RunStateManager
+
+            manager = RunStateManager(Path({str(tmp_path)!r}))
+
+            async def main():
+                done = 0
+                while done < 25:
+                    state, etag = await manager.get_run("run-1")
+                    try:
+                        await manager.update_run(
+                            "run-1", {{"context": {{"n": state["context"]["n"] + 1}}}}, expected_etag=etag
+                        )
+                    except ValueError:
+                        continue  # Another worker won; re-read and retry
+                    done += 1
+
+            asyncio.run(main())
+        """
+        procs = [
+            subprocess.Popen([sys.executable, "-c", textwrap.dedent(worker)], cwd=REPO_ROOT, stderr=subprocess.PIPE)
+            for _ in range(3)
+        ]
+        for proc in procs:
+            _, err = proc.communicate(timeout=120)
+            assert proc.returncode == 0, err.decode()
+
+        state, _ = asyncio.run(RunStateManager(tmp_path).get_run("run-1"))
+        assert state["context"]["n"] == 75
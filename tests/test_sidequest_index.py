@@ -0,0 +1,229 @@
+"""Tests for indexed sidequest trigger evaluation.
+
+Covers:
+- Indexed results match a full evaluation of every trigger, in priority order
+- Only sidequests watching a changed context field are re-evaluated
+- Usage limits still filter per run
+- add_sidequest / remove_sidequest / invalidate_index recompile the index
+- Benchmark: routing decisions against a 1,000-entry catalog file
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+from swarm.runtime import sidequest_catalog
+from swarm.runtime.sidequest_catalog import (
+    SidequestCatalog,
+    evaluate_trigger,
+    load_catalog_from_file,
+    parse_sidequest_definition,
+)
+
+FIELDS = ["verification_passed", "failure_type", "error_category", "has_ambiguity"]
+
+
+def _sidequest_data(i: int, rng: random.Random) -> Dict[str, Any]:
+    kind = i % 4
+    if kind == 0:
+        triggers = [
+            {
+                "condition_type": "field_check",
+                "field": rng.choice(FIELDS),
+                "operator": rng.choice(["equals", "not_equals"]),
+                "value": rng.choice([True, False, "timeout", "import"]),
+            }
+        ]
+    elif kind == 1:
+        triggers = [{"condition_type": "path_pattern", "pattern": f"src/mod{i % 50}/**"}]
+    elif kind == 2:
+        triggers = [
+            {"condition_type": "stall", "field": "stall_count", "operator": "gte", "value": 2},
+            {"condition_type": "iteration_count", "operator": "gte", "value": rng.randint(2, 8)},
+        ]
+    else:
+        triggers = [
+            {"condition_type": "field_check", "field": f"custom_{i % 100}", "value": True},
+        ]
+    return {
+        "sidequest_id": f"sq-{i}",
+        "name": f"Sidequest {i}",
+        "description": "generated",
+        "station_id": "clarifier",
+        "priority": rng.randint(1, 100),
+        "trigger_mode": rng.choice(["any", "all"]),
+        "max_uses_per_run": rng.randint(0, 3),
+        "triggers": triggers,
+    }
+
+
+def _catalog_data(n: int, seed: int = 7) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    return {"sidequests": [_sidequest_data(i, rng) for i in range(n)]}
+
+
+def _context(rng: random.Random, iteration: int) -> Dict[str, Any]:
+    context: Dict[str, Any] = {
+        "verification_passed": rng.random() < 0.7,
+        "stall_signals": {"stall_count": rng.randint(0, 3)},
+        "changed_paths": [f"src/mod{rng.randint(0, 60)}/file.py"],
+        "iteration": iteration,
+    }
+    if rng.random() < 0.5:
+        context["failure_type"] = rng.choice(["timeout", "import"])
+    return context
+
+
+def _reference(catalog: SidequestCatalog, context, run_id=None) -> List[str]:
+    """The unindexed evaluation: every trigger of every sidequest."""
+    applicable = []
+    for sq in catalog.get_all():
+        key = f"{run_id}:{sq.sidequest_id}" if run_id else sq.sidequest_id
+        if catalog._usage_counts.get(key, 0) >= sq.max_uses_per_run:
+            continue
+        results = [evaluate_trigger(t, context) for t in sq.triggers]
+        if all(results) if sq.trigger_mode == "all" else any(results):
+            applicable.append(sq)
+    return [sq.sidequest_id for sq in sorted(applicable, key=lambda s: -s.priority)]
+
+
+def _ids(sidequests) -> List[str]:
+    return [sq.sidequest_id for sq in sidequests]
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    calls: List[Any] = []
+    real = sidequest_catalog.evaluate_trigger
+
+    def counting(trigger, context):
+        calls.append(trigger)
+        return real(trigger, context)
+
+    monkeypatch.setattr(sidequest_catalog, "evaluate_trigger", counting)
+    return calls
+
+
+class TestIndexedEvaluation:
+    def test_matches_full_evaluation(self):
+        data = _catalog_data(200)
+        catalog = SidequestCatalog([parse_sidequest_definition(d) for d in data["sidequests"]])
+        rng = random.Random(1)
+        for step in range(60):
+            context = _context(rng, iteration=1 + step // 10)
+            run_id = f"run-{step % 3}"
+            assert _ids(catalog.get_applicable_sidequests(context, run_id)) == _reference(
+                catalog, context, run_id
+            )
+            for sq_id in _ids(catalog.get_applicable_sidequests(context, run_id))[:2]:
+                catalog.record_usage(sq_id, run_id)
+
+    def test_default_catalog_unchanged(self):
+        catalog = SidequestCatalog()
+        context = {
+            "verification_passed": False,
+            "stall_signals": {"stall_count": 3, "same_failure_signature": True},
+            "changed_paths": ["src/auth/login.py", "api/schema.json"],
+            "iteration": 4,
+            "has_ambiguity": True,
+        }
+        assert _ids(catalog.get_applicable_sidequests(context)) == _reference(catalog, context)
+
+    def test_only_changed_fields_are_re_evaluated(self, counted):
+        catalog = SidequestCatalog()
+        context = {"verification_passed": False, "iteration": 1, "changed_paths": []}
+        first = catalog.get_applicable_sidequests(context)
+        assert counted
+        counted.clear()
+
+        assert catalog.get_applicable_sidequests(dict(context)) == first
+        assert counted == []
+
+        catalog.get_applicable_sidequests({**context, "verification_passed": True})
+        watching = {
+            id(t)
+            for sq in catalog.get_all()
+            if any(
+                sidequest_catalog.watched_field(t) == "verification_passed" for t in sq.triggers
+            )
+            for t in sq.triggers
+        }
+        assert counted
+        assert all(id(t) in watching for t in counted)
+
+    def test_usage_limits_are_per_run(self):
+        catalog = SidequestCatalog()
+        context = {"has_ambiguity": True}
+        assert "clarifier" in _ids(catalog.get_applicable_sidequests(context, "run-1"))
+        for _ in range(catalog.get_by_id("clarifier").max_uses_per_run):
+            catalog.record_usage("clarifier", "run-1")
+        assert "clarifier" not in _ids(catalog.get_applicable_sidequests(context, "run-1"))
+        assert "clarifier" in _ids(catalog.get_applicable_sidequests(context, "run-2"))
+
+    def test_add_remove_and_invalidate(self):
+        data = _catalog_data(4)
+        catalog = SidequestCatalog([parse_sidequest_definition(d) for d in data["sidequests"][:1]])
+        context = {"custom_3": True}
+        assert catalog.get_applicable_sidequests(context) == []
+
+        late = parse_sidequest_definition(data["sidequests"][3])
+        late.max_uses_per_run = 1
+        catalog.add_sidequest(late)
+        assert _ids(catalog.get_applicable_sidequests(context)) == ["sq-3"]
+
+        late.triggers[0].value = False
+        catalog.invalidate_index()
+        assert catalog.get_applicable_sidequests(context) == []
+
+        assert catalog.remove_sidequest("sq-3")
+        assert catalog.get_applicable_sidequests({"custom_3": False}) == []
+
+    def test_trigger_without_fields(self):
+        always = parse_sidequest_definition(
+            {"sidequest_id": "always", "name": "a", "description": "", "trigger_mode": "all"}
+        )
+        never = parse_sidequest_definition(
+            {
+                "sidequest_id": "never",
+                "name": "n",
+                "description": "",
+                "triggers": [{"condition_type": "x"}],
+            }
+        )
+        catalog = SidequestCatalog([always, never])
+        assert _ids(catalog.get_applicable_sidequests({})) == ["always"]
+
+
+@pytest.mark.performance
+class TestSidequestIndexBenchmark:
+    """Routing-decision trigger evaluation over a 1,000-entry catalog."""
+
+    @pytest.fixture
+    def large_catalog(self, tmp_path) -> SidequestCatalog:
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps(_catalog_data(1000)))
+        catalog = load_catalog_from_file(path)
+        assert len(catalog.get_all()) == 1000
+        return catalog
+
+    @pytest.mark.benchmark(group="sidequest-applicable")
+    def test_routing_decisions(self, benchmark, large_catalog):
+        rng = random.Random(3)
+        # A microloop: iteration advances, evidence changes now and then
+        contexts = []
+        context = _context(rng, iteration=1)
+        for step in range(50):
+            if step % 10 == 0:
+                context = _context(rng, iteration=context["iteration"])
+            context = {**context, "iteration": 1 + step // 5}
+            contexts.append(context)
+
+        def decide():
+            return [large_catalog.get_applicable_sidequests(c, "run-1") for c in contexts]
+
+        results = benchmark(decide)
+        assert _ids(results[-1]) == _reference(large_catalog, contexts[-1], "run-1")
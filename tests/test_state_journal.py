@@ -0,0 +1,239 @@
+"""Tests for journaled incremental RunState persistence.
+
+Covers:
+- diff_state / apply_delta round trips
+- Writes append deltas instead of rewriting the snapshot
+- Periodic and terminal compaction
+- Crash recovery: replay, torn tail, snapshot written before journal removal
+- Another writer's changes are picked up
+- storage.update_run_state / commit_step_completion via the journal
+- The API run listing reads through the journal
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from swarm.runtime import state_journal, storage
+from swarm.runtime.state_journal import (
+    JOURNAL_FILE,
+    SNAPSHOT_FILE,
+    SNAPSHOT_SEQ_KEY,
+    RunStateJournal,
+    apply_delta,
+    diff_state,
+)
+from swarm.runtime.types import HandoffEnvelope, RoutingDecision, RoutingSignal, RunState
+
+
+@pytest.fixture(autouse=True)
+def fresh_journals():
+    state_journal.reset_state_journals()
+    yield
+    state_journal.reset_state_journals()
+
+
+def _state(step: int, envelopes: int = 0) -> dict:
+    return {
+        "run_id": "run-a",
+        "status": "running",
+        "step_index": step,
+        "handoff_envelopes": {f"s{i}": {"summary": "x" * 200} for i in range(envelopes)},
+        "completed_nodes": [f"s{i}" for i in range(envelopes)],
+        "loop_state": {},
+    }
+
+
+class TestDeltas:
+    def test_round_trip(self):
+        old = _state(1, envelopes=2)
+        new = _state(2, envelopes=3)
+        new["loop_state"] = {"loop": 1}
+        del new["status"]
+
+        delta = diff_state(old, new)
+        assert delta == {
+            "set": {"step_index": 2},
+            "merge": {"handoff_envelopes": {"s2": {"summary": "x" * 200}}, "loop_state": {"loop": 1}},
+            "extend": {"completed_nodes": ["s2"]},
+            "unset": ["status"],
+        }
+        apply_delta(old, delta)
+        assert old == new
+
+    def test_dropped_entries_and_rewritten_lists(self):
+        old = {"m": {"a": 1, "b": 2}, "l": [1, 2, 3]}
+        new = {"m": {"a": 1}, "l": [9]}
+        delta = diff_state(old, new)
+        assert delta == {"drop": {"m": ["b"]}, "set": {"l": [9]}}
+        apply_delta(old, delta)
+        assert old == new
+        assert diff_state(new, new) == {}
+
+
+class TestRunStateJournal:
+    def test_writes_append_constant_size_deltas(self, tmp_path):
+        journal = RunStateJournal(tmp_path, compact_every=1000)
+        journal.write(_state(0))
+        snapshot_mtime = (tmp_path / SNAPSHOT_FILE).stat().st_mtime_ns
+
+        sizes = []
+        for step in range(1, 60):
+            sizes.append(journal.write(_state(step, envelopes=step)))
+
+        assert (tmp_path / SNAPSHOT_FILE).stat().st_mtime_ns == snapshot_mtime
+        assert max(sizes) - min(sizes) < 10
+        assert journal.pending_entries == 59
+        assert RunStateJournal(tmp_path).load() == _state(59, envelopes=59)
+
+    def test_compacts_periodically_and_on_terminal_status(self, tmp_path):
+        journal = RunStateJournal(tmp_path, compact_every=3)
+        journal.write(_state(0))
+        for step in range(1, 4):
+            journal.write(_state(step))
+        assert not (tmp_path / JOURNAL_FILE).exists()
+        assert json.loads((tmp_path / SNAPSHOT_FILE).read_text())[SNAPSHOT_SEQ_KEY] == 3
+
+        journal.write(_state(4))
+        assert (tmp_path / JOURNAL_FILE).exists()
+        done = dict(_state(5), status="succeeded")
+        journal.write(done)
+        assert not (tmp_path / JOURNAL_FILE).exists()
+        snapshot = json.loads((tmp_path / SNAPSHOT_FILE).read_text())
+        assert snapshot["status"] == "succeeded" and snapshot["step_index"] == 5
+
+    def test_torn_tail_is_ignored_and_truncated(self, tmp_path):
+        RunStateJournal(tmp_path).write(_state(0))
+        RunStateJournal(tmp_path).write(_state(1))
+        with open(tmp_path / JOURNAL_FILE, "a") as f:
+            f.write('{"seq": 2, "set": {"step_')
+
+        journal = RunStateJournal(tmp_path)
+        assert journal.load()["step_index"] == 1
+        journal.write(_state(3))
+        lines = (tmp_path / JOURNAL_FILE).read_text().splitlines()
+        assert [json.loads(line)["seq"] for line in lines] == [1, 2]
+        assert RunStateJournal(tmp_path).load()["step_index"] == 3
+
+    def test_entries_folded_into_snapshot_are_not_replayed(self, tmp_path):
+        journal = RunStateJournal(tmp_path)
+        journal.write(_state(0, envelopes=1))
+        journal.write(_state(1, envelopes=2))
+        stale_journal = (tmp_path / JOURNAL_FILE).read_text()
+        journal.compact()
+        # Crash after the snapshot was written but before the journal was removed
+        (tmp_path / JOURNAL_FILE).write_text(stale_journal)
+
+        reloaded = RunStateJournal(tmp_path)
+        assert reloaded.load() == _state(1, envelopes=2)
+        assert reloaded.pending_entries == 0
+
+    def test_other_writers_are_picked_up(self, tmp_path):
+        a = RunStateJournal(tmp_path)
+        b = RunStateJournal(tmp_path)
+        a.write(_state(0))
+        b.write(_state(1))
+        a.write(dict(_state(1), status="paused"))
+        assert b.load() == dict(_state(1), status="paused")
+
+    def test_caller_mutation_after_write_is_persisted(self, tmp_path):
+        journal = RunStateJournal(tmp_path)
+        data = _state(0)
+        journal.write(data)
+        data["loop_state"]["loop"] = 2
+        journal.write(data)
+        assert RunStateJournal(tmp_path).load()["loop_state"] == {"loop": 2}
+
+
+def _envelope(step_id: str) -> HandoffEnvelope:
+    return HandoffEnvelope(
+        step_id=step_id,
+        flow_key="build",
+        run_id="run-a",
+        routing_signal=RoutingSignal(decision=RoutingDecision.ADVANCE, reason="ok", confidence=1.0),
+        summary=f"{step_id} done",
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+class TestStorageIntegration:
+    def test_step_updates_go_to_journal(self, tmp_path):
+        storage.write_run_state("run-a", RunState(run_id="run-a", flow_key="build", status="running"), tmp_path)
+        run_path = tmp_path / "run-a"
+
+        for i in range(3):
+            storage.commit_step_completion(
+                "run-a",
+                "build",
+                _envelope(f"step_{i}"),
+                {"step_index": i + 1, "current_step_id": f"step_{i + 1}"},
+                tmp_path,
+            )
+        storage.update_run_state("run-a", {"status": "paused", "unknown": 1}, tmp_path)
+
+        snapshot = json.loads((run_path / SNAPSHOT_FILE).read_text())
+        assert snapshot["step_index"] == 0
+        assert len((run_path / JOURNAL_FILE).read_text().splitlines()) == 4
+
+        state_journal.reset_state_journals()
+        state = storage.read_run_state("run-a", tmp_path)
+        assert state.status == "paused"
+        assert state.step_index == 3 and state.current_step_id == "step_3"
+        assert sorted(state.handoff_envelopes) == ["step_0", "step_1", "step_2"]
+        assert state_journal.get_state_journal(run_path).load()["current_node"] == "step_3"
+
+    def test_terminal_update_leaves_single_snapshot(self, tmp_path):
+        storage.write_run_state("run-a", RunState(run_id="run-a", flow_key="build", status="running"), tmp_path)
+        storage.update_run_state("run-a", {"step_index": 2}, tmp_path)
+        storage.update_run_state("run-a", {"status": "succeeded"}, tmp_path)
+
+        run_path = tmp_path / "run-a"
+        assert not (run_path / JOURNAL_FILE).exists()
+        assert json.loads((run_path / SNAPSHOT_FILE).read_text())["step_index"] == 2
+
+    def test_update_missing_state_raises(self, tmp_path):
+        storage.create_run_dir("run-a", tmp_path)
+        with pytest.raises(FileNotFoundError):
+            storage.update_run_state("run-a", {"status": "paused"}, tmp_path)
+
+    def test_api_run_listing_sees_journaled_status(self, tmp_path):
+        from swarm.api.server import SpecManager
+
+        storage.write_run_state("run-a", RunState(run_id="run-a", flow_key="build", status="running"), tmp_path)
+        storage.update_run_state("run-a", {"status": "paused"}, tmp_path)
+        assert json.loads((tmp_path / "run-a" / SNAPSHOT_FILE).read_text())["status"] == "running"
+
+        state_journal.reset_state_journals()
+        manager = SpecManager(tmp_path)
+        manager.runs_root = tmp_path
+        (run,) = manager.list_runs()
+        assert run["status"] == "paused" and run["flow_key"] == "build"
+        assert SNAPSHOT_SEQ_KEY not in run
+        assert state_journal._journals == {}
+
+    def test_event_stream_sees_journaled_state(self, tmp_path):
+        import asyncio
+
+        from swarm.api.routes.events import generate_run_events
+
+        storage.write_run_state("run-a", RunState(run_id="run-a", flow_key="build", status="pending"), tmp_path)
+        for step_id in ("s0", "s1", "s2"):
+            storage.update_run_state("run-a", {"status": "running", "current_step_id": step_id}, tmp_path)
+        assert json.loads((tmp_path / "run-a" / SNAPSHOT_FILE).read_text())["status"] == "pending"
+
+        async def first_events(count):
+            stream = generate_run_events("run-a", tmp_path, poll_interval=0, heartbeat_interval=0)
+            try:
+                return [await stream.__anext__() for _ in range(count)]
+            finally:
+                await stream.aclose()
+
+        state_journal.reset_state_journals()
+        _, heartbeat = asyncio.run(first_events(2))
+        assert "event: heartbeat" in heartbeat
+        data = json.loads(heartbeat.split("data: ", 1)[1])
+        assert (data["status"], data["current_step"]) == ("running", "s2")
+        assert state_journal._journals == {}
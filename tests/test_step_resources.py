@@ -0,0 +1,243 @@
+"""Tests for per-step resource accounting.
+
+Covers:
+- MeasuredPopen captures child CPU time and peak RSS via os.wait4()
+- Git commands are counted with their wall time
+- measure_step reports thread CPU and I/O
+- StatsDB projects step_resources rows and charges ingest time to steps
+- Orchestrator emits step_resources for every step; the
+  /api/runs/{run_id}/resources endpoint serves them per flow
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from swarm.runtime import storage
+from swarm.runtime.diff_scanner import _run_git_command
+from swarm.runtime.engines.claude import ClaudeStepEngine
+from swarm.runtime.resource_usage import (
+    MeasuredPopen,
+    StepResourceUsage,
+    current_meter,
+    measure_step,
+)
+from swarm.runtime.stepwise import StepwiseOrchestrator
+from swarm.runtime.types import RoutingMode, RunSpec
+
+repo_root = Path(__file__).resolve().parent.parent
+
+# Allocates ~64 MB and burns some CPU before exiting
+_HUNGRY_CHILD = "x = bytearray(64 * 1024 * 1024); sum(range(2_000_000))"
+
+
+class TestMeasuredPopen:
+    @pytest.mark.skipif(not hasattr(os, "wait4"), reason="os.wait4 not available")
+    def test_child_cpu_and_peak_rss(self):
+        with measure_step() as meter:
+            process = MeasuredPopen(
+                [sys.executable, "-c", _HUNGRY_CHILD],
+                kind="claude",
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            process.communicate(timeout=60)
+
+        usage = meter.usage
+        assert process.returncode == 0
+        assert usage.subprocess_count == 1
+        assert usage.subprocess_cpu_ms > 0
+        assert usage.subprocess_peak_rss_kb > 64 * 1024
+        assert usage.git_commands == 0
+
+    def test_no_meter_is_plain_popen(self):
+        assert current_meter() is None
+        process = MeasuredPopen([sys.executable, "-c", "print('hi')"], stdout=subprocess.PIPE)
+        out, _ = process.communicate(timeout=60)
+        assert out.strip() == b"hi"
+        assert process.returncode == 0
+
+    def test_git_commands_are_counted(self):
+        with measure_step() as meter:
+            success, _, _ = _run_git_command(["rev-parse", "--git-dir"], repo_root)
+            _run_git_command(["status", "--porcelain"], repo_root)
+
+        assert success
+        assert meter.usage.git_commands == 2
+        assert meter.usage.subprocess_count == 2
+        assert meter.usage.git_ms > 0
+
+
+class TestMeasureStep:
+    def test_cpu_and_io(self, tmp_path):
+        (tmp_path / "existing.txt").write_bytes(b"x" * 100)
+        with measure_step() as meter:
+            (tmp_path / "build").mkdir()
+            (tmp_path / "build" / "receipt.json").write_bytes(b"y" * 5000)
+            (tmp_path / "existing.txt").read_bytes()
+            sum(i * i for i in range(200_000))
+
+        usage = meter.usage
+        assert usage.cpu_ms > 0
+        if Path("/proc/thread-self/io").exists():
+            assert usage.io_write_bytes >= 5000
+            assert usage.io_read_bytes >= 100
+        assert "run_dir_bytes_written" not in usage.to_dict()
+
+    def test_usage_is_final_after_error(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            with measure_step() as meter:
+                (tmp_path / "partial.md").write_text("a" * 10)
+                raise RuntimeError("engine failed")
+        if Path("/proc/thread-self/io").exists():
+            assert meter.usage.io_write_bytes >= 10
+        assert current_meter() is None
+
+
+@pytest.fixture
+def stub_flow():
+    """Run the build flow with the stub engine."""
+    orch = StepwiseOrchestrator(
+        engine=ClaudeStepEngine(repo_root, mode="stub"),
+        repo_root=repo_root,
+        skip_preflight=True,
+        routing_mode=RoutingMode.DETERMINISTIC_ONLY,
+        prewarm_flows=False,
+    )
+    run_id = f"resources-{uuid.uuid4().hex[:8]}"
+    spec = RunSpec(
+        flow_keys=["build"],
+        profile_id=None,
+        backend="claude-step-orchestrator",
+        initiator="test",
+    )
+    summary = orch._execute_stepwise(run_id, "build", orch._load_flow_definition("build"), spec)
+    yield run_id, summary
+    shutil.rmtree(storage.get_run_path(run_id), ignore_errors=True)
+
+
+class TestOrchestratorResources:
+    def test_every_step_emits_step_resources(self, stub_flow):
+        run_id, summary = stub_flow
+        events = [e for e in storage.read_events(run_id) if e.kind == "step_resources"]
+
+        assert len(events) == len(summary.completed_steps)
+        for event in events:
+            assert event.payload["cpu_ms"] > 0
+            # Progress capture diffs the repo with git
+            assert event.payload["git_commands"] > 0
+
+    def test_resources_endpoint(self, stub_flow):
+        from fastapi.testclient import TestClient
+
+        from swarm.tools.flow_studio_fastapi import app
+
+        run_id, summary = stub_flow
+        client = TestClient(app)
+        data = client.get(f"/api/runs/{run_id}/resources", params={"flow": "build"}).json()
+        assert len(data["steps"]) == len(summary.completed_steps)
+        assert data["totals"]["cpu_ms"] == pytest.approx(
+            sum(s["cpu_ms"] for s in data["steps"])
+        )
+        assert data["totals"]["subprocess_peak_rss_kb"] == max(
+            s["subprocess_peak_rss_kb"] for s in data["steps"]
+        )
+
+        empty = client.get(f"/api/runs/{run_id}/resources", params={"flow": "gate"}).json()
+        assert empty["steps"] == [] and empty["message"]
+        assert client.get("/api/runs/no-such-run/resources").status_code == 404
+
+
+@pytest.fixture
+def stats_db():
+    pytest.importorskip("duckdb")
+    from swarm.runtime.db import StatsDB
+
+    db = StatsDB(None)
+    yield db
+    db.close()
+
+
+def _event(seq: int, kind: str, step_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "event_id": f"evt-{seq}",
+        "seq": seq,
+        "ts": f"2026-01-01T00:00:{seq:02d}+00:00",
+        "kind": kind,
+        "flow_key": "build",
+        "step_id": step_id,
+        "payload": payload,
+    }
+
+
+def _usage(**overrides: Any) -> Dict[str, Any]:
+    payload = StepResourceUsage(cpu_ms=12.5, git_commands=3, git_ms=40.0).to_dict()
+    payload.update(iteration=1, step_index=0)
+    payload.update(overrides)
+    return payload
+
+
+class TestStatsDBProjection:
+    def test_step_resources_rows(self, stats_db):
+        db = stats_db
+        db.ingest_events(
+            [
+                _event(1, "step_start", "implement", {"step_index": 0}),
+                _event(2, "step_resources", "implement", _usage(io_read_bytes=None)),
+                _event(3, "step_resources", "implement", _usage(iteration=2, cpu_ms=7.0)),
+                _event(4, "step_resources", "critique", _usage(step_index=1)),
+            ],
+            "run-1",
+        )
+
+        rows = db.get_step_resources("run-1")
+        assert [(r.step_id, r.iteration) for r in rows] == [
+            ("implement", 1),
+            ("implement", 2),
+            ("critique", 1),
+        ]
+        assert rows[0].cpu_ms == 12.5
+        assert rows[0].git_commands == 3
+        assert rows[0].io_read_bytes is None
+        assert rows[1].cpu_ms == 7.0
+        assert db.get_step_resources("run-1", "gate") == []
+
+    def test_ingest_time_is_charged_to_the_step(self, stats_db):
+        db = stats_db
+        # Events before and after the step_resources event, across batches
+        db.ingest_events([_event(1, "step_start", "implement", {"step_index": 0})], "run-1")
+        assert db.get_step_resources("run-1") == []
+        db.ingest_events(
+            [
+                _event(2, "step_resources", "implement", _usage()),
+                _event(3, "tool_end", "implement", {"tool": "Write", "duration_ms": 5}),
+            ],
+            "run-1",
+        )
+        (row,) = db.get_step_resources("run-1")
+        after_first_batches = row.db_ingest_ms
+        assert after_first_batches > 0
+
+        db.ingest_events([_event(4, "tool_end", "implement", {"tool": "Read"})], "run-1")
+        (row,) = db.get_step_resources("run-1")
+        assert row.db_ingest_ms > after_first_batches
+        assert db._pending_ingest_ms == {}
+
+    def test_run_completed_drops_pending_ingest_time(self, stats_db):
+        db = stats_db
+        db.ingest_events(
+            [
+                _event(1, "step_start", "legacy", {"step_index": 0}),
+                _event(2, "run_completed", "", {"status": "succeeded"}),
+            ],
+            "run-1",
+        )
+        assert db._pending_ingest_ms == {}
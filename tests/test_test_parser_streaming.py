@@ -0,0 +1,233 @@
+"""Tests for the streaming pytest and JUnit parsers.
+
+Covers:
+- Summary-line counts, durations and failure blocks from a full pytest log
+- Colored (--color=yes), indented, trailing-space and prefixed summary lines
+- Chunked feeding (arbitrary split points) matches one-shot parsing
+- Provisional counts from progress output while tests are still running
+- JUnit via iterparse: suite totals, failure details, element clearing
+- JUnit fed in chunks while the report is still being written
+"""
+
+from __future__ import annotations
+
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from swarm.runtime import test_parser as tp
+from swarm.runtime.forensic_types import FailureType
+
+PYTEST_LOG = """\
+============================= test session starts ==============================
+collected 6 items
+
+tests/test_auth.py ..F.                                                  [ 66%]
+tests/test_db.py sE                                                      [100%]
+
+==================================== ERRORS ====================================
+___________________________ ERROR at setup of test_pool ________________________
+    @pytest.fixture
+E   RuntimeError: database unavailable
+tests/test_db.py:5: RuntimeError
+=================================== FAILURES ===================================
+__________________________________ test_token __________________________________
+
+    def test_token():
+>       assert status == 401
+E       AssertionError: expected 401, got 500
+
+tests/test_auth.py:12: AssertionError
+_ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _
+tests/helpers.py:40: in check
+=========================== short test summary info ============================
+FAILED tests/test_auth.py::test_token - AssertionError: 3 passed == 4
+ERROR tests/test_db.py::test_pool - RuntimeError: database unavailable
+======== 1 failed, 3 passed, 1 skipped, 1 error, 2 warnings in 1.50s =========
+"""
+
+
+class TestPytestParser:
+    def test_full_log(self):
+        summary = tp.parse_pytest_output(PYTEST_LOG)
+
+        assert (summary.total, summary.passed, summary.failed) == (6, 3, 1)
+        assert (summary.skipped, summary.errors) == (1, 1)
+        assert summary.duration_ms == 1500
+        assert [f.test_name for f in summary.failures] == ["test_pool", "test_token"]
+
+        token = summary.failures[1]
+        assert token.test_file == "tests/test_auth.py"
+        assert token.test_line == 12
+        assert token.failure_type == FailureType.ASSERTION
+        assert (token.expected, token.actual) == ("401", "500")
+        assert "tests/helpers.py:40" in token.error_message
+        assert "short test summary" not in token.error_message
+        assert len(summary.error_signatures) == 2
+
+    @pytest.mark.parametrize("size", [1, 7, 64, 10_000])
+    def test_chunked_feed_matches_one_shot(self, size):
+        parser = tp.PytestStreamParser()
+        for start in range(0, len(PYTEST_LOG), size):
+            parser.feed(PYTEST_LOG[start : start + size])
+        streamed = tp.test_summary_to_dict(parser.close())
+        assert streamed == tp.test_summary_to_dict(tp.parse_pytest_output(PYTEST_LOG))
+
+    def test_snapshot_while_running(self):
+        parser = tp.PytestStreamParser()
+        parser.feed("tests/test_auth.py ..F")
+        assert parser.snapshot().total == 0  # Line not complete yet
+        parser.feed(".   [ 66%]\ntests/test_db.py s")
+        partial = parser.snapshot()
+        assert (partial.total, partial.passed, partial.failed) == (4, 3, 1)
+        assert not parser.finished
+
+        parser.feed(PYTEST_LOG.split("[100%]\n", 1)[1])
+        assert parser.finished
+        assert parser.snapshot().total == 6
+
+    def test_verbose_and_quiet_output(self):
+        log = (
+            "tests/test_a.py::test_one PASSED    [ 50%]\n"
+            "tests/test_a.py::test_two XFAIL     [100%]\n"
+        )
+        partial = tp.parse_pytest_output(log)
+        assert (partial.passed, partial.skipped) == (1, 1)
+
+        quiet = tp.parse_pytest_output("..FF\n2 failed, 2 passed in 0.30s\n")
+        assert (quiet.total, quiet.failed, quiet.duration_ms) == (4, 2, 300)
+
+    def test_colored_output(self):
+        red, green, bold, reset = "\x1b[31m", "\x1b[32m", "\x1b[1m", "\x1b[0m"
+        log = (
+            f"tests/test_auth.py ..{red}F{reset}                [100%]{reset}\n"
+            f"{red}=================== FAILURES ==================={reset}\n"
+            f"{red}{bold}__________________ test_token __________________{reset}\n"
+            f"{bold}{red}E       AssertionError: expected 401, got 500{reset}\n"
+            f"{red}tests/test_auth.py{reset}:12: AssertionError\n"
+            f"{red}======= {red}{bold}1 failed{reset}, {green}2 passed{reset}{red} in 0.50s{reset}"
+            f"{red} ======={reset}\n"
+        )
+        summary = tp.parse_pytest_output(log)
+        assert (summary.total, summary.passed, summary.failed) == (3, 2, 1)
+        assert summary.duration_ms == 500
+        (failure,) = summary.failures
+        assert failure.test_name == "test_token"
+        assert "\x1b" not in failure.error_message
+        assert (failure.test_file, failure.test_line) == ("tests/test_auth.py", 12)
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "===== 7 passed, 1 failed in 3.0s ===== ",
+            "    ===== 7 passed, 1 failed in 3.0s =====",
+            "  7 passed, 1 failed in 3.0s  ",
+            "Results: 7 passed, 1 failed in 3.0s",
+        ],
+        ids=["trailing-space", "indented-banner", "indented-quiet", "prefixed"],
+    )
+    def test_summary_line_variants(self, line):
+        summary = tp.parse_pytest_output(f"collected 8 items\n{line}\n")
+        assert (summary.total, summary.passed, summary.failed) == (8, 7, 1)
+        assert summary.duration_ms == 3000
+
+    def test_all_failed_run_is_counted(self):
+        summary = tp.parse_pytest_output("FF\n===== 2 failed in 0.10s =====\n")
+        assert (summary.total, summary.failed, summary.passed) == (2, 2, 0)
+
+    def test_file_input_is_streamed(self, tmp_path):
+        log = tmp_path / "pytest.log"
+        log.write_text(PYTEST_LOG)
+        summary = tp.parse_test_output(log)
+        assert summary.raw_output_path == log
+        assert summary.total == 6
+
+    def test_empty(self):
+        summary = tp.parse_pytest_output("")
+        assert summary.total == 0
+        assert summary.source_format == "pytest"
+
+
+JUNIT_XML = """\
+<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+  <testsuite name="auth" tests="3" failures="1" errors="1" skipped="0" time="1.5">
+    <properties><property name="ci" value="true"/></properties>
+    <testcase classname="tests.test_auth" name="test_ok" time="0.1"/>
+    <testcase classname="tests.test_auth" name="test_token" time="0.5">
+      <failure message="expected 401, got 500">Traceback ...</failure>
+    </testcase>
+    <testcase classname="tests.test_auth" name="test_timeout" time="0.9">
+      <error message="operation timed out">Traceback ...</error>
+    </testcase>
+  </testsuite>
+  <testsuite name="db" tests="2" failures="0" errors="0" skipped="1" time="0.5">
+    <testcase classname="tests.test_db" name="test_pool" time="0.5"/>
+    <testcase classname="tests.test_db" name="test_skip"><skipped/></testcase>
+  </testsuite>
+</testsuites>
+"""
+
+
+class TestJUnitParser:
+    def test_parse_file(self, tmp_path):
+        path = tmp_path / "results.xml"
+        path.write_text(JUNIT_XML)
+        summary = tp.parse_junit_xml(path)
+
+        assert (summary.total, summary.passed, summary.failed) == (5, 2, 1)
+        assert (summary.errors, summary.skipped) == (1, 1)
+        assert summary.duration_ms == 2000
+        token, timeout = summary.failures
+        assert token.test_name == "tests.test_auth::test_token"
+        assert (token.expected, token.actual) == ("401", "500")
+        assert token.duration_ms == 500
+        assert timeout.failure_type == FailureType.TIMEOUT
+        assert timeout.expected is None
+
+    def test_processed_elements_are_discarded(self):
+        parser = tp.JUnitStreamParser()
+        retained = []
+        for event, elem in ET.iterparse(io.BytesIO(JUNIT_XML.encode()), events=("start", "end")):
+            parser.handle(event, elem)
+            if event == "end" and elem.tag == "testsuites":
+                retained.extend(elem.iter())
+        assert [e.tag for e in retained] == ["testsuites"]
+        assert parser.snapshot().total == 5
+
+    def test_chunked_feed_while_writing(self):
+        parser = tp.JUnitStreamParser()
+        cut = JUNIT_XML.index('<testsuite name="db"')
+        parser.feed(JUNIT_XML[:cut])
+        partial = parser.snapshot()
+        assert (partial.total, partial.failed, len(partial.failures)) == (3, 1, 2)
+
+        parser.feed(JUNIT_XML[cut:])
+        final = parser.close()
+        assert final.total == 5
+        assert final.skipped == 1
+
+    def test_single_suite_root_and_nested_suites(self, tmp_path):
+        path = tmp_path / "results.xml"
+        path.write_text(
+            '<testsuite tests="2" failures="1">'
+            '<testcase name="a"><failure message="boom"/></testcase>'
+            '<testsuite tests="9"><testcase name="nested"><failure message="x"/></testcase>'
+            "</testsuite>"
+            '<testcase name="b"/>'
+            "</testsuite>"
+        )
+        summary = tp.parse_junit_xml(path)
+        assert (summary.total, summary.failed, summary.passed) == (2, 1, 1)
+        assert [f.test_name for f in summary.failures] == ["a"]
+
+    def test_invalid_documents(self, tmp_path):
+        assert tp.parse_junit_xml(tmp_path / "missing.xml").total == 0
+        broken = tmp_path / "broken.xml"
+        broken.write_text('<testsuites><testsuite tests="3">')
+        assert tp.parse_junit_xml(broken).total == 0
+        other = tmp_path / "other.xml"
+        other.write_text('<report><testsuite tests="3"/></report>')
+        assert tp.parse_junit_xml(other).total == 0
+